@@ -2,7 +2,8 @@
 
 Default path loads a complete ``outputs/embeddings/original/`` cache with no AWS
 calls. Refresh pulls from the keep/remove DynamoDB+S3 identity cache. Optional
-``--backfill`` fills residuals via ``shared.embeddings.bedrock.create_embedding``.
+``--backfill`` fills residuals via ``shared.embeddings.resolver.resolve_embeddings``,
+which also writes them back to the identity cache.
 
 Run from repo root::
 
@@ -24,7 +25,6 @@ from pathlib import Path
 
 import numpy as np
 import pandas as pd
-from tqdm import tqdm
 
 from experiments.bertopic_modeling_2026_08_05.src import data as data_mod
 from experiments.bertopic_modeling_2026_08_05.src import paths
@@ -35,14 +35,10 @@ from experiments.simplified_predict_remove_2026_05_13.experiment_create_embeddin
     DYNAMODB_TABLE_NAME,
     S3_BUCKET,
 )
-from lib.aws.dynamodb import DynamoDBEmbeddingIndex
 from lib.aws.embedding_identity import embedding_identity_sha256
-from lib.aws.s3 import S3
-from shared.embeddings.bedrock import (
-    BEDROCK_MODEL_ID,
-    EMBEDDING_DIMENSIONS,
-    create_embedding,
-)
+from shared.embeddings.bedrock import BEDROCK_MODEL_ID, EMBEDDING_DIMENSIONS
+from shared.embeddings.cache import load_embeddings_by_ids, make_embedding_cache_clients
+from shared.embeddings.resolver import resolve_embeddings
 
 TEXT_ROLE = paths.TEXT_ROLE_V1
 DISK_CACHE_DIRNAME = ".identity_disk_cache"
@@ -73,10 +69,6 @@ def _cache_paths(cache_dir: Path) -> tuple[Path, Path, Path]:
     )
 
 
-def _disk_cache_path(disk_cache_root: Path, embedding_id: str) -> Path:
-    return disk_cache_root / "embeddings" / f"{embedding_id}.npy"
-
-
 def _local_cache_is_complete(
     cache_dir: Path,
     message_ids: set[str],
@@ -146,51 +138,6 @@ def _load_local_cache(cache_dir: Path) -> EmbeddingCacheResult:
     )
 
 
-def _fetch_identity_vector(
-    text: str,
-    ddb: DynamoDBEmbeddingIndex,
-    s3: S3,
-    disk_cache_root: Path,
-    embedding_id_to_vec: dict[str, np.ndarray],
-) -> np.ndarray | None:
-    """Fetch one Titan vector from disk / DynamoDB+S3. Return None if missing."""
-    embedding_id = embedding_identity_sha256(
-        text,
-        model_id=BEDROCK_MODEL_ID,
-        dimensions=EMBEDDING_DIMENSIONS,
-        normalize=True,
-    )
-    if embedding_id in embedding_id_to_vec:
-        return embedding_id_to_vec[embedding_id]
-
-    cached = _disk_cache_path(disk_cache_root, embedding_id)
-    if cached.exists():
-        vec = np.load(cached)
-        embedding_id_to_vec[embedding_id] = vec
-        return vec
-
-    d_row = ddb.get_item(embedding_id)
-    if d_row is None:
-        return None
-    s3_key = str(d_row.get("s3_key", "")).strip()
-    if not s3_key:
-        return None
-
-    raw = s3.get_bytes(s3_key)
-    parsed = json.loads(raw.decode("utf-8"))
-    emb = parsed.get("embedding")
-    if emb is None or not isinstance(emb, list):
-        return None
-    if len(emb) != EMBEDDING_DIMENSIONS:
-        return None
-
-    vec = np.asarray([float(x) for x in emb], dtype=np.float64)
-    cached.parent.mkdir(parents=True, exist_ok=True)
-    np.save(cached, vec)
-    embedding_id_to_vec[embedding_id] = vec
-    return vec
-
-
 def _resolve_from_identity_and_optional_backfill(
     posts: pd.DataFrame,
     cache_dir: Path,
@@ -198,56 +145,55 @@ def _resolve_from_identity_and_optional_backfill(
 ) -> EmbeddingCacheResult:
     """Resolve original-text vectors via DynamoDB+S3, optionally Bedrock.
 
-    Missing identity-cache rows are dropped unless ``backfill`` is True.
-    Only the original text role is resolved (v1).
+    Pointers are read with BatchGetItem and payloads fetched concurrently
+    (``load_embeddings_by_ids``). Missing identity-cache rows are dropped
+    unless ``backfill`` is True, in which case ``resolve_embeddings`` embeds
+    them and writes them back to the identity cache. Only the original text
+    role is resolved (v1).
     """
     disk_cache = paths.EXPERIMENT_ROOT / "outputs" / "embeddings" / DISK_CACHE_DIRNAME
     disk_cache.mkdir(parents=True, exist_ok=True)
 
-    s3 = S3(S3_BUCKET, region_name=BEDROCK_AWS_REGION)
-    ddb = DynamoDBEmbeddingIndex(DYNAMODB_TABLE_NAME, region_name=BEDROCK_AWS_REGION)
-    embedding_id_to_vec: dict[str, np.ndarray] = {}
-
-    vectors: list[np.ndarray] = []
-    kept_ids: list[str] = []
-    dropped_message_ids: list[str] = []
-    backfill_message_ids: list[str] = []
-
-    rows = list(posts.itertuples(index=False))
-    for row in tqdm(rows, desc="Resolving original Titan vectors", unit="post"):
-        message_id = str(row.message_id)
-        original_text = str(row.original_text)
-        vec = _fetch_identity_vector(
-            text=original_text,
-            ddb=ddb,
-            s3=s3,
-            disk_cache_root=disk_cache,
-            embedding_id_to_vec=embedding_id_to_vec,
+    clients = make_embedding_cache_clients(
+        bucket=S3_BUCKET, table=DYNAMODB_TABLE_NAME, region_name=BEDROCK_AWS_REGION
+    )
+    message_ids = posts["message_id"].astype(str).tolist()
+    texts = posts["original_text"].astype(str).tolist()
+    embedding_ids = [
+        embedding_identity_sha256(
+            text,
+            model_id=BEDROCK_MODEL_ID,
+            dimensions=EMBEDDING_DIMENSIONS,
+            normalize=True,
         )
-        if vec is not None:
-            vectors.append(np.asarray(vec, dtype=np.float64).ravel())
-            kept_ids.append(message_id)
-            continue
-
-        if not backfill:
-            dropped_message_ids.append(message_id)
-            continue
-
-        try:
-            out = create_embedding(original_text)
-            emb = out["embedding"]
-            if len(emb) != EMBEDDING_DIMENSIONS:
-                raise RuntimeError(f"Unexpected embedding length {len(emb)}")
-            vectors.append(np.asarray(emb, dtype=np.float64))
-            kept_ids.append(message_id)
-            backfill_message_ids.append(message_id)
-        except Exception:
-            dropped_message_ids.append(message_id)
+        for text in texts
+    ]
+    loaded = load_embeddings_by_ids(embedding_ids, clients=clients, cache_dir=disk_cache)
+    matrix = loaded.matrix
+    found = loaded.found.copy()
 
+    backfill_message_ids: list[str] = []
+    if backfill:
+        todo = [i for i in np.flatnonzero(~found) if texts[i].strip()]
+        if todo:
+            resolved = resolve_embeddings(
+                [texts[i] for i in todo],
+                model_id=BEDROCK_MODEL_ID,
+                dimensions=EMBEDDING_DIMENSIONS,
+                normalize=True,
+                clients=clients,
+                cache_dir=disk_cache,
+            )
+            matrix[todo] = resolved.matrix
+            found[todo] = True
+            backfill_message_ids = [message_ids[i] for i in todo]
+
+    kept_ids = [mid for mid, ok in zip(message_ids, found, strict=True) if ok]
+    dropped_message_ids = [mid for mid, ok in zip(message_ids, found, strict=True) if not ok]
     if not kept_ids:
         raise RuntimeError("No embeddings resolved for any message_id")
 
-    embeddings = np.vstack(vectors)
+    embeddings = matrix[found].astype(np.float64)
     index = pd.DataFrame(
         {
             "row_id": np.arange(len(kept_ids), dtype=np.int64),
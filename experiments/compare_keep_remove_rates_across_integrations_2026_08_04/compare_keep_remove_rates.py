@@ -80,9 +80,9 @@ def derive_toxicity_label(sample_toxicity_type: str) -> str:
 def load_labeled_posts() -> pd.DataFrame:
     """Load keep/remove labels joined to stimuli toxicity."""
     labels = load_dataset(STUDY_PHASE_2_PART_2_KEEP_REMOVE_LABELS)
-    stimuli = load_dataset(STUDY_PHASE_2_PART_2_STIMULI)[
-        ["post_primary_key", "sample_toxicity_type"]
-    ]
+    stimuli = load_dataset(
+        STUDY_PHASE_2_PART_2_STIMULI, columns=["post_primary_key", "sample_toxicity_type"]
+    )
     merged = labels.merge(
         stimuli,
         left_on="message_id",
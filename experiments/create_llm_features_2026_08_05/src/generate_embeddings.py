@@ -16,7 +16,6 @@ from pathlib import Path
 from typing import Any
 
 import numpy as np
-from tqdm import tqdm
 
 from experiments.create_llm_features_2026_08_05.src.paths import (
     LabelClass,
@@ -27,8 +26,9 @@ from experiments.create_llm_features_2026_08_05.src.paths import (
 )
 from shared.embeddings.bedrock import (
     BEDROCK_MODEL_ID,
+    DEFAULT_MAX_CONCURRENCY,
     EMBEDDING_DIMENSIONS,
-    create_embedding,
+    create_embeddings_batch,
 )
 
 _METADATA_FILENAME = "metadata.json"
@@ -162,9 +162,8 @@ def extract_features_for_embedding(
     return records
 
 
-def _embed_one_record(record: dict[str, Any]) -> dict[str, Any]:
-    """Call Titan and attach embedding fields to one feature record."""
-    out = create_embedding(record["text_embedded"])
+def _attach_embedding(record: dict[str, Any], out: dict[str, Any]) -> dict[str, Any]:
+    """Validate one Titan result and attach its embedding fields to a feature record."""
     if out["model_id"] != BEDROCK_MODEL_ID:
         raise ValueError(f"Unexpected model_id: {out['model_id']}")
     if out["dimensions"] != EMBEDDING_DIMENSIONS:
@@ -183,23 +182,35 @@ def _embed_one_record(record: dict[str, Any]) -> dict[str, Any]:
     }
 
 
-def embed_feature_records(records: list[dict[str, Any]]) -> list[dict[str, Any]]:
+def embed_feature_records(
+    records: list[dict[str, Any]],
+    *,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> list[dict[str, Any]]:
     """Embed each feature record via Bedrock Titan.
 
+    Distinct texts are embedded once, concurrently and with throttle-aware
+    retries, via :func:`shared.embeddings.bedrock.create_embeddings_batch`.
+
     Parameters
     ----------
     records
         Flattened feature records with ``text_embedded``.
+    max_concurrency
+        Upper bound on in-flight Titan requests.
 
     Returns
     -------
     list[dict[str, Any]]
-        Records with embedding vectors attached.
+        Records with embedding vectors attached, in input order.
     """
-    embedded: list[dict[str, Any]] = []
-    for record in tqdm(records, desc="Stage 2 embeddings"):
-        embedded.append(_embed_one_record(record))
-    return embedded
+    outputs = create_embeddings_batch(
+        [record["text_embedded"] for record in records],
+        max_concurrency=max_concurrency,
+    )
+    return [
+        _attach_embedding(record, out) for record, out in zip(records, outputs, strict=True)
+    ]
 
 
 def write_embedding_artifacts(
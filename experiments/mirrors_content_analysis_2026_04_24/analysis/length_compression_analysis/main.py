@@ -19,7 +19,7 @@ from experiments.mirrors_content_analysis_2026_04_24.analysis.length_compression
 from experiments.mirrors_content_analysis_2026_04_24.analysis.metric_aggregator import (
     MetricAggregator,
     PairwiseAnalysisResult,
-    metrics_dict_for_text,
+    metrics_frame_for_texts,
 )
 from experiments.mirrors_content_analysis_2026_04_24.analysis.table_renderer import TableRenderer
 from experiments.mirrors_content_analysis_2026_04_24.dataloader import Dataloader
@@ -123,22 +123,18 @@ class LengthCompressionAnalyzer:
         labels_original = post_texts[["post_primary_key"]].copy()
         labels_mirrors = post_texts[["post_primary_key"]].copy()
 
-        labels_original_records = [
-            metrics_dict_for_text(str(text or ""), self._metrics)
-            for text in post_texts["original_text"]
-        ]
-        labels_mirror_records = [
-            metrics_dict_for_text(str(text or ""), self._metrics)
-            for text in post_texts["claude_mirror"]
-        ]
+        labels_original_metrics = metrics_frame_for_texts(
+            post_texts["original_text"].map(lambda text: str(text or "")), self._metrics
+        )
+        labels_mirror_metrics = metrics_frame_for_texts(
+            post_texts["claude_mirror"].map(lambda text: str(text or "")), self._metrics
+        )
 
         labels_original = pd.concat(
-            [labels_original.reset_index(drop=True), pd.DataFrame(labels_original_records)],
-            axis=1,
-        )
-        labels_mirrors = pd.concat(
-            [labels_mirrors.reset_index(drop=True), pd.DataFrame(labels_mirror_records)],
-            axis=1,
+            [labels_original, labels_original_metrics], axis=1
+        ).reset_index(drop=True)
+        labels_mirrors = pd.concat([labels_mirrors, labels_mirror_metrics], axis=1).reset_index(
+            drop=True
         )
 
         labels_original.to_csv(LABELS_ORIGINAL_PATH, index=False)
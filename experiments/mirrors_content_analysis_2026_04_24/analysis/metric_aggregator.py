@@ -15,8 +15,8 @@ from experiments.mirrors_content_analysis_2026_04_24.analysis.analysis_utils imp
     normalize_party,
     normalize_text,
     rows_both_posts_shown,
-    safe_divide,
 )
+from shared.textual_features.vectorized import safe_divide as safe_divide_array
 
 
 class TextMetric(Protocol):
@@ -60,6 +60,21 @@ def metrics_dict_for_text(text: str, metrics: Sequence[TextMetric]) -> dict[str,
     return {m.name: float(m.calculate(text)) for m in metrics}
 
 
+def metric_values(metric: TextMetric, texts: pd.Series) -> pd.Series:
+    """One metric over a string column: ``calculate_series`` if the metric has it, else per row."""
+    calculate_series = getattr(metric, "calculate_series", None)
+    if calculate_series is not None:
+        return calculate_series(texts).astype(float)
+    return texts.map(metric.calculate).astype(float)
+
+
+def metrics_frame_for_texts(texts: pd.Series, metrics: Sequence[TextMetric]) -> pd.DataFrame:
+    """All named metrics for a string column, one column per metric on ``texts.index``."""
+    return pd.DataFrame(
+        {m.name: metric_values(m, texts) for m in metrics}, index=texts.index
+    )
+
+
 class MetricAggregator:
     """Compute metric summaries and row-level pairwise outputs."""
 
@@ -73,7 +88,7 @@ class MetricAggregator:
         original_text = base["original_text"].map(normalize_text)
         return {
             metric.name: self._metric_calculation(
-                metric.name, original_text.map(metric.calculate), base
+                metric.name, metric_values(metric, original_text), base
             )
             for metric in self.metrics
         }
@@ -85,7 +100,7 @@ class MetricAggregator:
         mirror_text = base["mirror_text"].map(normalize_text)
         return {
             metric.name: self._metric_calculation(
-                metric.name, mirror_text.map(metric.calculate), base
+                metric.name, metric_values(metric, mirror_text), base
             )
             for metric in self.metrics
         }
@@ -181,37 +196,29 @@ class MetricAggregator:
         return both.loc[rows_both_posts_shown(both)].copy()
 
     def _build_pairwise_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
-        rows: list[dict[str, Any]] = []
         present_id_cols = [col for col in ID_COLUMNS if col in df.columns]
+        original_text = df["original_text"].map(normalize_text)
+        mirror_text = df["mirror_text"].map(normalize_text)
+        original_metrics = metrics_frame_for_texts(original_text, self.metrics)
+        mirror_metrics = metrics_frame_for_texts(mirror_text, self.metrics)
+
+        columns: dict[str, Any] = {col: df[col] for col in present_id_cols}
+        columns["original_text"] = original_text
+        columns["mirror_text"] = mirror_text
+        for metric_name in original_metrics.columns:
+            columns[f"original_{metric_name}"] = original_metrics[metric_name]
+        for metric_name in mirror_metrics.columns:
+            columns[f"mirror_{metric_name}"] = mirror_metrics[metric_name]
+        for metric in self.metrics:
+            columns[f"ratio_{metric.name}"] = pd.Series(
+                safe_divide_array(
+                    mirror_metrics[metric.name].to_numpy(dtype=float),
+                    original_metrics[metric.name].to_numpy(dtype=float),
+                ),
+                index=df.index,
+            )
 
-        for _, row in df.iterrows():
-            original_text = normalize_text(row.get("original_text", ""))
-            mirror_text = normalize_text(row.get("mirror_text", ""))
-
-            original_metrics = metrics_dict_for_text(original_text, self.metrics)
-            mirror_metrics = metrics_dict_for_text(mirror_text, self.metrics)
-
-            record: dict[str, Any] = {}
-            for col in present_id_cols:
-                record[col] = row[col]
-
-            record["original_text"] = original_text
-            record["mirror_text"] = mirror_text
-
-            for metric_name, value in original_metrics.items():
-                record[f"original_{metric_name}"] = value
-            for metric_name, value in mirror_metrics.items():
-                record[f"mirror_{metric_name}"] = value
-
-            for metric in self.metrics:
-                metric_name = metric.name
-                original_value = float(original_metrics[metric_name])
-                mirror_value = float(mirror_metrics[metric_name])
-                record[f"ratio_{metric_name}"] = safe_divide(mirror_value, original_value)
-
-            rows.append(record)
-
-        pairwise_df = pd.DataFrame(rows)
+        pairwise_df = pd.DataFrame(columns, index=df.index).reset_index(drop=True)
         return pairwise_df.replace([np.inf, -np.inf], 0.0).fillna(0.0)
 
     def _aggregate_for_group(
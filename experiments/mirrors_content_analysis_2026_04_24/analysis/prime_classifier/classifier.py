@@ -12,7 +12,9 @@ from pathlib import Path
 import pandas as pd
 
 from experiments.mirrors_content_analysis_2026_04_24.dataloader import Dataloader
+from shared.textual_features.result_cache import get_default_cache
 from shared.textual_features.prime import (
+    FEATURE_NAME,
     PrimeClassification,
     classify_post,
     classify_texts,
@@ -75,6 +77,8 @@ def classify_posts() -> tuple[pd.DataFrame, pd.DataFrame]:
 
     labels_original.to_csv(LABELS_ORIGINAL_PATH, index=False)
     labels_mirrors.to_csv(LABELS_MIRRORS_PATH, index=False)
+    stats = get_default_cache().stats(FEATURE_NAME)
+    print(f"Label cache: {stats.hits}/{stats.lookups} hits ({stats.hit_rate:.1%})")
     return labels_original, labels_mirrors
 
 
@@ -16,7 +16,7 @@ from experiments.mirrors_content_analysis_2026_04_24.analysis.interfaces import
 from experiments.mirrors_content_analysis_2026_04_24.analysis.metric_aggregator import (
     MetricAggregator,
     PairwiseAnalysisResult,
-    metrics_dict_for_text,
+    metrics_frame_for_texts,
 )
 from experiments.mirrors_content_analysis_2026_04_24.analysis.readability_complexity_analysis.metrics import (
     DEFAULT_READABILITY_METRICS,
@@ -123,22 +123,18 @@ class ReadabilityComplexityAnalyzer:
         labels_original = post_texts[["post_primary_key"]].copy()
         labels_mirrors = post_texts[["post_primary_key"]].copy()
 
-        labels_original_records = [
-            metrics_dict_for_text(str(text or ""), self._metrics)
-            for text in post_texts["original_text"]
-        ]
-        labels_mirror_records = [
-            metrics_dict_for_text(str(text or ""), self._metrics)
-            for text in post_texts["claude_mirror"]
-        ]
+        labels_original_metrics = metrics_frame_for_texts(
+            post_texts["original_text"].map(lambda text: str(text or "")), self._metrics
+        )
+        labels_mirror_metrics = metrics_frame_for_texts(
+            post_texts["claude_mirror"].map(lambda text: str(text or "")), self._metrics
+        )
 
         labels_original = pd.concat(
-            [labels_original.reset_index(drop=True), pd.DataFrame(labels_original_records)],
-            axis=1,
-        )
-        labels_mirrors = pd.concat(
-            [labels_mirrors.reset_index(drop=True), pd.DataFrame(labels_mirror_records)],
-            axis=1,
+            [labels_original, labels_original_metrics], axis=1
+        ).reset_index(drop=True)
+        labels_mirrors = pd.concat([labels_mirrors, labels_mirror_metrics], axis=1).reset_index(
+            drop=True
         )
 
         labels_original.to_csv(LABELS_ORIGINAL_PATH, index=False)
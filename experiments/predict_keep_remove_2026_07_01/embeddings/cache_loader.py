@@ -1,24 +1,21 @@
-"""Local-cached embedding loader with progress bars.
+"""Local-cached embedding loader.
 
 We load embeddings for the (original_text, mirror_text) pair by:
   1) computing an embedding identity hash (text + model_id + dims + normalize)
-  2) looking up the S3 key via DynamoDB (embedding_id -> s3_key)
-  3) downloading the embedding vector from S3 if not present in a local cache
+  2) looking up the S3 keys via DynamoDB BatchGetItem (embedding_id -> s3_key)
+  3) downloading the embedding vectors from S3 if not present in a local cache
 
-The cache is stored on disk keyed by `embedding_id`, so repeated training runs
+The cache is the shared local embedding store under ``cache_dir`` (older
+``embeddings/<id>.npy`` files are still read), so repeated training runs
 avoid re-downloading embeddings.
 """
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Literal
 
-import numpy as np
-from tqdm import tqdm
-
 from experiments.simplified_predict_remove_2026_05_13.experiment_bedrock_embeddings import (
     AWS_REGION as BEDROCK_AWS_REGION,
     BEDROCK_MODEL_ID,
@@ -33,9 +30,8 @@ from experiments.simplified_predict_remove_2026_05_13.generate_embeddings import
     TEXT_ROLE_ORIGINAL,
     validate_post_ids_unique,
 )
-from lib.aws.dynamodb import DynamoDBEmbeddingIndex
 from lib.aws.embedding_identity import embedding_identity_sha256
-from lib.aws.s3 import S3
+from shared.embeddings.cache import load_embeddings_by_ids, make_embedding_cache_clients
 
 
 TextRole = Literal["original_text", "mirror_text"]
@@ -48,11 +44,6 @@ class EmbeddingCacheStats:
     cache_misses: int
 
 
-def _cache_path(cache_dir: Path, embedding_id: str) -> Path:
-    # Store numpy arrays for fast loading.
-    return cache_dir / "embeddings" / f"{embedding_id}.npy"
-
-
 def load_embeddings_via_dynamodb_and_s3_with_cache(
     df,
     *,
@@ -84,73 +75,40 @@ def load_embeddings_via_dynamodb_and_s3_with_cache(
         raise ValueError("cache_dir is required so embeddings can be cached locally.")
     cache_root.mkdir(parents=True, exist_ok=True)
 
-    # Clients (kept outside the inner loop).
-    s3 = S3(bucket_name, region_name=BEDROCK_AWS_REGION)
-    ddb = DynamoDBEmbeddingIndex(table_name, region_name=BEDROCK_AWS_REGION)
+    clients = make_embedding_cache_clients(
+        bucket=bucket_name, table=table_name, region_name=BEDROCK_AWS_REGION
+    )
 
-    # Pre-materialize tasks so tqdm knows the total.
-    tasks: list[tuple[str, TextRole, str, str]] = []
+    tasks: list[tuple[str, TextRole, str]] = []
     for _, r in df.iterrows():
         pid = str(r["post_id"])
-        ot = str(r["original_text"])
-        mt = str(r["mirror_text"])
-
-        eid_o = embedding_identity_sha256(
-            ot, model_id=model_id, dimensions=dimensions, normalize=normalize
-        )
-        eid_m = embedding_identity_sha256(
-            mt, model_id=model_id, dimensions=dimensions, normalize=normalize
+        pair = ((TEXT_ROLE_ORIGINAL, r["original_text"]), (TEXT_ROLE_MIRROR, r["mirror_text"]))
+        for role, text in pair:
+            eid = embedding_identity_sha256(
+                str(text), model_id=model_id, dimensions=dimensions, normalize=normalize
+            )
+            tasks.append((pid, role, eid))
+
+    # Local store first, then one BatchGetItem pass and pooled S3 downloads
+    # for the rest. Remote hits are appended to the local store.
+    loaded = load_embeddings_by_ids(
+        [eid for _, _, eid in tasks],
+        clients=clients,
+        cache_dir=cache_root,
+        dimensions=dimensions,
+    )
+    if not loaded.found.all():
+        missing = [eid for (_, _, eid), ok in zip(tasks, loaded.found, strict=True) if not ok]
+        raise KeyError(
+            f"No DynamoDB embedding row for {len(set(missing))} embedding_id(s), "
+            f"e.g. {missing[0]!r}"
         )
 
-        tasks.append((pid, TEXT_ROLE_ORIGINAL, ot, eid_o))
-        tasks.append((pid, TEXT_ROLE_MIRROR, mt, eid_m))
-
     lookup: dict[tuple[str, str], list[float]] = {}
-    cache_hits = 0
-    cache_misses = 0
-
-    # In-memory dedupe to avoid repeated disk reads/downloads for repeated text.
-    embedding_id_to_vec: dict[str, np.ndarray] = {}
-
-    for pid, role, _text, embedding_id in tqdm(
-        tasks,
-        desc="Loading embeddings (cached)",
-        unit="embedding_instance",
-    ):
-        key = (pid, str(role))
-        if key in lookup:
-            continue
-
-        cached = _cache_path(cache_root, embedding_id)
-        if embedding_id in embedding_id_to_vec:
-            vec = embedding_id_to_vec[embedding_id]
-            cache_hits += 1
-        elif cached.exists():
-            vec = np.load(cached)
-            embedding_id_to_vec[embedding_id] = vec
-            cache_hits += 1
-        else:
-            # Pointer row: embedding_id -> s3_key
-            d_row = ddb.get_item(embedding_id)
-            if d_row is None:
-                raise KeyError(f"No DynamoDB embedding row for embedding_id={embedding_id!r}")
-            s3_key = str(d_row.get("s3_key", ""))
-            if not s3_key.strip():
-                raise KeyError(f"s3_key missing from DynamoDB row {embedding_id!r}")
-
-            raw = s3.get_bytes(s3_key)
-            parsed = json.loads(raw.decode("utf-8"))
-            emb = parsed.get("embedding")
-            if emb is None or not isinstance(emb, list):
-                raise RuntimeError(f"S3 embedding invalid for embedding_id={embedding_id!r}")
-
-            vec = np.asarray([float(x) for x in emb], dtype=np.float64)
-            cached.parent.mkdir(parents=True, exist_ok=True)
-            np.save(cached, vec)
-            embedding_id_to_vec[embedding_id] = vec
-            cache_misses += 1
-
-        lookup[key] = [float(x) for x in vec.ravel().tolist()]
+    for i, (pid, role, _eid) in enumerate(tasks):
+        lookup.setdefault((pid, str(role)), loaded.matrix[i].astype(float).tolist())
+    cache_misses = loaded.stats.remote_hits
+    cache_hits = len(tasks) - cache_misses
 
     stats = EmbeddingCacheStats(
         total_embedding_instances=len(tasks),
@@ -8,6 +8,7 @@ from pathlib import Path
 
 import matplotlib.pyplot as plt
 import numpy as np
+import pandas as pd
 
 from experiments.predict_keep_remove_2026_07_01.data.dataloader import Dataloader
 from experiments.predict_keep_remove_2026_07_01.reports.paths import (
@@ -19,20 +20,14 @@ from experiments.simplified_predict_remove_2026_05_13.experiment_bedrock_embeddi
     EMBEDDING_DIMENSIONS,
 )
 from lib.aws.embedding_identity import embedding_identity_sha256
+from shared.embeddings.similarity import pair_cosine
 
 
 def _load_embedding(cache_dir: Path, embedding_id: str) -> np.ndarray:
     path = cache_dir / "embeddings" / f"{embedding_id}.npy"
     if not path.exists():
         raise FileNotFoundError(f"Missing embedding cache file: {path}")
-    return np.load(path).astype(np.float64, copy=False).ravel()
-
-
-def _cosine(u: np.ndarray, v: np.ndarray) -> float:
-    denom = float(np.linalg.norm(u) * np.linalg.norm(v))
-    if denom == 0.0:
-        return 0.0
-    return float(np.dot(u, v) / denom)
+    return np.load(path).astype(np.float32, copy=False).ravel()
 
 
 def compute_cosine_similarities(*, cache_dir: Path) -> list[float]:
@@ -44,31 +39,25 @@ def compute_cosine_similarities(*, cache_dir: Path) -> list[float]:
     dimensions = EMBEDDING_DIMENSIONS
     normalize = True
 
-    cos_sims: list[float] = []
-    embedding_cache: dict[str, np.ndarray] = {}
-
-    for _, row in train_df.iterrows():
-        ot = str(row["original_text"])
-        mt = str(row["mirror_text"])
-
-        eid_o = embedding_identity_sha256(ot, model_id=model_id, dimensions=dimensions, normalize=normalize)
-        eid_m = embedding_identity_sha256(mt, model_id=model_id, dimensions=dimensions, normalize=normalize)
-
-        if eid_o in embedding_cache:
-            vo = embedding_cache[eid_o]
-        else:
-            vo = _load_embedding(cache_dir, eid_o)
-            embedding_cache[eid_o] = vo
-
-        if eid_m in embedding_cache:
-            vm = embedding_cache[eid_m]
-        else:
-            vm = _load_embedding(cache_dir, eid_m)
-            embedding_cache[eid_m] = vm
-
-        cos_sims.append(_cosine(vo, vm))
-
-    return cos_sims
+    def ids_for(texts: pd.Series) -> list[str]:
+        return [
+            embedding_identity_sha256(str(t), model_id=model_id, dimensions=dimensions, normalize=normalize)
+            for t in texts
+        ]
+
+    if train_df.empty:
+        return []
+    ids_o = ids_for(train_df["original_text"])
+    ids_m = ids_for(train_df["mirror_text"])
+    unique_ids = list(dict.fromkeys(ids_o + ids_m))
+    matrix = np.vstack([_load_embedding(cache_dir, eid) for eid in unique_ids])
+    row_of = {eid: i for i, eid in enumerate(unique_ids)}
+
+    cos_sims = pair_cosine(
+        matrix[[row_of[e] for e in ids_o]],
+        matrix[[row_of[e] for e in ids_m]],
+    )
+    return cos_sims.astype(np.float64).tolist()
 
 
 def main() -> None:
@@ -44,18 +44,19 @@ def main() -> None:
     result_a = create_embedding(similar_a)
     result_b = create_embedding(similar_b)
 
-    times: list[float] = create_embedding.embedding_times  # type: ignore[attr-defined]
-    avg_s = sum(times) / len(times)
+    latency = create_embedding.latency  # type: ignore[attr-defined]
 
     sim = cosine_similarity(result_a["embedding"], result_b["embedding"])
 
     print(f"model_id={result_a['model_id']} dimensions={result_a['dimensions']} normalize={result_a['normalize']}")
     print(f"cosine_similarity(similar pair): {sim:.6f}")
     print(f"inputTextTokenCount: {result_a['input_text_token_count']}, {result_b['input_text_token_count']}")
-    print("per-call latency (seconds):")
-    for i, dt in enumerate(times):
-        print(f"  embedding {i + 1}: {dt:.4f}s")
-    print(f"average embedding latency: {avg_s:.4f}s ({avg_s * 1000:.2f} ms)")
+    print(
+        f"embedding latency over {latency.count} calls: "
+        f"mean={latency.mean:.4f}s p50={latency.quantile(0.5):.4f}s "
+        f"p90={latency.quantile(0.9):.4f}s"
+    )
+    print(f"average embedding latency: {latency.mean:.4f}s ({latency.mean * 1000:.2f} ms)")
 
 
 if __name__ == "__main__":
@@ -1,6 +1,7 @@
-"""Bedrock embedding → S3 JSON + DynamoDB pointer → reload → vector equality check.
+"""Bedrock embedding → S3 binary payload + DynamoDB pointer → reload → vector equality check.
 
-Invokes Titan once, stores the embedding JSON on S3,
+Invokes Titan once, stores the embedding as a binary payload
+(``shared.embeddings.payload``) on S3,
 records bucket/key/metadata in DynamoDB, then reloads strictly through the DynamoDB row.
 
 Run from repository root:
@@ -10,11 +11,12 @@ Run from repository root:
 
 from __future__ import annotations
 
-import json
 import math
 from datetime import datetime, timezone
 from typing import Any
 
+import numpy as np
+
 from experiments.simplified_predict_remove_2026_05_13.experiment_bedrock_embeddings import (
     AWS_REGION as BEDROCK_AWS_REGION,
     BEDROCK_MODEL_ID,
@@ -24,6 +26,13 @@ from experiments.simplified_predict_remove_2026_05_13.experiment_bedrock_embeddi
 from lib.aws.dynamodb import DynamoDBEmbeddingIndex
 from lib.aws.embedding_identity import embedding_identity_sha256
 from lib.aws.s3 import S3
+from shared.embeddings.payload import (
+    BINARY_CONTENT_TYPE,
+    BINARY_KEY_SUFFIX,
+    PAYLOAD_FORMAT_BINARY,
+    decode_embedding_payload,
+    encode_embedding_payload,
+)
 
 AWS_REGION = BEDROCK_AWS_REGION
 S3_BUCKET = "jspsych-mirror-view-3"
@@ -67,7 +76,7 @@ def main() -> None:
         dimensions=EMBEDDING_DIMENSIONS,
         normalize=normalize,
     )
-    s3_key = f"{S3_PREFIX}{embedding_id}.json"
+    s3_key = f"{S3_PREFIX}{embedding_id}{BINARY_KEY_SUFFIX}"
 
     s3 = S3(bucket_name, region_name=AWS_REGION)
     ddb = DynamoDBEmbeddingIndex(table_name, region_name=AWS_REGION)
@@ -80,8 +89,16 @@ def main() -> None:
         normalize=normalize,
     )
 
-    body = json.dumps(fresh, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
-    s3.upload_bytes(s3_key, body, content_type="application/json")
+    body = encode_embedding_payload(
+        fresh["embedding"],
+        model_id=BEDROCK_MODEL_ID,
+        normalize=normalize,
+        extra={
+            "text": fresh.get("text"),
+            "input_text_token_count": fresh.get("input_text_token_count"),
+        },
+    )
+    s3.upload_bytes(s3_key, body, content_type=BINARY_CONTENT_TYPE)
 
     item = {
         "embedding_id": embedding_id,
@@ -92,6 +109,7 @@ def main() -> None:
         "model_id": BEDROCK_MODEL_ID,
         "dimensions": EMBEDDING_DIMENSIONS,
         "normalize": normalize,
+        "payload_format": PAYLOAD_FORMAT_BINARY,
     }
     ddb.put_item(item)
 
@@ -105,10 +123,12 @@ def main() -> None:
             f"DynamoDB s3_bucket mismatch: {loaded_bucket!r} != {bucket_name!r}"
         )
 
-    raw_json = s3.get_bytes(loaded_key)
-    parsed = json.loads(raw_json.decode("utf-8"))
-    loaded_embedding = parsed["embedding"]
+    decoded = decode_embedding_payload(s3.get_bytes(loaded_key))
+    loaded_embedding = [float(x) for x in decoded.embedding]
     fresh_embedding = fresh["embedding"]
+    if decoded.payload_format == PAYLOAD_FORMAT_BINARY:
+        # Binary payloads store float32; compare against the same rounding.
+        fresh_embedding = np.asarray(fresh_embedding, dtype=np.float32).astype(float).tolist()
 
     ok, how = _vectors_equivalent(fresh_embedding, loaded_embedding)
     if not ok:
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 import math
 from collections.abc import Mapping, MutableMapping, Sequence
 from typing import Any
@@ -35,9 +34,8 @@ from experiments.simplified_predict_remove_2026_05_13.generate_embeddings import
     TEXT_ROLE_ORIGINAL,
     validate_post_ids_unique,
 )
-from lib.aws.dynamodb import DynamoDBEmbeddingIndex
 from lib.aws.embedding_identity import embedding_identity_sha256
-from lib.aws.s3 import S3
+from shared.embeddings.cache import load_embeddings_by_ids, make_embedding_cache_clients
 
 JOIN_COL_ORIGINAL = "embedding_original_text"
 JOIN_COL_MIRROR = "embedding_mirror_text"
@@ -109,37 +107,6 @@ def join_embeddings(
     return out
 
 
-def _fetch_embedding_by_text(
-    text: str,
-    *,
-    s3: S3,
-    ddb: DynamoDBEmbeddingIndex,
-    model_id: str,
-    dimensions: int,
-    normalize: bool,
-) -> list[float]:
-    eid = embedding_identity_sha256(
-        text,
-        model_id=model_id,
-        dimensions=dimensions,
-        normalize=normalize,
-    )
-    d_row = ddb.get_item(eid)
-    if d_row is None:
-        raise KeyError(f"No DynamoDB embedding row for embedding_id={eid!r}")
-
-    key = str(d_row.get("s3_key", ""))
-    if not key.strip():
-        raise KeyError(f"s3_key missing from DynamoDB row {eid!r}")
-
-    raw = s3.get_bytes(key)
-    parsed = json.loads(raw.decode("utf-8"))
-    emb = parsed.get("embedding")
-    if emb is None or not isinstance(emb, list):
-        raise RuntimeError(f"S3 embedding invalid for embedding_id={eid!r}")
-    return [float(x) for x in emb]
-
-
 def load_embeddings_via_dynamodb_and_s3(
     df: pd.DataFrame,
     *,
@@ -149,39 +116,41 @@ def load_embeddings_via_dynamodb_and_s3(
     dimensions: int = EMBEDDING_DIMENSIONS,
     normalize: bool = True,
 ) -> Mapping[tuple[str, str], list[float]]:
-    """Fetch embeddings for ``df`` rows from S3 pointers in DynamoDB (identity key)."""
+    """Fetch embeddings for ``df`` rows from S3 pointers in DynamoDB (identity key).
+
+    Pointers are read with BatchGetItem and payloads fetched concurrently via
+    :func:`shared.embeddings.cache.load_embeddings_by_ids`.
+    """
     validate_post_ids_unique(df)
     for c in ("original_text", "mirror_text"):
         if c not in df.columns:
             raise KeyError(c)
 
-    b = (bucket or S3_BUCKET).strip()
-    t = (table or DYNAMODB_TABLE_NAME).strip()
-    s3 = S3(b, region_name=AWS_REGION)
-    ddb = DynamoDBEmbeddingIndex(t, region_name=AWS_REGION)
-
-    lookup: dict[tuple[str, str], list[float]] = {}
-
-    def put(pid: str, role: str, text: str) -> None:
-        key = (str(pid), str(role))
-        if key in lookup:
-            return
-        vec = _fetch_embedding_by_text(
-            text,
-            s3=s3,
-            ddb=ddb,
-            model_id=model_id,
-            dimensions=dimensions,
-            normalize=normalize,
-        )
-        lookup[key] = vec
-
-    for _, r in df.iterrows():
-        pid = str(r["post_id"])
-        put(pid, TEXT_ROLE_ORIGINAL, str(r["original_text"]))
-        put(pid, TEXT_ROLE_MIRROR, str(r["mirror_text"]))
+    clients = make_embedding_cache_clients(
+        bucket=bucket or S3_BUCKET, table=table or DYNAMODB_TABLE_NAME, region_name=AWS_REGION
+    )
 
-    return lookup
+    keys: list[tuple[str, str]] = []
+    ids: list[str] = []
+    for pid, ot, mt in zip(
+        df["post_id"].astype(str), df["original_text"].astype(str), df["mirror_text"].astype(str)
+    ):
+        for role, text in ((TEXT_ROLE_ORIGINAL, ot), (TEXT_ROLE_MIRROR, mt)):
+            keys.append((pid, role))
+            ids.append(
+                embedding_identity_sha256(
+                    text, model_id=model_id, dimensions=dimensions, normalize=normalize
+                )
+            )
+
+    loaded = load_embeddings_by_ids(ids, clients=clients, dimensions=dimensions)
+    if not loaded.found.all():
+        missing = [eid for eid, ok in zip(ids, loaded.found, strict=True) if not ok]
+        raise KeyError(
+            f"No DynamoDB embedding row for {len(set(missing))} embedding_id(s), "
+            f"e.g. {missing[0]!r}"
+        )
+    return {key: loaded.matrix[i].astype(float).tolist() for i, key in enumerate(keys)}
 
 
 def stack_embedding_dense_block(orig: np.ndarray, mirror: np.ndarray) -> np.ndarray:
@@ -8,12 +8,11 @@ Run from repo root::
 from __future__ import annotations
 
 import argparse
-import json
 import math
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
-from typing import Any, Literal, NamedTuple
+from typing import Literal, NamedTuple
 
+import numpy as np
 import pandas as pd
 from rich.console import Console
 from tqdm import tqdm
@@ -22,7 +21,6 @@ from experiments.simplified_predict_remove_2026_05_13.dataloader import Dataload
 from experiments.simplified_predict_remove_2026_05_13.experiment_bedrock_embeddings import (
     BEDROCK_MODEL_ID,
     EMBEDDING_DIMENSIONS,
-    create_embedding,
 )
 from experiments.simplified_predict_remove_2026_05_13.experiment_create_embedding_and_upload import (
     AWS_REGION,
@@ -31,8 +29,10 @@ from experiments.simplified_predict_remove_2026_05_13.experiment_create_embeddin
     S3_PREFIX,
 )
 from lib.aws.dynamodb import DynamoDBEmbeddingIndex
-from lib.aws.embedding_identity import embedding_identity_sha256
 from lib.aws.s3 import S3
+from shared.embeddings.cache import DEFAULT_S3_MAX_WORKERS, EmbeddingCacheClients
+from shared.embeddings.payload import decode_embedding_payload
+from shared.embeddings.resolver import resolve_embeddings
 
 TEXT_ROLE_ORIGINAL: Literal["original_text"] = "original_text"
 TEXT_ROLE_MIRROR: Literal["mirror_text"] = "mirror_text"
@@ -77,12 +77,8 @@ class EmbeddingGenerationResult:
     failed_verifications: list[VerificationFailure]
 
 
-def _utc_iso_z() -> str:
-    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-
-
 def _vectors_equivalent(a: list[float], b: list[float]) -> tuple[bool, str]:
-    """Strict equality preferred; fallback to tolerance after JSON round-trip."""
+    """Strict equality preferred; fallback to tolerance after a payload round-trip."""
     if a == b:
         return True, "strict_list_equality"
     if len(a) != len(b):
@@ -142,7 +138,10 @@ def generate_embeddings(
     limit: int | None = None,
     skip_table_create: bool = False,
 ) -> EmbeddingGenerationResult:
-    """Compute embeddings via Bedrock, write S3 payloads and Dynamo pointers. No verification."""
+    """Resolve embeddings through the identity cache, embedding and writing only misses.
+
+    ``embeddings_written`` counts the unique texts sent to Bedrock. No verification.
+    """
     bucket_name = (bucket or S3_BUCKET).strip()
     tbl = (table or DYNAMODB_TABLE_NAME).strip()
     prefix_raw = (s3_prefix if s3_prefix is not None else S3_PREFIX)
@@ -156,60 +155,40 @@ def generate_embeddings(
     if not instances:
         raise ValueError("No text instances after filtering.")
 
-    s3 = S3(bucket_name, region_name=AWS_REGION)
+    s3 = S3(bucket_name, region_name=AWS_REGION, max_pool_connections=DEFAULT_S3_MAX_WORKERS)
     ddb = DynamoDBEmbeddingIndex(tbl, region_name=AWS_REGION)
     if not skip_table_create:
         ddb.ensure_table_exists()
 
-    generated: list[EmbeddingInstanceRow] = []
-    for post_id, text_role, text in tqdm(instances, desc="generate embeddings", unit="emb"):
-        emb_id = embedding_identity_sha256(
-            text,
-            model_id=model_id,
-            dimensions=dimensions,
-            normalize=normalize,
-        )
-        key = f"{normalized_prefix}{emb_id}.json"
-        payload: dict[str, Any] = create_embedding(
-            text,
-            model_id=model_id,
-            dimensions=dimensions,
-            normalize=normalize,
-        )
-        body = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode(
-            "utf-8"
-        )
-        s3.upload_bytes(key, body, content_type="application/json")
-        row_item = {
-            "embedding_id": emb_id,
-            "s3_bucket": bucket_name,
-            "s3_key": key,
-            "text_sha256": emb_id,
-            "created_at": _utc_iso_z(),
-            "model_id": model_id,
-            "dimensions": dimensions,
-            "normalize": normalize,
-            "post_id": post_id,
-            "text_role": text_role,
-        }
-        ddb.put_item(row_item)
-
-        vec = payload["embedding"]
-        if not isinstance(vec, list):
-            raise TypeError(f"embedding must be a list[float], got {type(vec)!r}")
+    # Cache hits are served from DynamoDB → S3; only misses reach Bedrock and
+    # are written back (binary S3 payloads, batched DynamoDB pointers).
+    resolved = resolve_embeddings(
+        [text for _, _, text in instances],
+        model_id=model_id,
+        dimensions=dimensions,
+        normalize=normalize,
+        clients=EmbeddingCacheClients(s3=s3, ddb=ddb),
+        s3_prefix=normalized_prefix,
+    )
+    pointers = ddb.batch_get_items(resolved.embedding_ids, projection=("s3_bucket", "s3_key"))
 
+    generated: list[EmbeddingInstanceRow] = []
+    for (post_id, text_role, text), emb_id, vec in zip(
+        instances, resolved.embedding_ids, resolved.matrix, strict=True
+    ):
+        pointer = pointers.get(emb_id, {})
         generated.append(
             EmbeddingInstanceRow(
                 post_id=post_id,
                 text_role=text_role,
                 text=text,
                 embedding_id=emb_id,
-                s3_bucket=bucket_name,
-                s3_key=key,
+                s3_bucket=str(pointer.get("s3_bucket", bucket_name)),
+                s3_key=str(pointer.get("s3_key", "")),
                 model_id=model_id,
                 dimensions=dimensions,
                 normalize=normalize,
-                embedding_vector=[float(x) for x in vec],
+                embedding_vector=vec.astype(float).tolist(),
             )
         )
 
@@ -221,7 +200,7 @@ def generate_embeddings(
         dimensions=dimensions,
         normalize=normalize,
         text_instances=len(instances),
-        embeddings_written=len(generated),
+        embeddings_written=resolved.stats.embedded,
         embeddings_verified=0,
         generated_rows=generated,
         failed_verifications=[],
@@ -237,8 +216,11 @@ def verify_embeddings(
     s3 = S3(result.s3_bucket, region_name=AWS_REGION)
     ddb = DynamoDBEmbeddingIndex(result.dynamodb_table, region_name=AWS_REGION)
 
+    d_rows = ddb.batch_get_items(
+        [row.embedding_id for row in result.generated_rows], projection=("s3_bucket", "s3_key")
+    )
     for row in tqdm(result.generated_rows, desc="verify embeddings", unit="chk"):
-        d_row = ddb.get_item(row.embedding_id)
+        d_row = d_rows.get(row.embedding_id)
         if d_row is None:
             failures.append(
                 VerificationFailure(
@@ -262,31 +244,21 @@ def verify_embeddings(
             )
             continue
 
-        raw = s3.get_bytes(str(k))
-        parsed = json.loads(raw.decode("utf-8"))
-        loaded = parsed.get("embedding")
-        if loaded is None:
-            failures.append(
-                VerificationFailure(
-                    row.post_id,
-                    row.text_role,
-                    row.embedding_id,
-                    "missing_embedding_in_json",
-                )
-            )
-            continue
-        if not isinstance(loaded, list):
+        try:
+            decoded = decode_embedding_payload(s3.get_bytes(str(k)))
+        except ValueError as e:
             failures.append(
                 VerificationFailure(
                     row.post_id,
                     row.text_role,
                     row.embedding_id,
-                    f"s3_embedding_not_list:{type(loaded)!r}",
+                    f"undecodable_s3_payload:{e}",
                 )
             )
             continue
 
-        lv = [float(x) for x in loaded]
+        # Resolved vectors are float32; legacy JSON payloads are compared at that precision.
+        lv = np.asarray(decoded.embedding, dtype=np.float32).astype(float).tolist()
         ok, detail = _vectors_equivalent(row.embedding_vector, lv)
         if not ok:
             failures.append(
@@ -45,6 +45,14 @@ _REQUIRED_STIMULI_COLUMNS = (
     "sample_toxicity_type",
     "sampled_stance",
 )
+# Results columns read by the cohort build (the full export has many more).
+_TRIAL_COLUMNS = [
+    "evaluation_mode",
+    "decision",
+    "post_id",
+    "original_text",
+    "mirror_text",
+]
 
 
 def _load_slim_trial_frame(raw: pd.DataFrame) -> pd.DataFrame:
@@ -65,8 +73,7 @@ def _load_slim_trial_frame(raw: pd.DataFrame) -> pd.DataFrame:
     KeyError
         When required columns are missing.
     """
-    required = {"evaluation_mode", "decision", "post_id", "original_text", "mirror_text"}
-    missing = required - set(raw.columns)
+    missing = set(_TRIAL_COLUMNS) - set(raw.columns)
     if missing:
         raise KeyError(f"Results missing required columns: {sorted(missing)}")
 
@@ -302,7 +309,7 @@ def build_four_cell_cohort(
     raw_frame = (
         raw
         if raw is not None
-        else load_dataset(STUDY_PHASE_2_PART_2_RESULTS_FULL, low_memory=False)
+        else load_dataset(STUDY_PHASE_2_PART_2_RESULTS_FULL, columns=_TRIAL_COLUMNS)
     )
     stimuli_frame = (
         stimuli
@@ -7,7 +7,6 @@ Run from repo root::
 
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 import pandas as pd
@@ -114,40 +113,30 @@ def _compute_deterministic_metrics(texts: list[str]) -> pd.DataFrame:
 
 def _classify_column(
     texts: list[str],
-    classify_fn,
+    classify_texts_fn,
     field_name: str,
-    desc: str,
 ) -> list[bool]:
-    """Classify each text with ``classify_fn`` and return boolean labels.
+    """Classify ``texts`` with a batched ``classify_texts`` and return boolean labels.
 
     Parameters
     ----------
     texts
         Original post texts.
-    classify_fn
-        Callable returning a structured label with ``field_name``.
+    classify_texts_fn
+        Batched classifier (e.g. ``valence.classify_texts``) returning one
+        structured label with ``field_name`` per text, in input order.
     field_name
         Attribute to read from each classification result.
-    desc
-        Progress bar description.
 
     Returns
     -------
     list[bool]
         One label per input text, in input order.
     """
-    labels: list[bool | None] = [None] * len(texts)
-    with ThreadPoolExecutor(max_workers=_CLASSIFIER_WORKERS) as executor:
-        future_to_idx = {
-            executor.submit(classify_fn, text): idx for idx, text in enumerate(texts)
-        }
-        for future in tqdm(as_completed(future_to_idx), total=len(texts), desc=desc):
-            idx = future_to_idx[future]
-            result = future.result()
-            labels[idx] = bool(getattr(result, field_name))
-    if any(label is None for label in labels):
+    results = classify_texts_fn(texts, max_concurrency=_CLASSIFIER_WORKERS)
+    if len(results) != len(texts):
         raise RuntimeError(f"Incomplete labels for {field_name}")
-    return [bool(label) for label in labels]
+    return [bool(getattr(result, field_name)) for result in results]
 
 
 def _build_per_post_features(cohort: pd.DataFrame) -> pd.DataFrame:
@@ -165,13 +154,9 @@ def _build_per_post_features(cohort: pd.DataFrame) -> pd.DataFrame:
     """
     texts = cohort["original_text"].astype(str).tolist()
     metrics = _compute_deterministic_metrics(texts)
-    is_positive = _classify_column(
-        texts, valence.classify_post, "is_positive", "Valence"
-    )
-    is_intergroup = _classify_column(
-        texts, intergroup.classify_post, "is_intergroup", "Intergroup"
-    )
-    is_prime = _classify_column(texts, prime.classify_post, "is_prime", "PRIME")
+    is_positive = _classify_column(texts, valence.classify_texts, "is_positive")
+    is_intergroup = _classify_column(texts, intergroup.classify_texts, "is_intergroup")
+    is_prime = _classify_column(texts, prime.classify_texts, "is_prime")
 
     out = cohort[["message_id", "cell", "sample_toxicity_type"]].copy()
     out = pd.concat([out.reset_index(drop=True), metrics.reset_index(drop=True)], axis=1)
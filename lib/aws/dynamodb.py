@@ -2,13 +2,53 @@
 
 from __future__ import annotations
 
+import random
+import time
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
 from typing import Any
 
 import boto3
 from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
 from botocore.exceptions import ClientError
 
+from lib.telemetry import TELEMETRY
+
 _serializer = TypeSerializer()
+_deserializer = TypeDeserializer()
+
+BATCH_GET_MAX_KEYS = 100
+BATCH_WRITE_MAX_ITEMS = 25
+BATCH_MAX_ATTEMPTS = 8
+_BATCH_BACKOFF_BASE_SECONDS = 0.05
+_BATCH_BACKOFF_CAP_SECONDS = 5.0
+_THROTTLE_ERROR_CODES = frozenset(
+    {
+        "ProvisionedThroughputExceededException",
+        "ThrottlingException",
+        "RequestLimitExceeded",
+    }
+)
+
+
+@dataclass
+class BatchCallMetrics:
+    """Counters for one ``batch_get_items`` / ``batch_put_items`` call.
+
+    ``unprocessed_retries`` counts requests re-sent for ``UnprocessedKeys`` /
+    ``UnprocessedItems``; ``throttles`` counts throttling ``ClientError``s.
+    """
+
+    operation: str
+    requests: int = 0
+    items: int = 0
+    consumed_capacity_units: float = 0.0
+    unprocessed_retries: int = 0
+    throttles: int = 0
+    seconds: float = 0.0
+
+
+MetricsHook = Callable[[BatchCallMetrics], None]
 
 
 def _serialize_row(item: dict[str, Any]) -> dict[str, Any]:
@@ -16,8 +56,37 @@ def _serialize_row(item: dict[str, Any]) -> dict[str, Any]:
 
 
 def _deserialize_row(item: dict[str, Any]) -> dict[str, Any]:
-    d = TypeDeserializer()
-    return {k: d.deserialize(v) for k, v in item.items()}
+    return {k: _deserializer.deserialize(v) for k, v in item.items()}
+
+
+def _backoff_sleep(attempt: int) -> None:
+    """Full-jitter exponential backoff."""
+    cap = min(_BATCH_BACKOFF_CAP_SECONDS, _BATCH_BACKOFF_BASE_SECONDS * (2**attempt))
+    time.sleep(random.uniform(0.0, cap))
+
+
+def _is_throttle(exc: ClientError) -> bool:
+    return exc.response.get("Error", {}).get("Code") in _THROTTLE_ERROR_CODES
+
+
+def _record_batch_telemetry(metrics: BatchCallMetrics) -> None:
+    op = metrics.operation
+    TELEMETRY.observe("dynamodb_call_seconds", metrics.seconds, operation=op)
+    TELEMETRY.incr("dynamodb_requests_total", metrics.requests, operation=op)
+    TELEMETRY.incr("dynamodb_items_total", metrics.items, operation=op)
+    TELEMETRY.incr("dynamodb_throttles_total", metrics.throttles, operation=op)
+    TELEMETRY.incr(
+        "dynamodb_unprocessed_retries_total", metrics.unprocessed_retries, operation=op
+    )
+    TELEMETRY.incr(
+        "dynamodb_consumed_capacity_units_total", metrics.consumed_capacity_units, operation=op
+    )
+
+
+def _consumed_units(resp: dict[str, Any]) -> float:
+    return float(
+        sum(c.get("CapacityUnits", 0.0) for c in resp.get("ConsumedCapacity") or [])
+    )
 
 
 class DynamoDBEmbeddingIndex:
@@ -37,7 +106,8 @@ class DynamoDBEmbeddingIndex:
     def ensure_table_exists(self, *, billing_mode: str = "PAY_PER_REQUEST") -> None:
         """Create the table if missing (on-demand billing by default).
 
-        IAM once: dynamodb:CreateTable, DescribeTable, plus runtime GetItem/PutItem.
+        IAM once: dynamodb:CreateTable, DescribeTable, plus runtime GetItem/PutItem
+        (and BatchGetItem/BatchWriteItem for the batch methods).
         """
         try:
             self._client.describe_table(TableName=self._table_name)
@@ -60,19 +130,167 @@ class DynamoDBEmbeddingIndex:
         waiter = self._client.get_waiter("table_exists")
         waiter.wait(TableName=self._table_name)
 
-    def get_item(self, embedding_id: str) -> dict[str, Any] | None:
-        resp = self._client.get_item(
-            TableName=self._table_name,
-            Key={"embedding_id": {"S": embedding_id}},
-            ConsistentRead=True,
-        )
+    def get_item(
+        self, embedding_id: str, *, consistent_read: bool = True
+    ) -> dict[str, Any] | None:
+        with TELEMETRY.time("dynamodb_call_seconds", operation="GetItem"):
+            resp = self._client.get_item(
+                TableName=self._table_name,
+                Key={"embedding_id": {"S": embedding_id}},
+                ConsistentRead=consistent_read,
+            )
         raw = resp.get("Item")
         if not raw:
             return None
         return _deserialize_row(raw)
 
     def put_item(self, item: dict[str, Any]) -> None:
-        self._client.put_item(
-            TableName=self._table_name,
-            Item=_serialize_row(item),
+        with TELEMETRY.time("dynamodb_call_seconds", operation="PutItem"):
+            self._client.put_item(
+                TableName=self._table_name,
+                Item=_serialize_row(item),
+            )
+
+    def batch_get_items(
+        self,
+        embedding_ids: Iterable[str],
+        *,
+        consistent_read: bool = True,
+        projection: Sequence[str] | None = None,
+        metrics_hook: MetricsHook | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Fetch many rows with BatchGetItem (100 keys per request).
+
+        Duplicate ids are requested once. ``UnprocessedKeys`` and throttling
+        errors are retried with jittered exponential backoff. Ids with no row
+        are absent from the result.
+
+        Parameters
+        ----------
+        consistent_read
+            Pass False for eventually consistent reads (half the read
+            capacity); rows written moments ago may be missed.
+        projection
+            Attribute names to return; ``embedding_id`` is always included.
+        metrics_hook
+            Called once with this call's :class:`BatchCallMetrics` (which is
+            also recorded in :data:`lib.telemetry.TELEMETRY`).
+
+        Raises
+        ------
+        RuntimeError
+            If keys remain unprocessed after ``BATCH_MAX_ATTEMPTS`` attempts.
+        """
+        metrics = BatchCallMetrics(operation="BatchGetItem")
+        started = time.perf_counter()
+        unique_ids = list(dict.fromkeys(str(e) for e in embedding_ids))
+        table_request = self._batch_get_options(consistent_read, projection)
+        rows: dict[str, dict[str, Any]] = {}
+        for start in range(0, len(unique_ids), BATCH_GET_MAX_KEYS):
+            chunk = unique_ids[start : start + BATCH_GET_MAX_KEYS]
+            request = {
+                self._table_name: {
+                    **table_request,
+                    "Keys": [{"embedding_id": {"S": e}} for e in chunk],
+                }
+            }
+            for raw in self._run_batch("batch_get_item", request, metrics):
+                row = _deserialize_row(raw)
+                rows[str(row["embedding_id"])] = row
+        metrics.items = len(rows)
+        metrics.seconds = time.perf_counter() - started
+        _record_batch_telemetry(metrics)
+        if metrics_hook is not None:
+            metrics_hook(metrics)
+        return rows
+
+    def batch_put_items(
+        self,
+        items: Iterable[dict[str, Any]],
+        *,
+        metrics_hook: MetricsHook | None = None,
+    ) -> int:
+        """Write many rows with BatchWriteItem (25 items per request).
+
+        Items sharing an ``embedding_id`` are collapsed (last wins), since
+        BatchWriteItem rejects duplicate keys in one request.
+        ``UnprocessedItems`` and throttling errors are retried with jittered
+        exponential backoff.
+
+        Returns
+        -------
+        int
+            Number of distinct rows written.
+
+        Raises
+        ------
+        KeyError
+            If an item has no ``embedding_id``.
+        RuntimeError
+            If items remain unprocessed after ``BATCH_MAX_ATTEMPTS`` attempts.
+        """
+        metrics = BatchCallMetrics(operation="BatchWriteItem")
+        started = time.perf_counter()
+        by_id = {str(item["embedding_id"]): item for item in items}
+        rows = list(by_id.values())
+        for start in range(0, len(rows), BATCH_WRITE_MAX_ITEMS):
+            chunk = rows[start : start + BATCH_WRITE_MAX_ITEMS]
+            request = {
+                self._table_name: [
+                    {"PutRequest": {"Item": _serialize_row(item)}} for item in chunk
+                ]
+            }
+            self._run_batch("batch_write_item", request, metrics)
+        metrics.items = len(rows)
+        metrics.seconds = time.perf_counter() - started
+        _record_batch_telemetry(metrics)
+        if metrics_hook is not None:
+            metrics_hook(metrics)
+        return len(rows)
+
+    def _batch_get_options(
+        self, consistent_read: bool, projection: Sequence[str] | None
+    ) -> dict[str, Any]:
+        options: dict[str, Any] = {"ConsistentRead": consistent_read}
+        if projection:
+            names = list(dict.fromkeys(["embedding_id", *projection]))
+            placeholders = {f"#p{i}": name for i, name in enumerate(names)}
+            options["ProjectionExpression"] = ", ".join(placeholders)
+            options["ExpressionAttributeNames"] = placeholders
+        return options
+
+    def _run_batch(
+        self,
+        operation: str,
+        request: dict[str, Any],
+        metrics: BatchCallMetrics,
+    ) -> list[dict[str, Any]]:
+        """Send one batch request until nothing is left unprocessed.
+
+        Returns the ``Responses`` items (BatchGetItem only).
+        """
+        unprocessed_key = (
+            "UnprocessedKeys" if operation == "batch_get_item" else "UnprocessedItems"
+        )
+        call = getattr(self._client, operation)
+        items: list[dict[str, Any]] = []
+        for attempt in range(BATCH_MAX_ATTEMPTS):
+            try:
+                metrics.requests += 1
+                resp = call(RequestItems=request, ReturnConsumedCapacity="TOTAL")
+            except ClientError as e:
+                if not _is_throttle(e):
+                    raise
+                metrics.throttles += 1
+                _backoff_sleep(attempt)
+                continue
+            metrics.consumed_capacity_units += _consumed_units(resp)
+            items.extend(resp.get("Responses", {}).get(self._table_name, []))
+            request = resp.get(unprocessed_key) or {}
+            if not request:
+                return items
+            metrics.unprocessed_retries += 1
+            _backoff_sleep(attempt)
+        raise RuntimeError(
+            f"{operation} left requests unprocessed after {BATCH_MAX_ATTEMPTS} attempts"
         )
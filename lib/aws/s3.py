@@ -6,15 +6,27 @@ from typing import Any
 
 import boto3
 import pandas as pd
+from botocore.config import Config
+
+from lib.telemetry import TELEMETRY
 
 DEFAULT_REGION_NAME = "us-east-2"
 
 
 class S3:
-    def __init__(self, bucket: str, *, region_name: str | None = None) -> None:
+    def __init__(
+        self,
+        bucket: str,
+        *,
+        region_name: str | None = None,
+        max_pool_connections: int | None = None,
+    ) -> None:
+        """``max_pool_connections`` sizes the HTTP pool for threaded callers."""
         client_kwargs: dict[str, Any] = {}
         if region_name is not None:
             client_kwargs["region_name"] = region_name
+        if max_pool_connections is not None:
+            client_kwargs["config"] = Config(max_pool_connections=max_pool_connections)
         self._bucket = bucket
         self._client: Any = boto3.client("s3", **client_kwargs)
 
@@ -33,7 +45,9 @@ class S3:
         extra: dict[str, str] = {}
         if content_type is not None:
             extra["ContentType"] = content_type
-        self._client.put_object(Bucket=self._bucket, Key=key, Body=body, **extra)
+        with TELEMETRY.time("s3_call_seconds", operation="PutObject"):
+            self._client.put_object(Bucket=self._bucket, Key=key, Body=body, **extra)
+        TELEMETRY.incr("s3_bytes_total", len(body), operation="PutObject")
 
     def upload_file(
         self,
@@ -55,8 +69,11 @@ class S3:
 
     def get_bytes(self, key: str) -> bytes:
         key = key.lstrip("/")
-        response = self._client.get_object(Bucket=self._bucket, Key=key)
-        return response["Body"].read()
+        with TELEMETRY.time("s3_call_seconds", operation="GetObject"):
+            response = self._client.get_object(Bucket=self._bucket, Key=key)
+            body = response["Body"].read()
+        TELEMETRY.incr("s3_bytes_total", len(body), operation="GetObject")
+        return body
 
     def list_keys_ordered(self, prefix: str) -> list[str]:
         """List object keys for a prefix in ascending lexical order."""
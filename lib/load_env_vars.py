@@ -20,7 +20,8 @@ from dotenv import load_dotenv
 ENV_VAR_TYPES: Final[dict[str, type[str]]] = {
     "OPENAI_API_KEY": str,
     "WANDB_API_KEY": str,
-    "GOOGLE_API_KEY": str
+    "GOOGLE_API_KEY": str,
+    "TEXTUAL_FEATURES_CACHE_PATH": str,
 }
 
 
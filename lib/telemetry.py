@@ -0,0 +1,278 @@
+"""Process-wide counters and fixed-memory latency histograms.
+
+Instrumented code records into the shared :data:`TELEMETRY` registry::
+
+    with TELEMETRY.time("s3_call_seconds", operation="GetObject"):
+        ...
+    TELEMETRY.incr("bedrock_input_tokens_total", 42)
+
+Histograms use fixed bucket bounds, so memory does not grow with the number
+of observations; percentiles are interpolated within a bucket. At the end of
+a run, :meth:`Telemetry.write` dumps everything as JSON or as a Prometheus
+text-exposition file (node-exporter textfile collector format).
+
+To run:
+
+PYTHONPATH=. uv run python -c "from lib.telemetry import TELEMETRY; print(TELEMETRY.to_json())"
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import math
+import threading
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+# 1 ms .. ~131 s, doubling: 18 finite buckets plus +Inf.
+DEFAULT_LATENCY_BOUNDS: tuple[float, ...] = tuple(0.001 * 2**i for i in range(18))
+PROMETHEUS_SUFFIXES = frozenset({".prom", ".txt"})
+
+LabelKey = tuple[tuple[str, str], ...]
+
+
+def _label_key(labels: dict[str, Any]) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+class LatencyHistogram:
+    """Bucketed latency distribution with exact count, sum, min and max.
+
+    Parameters
+    ----------
+    bounds
+        Strictly increasing upper bucket bounds in seconds; an implicit
+        ``+Inf`` bucket catches everything above the last bound.
+    """
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_LATENCY_BOUNDS) -> None:
+        if any(b <= a for a, b in zip(bounds, bounds[1:])):
+            raise ValueError("bounds must be strictly increasing")
+        self._bounds = tuple(float(b) for b in bounds)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all observations (bounds are kept)."""
+        with self._lock:
+            self._counts = [0] * (len(self._bounds) + 1)
+            self._count = 0
+            self._sum = 0.0
+            self._min = math.inf
+            self._max = -math.inf
+
+    def observe(self, seconds: float) -> None:
+        """Record one latency."""
+        value = float(seconds)
+        slot = bisect.bisect_left(self._bounds, value)
+        with self._lock:
+            self._counts[slot] += 1
+            self._count += 1
+            self._sum += value
+            self._min = min(self._min, value)
+            self._max = max(self._max, value)
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def total(self) -> float:
+        return self._sum
+
+    @property
+    def mean(self) -> float:
+        return self._sum / self._count if self._count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Estimate the ``q`` quantile (0..1); 0.0 when empty.
+
+        Interpolates linearly inside the bucket holding the target rank and
+        clamps to the observed min/max.
+
+        Raises
+        ------
+        ValueError
+            If ``q`` is outside ``[0, 1]``.
+        """
+        if not 0.0 <= q <= 1.0:
+            raise ValueError("q must be in [0, 1]")
+        with self._lock:
+            counts = list(self._counts)
+            n, lo_seen, hi_seen = self._count, self._min, self._max
+        if n == 0:
+            return 0.0
+        rank = q * n
+        cumulative = 0
+        for slot, c in enumerate(counts):
+            if c and cumulative + c >= rank:
+                lower = self._bounds[slot - 1] if slot > 0 else 0.0
+                upper = self._bounds[slot] if slot < len(self._bounds) else hi_seen
+                lower, upper = max(lower, lo_seen), min(upper, hi_seen)
+                return lower + (upper - lower) * ((rank - cumulative) / c)
+            cumulative += c
+        return hi_seen
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-friendly summary with p50/p90/p99 and cumulative bucket counts."""
+        with self._lock:
+            counts = list(self._counts)
+        cumulative: dict[str, int] = {}
+        running = 0
+        for bound, c in zip([*self._bounds, math.inf], counts):
+            running += c
+            cumulative["+Inf" if bound == math.inf else f"{bound:g}"] = running
+        return {
+            "count": self._count,
+            "sum": self._sum,
+            "min": self._min if self._count else 0.0,
+            "max": self._max if self._count else 0.0,
+            "mean": self.mean,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+            "buckets": cumulative,
+        }
+
+
+class Telemetry:
+    """Registry of labelled counters and latency histograms.
+
+    Metric names follow Prometheus conventions: ``*_total`` for counters and
+    ``*_seconds`` for histograms. All methods are thread-safe.
+    """
+
+    def __init__(self, *, bounds: Sequence[float] = DEFAULT_LATENCY_BOUNDS) -> None:
+        self._bounds = tuple(bounds)
+        self._lock = threading.Lock()
+        self._counters: dict[tuple[str, LabelKey], float] = {}
+        self._histograms: dict[tuple[str, LabelKey], LatencyHistogram] = {}
+
+    def incr(self, name: str, value: float = 1.0, **labels: Any) -> None:
+        """Add ``value`` to counter ``name`` with ``labels``."""
+        key = (name, _label_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0.0) + value
+
+    def counter(self, name: str, **labels: Any) -> float:
+        """Current value of a counter (0.0 if never incremented)."""
+        with self._lock:
+            return self._counters.get((name, _label_key(labels)), 0.0)
+
+    def histogram(self, name: str, **labels: Any) -> LatencyHistogram:
+        """Return (creating if needed) the histogram for ``name`` and ``labels``."""
+        key = (name, _label_key(labels))
+        with self._lock:
+            hist = self._histograms.get(key)
+            if hist is None:
+                hist = self._histograms[key] = LatencyHistogram(self._bounds)
+            return hist
+
+    def observe(self, name: str, seconds: float, **labels: Any) -> None:
+        """Record one latency in histogram ``name``."""
+        self.histogram(name, **labels).observe(seconds)
+
+    @contextmanager
+    def time(self, name: str, **labels: Any) -> Iterator[None]:
+        """Time the block into histogram ``name``; also on error.
+
+        An exception additionally increments ``<name minus _seconds>_errors_total``
+        labelled with the exception type, then propagates.
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        except BaseException as e:
+            self.incr(_errors_name(name), error=type(e).__name__, **labels)
+            raise
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    def reset(self) -> None:
+        """Zero every counter and histogram in place (references stay valid)."""
+        with self._lock:
+            self._counters.clear()
+            histograms = list(self._histograms.values())
+        for hist in histograms:
+            hist.reset()
+
+    def snapshot(self) -> dict[str, list[dict[str, Any]]]:
+        """All metrics as plain data, sorted by name then labels."""
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted(self._histograms.items(), key=lambda kv: kv[0])
+        return {
+            "counters": [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in counters
+            ],
+            "histograms": [
+                {"name": name, "labels": dict(labels), **hist.to_dict()}
+                for (name, labels), hist in histograms
+                if hist.count
+            ],
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.snapshot(), indent=2, sort_keys=True)
+
+    def to_prometheus(self) -> str:
+        """Render in the Prometheus text exposition format."""
+        snap = self.snapshot()
+        lines: list[str] = []
+        typed: set[str] = set()
+        for c in snap["counters"]:
+            if c["name"] not in typed:
+                lines.append(f"# TYPE {c['name']} counter")
+                typed.add(c["name"])
+            lines.append(f"{c['name']}{_prom_labels(c['labels'])} {_prom_value(c['value'])}")
+        for h in snap["histograms"]:
+            name = h["name"]
+            if name not in typed:
+                lines.append(f"# TYPE {name} histogram")
+                typed.add(name)
+            for le, cum in h["buckets"].items():
+                labels = _prom_labels({**h["labels"], "le": le})
+                lines.append(f"{name}_bucket{labels} {cum}")
+            lines.append(f"{name}_sum{_prom_labels(h['labels'])} {_prom_value(h['sum'])}")
+            lines.append(f"{name}_count{_prom_labels(h['labels'])} {h['count']}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str | Path) -> Path:
+        """Write Prometheus text for ``.prom`` / ``.txt`` paths, JSON otherwise."""
+        out = Path(path)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        body = (
+            self.to_prometheus()
+            if out.suffix.lower() in PROMETHEUS_SUFFIXES
+            else self.to_json() + "\n"
+        )
+        out.write_text(body, encoding="utf-8")
+        return out
+
+
+def _errors_name(name: str) -> str:
+    base = name[: -len("_seconds")] if name.endswith("_seconds") else name
+    return f"{base}_errors_total"
+
+
+def _prom_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    body = ",".join(f'{k}="{_prom_escape(v)}"' for k, v in labels.items())
+    return "{" + body + "}"
+
+
+def _prom_escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _prom_value(value: float) -> str:
+    return repr(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+TELEMETRY = Telemetry()
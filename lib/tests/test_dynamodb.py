@@ -0,0 +1,211 @@
+"""Tests for the DynamoDB batch methods (boto3 client stubbed)."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from botocore.exceptions import ClientError
+
+from lib.aws import dynamodb
+from lib.aws.dynamodb import (
+    BATCH_MAX_ATTEMPTS,
+    BatchCallMetrics,
+    DynamoDBEmbeddingIndex,
+)
+
+TABLE = "embeddings"
+THROTTLE = "throttle"
+
+
+def _throttle_error(operation: str) -> ClientError:
+    return ClientError(
+        {"Error": {"Code": "ProvisionedThroughputExceededException"}}, operation
+    )
+
+
+class StubDynamoDBClient:
+    """Records batch requests and replays a script of per-call outcomes.
+
+    Each script step is ``THROTTLE`` (raise a throttling error), an int ``n``
+    (process only the first ``n`` keys/items and return the rest as
+    unprocessed), or ``None`` (process everything). Calls past the end of the
+    script process everything.
+    """
+
+    def __init__(self, script: list[Any] | None = None) -> None:
+        self.script = list(script or [])
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+        self.rows: dict[str, dict[str, Any]] = {}
+
+    def _step(self, operation: str) -> Any:
+        step = self.script.pop(0) if self.script else None
+        if step == THROTTLE:
+            raise _throttle_error(operation)
+        return step
+
+    def batch_get_item(self, *, RequestItems: dict[str, Any], **kwargs: Any) -> dict[str, Any]:
+        self.calls.append(("batch_get_item", {**RequestItems[TABLE], **kwargs}))
+        step = self._step("BatchGetItem")
+        keys = RequestItems[TABLE]["Keys"]
+        done, rest = (keys, []) if step is None else (keys[:step], keys[step:])
+        resp: dict[str, Any] = {
+            "Responses": {
+                TABLE: [
+                    {**k, "s3_key": {"S": f"embeddings/{k['embedding_id']['S']}.bin"}}
+                    for k in done
+                ]
+            },
+            "ConsumedCapacity": [{"TableName": TABLE, "CapacityUnits": 0.5 * len(done)}],
+        }
+        if rest:
+            resp["UnprocessedKeys"] = {TABLE: {**RequestItems[TABLE], "Keys": rest}}
+        return resp
+
+    def batch_write_item(self, *, RequestItems: dict[str, Any], **kwargs: Any) -> dict[str, Any]:
+        self.calls.append(("batch_write_item", {"Requests": RequestItems[TABLE], **kwargs}))
+        step = self._step("BatchWriteItem")
+        requests = RequestItems[TABLE]
+        done, rest = (requests, []) if step is None else (requests[:step], requests[step:])
+        for request in done:
+            item = request["PutRequest"]["Item"]
+            self.rows[item["embedding_id"]["S"]] = item
+        resp: dict[str, Any] = {
+            "ConsumedCapacity": [{"TableName": TABLE, "CapacityUnits": 1.0 * len(done)}]
+        }
+        if rest:
+            resp["UnprocessedItems"] = {TABLE: rest}
+        return resp
+
+
+@pytest.fixture(autouse=True)
+def _no_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(dynamodb, "_backoff_sleep", lambda attempt: None)
+
+
+def _index(
+    monkeypatch: pytest.MonkeyPatch, script: list[Any] | None = None
+) -> tuple[DynamoDBEmbeddingIndex, StubDynamoDBClient]:
+    client = StubDynamoDBClient(script)
+    monkeypatch.setattr(dynamodb.boto3, "client", lambda *args, **kwargs: client)
+    return DynamoDBEmbeddingIndex(TABLE), client
+
+
+def _get_key_counts(client: StubDynamoDBClient) -> list[int]:
+    return [len(request["Keys"]) for op, request in client.calls if op == "batch_get_item"]
+
+
+class TestBatchGetItems:
+    """Tests for DynamoDBEmbeddingIndex.batch_get_items()."""
+
+    def test_chunks_at_100_keys_and_dedupes(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Verifies 250 unique ids (plus repeats) are sent as 100 + 100 + 50 keys."""
+        index, client = _index(monkeypatch)
+        ids = [f"e{i}" for i in range(250)]
+        rows = index.batch_get_items(ids + ids[:10])
+        assert _get_key_counts(client) == [100, 100, 50]
+        assert set(rows) == set(ids)
+        assert rows["e7"]["s3_key"] == "embeddings/e7.bin"
+
+    def test_unprocessed_keys_are_resubmitted(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Verifies only the UnprocessedKeys are re-sent and their rows are returned."""
+        index, client = _index(monkeypatch, script=[3])
+        rows = index.batch_get_items([f"e{i}" for i in range(5)])
+        assert _get_key_counts(client) == [5, 2]
+        assert [k["embedding_id"]["S"] for k in client.calls[1][1]["Keys"]] == ["e3", "e4"]
+        assert len(rows) == 5
+
+    def test_throttling_is_retried(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Verifies a throttling ClientError is retried rather than raised."""
+        index, client = _index(monkeypatch, script=[THROTTLE, THROTTLE])
+        assert len(index.batch_get_items(["a", "b"])) == 2
+        assert len(client.calls) == 3
+
+    def test_raises_after_max_attempts(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Verifies RuntimeError once BATCH_MAX_ATTEMPTS requests are all throttled."""
+        index, client = _index(monkeypatch, script=[THROTTLE] * BATCH_MAX_ATTEMPTS)
+        with pytest.raises(RuntimeError, match="unprocessed"):
+            index.batch_get_items(["a"])
+        assert len(client.calls) == BATCH_MAX_ATTEMPTS
+
+    def test_other_client_errors_propagate(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Verifies non-throttling errors are raised on the first attempt."""
+        index, client = _index(monkeypatch)
+
+        def fail(**kwargs: Any) -> dict[str, Any]:
+            raise ClientError({"Error": {"Code": "ValidationException"}}, "BatchGetItem")
+
+        monkeypatch.setattr(client, "batch_get_item", fail)
+        with pytest.raises(ClientError):
+            index.batch_get_items(["a"])
+
+    def test_projection_uses_placeholders(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Verifies projected names go through ExpressionAttributeNames, key first."""
+        index, client = _index(monkeypatch)
+        index.batch_get_items(["a"], projection=("s3_key", "embedding_id"))
+        request = client.calls[0][1]
+        assert request["ProjectionExpression"] == "#p0, #p1"
+        assert request["ExpressionAttributeNames"] == {"#p0": "embedding_id", "#p1": "s3_key"}
+
+    def test_consistent_read_opt_out(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Verifies ConsistentRead defaults to True and is False when opted out."""
+        index, client = _index(monkeypatch)
+        index.batch_get_items(["a"])
+        index.batch_get_items(["a"], consistent_read=False)
+        assert [request["ConsistentRead"] for _, request in client.calls] == [True, False]
+        assert "ProjectionExpression" not in client.calls[0][1]
+
+    def test_metrics_hook_payload(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Verifies the hook sees requests, items, capacity, retries, and throttles."""
+        index, _ = _index(monkeypatch, script=[THROTTLE, 1])
+        seen: list[BatchCallMetrics] = []
+        index.batch_get_items(["a", "b", "c"], metrics_hook=seen.append)
+        (metrics,) = seen
+        assert metrics.operation == "BatchGetItem"
+        assert (metrics.requests, metrics.items) == (3, 3)
+        assert (metrics.throttles, metrics.unprocessed_retries) == (1, 1)
+        assert metrics.consumed_capacity_units == pytest.approx(1.5)
+        assert metrics.seconds >= 0.0
+
+
+class TestBatchPutItems:
+    """Tests for DynamoDBEmbeddingIndex.batch_put_items()."""
+
+    def test_chunks_at_25_items_and_collapses_duplicates(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verifies 60 distinct rows are sent as 25 + 25 + 10 and the last duplicate wins."""
+        index, client = _index(monkeypatch)
+        items = [{"embedding_id": f"e{i}", "s3_key": "old"} for i in range(60)]
+        written = index.batch_put_items([*items, {"embedding_id": "e0", "s3_key": "new"}])
+        assert written == 60
+        assert [len(request["Requests"]) for _, request in client.calls] == [25, 25, 10]
+        assert client.rows["e0"]["s3_key"] == {"S": "new"}
+
+    def test_unprocessed_items_are_resubmitted(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Verifies UnprocessedItems are re-sent until every row is written."""
+        index, client = _index(monkeypatch, script=[1, THROTTLE, 0])
+        seen: list[BatchCallMetrics] = []
+        index.batch_put_items(
+            [{"embedding_id": e} for e in ("a", "b", "c")], metrics_hook=seen.append
+        )
+        assert [len(request["Requests"]) for _, request in client.calls] == [3, 2, 2, 2]
+        assert set(client.rows) == {"a", "b", "c"}
+        (metrics,) = seen
+        assert metrics.operation == "BatchWriteItem"
+        assert (metrics.requests, metrics.items) == (4, 3)
+        assert (metrics.throttles, metrics.unprocessed_retries) == (1, 2)
+        assert metrics.consumed_capacity_units == pytest.approx(3.0)
+
+    def test_raises_after_max_attempts(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Verifies RuntimeError when items stay unprocessed for every attempt."""
+        index, _ = _index(monkeypatch, script=[0] * BATCH_MAX_ATTEMPTS)
+        with pytest.raises(RuntimeError, match="unprocessed"):
+            index.batch_put_items([{"embedding_id": "a"}])
+
+    def test_missing_key_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Verifies an item without embedding_id is rejected before any request."""
+        index, client = _index(monkeypatch)
+        with pytest.raises(KeyError):
+            index.batch_put_items([{"s3_key": "x"}])
+        assert client.calls == []
@@ -0,0 +1,58 @@
+"""Tests for lib.telemetry."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from lib.telemetry import LatencyHistogram, Telemetry
+
+
+class TestLatencyHistogram:
+    """Tests for LatencyHistogram."""
+
+    def test_quantiles_stay_within_bucket_of_truth(self) -> None:
+        """Verifies interpolated percentiles land in the true value's bucket."""
+        hist = LatencyHistogram(bounds=(0.01, 0.1, 1.0))
+        for _ in range(90):
+            hist.observe(0.05)
+        for _ in range(10):
+            hist.observe(0.5)
+        assert hist.count == 100
+        assert hist.mean == pytest.approx(0.095)
+        assert 0.01 <= hist.quantile(0.5) <= 0.1
+        assert 0.1 <= hist.quantile(0.99) <= 0.5
+        assert hist.to_dict()["buckets"] == {"0.01": 0, "0.1": 90, "1": 100, "+Inf": 100}
+
+    def test_rejects_unsorted_bounds(self) -> None:
+        """Verifies bucket bounds must increase."""
+        with pytest.raises(ValueError, match="strictly increasing"):
+            LatencyHistogram(bounds=(1.0, 0.5))
+
+
+class TestTelemetry:
+    """Tests for Telemetry export and timing."""
+
+    def test_time_records_latency_and_errors(self) -> None:
+        """Verifies failed blocks are timed and counted under *_errors_total."""
+        t = Telemetry()
+        with pytest.raises(KeyError):
+            with t.time("op_seconds", operation="x"):
+                raise KeyError("boom")
+        assert t.histogram("op_seconds", operation="x").count == 1
+        assert t.counter("op_errors_total", operation="x", error="KeyError") == 1
+
+    def test_write_json_and_prometheus(self, tmp_path: Path) -> None:
+        """Verifies both export formats contain counters and histogram series."""
+        t = Telemetry(bounds=(0.1, 1.0))
+        t.incr("s3_bytes_total", 2048, operation="GetObject")
+        t.observe("s3_call_seconds", 0.05, operation="GetObject")
+        snap = json.loads(t.write(tmp_path / "m.json").read_text())
+        assert snap["counters"][0]["value"] == 2048
+        prom = t.write(tmp_path / "m.prom").read_text()
+        assert 's3_bytes_total{operation="GetObject"} 2048' in prom
+        assert 's3_call_seconds_bucket{operation="GetObject",le="0.1"} 1' in prom
+        assert 's3_call_seconds_count{operation="GetObject"} 1' in prom
+
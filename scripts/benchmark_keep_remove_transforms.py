@@ -0,0 +1,251 @@
+"""Benchmark the Part 2 keep/remove label transforms against their row-wise originals.
+
+Builds a synthetic Part 2 results table, runs the vectorized
+``build_keep_remove_labels`` and ``build_keep_remove_labels_unanimous_min3``
+plus the original per-group-lambda / ``apply(axis=1)`` implementations kept
+below as references, checks that the outputs are identical, and reports the
+speedup.
+
+The synthetic table mimics the export's mess: mixed-case and padded
+``decision`` / ``evaluation_mode`` values, non keep/remove decisions, null,
+empty, and literal ``"nan"`` post IDs, posts whose texts are missing, and a
+mix of unanimous, split, and tied posts.
+
+Run from repo root:
+
+    PYTHONPATH=. uv run python scripts/benchmark_keep_remove_transforms.py
+    PYTHONPATH=. uv run python scripts/benchmark_keep_remove_transforms.py --trials 1000000 --json keep_remove_bench.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from shared.data.transformed.study_phase_2_part_2.transform import build_keep_remove_labels
+from shared.data.transformed.study_phase_2_part_2.transform_keep_remove_labels_unanimous_min3 import (  # noqa: E501
+    build_keep_remove_labels_unanimous_min3,
+)
+
+DEFAULT_TRIALS = 10_000_000
+TRIALS_PER_POST = 5
+
+_MODES = np.array(["linked_fate", "Linked_Fate ", "assisted", np.nan], dtype=object)
+_MODE_P = [0.6, 0.1, 0.25, 0.05]
+_REMOVE_RATES = np.array([0.0, 0.0, 0.3, 0.5, 0.7, 1.0])
+
+
+def synthetic_results(n_trials: int, *, seed: int = 0) -> pd.DataFrame:
+    """Part 2 results-shaped frame with ``n_trials`` rows (about five per post)."""
+    rng = np.random.default_rng(seed)
+    n_posts = max(1, n_trials // TRIALS_PER_POST)
+    post = rng.integers(n_posts, size=n_trials)
+
+    post_ids = np.array([f"post_{i}" for i in range(n_posts)], dtype=object)
+    originals = np.array([f"original text {i}" for i in range(n_posts)], dtype=object)
+    mirrors = np.array([f"mirror text {i}" for i in range(n_posts)], dtype=object)
+    originals[rng.random(n_posts) < 0.01] = np.nan
+    mirrors[rng.random(n_posts) < 0.02] = np.nan
+
+    post_id = post_ids[post]
+    noise = rng.random(n_trials)
+    post_id[noise < 0.005] = np.nan
+    post_id[(noise >= 0.005) & (noise < 0.007)] = ""
+    post_id[(noise >= 0.007) & (noise < 0.009)] = " NaN "
+    padded = (noise >= 0.009) & (noise < 0.02)
+    post_id[padded] = [f" {p} " for p in post_id[padded]]
+
+    is_remove = rng.random(n_trials) < rng.choice(_REMOVE_RATES, size=n_posts)[post]
+    decision = np.where(is_remove, "remove", "keep").astype(object)
+    noise = rng.random(n_trials)
+    decision[noise < 0.05] = np.where(is_remove[noise < 0.05], " REMOVE", "Keep ")
+    decision[(noise >= 0.05) & (noise < 0.06)] = "skip"
+    decision[(noise >= 0.06) & (noise < 0.065)] = np.nan
+
+    return pd.DataFrame(
+        {
+            "trial_type": "moderation-trial",
+            "evaluation_mode": rng.choice(_MODES, size=n_trials, p=_MODE_P),
+            "post_id": post_id,
+            "original_text": originals[post],
+            "mirror_text": mirrors[post],
+            "decision": decision,
+        }
+    )
+
+
+# --- Reference implementations (row-wise originals) -------------------------
+
+
+def _legacy_slim_trials(raw: pd.DataFrame) -> pd.DataFrame:
+    trials = raw.copy()
+    trials["decision"] = trials["decision"].astype(str).str.lower().str.strip()
+    trials["evaluation_mode"] = trials["evaluation_mode"].astype(str).str.lower().str.strip()
+    trials = trials[trials["evaluation_mode"] == "linked_fate"].copy()
+    trials = trials[trials["decision"].isin(["keep", "remove"])].copy()
+    post_id = trials["post_id"]
+    trials = trials[post_id.notna()].copy()
+    trials["post_id"] = trials["post_id"].astype(str).str.strip()
+    trials = trials[trials["post_id"] != ""].copy()
+    trials = trials[trials["post_id"].str.lower() != "nan"].copy()
+    return trials
+
+
+def _legacy_assert_stable_texts(trials: pd.DataFrame) -> None:
+    text_nunique = (
+        trials.groupby("post_id", dropna=False)
+        .agg(
+            original_text_nunique=("original_text", lambda s: s.fillna("").nunique()),
+            mirror_text_nunique=("mirror_text", lambda s: s.fillna("").nunique()),
+        )
+        .reset_index()
+    )
+    bad = text_nunique[
+        (text_nunique["original_text_nunique"] != 1)
+        | (text_nunique["mirror_text_nunique"] != 1)
+    ]
+    if len(bad):
+        example_post = str(bad.iloc[0]["post_id"])
+        raise ValueError(
+            "Expected stable original/mirror text per post_id, but found conflicts. "
+            f"Example problematic post_id={example_post}."
+        )
+
+
+def legacy_keep_remove_labels(raw: pd.DataFrame) -> pd.DataFrame:
+    """Modal labels as computed before vectorization."""
+    trials = _legacy_slim_trials(raw)
+    _legacy_assert_stable_texts(trials)
+    counts = (
+        trials.groupby(["post_id", "decision"], dropna=False)
+        .size()
+        .unstack(fill_value=0)
+        .reset_index()
+    )
+    if "keep" not in counts.columns:
+        counts["keep"] = 0
+    if "remove" not in counts.columns:
+        counts["remove"] = 0
+    counts["decision"] = counts.apply(
+        lambda r: "keep" if int(r["keep"]) > int(r["remove"]) else "remove",
+        axis=1,
+    )
+    counts["keep_remove_label"] = (counts["decision"] == "remove").astype(int)
+    texts = trials.drop_duplicates(subset=["post_id"])[
+        ["post_id", "original_text", "mirror_text"]
+    ]
+    out = counts.merge(texts, on="post_id", how="left")
+    out = out.rename(columns={"post_id": "message_id"})
+    columns = ["message_id", "original_text", "mirror_text", "decision", "keep_remove_label"]
+    return out[columns].reset_index(drop=True)
+
+
+def legacy_keep_remove_labels_unanimous_min3(raw: pd.DataFrame) -> pd.DataFrame:
+    """Unanimous min-3 labels as computed before vectorization."""
+    trials = _legacy_slim_trials(raw)
+    _legacy_assert_stable_texts(trials)
+    grouped = (
+        trials.groupby("post_id", dropna=False)
+        .agg(
+            n_raters=("decision", "size"),
+            n_unique_decisions=("decision", "nunique"),
+            keep_count=("decision", lambda s: int((s == "keep").sum())),
+            remove_count=("decision", lambda s: int((s == "remove").sum())),
+        )
+        .reset_index()
+    )
+    kept = grouped[(grouped["n_raters"] >= 3) & (grouped["n_unique_decisions"] == 1)].copy()
+    kept["decision"] = kept.apply(
+        lambda row: "keep" if int(row["keep_count"]) == int(row["n_raters"]) else "remove",
+        axis=1,
+    )
+    kept["keep_remove_label"] = (kept["decision"] == "remove").astype(int)
+    texts = trials.drop_duplicates(subset=["post_id"])[
+        ["post_id", "original_text", "mirror_text"]
+    ]
+    out = kept.merge(texts, on="post_id", how="left")
+    out = out.rename(columns={"post_id": "message_id"})
+    columns = [
+        "message_id",
+        "original_text",
+        "mirror_text",
+        "decision",
+        "keep_remove_label",
+        "n_raters",
+    ]
+    return out[columns].reset_index(drop=True)
+
+
+# ---------------------------------------------------------------------------
+
+TRANSFORMS: dict[str, tuple[Callable[..., pd.DataFrame], Callable[..., pd.DataFrame]]] = {
+    "keep_remove_labels": (build_keep_remove_labels, legacy_keep_remove_labels),
+    "keep_remove_labels_unanimous_min3": (
+        build_keep_remove_labels_unanimous_min3,
+        legacy_keep_remove_labels_unanimous_min3,
+    ),
+}
+
+
+def _timed(fn: Callable[[pd.DataFrame], pd.DataFrame], raw: pd.DataFrame) -> tuple[float, Any]:
+    start = time.perf_counter()
+    out = fn(raw)
+    return time.perf_counter() - start, out
+
+
+def run(n_trials: int, *, seed: int = 0, legacy: bool = True) -> list[dict[str, Any]]:
+    """Time each transform (and its reference) on one synthetic table.
+
+    Raises
+    ------
+    AssertionError
+        If a vectorized output differs from its reference.
+    """
+    raw = synthetic_results(n_trials, seed=seed)
+    rows = []
+    for name, (vectorized, reference) in TRANSFORMS.items():
+        seconds, out = _timed(vectorized, raw)
+        row: dict[str, Any] = {
+            "transform": name,
+            "n_trials": n_trials,
+            "rows_out": len(out),
+            "seconds": seconds,
+        }
+        if legacy:
+            legacy_seconds, expected = _timed(reference, raw)
+            pd.testing.assert_frame_equal(out, expected)
+            row["legacy_seconds"] = legacy_seconds
+            row["speedup"] = legacy_seconds / seconds
+        rows.append(row)
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--trials", type=int, default=DEFAULT_TRIALS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--skip-legacy", action="store_true", help="Time only the vectorized transforms"
+    )
+    parser.add_argument("--json", type=Path, default=None, help="Also write results as JSON")
+    args = parser.parse_args()
+
+    rows = run(args.trials, seed=args.seed, legacy=not args.skip_legacy)
+    for row in rows:
+        line = f"{row['transform']:<36} {row['n_trials']:>11,} trials  {row['seconds']:8.2f} s"
+        if "speedup" in row:
+            line += f"  (row-wise {row['legacy_seconds']:.2f} s, {row['speedup']:.1f}x)"
+        print(line)
+    if args.json is not None:
+        args.json.write_text(json.dumps(rows, indent=2) + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,516 @@
+"""Throughput, peak-memory, and import-time benchmarks for ``shared.textual_features``.
+
+Each run measures four things and writes them to one JSON file, so two runs
+can be compared with ``--compare``:
+
+- **metrics**: ``engine.compute_metrics`` for each registry metric on its own,
+  and for the whole registry at once, per corpus, size, and readability
+  backend.
+- **llm**: ``registry.classify_features`` with the joint prompt, with one
+  prompt per feature, and with a cold then warm result cache, run through a
+  local fake chain that sleeps ``--llm-latency`` seconds per request.
+- **memory**: peak traced allocation (``tracemalloc``) of each metrics case,
+  measured on a separate, untimed run.
+- **imports**: cumulative import time of the package modules.
+
+The corpora are built as follows:
+
+- ``synthetic`` generates unique posts with the same length range as the
+  study stimuli.
+- ``real`` resamples the stimulus posts (originals and mirrors) with
+  replacement. This keeps the duplicate-heavy shape of per-trial frames.
+
+The spaCy backend is slow at large sizes. Cases above ``--spacy-max-posts``
+are recorded as skipped and are not timed.
+
+Run from repo root:
+
+    PYTHONPATH=. uv run python scripts/benchmark_textual_features.py --sizes 1000
+    PYTHONPATH=. uv run python scripts/benchmark_textual_features.py --sizes 1000 100000 1000000 --backends regex
+    PYTHONPATH=. uv run python scripts/benchmark_textual_features.py --sizes 1000 --compare .cache/benchmarks/textual_features/baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import hashlib
+import json
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from importlib import import_module
+from pathlib import Path
+from typing import Any
+
+from lib.constants import REPO_ROOT
+from lib.timestamp_utils import get_current_timestamp
+from scripts.check_import_times import trace_import
+from shared.data.registry import STUDY_PHASE_2_PART_1_STIMULI
+
+DEFAULT_OUTPUT_DIR = REPO_ROOT / ".cache" / "benchmarks" / "textual_features"
+SIZES: tuple[int, ...] = (1_000, 100_000, 1_000_000)
+CORPORA: tuple[str, ...] = ("synthetic", "real")
+BACKENDS: tuple[str, ...] = ("regex", "spacy")
+IMPORT_MODULES: tuple[str, ...] = (
+    "shared.textual_features",
+    "shared.textual_features.registry",
+    "shared.textual_features.engine",
+    "shared.textual_features.feature_store",
+    "shared.textual_features.combined",
+)
+DEFAULT_SPACY_MAX_POSTS = 100_000
+DEFAULT_LLM_POSTS = 1_000
+DEFAULT_LLM_LATENCY = 0.05
+REAL_COLUMNS: tuple[str, ...] = ("original_text", "claude_mirror")
+ALL_METRICS = "ALL"
+
+# Word list for synthetic posts: short function words, longer content words,
+# hashtags/mentions, and non-ASCII tokens so the Unicode paths are exercised.
+_WORDS: tuple[str, ...] = tuple(
+    "the a to and of is in that it for they we people government community policy "
+    "election immigration economy healthcare responsibility unbelievable together "
+    "honestly disgusting wonderful #news @user café naïve don't can't 100% U.S. 🙂 🔥".split()
+)
+_ENDINGS: tuple[str, ...] = (".", ".", ".", "!", "?", "...", "!!")
+
+
+@dataclass
+class BenchmarkResult:
+    """One timed case.
+
+    ``posts_per_second`` uses the best of ``repeat`` wall-clock runs.
+    ``peak_mb`` is ``None`` when memory was not measured.
+    """
+
+    suite: str
+    case: str
+    corpus: str
+    n_posts: int
+    backend: str | None
+    seconds: float | None
+    posts_per_second: float | None
+    peak_mb: float | None = None
+    skipped: str | None = None
+    extra: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def key(self) -> tuple[str, str, str, int, str | None]:
+        return (self.suite, self.case, self.corpus, self.n_posts, self.backend)
+
+
+def synthetic_corpus(n: int, *, seed: int = 0) -> list[str]:
+    """``n`` unique synthetic posts of 1-4 sentences (about 100-310 characters)."""
+    rng = random.Random(seed)
+    posts = []
+    for i in range(n):
+        target = rng.randint(100, 310)
+        sentences = []
+        length = 0
+        while length < target:
+            words = rng.choices(_WORDS, k=rng.randint(5, 18))
+            sentence = " ".join(words).capitalize() + rng.choice(_ENDINGS)
+            sentences.append(sentence)
+            length += len(sentence) + 1
+        posts.append(f"{' '.join(sentences)} #{i}")
+    return posts
+
+
+def real_corpus(
+    n: int, *, seed: int = 0, dataset: str = STUDY_PHASE_2_PART_1_STIMULI
+) -> list[str]:
+    """``n`` posts resampled with replacement from ``dataset``'s text columns.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the dataset CSV is not on disk.
+    """
+    from shared.data.dataloader import load_dataset
+
+    frame = load_dataset(dataset)
+    columns = [c for c in REAL_COLUMNS if c in frame.columns]
+    pool = frame[columns].stack().dropna().astype(str).tolist()
+    return random.Random(seed).choices(pool, k=n)
+
+
+def build_corpus(name: str, n: int, *, seed: int = 0) -> list[str]:
+    """Dispatch to :func:`synthetic_corpus` or :func:`real_corpus`."""
+    if name == "synthetic":
+        return synthetic_corpus(n, seed=seed)
+    if name == "real":
+        return real_corpus(n, seed=seed)
+    raise ValueError(f"Unknown corpus {name!r}; expected one of {CORPORA}")
+
+
+def time_call(fn: Callable[[], Any], *, repeat: int = 1) -> float:
+    """Best wall-clock seconds of ``repeat`` calls to ``fn``."""
+    best = float("inf")
+    for _ in range(max(1, repeat)):
+        gc.collect()
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def peak_memory_mb(fn: Callable[[], Any]) -> float:
+    """Peak traced Python/NumPy allocation in MiB while ``fn`` runs."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / (1 << 20)
+
+
+def _throughput(n: int, seconds: float) -> float:
+    return n / seconds if seconds > 0 else float("inf")
+
+
+def bench_metrics(
+    texts: Sequence[str],
+    *,
+    corpus: str,
+    backends: Sequence[str],
+    repeat: int = 1,
+    memory: bool = True,
+    spacy_max_posts: int = DEFAULT_SPACY_MAX_POSTS,
+) -> list[BenchmarkResult]:
+    """Per-metric and whole-registry ``compute_metrics`` cases for ``texts``."""
+    from shared.textual_features.engine import READABILITY_NAMES, compute_metrics, metric_names
+
+    n = len(texts)
+    results = []
+    for backend in backends:
+        for name in [*metric_names(), ALL_METRICS]:
+            uses_parser = name == ALL_METRICS or name in READABILITY_NAMES
+            if not uses_parser and backend != backends[0]:
+                # Only readability metrics depend on the backend.
+                continue
+            case_backend = backend if uses_parser else None
+            if uses_parser and backend == "spacy" and n > spacy_max_posts:
+                results.append(
+                    BenchmarkResult(
+                        suite="metrics",
+                        case=name,
+                        corpus=corpus,
+                        n_posts=n,
+                        backend=case_backend,
+                        seconds=None,
+                        posts_per_second=None,
+                        skipped=f"n_posts > spacy_max_posts ({spacy_max_posts})",
+                    )
+                )
+                continue
+            names = None if name == ALL_METRICS else [name]
+
+            def run(names: list[str] | None = names, backend: str = backend) -> None:
+                compute_metrics(texts, names, backend=backend)
+
+            if uses_parser and backend == "spacy":
+                run()  # load the spaCy model outside the timed runs
+            seconds = time_call(run, repeat=repeat)
+            results.append(
+                BenchmarkResult(
+                    suite="metrics",
+                    case=name,
+                    corpus=corpus,
+                    n_posts=n,
+                    backend=case_backend,
+                    seconds=seconds,
+                    posts_per_second=_throughput(n, seconds),
+                    peak_mb=peak_memory_mb(run) if memory else None,
+                )
+            )
+    return results
+
+
+_LLM_SCHEMAS: dict[str, str] = {
+    "combined": "CombinedClassification",
+    "valence": "ValenceClassification",
+    "intergroup": "IntergroupClassification",
+    "prime": "PrimeClassification",
+}
+
+
+class FakeChain:
+    """Async stand-in for a classifier chain that sleeps ``latency`` per request.
+
+    Labels are a deterministic function of the post, so repeated runs agree.
+    """
+
+    def __init__(self, schema: type, latency: float) -> None:
+        self.schema = schema
+        self.latency = latency
+        self.requests = 0
+
+    async def ainvoke(self, payload: dict[str, str]) -> Any:
+        self.requests += 1
+        await asyncio.sleep(self.latency)
+        (post,) = payload.values()  # "post" or "prompt_input", depending on the module
+        digest = hashlib.blake2b(post.encode("utf-8"), digest_size=8).digest()
+        fields = list(self.schema.model_fields)
+        return self.schema(**{f: bool(digest[i] & 1) for i, f in enumerate(fields)})
+
+
+@contextmanager
+def fake_llm_backend(latency: float) -> Iterator[dict[str, FakeChain]]:
+    """Route every classifier module's ``get_chain`` to a :class:`FakeChain`.
+
+    Yields
+    ------
+    dict[str, FakeChain]
+        Module name -> its fake chain, for request counts.
+    """
+    chains: dict[str, FakeChain] = {}
+    originals: dict[str, Any] = {}
+    for name, schema_name in _LLM_SCHEMAS.items():
+        module = import_module(f"shared.textual_features.{name}")
+        chains[name] = FakeChain(getattr(module, schema_name), latency)
+        originals[name] = module.get_chain
+        module.get_chain = lambda model=None, chain=chains[name]: chain
+    try:
+        yield chains
+    finally:
+        for name, get_chain in originals.items():
+            import_module(f"shared.textual_features.{name}").get_chain = get_chain
+
+
+def bench_llm(
+    texts: Sequence[str],
+    *,
+    corpus: str,
+    latency: float = DEFAULT_LLM_LATENCY,
+    max_concurrency: int | None = None,
+) -> list[BenchmarkResult]:
+    """``classify_features`` through the fake backend: combined, separate, and cached.
+
+    ``extra`` records the requests sent, the ideal time
+    (``requests * latency / max_concurrency``), and the efficiency against it.
+    """
+    from shared.textual_features.llm_batch import DEFAULT_MAX_CONCURRENCY
+    from shared.textual_features.registry import CLASSIFIER_MODULES, classify_features
+    from shared.textual_features.result_cache import ClassifierResultCache
+
+    concurrency = max_concurrency or DEFAULT_MAX_CONCURRENCY
+    posts = list(texts)
+    names = list(CLASSIFIER_MODULES)
+    results = []
+    with tempfile.TemporaryDirectory() as tmp, fake_llm_backend(latency) as chains:
+        cache = ClassifierResultCache(Path(tmp) / "labels.sqlite3")
+        cases: list[tuple[str, bool, ClassifierResultCache | bool]] = [
+            ("combined", True, False),
+            ("separate", False, False),
+            ("combined_cold_cache", True, cache),
+            ("combined_warm_cache", True, cache),
+        ]
+        try:
+            for case, combined, case_cache in cases:
+                before = sum(c.requests for c in chains.values())
+                seconds = time_call(
+                    lambda combined=combined, case_cache=case_cache: classify_features(
+                        names,
+                        posts,
+                        combined=combined,
+                        max_concurrency=concurrency,
+                        cache=case_cache,
+                    )
+                )
+                requests = sum(c.requests for c in chains.values()) - before
+                ideal = requests * latency / concurrency
+                results.append(
+                    BenchmarkResult(
+                        suite="llm",
+                        case=case,
+                        corpus=corpus,
+                        n_posts=len(posts),
+                        backend=None,
+                        seconds=seconds,
+                        posts_per_second=_throughput(len(posts), seconds),
+                        extra={
+                            "latency_seconds": latency,
+                            "max_concurrency": concurrency,
+                            "requests": requests,
+                            "ideal_seconds": ideal,
+                            "efficiency": ideal / seconds if seconds > 0 else None,
+                        },
+                    )
+                )
+        finally:
+            cache.close()
+    return results
+
+
+def bench_imports(modules: Sequence[str] = IMPORT_MODULES, *, repeat: int = 3) -> list[dict]:
+    """Best-of-``repeat`` cumulative import time (ms) per module, in fresh interpreters."""
+    rows = []
+    for module in modules:
+        best_us = float("inf")
+        for _ in range(max(1, repeat)):
+            records = trace_import(module)
+            target = next((r for r in records if r.module == module), None)
+            best_us = min(best_us, target.cumulative_us if target else 0)
+        rows.append({"module": module, "cumulative_ms": best_us / 1000.0})
+    return rows
+
+
+def _git_commit() -> str | None:
+    proc = subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"],
+        capture_output=True,
+        text=True,
+        cwd=REPO_ROOT,
+        check=False,
+    )
+    return proc.stdout.strip() or None
+
+
+def run_benchmarks(args: argparse.Namespace) -> dict[str, Any]:
+    """Run every requested suite and return the JSON-ready report."""
+    results: list[BenchmarkResult] = []
+    for corpus in args.corpora:
+        for n in args.sizes:
+            try:
+                texts = build_corpus(corpus, n, seed=args.seed)
+            except FileNotFoundError as exc:
+                print(f"skipping {corpus} corpus: {exc}", file=sys.stderr)
+                break
+            print(f"{corpus} n={n:,}", file=sys.stderr)
+            results.extend(
+                bench_metrics(
+                    texts,
+                    corpus=corpus,
+                    backends=args.backends,
+                    repeat=args.repeat,
+                    memory=not args.no_memory,
+                    spacy_max_posts=args.spacy_max_posts,
+                )
+            )
+        else:
+            # Only reached when the corpus loaded (no ``break`` above).
+            if args.llm_posts:
+                results.extend(
+                    bench_llm(
+                        build_corpus(corpus, args.llm_posts, seed=args.seed),
+                        corpus=corpus,
+                        latency=args.llm_latency,
+                        max_concurrency=args.llm_concurrency,
+                    )
+                )
+    return {
+        "meta": {
+            "created_at": get_current_timestamp(),
+            "git_commit": _git_commit(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "args": {k: v for k, v in vars(args).items() if k not in {"output", "compare"}},
+        },
+        "imports": [] if args.no_imports else bench_imports(),
+        "results": [asdict(r) for r in results],
+    }
+
+
+def compare_reports(baseline: dict[str, Any], current: dict[str, Any]) -> list[dict[str, Any]]:
+    """Throughput ratio (current / baseline) for every case present and timed in both."""
+    def index(report: dict[str, Any]) -> dict[tuple, dict[str, Any]]:
+        return {
+            BenchmarkResult(**row).key: row
+            for row in report["results"]
+            if row["posts_per_second"] is not None
+        }
+
+    base, cur = index(baseline), index(current)
+    rows = []
+    for key in cur.keys() & base.keys():
+        suite, case, corpus, n_posts, backend = key
+        rows.append(
+            {
+                "suite": suite,
+                "case": case,
+                "corpus": corpus,
+                "n_posts": n_posts,
+                "backend": backend,
+                "baseline_posts_per_second": base[key]["posts_per_second"],
+                "posts_per_second": cur[key]["posts_per_second"],
+                "speedup": cur[key]["posts_per_second"] / base[key]["posts_per_second"],
+            }
+        )
+    return sorted(rows, key=lambda r: (r["suite"], r["corpus"], r["n_posts"], r["case"]))
+
+
+def _format_result(row: dict[str, Any]) -> str:
+    backend = f" [{row['backend']}]" if row["backend"] else ""
+    label = f"{row['suite']:<7} {row['corpus']:<9} {row['n_posts']:>9,} {row['case']}{backend}"
+    if row["skipped"]:
+        return f"{label:<60} skipped: {row['skipped']}"
+    memory = f"  peak {row['peak_mb']:8.1f} MiB" if row["peak_mb"] is not None else ""
+    return f"{label:<60} {row['posts_per_second']:>12,.0f} posts/s{memory}"
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument("--corpora", nargs="+", choices=CORPORA, default=list(CORPORA))
+    parser.add_argument("--backends", nargs="+", choices=BACKENDS, default=list(BACKENDS))
+    parser.add_argument("--repeat", type=int, default=1, help="Timed runs per case (best kept)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--spacy-max-posts",
+        type=int,
+        default=DEFAULT_SPACY_MAX_POSTS,
+        help="Skip spaCy-backed cases above this corpus size",
+    )
+    parser.add_argument("--no-memory", action="store_true", help="Skip tracemalloc runs")
+    parser.add_argument("--no-imports", action="store_true", help="Skip import timing")
+    parser.add_argument(
+        "--llm-posts",
+        type=int,
+        default=DEFAULT_LLM_POSTS,
+        help="Posts per LLM case, run once per corpus (0 disables the LLM suite)",
+    )
+    parser.add_argument(
+        "--llm-latency", type=float, default=DEFAULT_LLM_LATENCY, help="Fake seconds per request"
+    )
+    parser.add_argument("--llm-concurrency", type=int, default=None)
+    parser.add_argument("--output", type=Path, default=None, help="JSON report path")
+    parser.add_argument("--compare", type=Path, default=None, help="Baseline JSON report")
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    args = parse_args(argv)
+    report = run_benchmarks(args)
+    for row in report["imports"]:
+        print(f"import  {row['module']:<52} {row['cumulative_ms']:>12.1f} ms")
+    for row in report["results"]:
+        print(_format_result(row))
+
+    stamp = report["meta"]["created_at"].replace(":", "")
+    output = args.output or DEFAULT_OUTPUT_DIR / f"{stamp}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    print(f"wrote {output}")
+
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        for row in compare_reports(baseline, report):
+            backend = f" [{row['backend']}]" if row["backend"] else ""
+            print(
+                f"{row['suite']:<7} {row['corpus']:<9} {row['n_posts']:>9,} "
+                f"{row['case']}{backend}: {row['speedup']:.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""Import-time budget check for shared packages.
+
+Each module is imported in a fresh interpreter under ``python -X importtime``;
+the stderr trace is parsed into a report of cumulative import time and the
+slowest transitive imports. The script exits non-zero when a module exceeds
+its budget (best of ``--repeat`` runs) or pulls in a module it must not load
+at import time (e.g. spaCy or LangChain for ``shared.textual_features``).
+
+Run from repo root:
+
+    PYTHONPATH=. uv run python scripts/check_import_times.py
+    PYTHONPATH=. uv run python scripts/check_import_times.py --json import_times.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from lib.constants import REPO_ROOT
+
+
+@dataclass(frozen=True)
+class ImportBudget:
+    """Cumulative import-time ceiling and forbidden eager imports for one module."""
+
+    module: str
+    max_ms: float
+    forbidden: tuple[str, ...] = ()
+
+
+BUDGETS: tuple[ImportBudget, ...] = (
+    ImportBudget(
+        "shared.textual_features",
+        max_ms=150.0,
+        forbidden=("spacy", "langchain_core", "langchain_openai"),
+    ),
+    ImportBudget(
+        "shared.textual_features.registry",
+        max_ms=250.0,
+        forbidden=("spacy", "langchain_core", "langchain_openai"),
+    ),
+    ImportBudget(
+        "shared.embeddings",
+        max_ms=150.0,
+        forbidden=("boto3", "numpy"),
+    ),
+    ImportBudget(
+        "shared.embeddings.cache",
+        max_ms=600.0,
+        forbidden=("boto3", "pandas"),
+    ),
+)
+
+_LINE_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    """One ``-X importtime`` line (times in microseconds)."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class ModuleReport:
+    """Result of checking one :class:`ImportBudget`."""
+
+    module: str
+    cumulative_ms: float
+    max_ms: float
+    loaded_forbidden: list[str]
+    slowest: list[tuple[str, float]] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return self.cumulative_ms <= self.max_ms and not self.loaded_forbidden
+
+
+def parse_importtime(stderr: str) -> list[ImportRecord]:
+    """Parse ``python -X importtime`` stderr into records (header and noise skipped)."""
+    records = []
+    for line in stderr.splitlines():
+        match = _LINE_RE.match(line)
+        if match is None:
+            continue
+        self_us, cum_us, indent, name = match.groups()
+        records.append(
+            ImportRecord(
+                module=name,
+                self_us=int(self_us),
+                cumulative_us=int(cum_us),
+                depth=max(0, len(indent) - 1) // 2,
+            )
+        )
+    return records
+
+
+def trace_import(module: str) -> list[ImportRecord]:
+    """Import ``module`` in a fresh interpreter and return its import trace.
+
+    Raises
+    ------
+    RuntimeError
+        If the import fails.
+    """
+    pythonpath = [str(REPO_ROOT), os.environ.get("PYTHONPATH", "")]
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(p for p in pythonpath if p)}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        cwd=REPO_ROOT,
+        env=env,
+        check=False,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr[-2000:]}")
+    return parse_importtime(proc.stderr)
+
+
+def check_budget(budget: ImportBudget, *, repeat: int = 3, top: int = 10) -> ModuleReport:
+    """Best-of-``repeat`` cumulative time for ``budget.module`` plus forbidden-import check."""
+    best: list[ImportRecord] | None = None
+    best_us = float("inf")
+    for _ in range(max(1, repeat)):
+        records = trace_import(budget.module)
+        target = next((r for r in records if r.module == budget.module), None)
+        cum = target.cumulative_us if target else 0
+        if cum < best_us:
+            best, best_us = records, cum
+    records = best or []
+    loaded = {r.module.split(".")[0] for r in records}
+    slowest = sorted(records, key=lambda r: r.self_us, reverse=True)[:top]
+    return ModuleReport(
+        module=budget.module,
+        cumulative_ms=best_us / 1000.0,
+        max_ms=budget.max_ms,
+        loaded_forbidden=sorted(m for m in budget.forbidden if m in loaded),
+        slowest=[(r.module, r.self_us / 1000.0) for r in slowest],
+    )
+
+
+def _format_report(report: ModuleReport) -> str:
+    status = "ok" if report.ok else "FAIL"
+    lines = [
+        f"[{status}] {report.module}: {report.cumulative_ms:.1f} ms (budget {report.max_ms:.0f} ms)"
+    ]
+    if report.loaded_forbidden:
+        lines.append(f"    eagerly imports: {', '.join(report.loaded_forbidden)}")
+    for name, ms in report.slowest:
+        lines.append(f"    {ms:8.1f} ms  {name}")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Check import-time budgets for shared packages.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per module (best is kept)")
+    parser.add_argument("--top", type=int, default=8, help="Slowest imports to list per module")
+    parser.add_argument("--json", type=Path, default=None, help="Also write the report as JSON")
+    args = parser.parse_args()
+
+    reports = [check_budget(b, repeat=args.repeat, top=args.top) for b in BUDGETS]
+    for report in reports:
+        print(_format_report(report))
+    if args.json is not None:
+        args.json.write_text(
+            json.dumps([{**asdict(r), "ok": r.ok} for r in reports], indent=2) + "\n",
+            encoding="utf-8",
+        )
+    if not all(r.ok for r in reports):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Compare combined multi-label classification against the single-feature prompts.
+
+Labels a sample of posts from a registered dataset twice (once with the joint
+VALENCE/INTERGROUP/PRIME prompt and once with each feature's own prompt),
+prints per-label agreement and Cohen's kappa, and writes the report plus the
+per-post labels next to ``--output`` (default: under the gitignored
+``.cache/classifier_agreement/``).
+
+Run from repo root:
+
+    PYTHONPATH=. uv run python scripts/classifier_agreement_report.py
+    PYTHONPATH=. uv run python scripts/classifier_agreement_report.py --sample 500 --column claude_mirror
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+import pandas as pd
+
+from lib.constants import REPO_ROOT
+from shared.data.dataloader import load_dataset
+from shared.data.registry import STUDY_PHASE_2_PART_1_STIMULI
+from shared.textual_features.combined import agreement_report
+from shared.textual_features.registry import CLASSIFIER_MODULES, classify_features, get_feature
+
+DEFAULT_OUTPUT = REPO_ROOT / ".cache" / "classifier_agreement" / "classifier_agreement_report.csv"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dataset", default=STUDY_PHASE_2_PART_1_STIMULI)
+    parser.add_argument("--column", default="original_text")
+    parser.add_argument("--sample", type=int, default=200, help="Posts to label (0 = all)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-concurrency", type=int, default=16)
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=DEFAULT_OUTPUT,
+        help=f"Report CSV (default: {DEFAULT_OUTPUT})",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    texts = load_dataset(args.dataset)[args.column].dropna().astype(str)
+    texts = texts[texts.str.strip() != ""].drop_duplicates()
+    if args.sample and args.sample < len(texts):
+        texts = texts.sample(n=args.sample, random_state=args.seed)
+    posts = texts.tolist()
+
+    names = list(CLASSIFIER_MODULES)
+    combined = classify_features(names, posts, max_concurrency=args.max_concurrency)
+    separate = classify_features(
+        names, posts, combined=False, max_concurrency=args.max_concurrency
+    )
+    fields = {name: get_feature(name).label_field for name in names}
+    report = agreement_report(
+        {fields[n]: combined[n] for n in names}, {fields[n]: separate[n] for n in names}
+    )
+
+    labels = pd.DataFrame({"text": posts})
+    for name in names:
+        labels[f"combined_{fields[name]}"] = combined[name]
+        labels[f"separate_{fields[name]}"] = separate[name]
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    report.to_csv(args.output, index=False)
+    labels_path = args.output.with_name(f"{args.output.stem}_labels.csv")
+    labels.to_csv(labels_path, index=False)
+    print(report.to_string(index=False))
+    print(f"Wrote {args.output} and {labels_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""Export the spaCy rules snapshot used by the spaCy-free readability backend.
+
+Writes ``shared/textual_features/spacy_en_rules.json`` from the installed
+spaCy's blank English tokenizer and sentencizer. Re-run after upgrading spaCy;
+``shared/textual_features/tests/test_fast_readability.py`` fails while the
+committed snapshot and the installed spaCy disagree.
+
+Run from repo root:
+
+    PYTHONPATH=. uv run python scripts/export_spacy_tokenizer_rules.py
+"""
+
+from __future__ import annotations
+
+import json
+
+from shared.textual_features.fast_readability import RULES_PATH, export_rules
+
+
+def main() -> None:
+    snapshot = export_rules()
+    RULES_PATH.write_text(
+        json.dumps(snapshot, ensure_ascii=False, indent=1) + "\n", encoding="utf-8"
+    )
+    print(
+        f"Wrote {RULES_PATH} (spaCy {snapshot['spacy_version']}, "
+        f"{len(snapshot['specials'])} special cases)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,25 +2,391 @@
 
 Resolves any registered name (raw or transformed) to its CSV path and reads it
 with no further transforms.
+
+The first load of a CSV also writes a Parquet sidecar under
+``.cache/shared_data/``. Later loads read the sidecar, which supports column
+projection (``columns=``) and row-group predicate pushdown (``filters=``). A
+small JSON manifest next to the sidecar records the CSV's size, mtime, and
+SHA-256:
+
+- If the size and mtime are unchanged, the sidecar is used without hashing.
+- If either changed, the CSV is hashed. A matching hash only refreshes the
+  manifest.
+- A different hash rebuilds the sidecar.
+
+The sidecar returns the same frame ``pd.read_csv(path, low_memory=False)``
+would.
+
+With ``typed=True`` the entry's declared ``dtypes`` (categoricals, Arrow
+strings, sized nullable ints) are applied and validated after the read;
+:func:`memory_report` shows what that saves per column.
+
+Loaded frames are also memoized in-process, keyed by the load arguments and
+the CSV's size and mtime, in an LRU bounded by ``MEMO_MAX_BYTES`` of frame
+memory. Each call gets its own shallow copy. Under pandas copy-on-write,
+changes a caller makes to its copy never reach the memo or other callers.
+:func:`memo_info` reports hits, misses, and evictions.
+
+To run:
+
+PYTHONPATH=. uv run python -c "from shared.data.dataloader import load_dataset; print(load_dataset('STUDY_PHASE_2_PART_1_STIMULI', columns=['post_primary_key', 'original_text']).head())"
+PYTHONPATH=. uv run python -m shared.data.dataloader STUDY_PHASE_2_PART_1_RESULTS_PILOT
 """
 
 from __future__ import annotations
 
+import argparse
+import hashlib
+import json
+import os
+import uuid
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
 import pandas as pd
 
 from shared.data import registry
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+DEFAULT_CACHE_DIR = registry.REPO_ROOT / ".cache" / "shared_data"
+_HASH_CHUNK_BYTES = 1 << 20
+# Row groups small enough that ``filters`` can skip most of a results file.
+_ROW_GROUP_SIZE = 50_000
 
-def load_dataset(name: str, *, low_memory: bool = False) -> pd.DataFrame:
+# pyarrow DNF: a list of (column, op, value) tuples ANDed together, or a list
+# of such lists ORed together.
+Filters = Sequence[tuple[str, str, Any]] | Sequence[Sequence[tuple[str, str, Any]]]
+
+# Upper bound on the deep memory of frames kept by the in-process memo. A
+# frame larger than this on its own is returned but not memoized.
+MEMO_MAX_BYTES = 1 << 30
+
+
+@dataclass(frozen=True)
+class MemoInfo:
+    """Counters of the in-process ``load_dataset`` memo, like ``functools.cache_info``."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    nbytes: int
+    max_bytes: int
+
+
+_memo: OrderedDict[tuple[Any, ...], tuple[pd.DataFrame, int]] = OrderedDict()
+_memo_counts = {"hits": 0, "misses": 0, "evictions": 0}
+
+
+def load_dataset(
+    name: str,
+    *,
+    columns: Sequence[str] | None = None,
+    filters: Filters | None = None,
+    low_memory: bool = False,
+    use_cache: bool = True,
+    typed: bool = False,
+    memo: bool = True,
+) -> pd.DataFrame:
     """Load a registered study CSV by name with no transforms.
 
     Works for raw and transformed registry entries alike.
 
+    Args:
+        name: Registry key, e.g. ``STUDY_PHASE_2_PART_2_RESULTS_FULL``.
+        columns: Columns to return, in this order. Defaults to all columns.
+        filters: pyarrow-style row filters, e.g. ``[("phase", "==", 1)]``.
+            Rows where a filtered column is missing never match. The result
+            has a fresh ``RangeIndex``.
+        low_memory: Forwarded to ``pd.read_csv``. ``True`` bypasses the
+            sidecar, which is always built with ``low_memory=False``.
+        use_cache: Read through (and build) the Parquet sidecar. ``False``
+            parses the CSV every time and skips the in-process memo.
+        typed: Apply the entry's declared ``dtypes`` (see
+            :func:`apply_dtypes`). Off by default: categoricals reject new
+            values (``fillna("")``) and nullable ints yield ``pd.NA`` in
+            comparisons, which not every caller expects.
+        memo: Serve repeated identical loads of an unchanged file from the
+            in-process memo (see :func:`memo_info`). Only applies to sidecar
+            reads.
+
     Raises:
-        KeyError: If ``name`` is not in the registry.
+        KeyError: If ``name`` is not in the registry, or if ``columns`` or
+            ``filters`` name columns the dataset does not have. The message
+            lists every missing column.
         FileNotFoundError: If the resolved CSV path is missing on disk.
+        ValueError: With ``typed=True``, if a declared column is missing or
+            cannot be cast.
     """
     path = registry.resolve_path(name)
     if not path.is_file():
         raise FileNotFoundError(f"Dataset file not found: {path}")
-    return pd.read_csv(path, low_memory=low_memory)
+    columns = list(columns) if columns is not None else None
+    key = None
+    if memo and use_cache and not low_memory:
+        stat = path.stat()
+        key = (
+            name,
+            str(path),
+            stat.st_size,
+            stat.st_mtime_ns,
+            tuple(columns) if columns is not None else None,
+            repr(filters) if filters else None,
+            typed,
+        )
+        if key in _memo:
+            _memo.move_to_end(key)
+            _memo_counts["hits"] += 1
+            return _memo[key][0].copy(deep=False)
+        _memo_counts["misses"] += 1
+    if use_cache and not low_memory:
+        import pyarrow.parquet as pq
+
+        sidecar = ensure_sidecar(name)
+        _check_columns(pq.read_schema(sidecar).names, columns, filters, name)
+        frame = pd.read_parquet(sidecar, columns=columns, filters=filters or None)
+        frame = _restore_missing(frame)
+    else:
+        frame = pd.read_csv(path, low_memory=low_memory)
+        _check_columns(frame.columns, columns, filters, name)
+        if filters:
+            frame = _filter_frame(frame, filters)
+        if columns is not None:
+            frame = frame[columns]
+    if typed:
+        frame = apply_dtypes(frame, name, strict=columns is None)
+    if key is not None:
+        _memoize(key, frame)
+        return frame.copy(deep=False)
+    return frame
+
+
+def memo_info() -> MemoInfo:
+    """Hit, miss, and eviction counts and current size of the ``load_dataset`` memo."""
+    return MemoInfo(
+        hits=_memo_counts["hits"],
+        misses=_memo_counts["misses"],
+        evictions=_memo_counts["evictions"],
+        entries=len(_memo),
+        nbytes=sum(nbytes for _, nbytes in _memo.values()),
+        max_bytes=MEMO_MAX_BYTES,
+    )
+
+
+def memo_clear() -> None:
+    """Drop every memoized frame and reset the counters."""
+    _memo.clear()
+    _memo_counts.update(hits=0, misses=0, evictions=0)
+
+
+def _memoize(key: tuple[Any, ...], frame: pd.DataFrame) -> None:
+    nbytes = int(frame.memory_usage(deep=True).sum())
+    if nbytes > MEMO_MAX_BYTES:
+        return
+    _memo[key] = (frame, nbytes)
+    total = sum(size for _, size in _memo.values())
+    while total > MEMO_MAX_BYTES:
+        _, (_, evicted) = _memo.popitem(last=False)
+        total -= evicted
+        _memo_counts["evictions"] += 1
+
+
+def apply_dtypes(frame: pd.DataFrame, name: str, *, strict: bool = True) -> pd.DataFrame:
+    """Cast ``frame``'s columns to the dtypes declared for ``name``.
+
+    Args:
+        frame: Frame loaded for ``name`` (all or some of its columns).
+        name: Registry key whose ``DatasetEntry.dtypes`` are applied.
+        strict: Require every declared column to be present. Projected loads
+            pass ``False`` and only cast the columns they read.
+
+    Raises:
+        KeyError: If ``name`` is not in the registry.
+        ValueError: If a declared column is missing (``strict``) or its values
+            do not fit the declared dtype (e.g. ``2.5`` or ``300`` for
+            ``Int8``).
+    """
+    declared = registry.get_dataset(name).dtypes
+    missing = [column for column in declared if column not in frame.columns]
+    if strict and missing:
+        raise ValueError(f"{name}: declared columns missing from the file: {missing}")
+    casts = {column: dtype for column, dtype in declared.items() if column in frame.columns}
+    out = frame.copy(deep=False)
+    for column, dtype in casts.items():
+        if str(out[column].dtype) == dtype:
+            continue
+        try:
+            out[column] = out[column].astype(dtype)
+        except (TypeError, ValueError) as exc:
+            raise ValueError(
+                f"{name}: column {column!r} ({out[column].dtype}) cannot be cast to "
+                f"{dtype}: {exc}"
+            ) from exc
+    return out
+
+
+def memory_report(name: str) -> pd.DataFrame:
+    """Per-column deep memory of ``name`` as inferred and with declared dtypes.
+
+    Returns:
+        One row per column (``column``, ``inferred``, ``declared``,
+        ``inferred_bytes``, ``declared_bytes``) plus a ``TOTAL`` row, largest
+        inferred columns first.
+
+    Raises:
+        KeyError: If ``name`` is not in the registry.
+        FileNotFoundError: If the resolved CSV path is missing on disk.
+        ValueError: If the declared dtypes do not validate.
+    """
+    inferred = load_dataset(name)
+    typed = apply_dtypes(inferred, name)
+    before = inferred.memory_usage(deep=True, index=False)
+    after = typed.memory_usage(deep=True, index=False)
+    report = pd.DataFrame(
+        {
+            "column": inferred.columns,
+            "inferred": [str(t) for t in inferred.dtypes],
+            "declared": [str(t) for t in typed.dtypes],
+            "inferred_bytes": before.to_numpy(),
+            "declared_bytes": after.to_numpy(),
+        }
+    ).sort_values("inferred_bytes", ascending=False, ignore_index=True)
+    total = {
+        "column": "TOTAL",
+        "inferred": "",
+        "declared": "",
+        "inferred_bytes": int(before.sum()),
+        "declared_bytes": int(after.sum()),
+    }
+    return pd.concat([report, pd.DataFrame([total])], ignore_index=True)
+
+
+def ensure_sidecar(name: str, *, cache_dir: Path | None = None) -> Path:
+    """Return the up-to-date Parquet sidecar for ``name``, building it if needed.
+
+    Raises:
+        KeyError: If ``name`` is not in the registry.
+        FileNotFoundError: If the resolved CSV path is missing on disk.
+    """
+    path = registry.resolve_path(name)
+    cache_dir = Path(cache_dir or DEFAULT_CACHE_DIR)
+    manifest_path = cache_dir / f"{name}.json"
+    stat = path.stat()
+    manifest = _read_manifest(manifest_path)
+    if manifest is not None:
+        sidecar = cache_dir / manifest["sidecar"]
+        if sidecar.is_file():
+            if (manifest["size"], manifest["mtime_ns"]) == (stat.st_size, stat.st_mtime_ns):
+                return sidecar
+            if manifest["size"] == stat.st_size and manifest["sha256"] == _file_sha256(path):
+                _write_manifest(manifest_path, {**manifest, "mtime_ns": stat.st_mtime_ns})
+                return sidecar
+
+    digest = _file_sha256(path)
+    sidecar = cache_dir / f"{name}-{digest[:16]}.parquet"
+    if not sidecar.is_file():
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        frame = pd.read_csv(path, low_memory=False)
+        tmp = cache_dir / f".{sidecar.name}.{uuid.uuid4().hex[:8]}.tmp"
+        frame.to_parquet(tmp, index=False, row_group_size=_ROW_GROUP_SIZE)
+        os.replace(tmp, sidecar)
+    _write_manifest(
+        manifest_path,
+        {
+            "csv": str(registry.get_dataset(name).relative_path),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": digest,
+            "sidecar": sidecar.name,
+        },
+    )
+    for stale in cache_dir.glob(f"{name}-*.parquet"):
+        if stale != sidecar:
+            stale.unlink(missing_ok=True)
+    return sidecar
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        while chunk := f.read(_HASH_CHUNK_BYTES):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _read_manifest(path: Path) -> dict[str, Any] | None:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def _write_manifest(path: Path, manifest: dict[str, Any]) -> None:
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+    tmp.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _restore_missing(frame: pd.DataFrame) -> pd.DataFrame:
+    """Turn Parquet's ``None`` back into ``NaN`` in object columns, as ``read_csv`` returns."""
+    for column in frame.columns[frame.dtypes == object]:
+        frame[column] = frame[column].where(frame[column].notna(), float("nan"))
+    return frame
+
+
+def _filter_frame(frame: pd.DataFrame, filters: Filters) -> pd.DataFrame:
+    """Apply ``filters`` with the same Arrow semantics the sidecar read uses."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    expression = pq.filters_to_expression(filters)
+    referenced = _filter_columns(filters)
+    table: pa.Table = pa.Table.from_pandas(frame[referenced], preserve_index=False)
+    table = table.append_column("__row", pa.array(range(len(frame)), type=pa.int64()))
+    rows = table.filter(expression)["__row"].to_numpy()
+    return frame.iloc[rows].reset_index(drop=True)
+
+
+def _check_columns(
+    available: Sequence[str],
+    columns: Sequence[str] | None,
+    filters: Filters | None,
+    name: str,
+) -> None:
+    """Raise one ``KeyError`` naming every requested or filtered column not in ``available``."""
+    requested = [*(columns or []), *(_filter_columns(filters) if filters else [])]
+    known = set(available)
+    missing = [column for column in dict.fromkeys(requested) if column not in known]
+    if missing:
+        raise KeyError(f"{name} has no columns {missing}")
+
+
+def _filter_columns(filters: Filters) -> list[str]:
+    groups = filters if filters and not isinstance(filters[0], tuple) else [filters]
+    return list(dict.fromkeys(column for group in groups for column, _, _ in group))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Report memory before and after applying a dataset's declared dtypes."
+    )
+    parser.add_argument("names", nargs="+", help="Registry keys")
+    args = parser.parse_args()
+    for name in args.names:
+        report = memory_report(name)
+        total = report.iloc[-1]
+        ratio = total["declared_bytes"] / total["inferred_bytes"]
+        print(
+            f"{name}: {total['inferred_bytes'] / 2**20:.1f} MiB -> "
+            f"{total['declared_bytes'] / 2**20:.1f} MiB ({ratio:.0%})"
+        )
+        print(report.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,315 @@
+"""Incremental rebuild of transformed datasets declared as a DAG over registry names.
+
+Each :class:`TransformNode` names the registry entry it writes, the registry
+entries it reads, and the function that writes it. :func:`rebuild` keeps a
+JSON manifest next to the outputs. For each node the manifest records the
+SHA-256 of its inputs, of the module that defines its writer, and of the
+output it produced. A node is rerun only if one of these changed, its output
+is missing, or a node upstream of it is rerun.
+
+Independent stale nodes run in parallel worker processes. As in the Parquet
+sidecar manifest, a file whose size and mtime match its record is not
+re-hashed.
+
+To run (Study Phase 2 Part 2)::
+
+    PYTHONPATH=. uv run python shared/data/transformed/study_phase_2_part_2/main.py rebuild --dry-run
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import multiprocessing
+import os
+import uuid
+from collections.abc import Callable, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from shared.data import dataloader, registry
+
+MANIFEST_VERSION = 1
+
+Fingerprint = dict[str, Any]
+
+
+@dataclass(frozen=True)
+class TransformNode:
+    """One transform in a rebuild DAG.
+
+    ``write`` is called with the resolved path of ``output`` and must write
+    that file. It must be a module-level function so worker processes can
+    import it. Its defining module is hashed as the node's code.
+    """
+
+    output: str
+    inputs: tuple[str, ...]
+    write: Callable[[Path], object]
+
+    @property
+    def code_path(self) -> Path:
+        return Path(inspect.getsourcefile(self.write) or "")
+
+
+def plan(
+    nodes: Sequence[TransformNode], manifest_path: Path, *, force: bool = False
+) -> dict[str, str | None]:
+    """Return why each node must be rerun, or ``None`` if it is fresh.
+
+    Args:
+        nodes: The DAG. Inputs that are not another node's output are leaves.
+        manifest_path: Manifest written by earlier :func:`rebuild` runs.
+        force: Treat every node as stale.
+
+    Raises:
+        KeyError: If a node names an unknown dataset.
+        ValueError: If two nodes write the same output or the graph has a cycle.
+        FileNotFoundError: If a leaf input is missing on disk.
+    """
+    order = _topological_order(nodes)
+    records = _read_manifest(manifest_path)
+    hasher = _Hasher(records)
+    reasons: dict[str, str | None] = {}
+    for node in order:
+        reasons[node.output] = "forced" if force else _stale_reason(node, records, reasons, hasher)
+    return reasons
+
+
+def rebuild(
+    nodes: Sequence[TransformNode],
+    manifest_path: Path,
+    *,
+    jobs: int | None = None,
+    force: bool = False,
+    dry_run: bool = False,
+    log: Callable[[str], None] = print,
+) -> list[str]:
+    """Rerun the stale nodes of ``nodes`` and return their outputs in completion order.
+
+    Args:
+        nodes: The DAG; see :func:`plan`.
+        manifest_path: JSON manifest to read and update after each node.
+        jobs: Worker processes. Defaults to one per stale node, capped at the
+            CPU count. ``1`` runs every node in this process.
+        force: Rerun every node.
+        dry_run: Only log the plan.
+        log: Receives one line per node.
+
+    Raises:
+        KeyError: If a node names an unknown dataset.
+        ValueError: If two nodes write the same output or the graph has a cycle.
+        FileNotFoundError: If a leaf input is missing on disk.
+        Exception: The first error raised by a transform. Nodes already
+            finished are recorded in the manifest. Nodes downstream of the
+            failed one are not started.
+    """
+    reasons = plan(nodes, manifest_path, force=force)
+    for name, reason in reasons.items():
+        log(f"{'stale' if reason else 'fresh'}  {name}" + (f"  ({reason})" if reason else ""))
+    stale = [node for node in _topological_order(nodes) if reasons[node.output]]
+    if dry_run or not stale:
+        return []
+
+    jobs = jobs or min(len(stale), os.cpu_count() or 1)
+    if jobs > 1:
+        # Build leaf sidecars once here so parallel workers do not each parse
+        # the same raw CSV.
+        produced = {node.output for node in nodes}
+        for name in dict.fromkeys(i for node in stale for i in node.inputs if i not in produced):
+            dataloader.ensure_sidecar(name)
+
+    records = _read_manifest(manifest_path)
+    hasher = _Hasher(records)
+    pending = {node.output: node for node in stale}
+    done: list[str] = []
+    error: BaseException | None = None
+
+    def finish(node: TransformNode) -> None:
+        hasher.forget(registry.resolve_path(node.output))
+        records[node.output] = _record(node, hasher)
+        _write_manifest(manifest_path, records)
+        done.append(node.output)
+        log(f"built  {node.output}")
+
+    def ready() -> list[TransformNode]:
+        return [
+            node
+            for node in pending.values()
+            if not any(i in pending for i in node.inputs)
+        ]
+
+    if jobs == 1:
+        for node in list(pending.values()):
+            node.write(registry.resolve_path(node.output))
+            del pending[node.output]
+            finish(node)
+        return done
+
+    running: dict[Future[None], TransformNode] = {}
+    # spawn, not fork: the parent may already hold pyarrow's thread pools.
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=context) as pool:
+        while pending or running:
+            if error is None:
+                for node in ready():
+                    if node not in running.values():
+                        path = registry.resolve_path(node.output)
+                        running[pool.submit(_run_node, node.write, path)] = node
+            if not running:
+                break
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                node = running.pop(future)
+                try:
+                    future.result()
+                except Exception as exc:  # re-raised once running nodes finish
+                    error = error or exc
+                    continue
+                del pending[node.output]
+                finish(node)
+    if error is not None:
+        raise error
+    return done
+
+
+def _run_node(write: Callable[[Path], object], path: Path) -> None:
+    """Worker entry point. Discards the written frame instead of pickling it back."""
+    write(path)
+
+
+def _topological_order(nodes: Sequence[TransformNode]) -> list[TransformNode]:
+    by_output: dict[str, TransformNode] = {}
+    for node in nodes:
+        for name in (node.output, *node.inputs):
+            registry.get_dataset(name)
+        if node.output in by_output:
+            raise ValueError(f"More than one node writes {node.output}")
+        by_output[node.output] = node
+
+    order: list[TransformNode] = []
+    state: dict[str, str] = {}
+
+    def visit(node: TransformNode, path: tuple[str, ...]) -> None:
+        if state.get(node.output) == "done":
+            return
+        if state.get(node.output) == "visiting":
+            raise ValueError(f"Cycle in transform graph: {' -> '.join((*path, node.output))}")
+        state[node.output] = "visiting"
+        for name in node.inputs:
+            if name in by_output:
+                visit(by_output[name], (*path, node.output))
+        state[node.output] = "done"
+        order.append(node)
+
+    for node in nodes:
+        visit(node, ())
+    return order
+
+
+def _stale_reason(
+    node: TransformNode,
+    records: dict[str, Any],
+    reasons: dict[str, str | None],
+    hasher: _Hasher,
+) -> str | None:
+    upstream = [name for name in node.inputs if reasons.get(name)]
+    if upstream:
+        return f"upstream {upstream[0]} is stale"
+    record = records.get(node.output)
+    if record is None:
+        return "never built"
+    if set(record["inputs"]) != set(node.inputs):
+        return "inputs changed"
+    for name in node.inputs:
+        if hasher.sha256(registry.resolve_path(name)) != record["inputs"][name]["sha256"]:
+            return f"input {name} changed"
+    if hasher.sha256(node.code_path) != record["code"]["sha256"]:
+        return f"code {_relative(node.code_path)} changed"
+    output = registry.resolve_path(node.output)
+    if not output.is_file():
+        return "output missing"
+    if hasher.sha256(output) != record["output"]["sha256"]:
+        return "output modified"
+    return None
+
+
+def _record(node: TransformNode, hasher: _Hasher) -> dict[str, Any]:
+    return {
+        "inputs": {
+            name: hasher.fingerprint(registry.resolve_path(name)) for name in node.inputs
+        },
+        "code": hasher.fingerprint(node.code_path),
+        "output": hasher.fingerprint(registry.resolve_path(node.output)),
+    }
+
+
+class _Hasher:
+    """SHA-256 of files, skipping files whose size and mtime match the manifest."""
+
+    def __init__(self, records: dict[str, Any]) -> None:
+        self._known: dict[str, Fingerprint] = {}
+        for record in records.values():
+            for fingerprint in (record["code"], record["output"], *record["inputs"].values()):
+                self._known[fingerprint["path"]] = fingerprint
+        self._memo: dict[Path, Fingerprint] = {}
+
+    def fingerprint(self, path: Path) -> Fingerprint:
+        if path in self._memo:
+            return self._memo[path]
+        if not path.is_file():
+            raise FileNotFoundError(f"Dataset file not found: {path}")
+        stat = path.stat()
+        key = _relative(path)
+        known = self._known.get(key)
+        if known and (known["size"], known["mtime_ns"]) == (stat.st_size, stat.st_mtime_ns):
+            digest = known["sha256"]
+        else:
+            digest = _file_sha256(path)
+        fingerprint = {
+            "path": key,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": digest,
+        }
+        self._memo[path] = fingerprint
+        return fingerprint
+
+    def sha256(self, path: Path) -> str:
+        return self.fingerprint(path)["sha256"]
+
+    def forget(self, path: Path) -> None:
+        """Drop the memoized fingerprint of a file that was just rewritten."""
+        self._memo.pop(path, None)
+
+
+def _relative(path: Path) -> str:
+    try:
+        return str(path.resolve().relative_to(registry.REPO_ROOT))
+    except ValueError:
+        return str(path)
+
+
+def _file_sha256(path: Path) -> str:
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def _read_manifest(path: Path) -> dict[str, Any]:
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {}
+    return manifest["nodes"]
+
+
+def _write_manifest(path: Path, records: dict[str, Any]) -> None:
+    manifest = {"version": MANIFEST_VERSION, "nodes": dict(sorted(records.items()))}
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+    tmp.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp, path)
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Literal
 
@@ -24,18 +25,75 @@ STUDY_PHASE_2_PART_2_USER_REFLECTION_FEEDBACK = (
 )
 
 
+# Declared column dtypes, applied by ``load_dataset(name, typed=True)``:
+# ``category`` for low-cardinality labels and per-trial repeated IDs, ``str``
+# (Arrow-backed in pandas 3) for free text, and sized nullable ints for
+# integer codes that are missing on some rows. Undeclared columns keep the
+# dtype ``read_csv`` infers.
+_RESULTS_DTYPES: dict[str, str] = {
+    "trial_type": "category",
+    "trial_index": "Int32",
+    "post_id": "str",
+    "post_number": "Int32",
+    "sampled_stance": "category",
+    "sample_toxicity_type": "category",
+    "phase": "Int8",
+    "evaluation_mode": "category",
+    "original_text": "str",
+    "mirror_text": "str",
+    "show_pair": "boolean",
+    "decision": "category",
+    "pair_order": "category",
+    "evaluated_post_role": "category",
+    "participant_id": "category",
+    "prolific_id": "category",
+    "consented": "Int8",
+    "political_affiliation": "category",
+    "party_lean": "category",
+    "party_group": "category",
+    "condition": "category",
+    "age": "Int16",
+    "gender": "category",
+    "education": "category",
+    "political_ideology": "Int8",
+    "political_follow": "Int8",
+    "rep_id": "Int8",
+    "dem_id": "Int8",
+    "attitude_reduce_abortion": "Int16",
+    "attitude_citizenship_undocumented": "Int16",
+    "attitude_restrict_guns": "Int16",
+    "attitude_regulate_environment": "Int16",
+    "attitude_raise_wealth_taxes": "Int16",
+    "attitude_expand_medicaid": "Int16",
+    "phase1_pair_reflection_text": "str",
+    "phase1_pair_influence_rating": "Int8",
+}
+
+_KEEP_REMOVE_LABELS_DTYPES: dict[str, str] = {
+    "message_id": "str",
+    "original_text": "str",
+    "mirror_text": "str",
+    "decision": "category",
+    "keep_remove_label": "Int8",
+}
+
+
 @dataclass(frozen=True)
 class DatasetEntry:
     """Immutable catalog record for one registered study CSV.
 
     ``kind`` is ``results`` or ``stimuli`` for raw inputs, or
     ``transformed`` for derived artifacts under ``shared/data/transformed/``.
+    ``dtypes`` maps column names to the pandas dtypes ``load_dataset``
+    applies and validates with ``typed=True``; every declared column must be
+    present in the file.
     """
 
     name: str
     relative_path: Path
     kind: DatasetKind
     study_phase: str
+    dtypes: Mapping[str, str] = field(default_factory=dict)
 
 
 DATASETS: dict[str, DatasetEntry] = {
@@ -44,12 +102,14 @@ DATASETS: dict[str, DatasetEntry] = {
         relative_path=Path("shared/data/raw/study_phase_2_part_1/results/pilot.csv"),
         kind="results",
         study_phase="study_phase_2_part_1",
+        dtypes=_RESULTS_DTYPES,
     ),
     STUDY_PHASE_2_PART_1_RESULTS_FULL: DatasetEntry(
         name=STUDY_PHASE_2_PART_1_RESULTS_FULL,
         relative_path=Path("shared/data/raw/study_phase_2_part_1/results/full.csv"),
         kind="results",
         study_phase="study_phase_2_part_1",
+        dtypes=_RESULTS_DTYPES,
     ),
     STUDY_PHASE_2_PART_1_STIMULI: DatasetEntry(
         name=STUDY_PHASE_2_PART_1_STIMULI,
@@ -58,18 +118,33 @@ DATASETS: dict[str, DatasetEntry] = {
         ),
         kind="stimuli",
         study_phase="study_phase_2_part_1",
+        dtypes={
+            "post_primary_key": "str",
+            "post_number": "Int32",
+            "original_text": "str",
+            "claude_mirror": "str",
+            "sampled_stance": "category",
+            "sample_toxicity_type": "category",
+        },
     ),
     STUDY_PHASE_2_PART_2_RESULTS_FULL: DatasetEntry(
         name=STUDY_PHASE_2_PART_2_RESULTS_FULL,
         relative_path=Path("shared/data/raw/study_phase_2_part_2/results/full.csv"),
         kind="results",
         study_phase="study_phase_2_part_2",
+        dtypes=_RESULTS_DTYPES,
     ),
     STUDY_PHASE_2_PART_2_STIMULI: DatasetEntry(
         name=STUDY_PHASE_2_PART_2_STIMULI,
         relative_path=Path("shared/data/raw/study_phase_2_part_2/stimuli/flips.csv"),
         kind="stimuli",
         study_phase="study_phase_2_part_2",
+        dtypes={
+            "post_primary_key": "str",
+            "original_text": "str",
+            "sampled_stance": "category",
+            "sample_toxicity_type": "category",
+        },
     ),
     STUDY_PHASE_2_PART_2_KEEP_REMOVE_LABELS: DatasetEntry(
         name=STUDY_PHASE_2_PART_2_KEEP_REMOVE_LABELS,
@@ -78,6 +153,7 @@ DATASETS: dict[str, DatasetEntry] = {
         ),
         kind="transformed",
         study_phase="study_phase_2_part_2",
+        dtypes=_KEEP_REMOVE_LABELS_DTYPES,
     ),
     STUDY_PHASE_2_PART_2_KEEP_REMOVE_LABELS_UNANIMOUS_MIN3: DatasetEntry(
         name=STUDY_PHASE_2_PART_2_KEEP_REMOVE_LABELS_UNANIMOUS_MIN3,
@@ -87,6 +163,7 @@ DATASETS: dict[str, DatasetEntry] = {
         ),
         kind="transformed",
         study_phase="study_phase_2_part_2",
+        dtypes={**_KEEP_REMOVE_LABELS_DTYPES, "n_raters": "Int16"},
     ),
     STUDY_PHASE_2_PART_2_USER_REFLECTION_FEEDBACK: DatasetEntry(
         name=STUDY_PHASE_2_PART_2_USER_REFLECTION_FEEDBACK,
@@ -95,6 +172,12 @@ DATASETS: dict[str, DatasetEntry] = {
         ),
         kind="transformed",
         study_phase="study_phase_2_part_2",
+        dtypes={
+            "participant_id": "str",
+            "prolific_id": "str",
+            "phase1_pair_reflection_text": "str",
+            "phase1_pair_influence_rating": "Int8",
+        },
     ),
 }
 
@@ -0,0 +1,267 @@
+"""Tests for load_dataset and its Parquet sidecar cache."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from shared.data import dataloader, registry
+from shared.data.dataloader import (
+    apply_dtypes,
+    ensure_sidecar,
+    load_dataset,
+    memo_clear,
+    memo_info,
+    memory_report,
+)
+from shared.data.registry import STUDY_PHASE_2_PART_1_RESULTS_PILOT, DatasetEntry
+
+TOY = "TOY_RESULTS"
+TOY_DTYPES = {
+    "participant_id": "category",
+    "phase": "Int8",
+    "decision": "category",
+    "show_pair": "boolean",
+}
+TOY_CSV = (
+    "participant_id,phase,decision,show_pair\n"
+    "p1,1,keep,True\n"
+    "p1,2,remove,\n"
+    "p2,1,,False\n"
+    "p3,,keep,True\n"
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_memo():
+    memo_clear()
+    yield
+    memo_clear()
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(dataloader, "DEFAULT_CACHE_DIR", cache_dir)
+    return cache_dir
+
+
+@pytest.fixture
+def toy_csv(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, cache_dir: Path) -> Path:
+    """Register ``TOY`` at ``tmp_path/raw/toy.csv``."""
+    path = tmp_path / "raw" / "toy.csv"
+    path.parent.mkdir()
+    path.write_text(TOY_CSV, encoding="utf-8")
+    monkeypatch.setattr(registry, "REPO_ROOT", tmp_path)
+    monkeypatch.setitem(
+        registry.DATASETS,
+        TOY,
+        DatasetEntry(
+            TOY, Path("raw/toy.csv"), kind="results", study_phase="toy", dtypes=TOY_DTYPES
+        ),
+    )
+    return path
+
+
+@pytest.fixture
+def csv_reads(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    """Record every ``pd.read_csv`` call the loader makes."""
+    calls: list[Path] = []
+    real = pd.read_csv
+
+    def read_csv(path, *args, **kwargs):
+        calls.append(Path(path))
+        return real(path, *args, **kwargs)
+
+    monkeypatch.setattr(dataloader.pd, "read_csv", read_csv)
+    return calls
+
+
+class TestLoadDataset:
+    """Tests for load_dataset() through the sidecar."""
+
+    def test_matches_read_csv_on_registry_file(self, cache_dir: Path) -> None:
+        """Verifies the sidecar returns exactly what read_csv does for a study CSV."""
+        expected = pd.read_csv(
+            registry.resolve_path(STUDY_PHASE_2_PART_1_RESULTS_PILOT), low_memory=False
+        )
+        first = load_dataset(STUDY_PHASE_2_PART_1_RESULTS_PILOT)
+        second = load_dataset(STUDY_PHASE_2_PART_1_RESULTS_PILOT)
+        pd.testing.assert_frame_equal(first, expected)
+        pd.testing.assert_frame_equal(second, expected)
+
+    def test_columns_and_filters(self, toy_csv: Path) -> None:
+        """Verifies projection order, pushdown filters, and that missing values never match."""
+        result = load_dataset(
+            TOY, columns=["decision", "participant_id"], filters=[("phase", "==", 1)]
+        )
+        assert list(result.columns) == ["decision", "participant_id"]
+        assert result["participant_id"].tolist() == ["p1", "p2"]
+        assert result.index.tolist() == [0, 1]
+
+    def test_filters_match_without_cache(self, toy_csv: Path) -> None:
+        """Verifies the CSV path filters and projects like the sidecar path."""
+        kwargs = dict(
+            columns=["participant_id", "show_pair"],
+            filters=[[("decision", "==", "keep")], [("phase", ">", 1)]],
+        )
+        cached = load_dataset(TOY, **kwargs)
+        uncached = load_dataset(TOY, use_cache=False, **kwargs)
+        pd.testing.assert_frame_equal(cached, uncached)
+        assert cached["participant_id"].tolist() == ["p1", "p1", "p3"]
+
+    @pytest.mark.parametrize("use_cache", [True, False])
+    def test_unknown_columns_raise_key_error(self, toy_csv: Path, use_cache: bool) -> None:
+        """Verifies both paths raise one KeyError naming every unknown column."""
+        with pytest.raises(KeyError, match=r"\['nope', 'absent'\]"):
+            load_dataset(
+                TOY,
+                columns=["participant_id", "nope"],
+                filters=[("absent", "==", 1)],
+                use_cache=use_cache,
+            )
+
+    def test_missing_file(self, toy_csv: Path) -> None:
+        """Verifies a registered but absent CSV raises FileNotFoundError."""
+        toy_csv.unlink()
+        with pytest.raises(FileNotFoundError, match="Dataset file not found"):
+            load_dataset(TOY)
+
+
+class TestEnsureSidecar:
+    """Tests for sidecar reuse and invalidation."""
+
+    def test_parses_csv_once(self, toy_csv: Path, csv_reads: list[Path]) -> None:
+        """Verifies later loads read the sidecar instead of the CSV."""
+        for _ in range(3):
+            load_dataset(TOY, memo=False)
+        assert csv_reads == [toy_csv]
+
+    def test_touch_without_change_reuses_sidecar(
+        self, toy_csv: Path, csv_reads: list[Path]
+    ) -> None:
+        """Verifies a new mtime with identical content is revalidated by hash, not re-parsed."""
+        sidecar = ensure_sidecar(TOY)
+        stat = toy_csv.stat()
+        os.utime(toy_csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert ensure_sidecar(TOY) == sidecar
+        assert len(csv_reads) == 1
+
+    def test_edit_rebuilds_and_drops_stale_sidecar(
+        self, toy_csv: Path, cache_dir: Path
+    ) -> None:
+        """Verifies changed content yields a new sidecar and removes the old one."""
+        old = ensure_sidecar(TOY)
+        toy_csv.write_text(TOY_CSV + "p4,2,keep,True\n", encoding="utf-8")
+        new = ensure_sidecar(TOY)
+        assert new != old and not old.exists()
+        assert load_dataset(TOY)["participant_id"].tolist()[-1] == "p4"
+        assert sorted(p.name for p in cache_dir.glob("*.parquet")) == [new.name]
+
+    def test_low_memory_bypasses_sidecar(self, toy_csv: Path, cache_dir: Path) -> None:
+        """Verifies low_memory=True parses the CSV and writes no sidecar."""
+        load_dataset(TOY, low_memory=True)
+        assert not cache_dir.exists()
+
+
+class TestDeclaredDtypes:
+    """Tests for typed loads, apply_dtypes(), and memory_report()."""
+
+    def test_typed_load_applies_declared_dtypes(self, toy_csv: Path) -> None:
+        """Verifies declared columns get their dtype and keep their values."""
+        plain = load_dataset(TOY)
+        typed = load_dataset(TOY, typed=True)
+        assert {c: str(typed[c].dtype) for c in TOY_DTYPES} == TOY_DTYPES
+        assert typed["phase"].tolist() == [1, 2, 1, pd.NA]
+        pd.testing.assert_series_equal(typed["decision"].astype("str"), plain["decision"])
+
+    def test_projected_typed_load_casts_requested_columns(self, toy_csv: Path) -> None:
+        """Verifies a column subset is cast without requiring the other declared columns."""
+        typed = load_dataset(TOY, columns=["decision"], typed=True)
+        assert list(typed.columns) == ["decision"]
+        assert typed["decision"].dtype == "category"
+
+    def test_missing_declared_column(self, toy_csv: Path) -> None:
+        """Verifies a full typed load requires every declared column."""
+        frame = load_dataset(TOY).drop(columns=["show_pair"])
+        with pytest.raises(ValueError, match=r"missing from the file: \['show_pair'\]"):
+            apply_dtypes(frame, TOY)
+
+    def test_values_that_do_not_fit(self, toy_csv: Path) -> None:
+        """Verifies a non-integer value in an Int8 column is reported with its column."""
+        frame = load_dataset(TOY).assign(phase=[1.0, 2.5, 1.0, None])
+        with pytest.raises(ValueError, match="column 'phase'"):
+            apply_dtypes(frame, TOY)
+
+    def test_registry_dtypes_validate_and_shrink(self, cache_dir: Path) -> None:
+        """Verifies the declared pilot dtypes fit the file and reduce memory."""
+        report = memory_report(STUDY_PHASE_2_PART_1_RESULTS_PILOT)
+        total = report.iloc[-1]
+        assert total["column"] == "TOTAL"
+        assert total["declared_bytes"] < 0.75 * total["inferred_bytes"]
+
+
+class TestMemo:
+    """Tests for the in-process load_dataset memo."""
+
+    @pytest.fixture
+    def parquet_reads(self, monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+        calls: list[Path] = []
+        real = pd.read_parquet
+
+        def read_parquet(path, *args, **kwargs):
+            calls.append(Path(path))
+            return real(path, *args, **kwargs)
+
+        monkeypatch.setattr(dataloader.pd, "read_parquet", read_parquet)
+        return calls
+
+    def test_repeat_loads_hit(self, toy_csv: Path, parquet_reads: list[Path]) -> None:
+        """Verifies identical loads read the sidecar once and differing arguments miss."""
+        first = load_dataset(TOY)
+        second = load_dataset(TOY)
+        load_dataset(TOY, columns=["decision"])
+        pd.testing.assert_frame_equal(first, second)
+        assert first is not second
+        assert len(parquet_reads) == 2
+        info = memo_info()
+        assert (info.hits, info.misses, info.entries) == (1, 2, 2)
+
+    def test_callers_cannot_corrupt_each_other(self, toy_csv: Path) -> None:
+        """Verifies in-place edits on a returned frame do not reach the memo."""
+        expected = load_dataset(TOY, use_cache=False)
+        frame = load_dataset(TOY)
+        frame.loc[0, "participant_id"] = "changed"
+        frame["phase"] += 10
+        frame.drop(columns=["decision"], inplace=True)
+        frame.sort_values("participant_id", ascending=False, inplace=True)
+        pd.testing.assert_frame_equal(load_dataset(TOY), expected)
+        assert memo_info().hits == 1
+
+    def test_edited_file_misses(self, toy_csv: Path) -> None:
+        """Verifies a changed CSV is reloaded instead of served from the memo."""
+        load_dataset(TOY)
+        toy_csv.write_text(TOY_CSV + "p4,2,keep,True\n", encoding="utf-8")
+        assert load_dataset(TOY)["participant_id"].tolist()[-1] == "p4"
+        assert memo_info().misses == 2
+
+    def test_lru_bound(self, toy_csv: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Verifies the least recently used frame is evicted to stay under the bound."""
+        one = int(load_dataset(TOY, columns=["phase"]).memory_usage(deep=True).sum())
+        monkeypatch.setattr(dataloader, "MEMO_MAX_BYTES", one)
+        load_dataset(TOY, columns=["phase"], filters=[("phase", "==", 1)])
+        info = memo_info()
+        assert (info.entries, info.evictions) == (1, 1)
+        assert info.nbytes <= info.max_bytes
+        load_dataset(TOY, columns=["phase"])
+        assert memo_info().misses == 3
+
+    def test_disabled_without_sidecar(self, toy_csv: Path, csv_reads: list[Path]) -> None:
+        """Verifies use_cache=False parses the CSV every time and records nothing."""
+        load_dataset(TOY, use_cache=False)
+        load_dataset(TOY, use_cache=False)
+        assert len(csv_reads) == 2
+        assert memo_info().entries == 0
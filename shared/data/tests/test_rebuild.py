@@ -0,0 +1,133 @@
+"""Tests for the incremental transformed-dataset rebuild."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from shared.data import dataloader, registry
+from shared.data.rebuild import TransformNode, plan, rebuild
+from shared.data.registry import DatasetEntry
+
+RAW = "TOY_RAW"
+DOUBLED = "TOY_DOUBLED"
+SUMMED = "TOY_SUMMED"
+COUNTED = "TOY_COUNTED"
+
+
+def _log_call(path: Path) -> None:
+    with (path.parent / "calls.log").open("a", encoding="utf-8") as f:
+        f.write(path.stem + "\n")
+
+
+# Writers read their inputs next to ``path`` so spawned workers, which do not
+# see the monkeypatched registry, find them.
+def write_doubled(path: Path) -> None:
+    _log_call(path)
+    values = (path.parent / "raw.csv").read_text(encoding="utf-8").split()
+    path.write_text("\n".join(str(2 * int(v)) for v in values), encoding="utf-8")
+
+
+def write_summed(path: Path) -> None:
+    _log_call(path)
+    values = (path.parent / "doubled.csv").read_text(encoding="utf-8").split()
+    path.write_text(str(sum(int(v) for v in values)), encoding="utf-8")
+
+
+def write_counted(path: Path) -> None:
+    _log_call(path)
+    values = (path.parent / "raw.csv").read_text(encoding="utf-8").split()
+    path.write_text(str(len(values)), encoding="utf-8")
+
+
+NODES = (
+    TransformNode(SUMMED, (DOUBLED,), write_summed),
+    TransformNode(DOUBLED, (RAW,), write_doubled),
+    TransformNode(COUNTED, (RAW,), write_counted),
+)
+
+
+@pytest.fixture
+def root(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Register the toy DAG's datasets under ``tmp_path/data``."""
+    data = tmp_path / "data"
+    data.mkdir()
+    (data / "raw.csv").write_text("1\n2\n3\n", encoding="utf-8")
+    monkeypatch.setattr(registry, "REPO_ROOT", tmp_path)
+    monkeypatch.setattr(dataloader, "DEFAULT_CACHE_DIR", tmp_path / "cache")
+    for name in (RAW, DOUBLED, SUMMED, COUNTED):
+        stem = name.removeprefix("TOY_").lower()
+        monkeypatch.setitem(
+            registry.DATASETS,
+            name,
+            DatasetEntry(name, Path(f"data/{stem}.csv"), kind="transformed", study_phase="toy"),
+        )
+    return tmp_path
+
+
+def _rebuild(root: Path, **kwargs) -> list[str]:
+    return rebuild(NODES, root / "manifest.json", log=lambda _: None, **kwargs)
+
+
+def _calls(root: Path) -> list[str]:
+    return (root / "data" / "calls.log").read_text(encoding="utf-8").split()
+
+
+class TestRebuild:
+    """Tests for plan() and rebuild()."""
+
+    def test_first_run_builds_in_dependency_order(self, root: Path) -> None:
+        """Verifies every node is built once, upstream before downstream."""
+        built = _rebuild(root, jobs=1)
+        assert built.index(DOUBLED) < built.index(SUMMED)
+        assert sorted(built) == sorted([DOUBLED, SUMMED, COUNTED])
+        assert (root / "data" / "summed.csv").read_text(encoding="utf-8") == "12"
+
+    def test_second_run_is_a_no_op(self, root: Path) -> None:
+        """Verifies nothing reruns when inputs, code, and outputs are unchanged."""
+        _rebuild(root, jobs=1)
+        assert set(plan(NODES, root / "manifest.json").values()) == {None}
+        assert _rebuild(root, jobs=1) == []
+
+    def test_input_change_reruns_dependents_only(self, root: Path) -> None:
+        """Verifies a changed leaf reruns its consumers and their downstream nodes."""
+        _rebuild(root, jobs=1)
+        (root / "data" / "raw.csv").write_text("1\n2\n3\n4\n", encoding="utf-8")
+        reasons = plan(NODES, root / "manifest.json")
+        assert reasons[DOUBLED] == f"input {RAW} changed"
+        assert reasons[SUMMED] == f"upstream {DOUBLED} is stale"
+        assert (root / "data" / "summed.csv").exists()
+        _rebuild(root, jobs=1)
+        assert (root / "data" / "summed.csv").read_text(encoding="utf-8") == "20"
+
+    def test_missing_output_reruns_node_and_downstream(self, root: Path) -> None:
+        """Verifies a deleted output is rebuilt along with its consumers, then settles."""
+        _rebuild(root, jobs=1)
+        (root / "data" / "doubled.csv").unlink()
+        assert plan(NODES, root / "manifest.json")[DOUBLED] == "output missing"
+        mark = len(_calls(root))
+        _rebuild(root, jobs=1)
+        assert _calls(root)[mark:] == ["doubled", "summed"]
+        assert _rebuild(root, jobs=1) == []
+
+    def test_hand_edited_output_is_rebuilt(self, root: Path) -> None:
+        """Verifies an output modified outside the rebuild is regenerated."""
+        _rebuild(root, jobs=1)
+        (root / "data" / "counted.csv").write_text("99", encoding="utf-8")
+        assert plan(NODES, root / "manifest.json")[COUNTED] == "output modified"
+        _rebuild(root, jobs=1)
+        assert (root / "data" / "counted.csv").read_text(encoding="utf-8") == "3"
+
+    def test_parallel_matches_serial(self, root: Path) -> None:
+        """Verifies worker processes build the same outputs and manifest."""
+        built = _rebuild(root, jobs=2)
+        assert built.index(DOUBLED) < built.index(SUMMED)
+        assert (root / "data" / "summed.csv").read_text(encoding="utf-8") == "12"
+        assert _rebuild(root, jobs=1) == []
+
+    def test_cycle_is_rejected(self, root: Path) -> None:
+        """Verifies a cyclic graph raises before anything runs."""
+        nodes = (*NODES, TransformNode(RAW, (SUMMED,), write_counted))
+        with pytest.raises(ValueError, match="Cycle"):
+            plan(nodes, root / "manifest.json")
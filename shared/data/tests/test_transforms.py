@@ -0,0 +1,79 @@
+"""Tests for the Part 2 keep/remove label transforms."""
+
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from scripts.benchmark_keep_remove_transforms import (
+    legacy_keep_remove_labels,
+    legacy_keep_remove_labels_unanimous_min3,
+    synthetic_results,
+)
+from shared.data.transformed.study_phase_2_part_2.transform import build_keep_remove_labels
+from shared.data.transformed.study_phase_2_part_2.transform_keep_remove_labels_unanimous_min3 import (  # noqa: E501
+    build_keep_remove_labels_unanimous_min3,
+)
+
+
+def _trials(rows: list[tuple[str, str]]) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "evaluation_mode": "linked_fate",
+            "post_id": [post for post, _ in rows],
+            "original_text": [f"original {post}" for post, _ in rows],
+            "mirror_text": [f"mirror {post}" for post, _ in rows],
+            "decision": [decision for _, decision in rows],
+        }
+    )
+
+
+class TestKeepRemoveLabels:
+    """Tests for build_keep_remove_labels()."""
+
+    def test_matches_row_wise_reference(self) -> None:
+        """Verifies the vectorized output equals the original per-group implementation."""
+        raw = synthetic_results(5_000, seed=3)
+        pd.testing.assert_frame_equal(
+            build_keep_remove_labels(raw), legacy_keep_remove_labels(raw)
+        )
+
+    def test_tie_resolves_to_remove(self) -> None:
+        """Verifies an even split is labelled remove and a majority keep is labelled keep."""
+        raw = _trials([("a", "keep"), ("a", "remove"), ("b", "keep"), ("b", "Keep ")])
+        out = build_keep_remove_labels(raw).set_index("message_id")
+        assert out.loc["a", "decision"] == "remove"
+        assert out.loc["a", "keep_remove_label"] == 1
+        assert out.loc["b", "decision"] == "keep"
+
+    def test_conflicting_texts(self) -> None:
+        """Verifies a post with two different original texts is rejected by post_id."""
+        raw = _trials([("a", "keep"), ("a", "remove")])
+        raw.loc[1, "original_text"] = "edited"
+        with pytest.raises(ValueError, match="post_id=a"):
+            build_keep_remove_labels(raw)
+
+
+class TestKeepRemoveLabelsUnanimousMin3:
+    """Tests for build_keep_remove_labels_unanimous_min3()."""
+
+    def test_matches_row_wise_reference(self) -> None:
+        """Verifies the vectorized output equals the original per-group implementation."""
+        raw = synthetic_results(5_000, seed=4)
+        pd.testing.assert_frame_equal(
+            build_keep_remove_labels_unanimous_min3(raw),
+            legacy_keep_remove_labels_unanimous_min3(raw),
+        )
+
+    def test_keeps_only_unanimous_posts_with_three_raters(self) -> None:
+        """Verifies split and under-rated posts are dropped."""
+        raw = _trials(
+            [("a", "remove")] * 3
+            + [("b", "keep")] * 4
+            + [("c", "keep"), ("c", "keep"), ("c", "remove")]
+            + [("d", "keep")] * 2
+        )
+        out = build_keep_remove_labels_unanimous_min3(raw)
+        assert out["message_id"].tolist() == ["a", "b"]
+        assert out["decision"].tolist() == ["remove", "keep"]
+        assert out["n_raters"].tolist() == [3, 4]
@@ -3,15 +3,31 @@
 Runs keep/remove modal labels, user reflection feedback, and unanimous
 min-3 keep/remove labels transforms.
 
+``rebuild`` reruns only the transforms whose inputs, code, or output changed
+since the last rebuild, as recorded in ``rebuild_manifest.json`` next to the
+outputs. Independent transforms run in parallel processes. See
+``shared.data.rebuild``.
+
 Run from repo root::
 
     PYTHONPATH=. uv run python shared/data/transformed/study_phase_2_part_2/main.py
+    PYTHONPATH=. uv run python shared/data/transformed/study_phase_2_part_2/main.py rebuild [--dry-run] [--force] [--jobs N]
 """
 
 from __future__ import annotations
 
+import argparse
+
+from shared.data.rebuild import TransformNode, rebuild
+from shared.data.registry import (
+    STUDY_PHASE_2_PART_2_KEEP_REMOVE_LABELS,
+    STUDY_PHASE_2_PART_2_KEEP_REMOVE_LABELS_UNANIMOUS_MIN3,
+    STUDY_PHASE_2_PART_2_RESULTS_FULL,
+    STUDY_PHASE_2_PART_2_USER_REFLECTION_FEEDBACK,
+)
 from shared.data.transformed.study_phase_2_part_2.transform import (
     OUTPUT_CSV,
+    OUTPUT_DIR,
     write_keep_remove_labels,
 )
 from shared.data.transformed.study_phase_2_part_2.transform_get_user_reflection_feedback import (
@@ -23,8 +39,28 @@ from shared.data.transformed.study_phase_2_part_2.transform_keep_remove_labels_u
     write_keep_remove_labels_unanimous_min3,
 )
 
+MANIFEST_PATH = OUTPUT_DIR / "rebuild_manifest.json"
 
-def main() -> None:
+NODES = (
+    TransformNode(
+        output=STUDY_PHASE_2_PART_2_KEEP_REMOVE_LABELS,
+        inputs=(STUDY_PHASE_2_PART_2_RESULTS_FULL,),
+        write=write_keep_remove_labels,
+    ),
+    TransformNode(
+        output=STUDY_PHASE_2_PART_2_USER_REFLECTION_FEEDBACK,
+        inputs=(STUDY_PHASE_2_PART_2_RESULTS_FULL,),
+        write=write_user_reflection_feedback,
+    ),
+    TransformNode(
+        output=STUDY_PHASE_2_PART_2_KEEP_REMOVE_LABELS_UNANIMOUS_MIN3,
+        inputs=(STUDY_PHASE_2_PART_2_RESULTS_FULL,),
+        write=write_keep_remove_labels_unanimous_min3,
+    ),
+)
+
+
+def regenerate_all() -> None:
     labels = write_keep_remove_labels()
     print(f"Wrote {OUTPUT_CSV}")
     print(f"rows={len(labels)}")
@@ -43,5 +79,24 @@ def main() -> None:
     print(f"columns={list(unanimous.columns)}")
 
 
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Regenerate Part 2 transformed artifacts.")
+    subcommands = parser.add_subparsers(dest="command")
+    rebuild_parser = subcommands.add_parser(
+        "rebuild", help="Rerun only transforms that are out of date"
+    )
+    rebuild_parser.add_argument("--dry-run", action="store_true", help="Only show the plan")
+    rebuild_parser.add_argument("--force", action="store_true", help="Rerun every transform")
+    rebuild_parser.add_argument("--jobs", type=int, default=None, help="Worker processes")
+    args = parser.parse_args()
+
+    if args.command == "rebuild":
+        rebuild(
+            NODES, MANIFEST_PATH, jobs=args.jobs, force=args.force, dry_run=args.dry_run
+        )
+    else:
+        regenerate_all()
+
+
 if __name__ == "__main__":
     main()
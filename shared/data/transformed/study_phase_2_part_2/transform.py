@@ -14,6 +14,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 from shared.data.dataloader import load_dataset
@@ -35,33 +36,36 @@ def _load_slim_trial_frame(raw: pd.DataFrame) -> pd.DataFrame:
     """Select linked-fate keep/remove trials with a usable ``post_id``.
 
     Normalizes ``decision`` and ``evaluation_mode`` for comparison. Rows with
-    null, empty, or literal ``"nan"`` post IDs are dropped.
+    null, empty, or literal ``"nan"`` post IDs are dropped. All filters are
+    combined into one mask, so only the selected rows of the needed columns
+    are copied.
 
     Raises
     ------
     KeyError
         If ``evaluation_mode`` or ``post_id`` is missing from ``raw``.
     """
-    trials = raw.copy()
-    trials["decision"] = trials["decision"].astype(str).str.lower().str.strip()
-
-    if "evaluation_mode" not in trials.columns:
+    if "evaluation_mode" not in raw.columns:
         raise KeyError("Expected `evaluation_mode` column in Part 2 results.")
-    trials["evaluation_mode"] = trials["evaluation_mode"].astype(str).str.lower().str.strip()
-    trials = trials[trials["evaluation_mode"] == "linked_fate"].copy()
-
-    trials = trials[trials["decision"].isin(["keep", "remove"])].copy()
-
-    if "post_id" not in trials.columns:
+    if "post_id" not in raw.columns:
         raise KeyError("Expected `post_id` column in Part 2 results.")
 
-    # Drop null/empty post_id before stringifying (avoids "nan" string keys).
-    post_id = trials["post_id"]
-    trials = trials[post_id.notna()].copy()
-    trials["post_id"] = trials["post_id"].astype(str).str.strip()
-    trials = trials[trials["post_id"] != ""].copy()
-    trials = trials[trials["post_id"].str.lower() != "nan"].copy()
-
+    decision = raw["decision"].astype(str).str.lower().str.strip()
+    evaluation_mode = raw["evaluation_mode"].astype(str).str.lower().str.strip()
+    # Null post_id is excluded before stringifying (avoids "nan" string keys).
+    post_id = raw["post_id"].astype(str).str.strip()
+    mask = (
+        (evaluation_mode == "linked_fate")
+        & decision.isin(["keep", "remove"])
+        & raw["post_id"].notna()
+        & (post_id != "")
+        & (post_id.str.lower() != "nan")
+    )
+    columns = [c for c in ("original_text", "mirror_text") if c in raw.columns]
+    trials = raw.loc[mask, columns].copy()
+    trials["post_id"] = post_id[mask]
+    trials["decision"] = decision[mask]
+    trials["evaluation_mode"] = evaluation_mode[mask]
     return trials
 
 
@@ -83,48 +87,32 @@ def _aggregate_modal_labels(trials: pd.DataFrame) -> pd.DataFrame:
     if missing:
         raise KeyError(f"Dataset is missing required columns: {sorted(missing)}")
 
-    text_nunique = (
-        trials.groupby("post_id", dropna=False)
-        .agg(
-            original_text_nunique=("original_text", lambda s: s.fillna("").nunique()),
-            mirror_text_nunique=("mirror_text", lambda s: s.fillna("").nunique()),
-        )
-        .reset_index()
-    )
-    bad = text_nunique[
-        (text_nunique["original_text_nunique"] != 1)
-        | (text_nunique["mirror_text_nunique"] != 1)
-    ]
+    texts = trials[["original_text", "mirror_text"]].fillna("")
+    text_nunique = texts.groupby(trials["post_id"]).nunique()
+    bad = text_nunique.index[(text_nunique != 1).any(axis=1)]
     if len(bad):
-        example_post = str(bad.iloc[0]["post_id"])
+        example_post = str(bad[0])
         raise ValueError(
             "Expected stable original/mirror text per post_id, but found conflicts. "
             f"Example problematic post_id={example_post}."
         )
 
-    counts = (
-        trials.groupby(["post_id", "decision"], dropna=False)
-        .size()
-        .unstack(fill_value=0)
-        .reset_index()
-    )
-    if "keep" not in counts.columns:
-        counts["keep"] = 0
-    if "remove" not in counts.columns:
-        counts["remove"] = 0
-
-    counts["decision"] = counts.apply(
-        lambda r: "keep" if int(r["keep"]) > int(r["remove"]) else "remove",
-        axis=1,
+    votes = (trials["decision"] == "remove").groupby(trials["post_id"])
+    n_raters = votes.size()
+    remove_count = votes.sum()
+    keep_wins = (n_raters - remove_count) > remove_count
+
+    out = pd.DataFrame(
+        {
+            "decision": np.where(keep_wins, "keep", "remove"),
+            "keep_remove_label": (~keep_wins).astype(int).to_numpy(),
+        },
+        index=n_raters.index,
     )
-    counts["keep_remove_label"] = (counts["decision"] == "remove").astype(int)
-
-    texts = trials.drop_duplicates(subset=["post_id"])[
-        ["post_id", "original_text", "mirror_text"]
-    ]
-    out = counts.merge(texts, on="post_id", how="left")
-    out = out.rename(columns={"post_id": "message_id"})
-    return out[_OUTPUT_COLUMNS].reset_index(drop=True)
+    first_texts = trials.drop_duplicates(subset=["post_id"]).set_index("post_id")
+    out = out.join(first_texts[["original_text", "mirror_text"]])
+    out = out.rename_axis("message_id").reset_index()
+    return out[_OUTPUT_COLUMNS]
 
 
 def build_keep_remove_labels(
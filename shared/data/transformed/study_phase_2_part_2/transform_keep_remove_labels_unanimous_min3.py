@@ -20,6 +20,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 from shared.data.dataloader import load_dataset
@@ -44,53 +45,47 @@ def _load_slim_trial_frame(raw: pd.DataFrame) -> pd.DataFrame:
     """Select linked-fate keep/remove trials with a usable ``post_id``.
 
     Normalizes ``decision`` and ``evaluation_mode`` for comparison. Rows with
-    null, empty, or literal ``"nan"`` post IDs are dropped.
+    null, empty, or literal ``"nan"`` post IDs are dropped. All filters are
+    combined into one mask, so only the selected rows of the needed columns
+    are copied.
 
     Raises
     ------
     KeyError
         If ``evaluation_mode``, ``post_id``, or ``decision`` is missing.
     """
-    trials = raw.copy()
-    if "decision" not in trials.columns:
+    if "decision" not in raw.columns:
         raise KeyError("Expected `decision` column in Part 2 results.")
-    if "evaluation_mode" not in trials.columns:
+    if "evaluation_mode" not in raw.columns:
         raise KeyError("Expected `evaluation_mode` column in Part 2 results.")
-    if "post_id" not in trials.columns:
+    if "post_id" not in raw.columns:
         raise KeyError("Expected `post_id` column in Part 2 results.")
 
-    trials["decision"] = trials["decision"].astype(str).str.lower().str.strip()
-    trials["evaluation_mode"] = (
-        trials["evaluation_mode"].astype(str).str.lower().str.strip()
+    decision = raw["decision"].astype(str).str.lower().str.strip()
+    evaluation_mode = raw["evaluation_mode"].astype(str).str.lower().str.strip()
+    post_id = raw["post_id"].astype(str).str.strip()
+    mask = (
+        (evaluation_mode == "linked_fate")
+        & decision.isin(_KEEP_REMOVE)
+        & raw["post_id"].notna()
+        & (post_id != "")
+        & (post_id.str.lower() != "nan")
     )
-    trials = trials[trials["evaluation_mode"] == "linked_fate"].copy()
-    trials = trials[trials["decision"].isin(_KEEP_REMOVE)].copy()
-
-    post_id = trials["post_id"]
-    trials = trials[post_id.notna()].copy()
-    trials["post_id"] = trials["post_id"].astype(str).str.strip()
-    trials = trials[trials["post_id"] != ""].copy()
-    trials = trials[trials["post_id"].str.lower() != "nan"].copy()
-
+    columns = [c for c in ("original_text", "mirror_text") if c in raw.columns]
+    trials = raw.loc[mask, columns].copy()
+    trials["post_id"] = post_id[mask]
+    trials["decision"] = decision[mask]
+    trials["evaluation_mode"] = evaluation_mode[mask]
     return trials
 
 
 def _assert_stable_texts(trials: pd.DataFrame) -> None:
     """Raise if any ``post_id`` has conflicting original or mirror text."""
-    text_nunique = (
-        trials.groupby("post_id", dropna=False)
-        .agg(
-            original_text_nunique=("original_text", lambda s: s.fillna("").nunique()),
-            mirror_text_nunique=("mirror_text", lambda s: s.fillna("").nunique()),
-        )
-        .reset_index()
-    )
-    bad = text_nunique[
-        (text_nunique["original_text_nunique"] != 1)
-        | (text_nunique["mirror_text_nunique"] != 1)
-    ]
+    texts = trials[["original_text", "mirror_text"]].fillna("")
+    text_nunique = texts.groupby(trials["post_id"]).nunique()
+    bad = text_nunique.index[(text_nunique != 1).any(axis=1)]
     if len(bad):
-        example_post = str(bad.iloc[0]["post_id"])
+        example_post = str(bad[0])
         raise ValueError(
             "Expected stable original/mirror text per post_id, but found conflicts. "
             f"Example problematic post_id={example_post}."
@@ -114,32 +109,26 @@ def _aggregate_unanimous_min3(trials: pd.DataFrame) -> pd.DataFrame:
 
     _assert_stable_texts(trials)
 
-    grouped = (
-        trials.groupby("post_id", dropna=False)
-        .agg(
-            n_raters=("decision", "size"),
-            n_unique_decisions=("decision", "nunique"),
-            keep_count=("decision", lambda s: int((s == "keep").sum())),
-            remove_count=("decision", lambda s: int((s == "remove").sum())),
-        )
-        .reset_index()
-    )
-    kept = grouped[
-        (grouped["n_raters"] >= _MIN_RATERS) & (grouped["n_unique_decisions"] == 1)
-    ].copy()
-
-    kept["decision"] = kept.apply(
-        lambda row: "keep" if int(row["keep_count"]) == int(row["n_raters"]) else "remove",
-        axis=1,
+    # Decisions are only keep/remove here, so a post is unanimous when its
+    # remove votes are all or none of its votes.
+    votes = (trials["decision"] == "remove").groupby(trials["post_id"])
+    n_raters = votes.size()
+    remove_count = votes.sum()
+    all_remove = remove_count == n_raters
+    kept = (n_raters >= _MIN_RATERS) & (all_remove | (remove_count == 0))
+
+    out = pd.DataFrame(
+        {
+            "decision": np.where(all_remove[kept], "remove", "keep"),
+            "keep_remove_label": all_remove[kept].astype(int).to_numpy(),
+            "n_raters": n_raters[kept].to_numpy(),
+        },
+        index=n_raters.index[kept],
     )
-    kept["keep_remove_label"] = (kept["decision"] == "remove").astype(int)
-
-    texts = trials.drop_duplicates(subset=["post_id"])[
-        ["post_id", "original_text", "mirror_text"]
-    ]
-    out = kept.merge(texts, on="post_id", how="left")
-    out = out.rename(columns={"post_id": "message_id"})
-    return out[_OUTPUT_COLUMNS].reset_index(drop=True)
+    first_texts = trials.drop_duplicates(subset=["post_id"]).set_index("post_id")
+    out = out.join(first_texts[["original_text", "mirror_text"]])
+    out = out.rename_axis("message_id").reset_index()
+    return out[_OUTPUT_COLUMNS]
 
 
 def build_keep_remove_labels_unanimous_min3(
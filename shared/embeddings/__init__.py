@@ -1,33 +1,122 @@
-"""Shared embedding utilities."""
-
-from shared.embeddings.bedrock import (
-    AWS_REGION,
-    BEDROCK_MODEL_ID,
-    EMBEDDING_DIMENSIONS,
-    cosine_similarity,
-    create_embedding,
-    timed_embedding_calls,
-)
-from shared.embeddings.cache import (
-    DEFAULT_DYNAMODB_TABLE_NAME,
-    DEFAULT_S3_BUCKET,
-    EmbeddingCacheClients,
-    load_embedding_by_id,
-    load_embedding_by_text,
-    make_embedding_cache_clients,
-)
+"""Shared embedding utilities.
+
+Public names resolve lazily (PEP 562), so ``from shared.embeddings import
+pair_cosine`` does not import boto3 or build any AWS client.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from shared.embeddings.ann import IVFIndex, build_index_from_store
+    from shared.embeddings.bedrock import (
+        AWS_REGION,
+        BEDROCK_MODEL_ID,
+        EMBEDDING_DIMENSIONS,
+        cosine_similarity,
+        create_embedding,
+        create_embeddings_batch,
+        timed_embedding_calls,
+    )
+    from shared.embeddings.cache import (
+        DEFAULT_DYNAMODB_TABLE_NAME,
+        DEFAULT_S3_BUCKET,
+        BulkEmbeddingLoad,
+        BulkLoadStats,
+        EmbeddingCacheClients,
+        load_embedding_by_id,
+        load_embedding_by_text,
+        load_embeddings_by_ids,
+        make_embedding_cache_clients,
+        open_local_store,
+    )
+    from shared.embeddings.resolver import (
+        ResolvedEmbeddings,
+        ResolveStats,
+        resolve_embeddings,
+    )
+    from shared.embeddings.similarity import (
+        iter_similarity_blocks,
+        l2_normalize,
+        pair_cosine,
+        topk_similar,
+    )
+    from shared.embeddings.store import EmbeddingStore, import_npy_tree
+
+_LAZY_ATTRS: dict[str, tuple[str, str]] = {
+    "IVFIndex": ("ann", "IVFIndex"),
+    "build_index_from_store": ("ann", "build_index_from_store"),
+    "AWS_REGION": ("bedrock", "AWS_REGION"),
+    "BEDROCK_MODEL_ID": ("bedrock", "BEDROCK_MODEL_ID"),
+    "EMBEDDING_DIMENSIONS": ("bedrock", "EMBEDDING_DIMENSIONS"),
+    "cosine_similarity": ("bedrock", "cosine_similarity"),
+    "create_embedding": ("bedrock", "create_embedding"),
+    "create_embeddings_batch": ("bedrock", "create_embeddings_batch"),
+    "timed_embedding_calls": ("bedrock", "timed_embedding_calls"),
+    "DEFAULT_DYNAMODB_TABLE_NAME": ("cache", "DEFAULT_DYNAMODB_TABLE_NAME"),
+    "DEFAULT_S3_BUCKET": ("cache", "DEFAULT_S3_BUCKET"),
+    "BulkEmbeddingLoad": ("cache", "BulkEmbeddingLoad"),
+    "BulkLoadStats": ("cache", "BulkLoadStats"),
+    "EmbeddingCacheClients": ("cache", "EmbeddingCacheClients"),
+    "load_embedding_by_id": ("cache", "load_embedding_by_id"),
+    "load_embedding_by_text": ("cache", "load_embedding_by_text"),
+    "load_embeddings_by_ids": ("cache", "load_embeddings_by_ids"),
+    "make_embedding_cache_clients": ("cache", "make_embedding_cache_clients"),
+    "open_local_store": ("cache", "open_local_store"),
+    "ResolvedEmbeddings": ("resolver", "ResolvedEmbeddings"),
+    "ResolveStats": ("resolver", "ResolveStats"),
+    "resolve_embeddings": ("resolver", "resolve_embeddings"),
+    "iter_similarity_blocks": ("similarity", "iter_similarity_blocks"),
+    "l2_normalize": ("similarity", "l2_normalize"),
+    "pair_cosine": ("similarity", "pair_cosine"),
+    "topk_similar": ("similarity", "topk_similar"),
+    "EmbeddingStore": ("store", "EmbeddingStore"),
+    "import_npy_tree": ("store", "import_npy_tree"),
+}
 
 __all__ = [
     "AWS_REGION",
     "BEDROCK_MODEL_ID",
+    "BulkEmbeddingLoad",
+    "BulkLoadStats",
     "DEFAULT_DYNAMODB_TABLE_NAME",
     "DEFAULT_S3_BUCKET",
     "EMBEDDING_DIMENSIONS",
     "EmbeddingCacheClients",
+    "EmbeddingStore",
+    "IVFIndex",
+    "ResolveStats",
+    "ResolvedEmbeddings",
+    "build_index_from_store",
     "cosine_similarity",
     "create_embedding",
+    "create_embeddings_batch",
+    "import_npy_tree",
+    "iter_similarity_blocks",
+    "l2_normalize",
     "load_embedding_by_id",
     "load_embedding_by_text",
+    "load_embeddings_by_ids",
     "make_embedding_cache_clients",
+    "open_local_store",
+    "pair_cosine",
+    "resolve_embeddings",
     "timed_embedding_calls",
+    "topk_similar",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(f"{__name__}.{module}"), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
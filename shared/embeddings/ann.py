@@ -0,0 +1,407 @@
+"""Persistent IVF (inverted-file) approximate nearest-neighbour index.
+
+Vectors are L2-normalized and bucketed by their nearest of ``n_lists``
+spherical k-means centroids. A query scores only the rows in its ``n_probe``
+nearest buckets, so search and the :meth:`IVFIndex.near_duplicates` sweep cost
+roughly ``n_probe / n_lists`` of a brute-force pass. Pure NumPy; similarity is
+cosine.
+
+Centroids are trained once; later :meth:`IVFIndex.add` calls only assign new
+rows to existing buckets. Retrain (rebuild) when the corpus drifts far from
+the training sample.
+
+Run from repo root::
+
+    PYTHONPATH=. uv run python -m shared.embeddings.ann \\
+      --store-dir path/to/embedding_cache/embedding_store \\
+      --index-path path/to/embedding_cache/ivf_index.npz --near-duplicates 0.97
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import os
+from collections.abc import Sequence
+from pathlib import Path
+
+import numpy as np
+
+from shared.embeddings.similarity import (
+    DEFAULT_MAX_BLOCK_BYTES,
+    iter_similarity_blocks,
+    l2_normalize,
+    topk_similar,
+)
+from shared.embeddings.store import EmbeddingStore
+
+INDEX_FORMAT_VERSION = 1
+DEFAULT_N_PROBE = 8
+DEFAULT_KMEANS_ITERATIONS = 20
+DEFAULT_TRAIN_SAMPLE_SIZE = 100_000
+DEFAULT_BUILD_BATCH_SIZE = 65_536
+_DTYPE = np.float32
+
+
+def default_n_lists(n_vectors: int) -> int:
+    """Rule-of-thumb bucket count: about ``4 * sqrt(n)``, at least 1."""
+    return max(1, int(4 * math.sqrt(max(1, n_vectors))))
+
+
+def _nearest_centroid(unit_vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    out = np.empty(unit_vectors.shape[0], dtype=np.int32)
+    for start, block in iter_similarity_blocks(unit_vectors, centroids, normalized=True):
+        out[start : start + block.shape[0]] = block.argmax(axis=1)
+    return out
+
+
+def train_centroids(
+    vectors: np.ndarray,
+    n_lists: int,
+    *,
+    n_iter: int = DEFAULT_KMEANS_ITERATIONS,
+    sample_size: int = DEFAULT_TRAIN_SAMPLE_SIZE,
+    seed: int = 0,
+) -> np.ndarray:
+    """Spherical k-means centroids (unit rows) over a sample of ``vectors``.
+
+    ``n_lists`` is clamped to the sample size. Empty clusters are reseeded
+    from random sample rows.
+
+    Raises
+    ------
+    ValueError
+        If ``vectors`` is empty.
+    """
+    if len(vectors) == 0:
+        raise ValueError("Cannot train centroids on an empty matrix")
+    rng = np.random.default_rng(seed)
+    if len(vectors) > sample_size:
+        pick = np.sort(rng.choice(len(vectors), size=sample_size, replace=False))
+        sample = l2_normalize(vectors[pick])
+    else:
+        sample = l2_normalize(vectors)
+    n_lists = min(n_lists, len(sample))
+    centroids = sample[rng.choice(len(sample), size=n_lists, replace=False)].copy()
+    for _ in range(n_iter):
+        assign = _nearest_centroid(sample, centroids)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assign, sample)
+        empty = np.bincount(assign, minlength=n_lists) == 0
+        if empty.any():
+            sums[empty] = sample[rng.choice(len(sample), size=int(empty.sum()))]
+        centroids = l2_normalize(sums)
+    return centroids
+
+
+class IVFIndex:
+    """Cosine ANN index over string ids, with incremental inserts and persistence.
+
+    Parameters
+    ----------
+    centroids
+        ``(n_lists, d)`` bucket centroids, e.g. from :func:`train_centroids`.
+    """
+
+    def __init__(self, centroids: np.ndarray) -> None:
+        self._centroids = l2_normalize(centroids)
+        d = self._centroids.shape[1]
+        self._vectors = np.empty((0, d), dtype=_DTYPE)
+        self._assign = np.empty(0, dtype=np.int32)
+        self._ids: list[str] = []
+        self._row_of: dict[str, int] = {}
+        self._lists: list[np.ndarray] | None = None
+
+    @classmethod
+    def train(
+        cls,
+        vectors: np.ndarray,
+        *,
+        n_lists: int | None = None,
+        n_iter: int = DEFAULT_KMEANS_ITERATIONS,
+        sample_size: int = DEFAULT_TRAIN_SAMPLE_SIZE,
+        seed: int = 0,
+    ) -> IVFIndex:
+        """Train centroids on ``vectors`` and return an empty index."""
+        return cls(
+            train_centroids(
+                vectors,
+                n_lists or default_n_lists(len(vectors)),
+                n_iter=n_iter,
+                sample_size=sample_size,
+                seed=seed,
+            )
+        )
+
+    @property
+    def dimensions(self) -> int:
+        return int(self._centroids.shape[1])
+
+    @property
+    def n_lists(self) -> int:
+        return int(self._centroids.shape[0])
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, embedding_id: object) -> bool:
+        return embedding_id in self._row_of
+
+    def ids(self) -> list[str]:
+        """Indexed ids in insertion order."""
+        return list(self._ids)
+
+    def add(self, ids: Sequence[str], vectors: np.ndarray) -> int:
+        """Insert vectors under ``ids``; ids already indexed are skipped.
+
+        Returns
+        -------
+        int
+            Number of rows added.
+
+        Raises
+        ------
+        ValueError
+            If ``ids`` and ``vectors`` disagree in length or ``vectors`` has
+            the wrong width.
+        """
+        matrix = np.asarray(vectors)
+        if matrix.ndim != 2 or matrix.shape[1] != self.dimensions:
+            raise ValueError(
+                f"Expected shape (n, {self.dimensions}); got {matrix.shape}"
+            )
+        if len(ids) != matrix.shape[0]:
+            raise ValueError(f"{len(ids)} ids for {matrix.shape[0]} vectors")
+        keep: list[int] = []
+        seen: set[str] = set()
+        for i, eid in enumerate(ids):
+            if eid not in self._row_of and eid not in seen:
+                seen.add(eid)
+                keep.append(i)
+        if not keep:
+            return 0
+        unit = l2_normalize(matrix[keep])
+        first = len(self._ids)
+        self._reserve(first + len(keep))
+        self._vectors[first : first + len(keep)] = unit
+        self._assign[first : first + len(keep)] = _nearest_centroid(unit, self._centroids)
+        for offset, i in enumerate(keep):
+            self._ids.append(ids[i])
+            self._row_of[ids[i]] = first + offset
+        self._lists = None
+        return len(keep)
+
+    def add_from_store(
+        self, store: EmbeddingStore, *, batch_size: int = DEFAULT_BUILD_BATCH_SIZE
+    ) -> int:
+        """Insert every vector in ``store`` not yet indexed; returns rows added."""
+        pending = [eid for eid in store.ids() if eid not in self._row_of]
+        added = 0
+        for start in range(0, len(pending), batch_size):
+            chunk = pending[start : start + batch_size]
+            added += self.add(chunk, store.get_many(chunk))
+        return added
+
+    def search(
+        self,
+        queries: np.ndarray,
+        k: int,
+        *,
+        n_probe: int = DEFAULT_N_PROBE,
+    ) -> list[list[tuple[str, float]]]:
+        """Approximate top-``k`` ``(id, cosine)`` matches for each query row.
+
+        Each list is sorted by descending similarity and may be shorter than
+        ``k`` when the probed buckets hold fewer rows.
+        """
+        unit = l2_normalize(np.atleast_2d(queries))
+        lists = self._inverted_lists()
+        probe = min(n_probe, self.n_lists)
+        nearest, _ = topk_similar(unit, self._centroids, probe, normalized=True)
+        results: list[list[tuple[str, float]]] = []
+        for q, buckets in zip(unit, nearest, strict=True):
+            rows = np.concatenate([lists[b] for b in buckets])
+            if rows.size == 0:
+                results.append([])
+                continue
+            scores = self._vectors[rows] @ q
+            kk = min(k, rows.size)
+            top = np.argpartition(-scores, kk - 1)[:kk]
+            top = top[np.argsort(-scores[top], kind="stable")]
+            results.append([(self._ids[rows[i]], float(scores[i])) for i in top])
+        return results
+
+    def near_duplicates(
+        self,
+        threshold: float,
+        *,
+        n_probe: int = DEFAULT_N_PROBE,
+        max_block_bytes: int = DEFAULT_MAX_BLOCK_BYTES,
+    ) -> list[tuple[str, str, float]]:
+        """All indexed pairs with cosine ``>= threshold`` (approximate).
+
+        Each bucket is compared against its ``n_probe`` nearest buckets (by
+        centroid), so pairs that straddle distant buckets can be missed;
+        raise ``n_probe`` for higher recall.
+
+        Returns
+        -------
+        list[tuple[str, str, float]]
+            ``(id_a, id_b, cosine)`` with ``id_a`` inserted before ``id_b``,
+            sorted by descending cosine.
+        """
+        lists = self._inverted_lists()
+        probe = min(n_probe, self.n_lists)
+        neighbours, _ = topk_similar(self._centroids, self._centroids, probe, normalized=True)
+        found: dict[tuple[int, int], float] = {}
+        for bucket, rows in enumerate(lists):
+            if rows.size == 0:
+                continue
+            cand = np.concatenate([lists[b] for b in neighbours[bucket]])
+            for start, block in iter_similarity_blocks(
+                self._vectors[rows],
+                self._vectors[cand],
+                normalized=True,
+                max_block_bytes=max_block_bytes,
+            ):
+                r, c = np.nonzero(block >= threshold)
+                a = rows[start + r]
+                b = cand[c]
+                for i, j, s in zip(a.tolist(), b.tolist(), block[r, c].tolist()):
+                    if i != j:
+                        found[(min(i, j), max(i, j))] = s
+        pairs = sorted(found.items(), key=lambda kv: (-kv[1], kv[0]))
+        return [(self._ids[i], self._ids[j], s) for (i, j), s in pairs]
+
+    def save(self, path: str | Path) -> Path:
+        """Write the index to one ``.npz`` file (atomic replace); returns the path."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        with tmp.open("wb") as handle:
+            np.savez(
+                handle,
+                format_version=np.int64(INDEX_FORMAT_VERSION),
+                centroids=self._centroids,
+                vectors=self._vectors[: len(self._ids)],
+                assign=self._assign[: len(self._ids)],
+                ids=np.asarray(self._ids, dtype=np.str_),
+            )
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp, path)
+        return path
+
+    @classmethod
+    def load(cls, path: str | Path) -> IVFIndex:
+        """Read an index written by :meth:`save`.
+
+        Raises
+        ------
+        ValueError
+            If the file has an unsupported format version.
+        """
+        with np.load(Path(path), allow_pickle=False) as data:
+            version = int(data["format_version"])
+            if version != INDEX_FORMAT_VERSION:
+                raise ValueError(f"Unsupported IVF index format {version} in {path}")
+            index = cls(data["centroids"])
+            index._vectors = data["vectors"].astype(_DTYPE, copy=False)
+            index._assign = data["assign"].astype(np.int32, copy=False)
+            index._ids = data["ids"].tolist()
+        index._row_of = {eid: i for i, eid in enumerate(index._ids)}
+        return index
+
+    def _reserve(self, rows: int) -> None:
+        """Grow the row buffers geometrically so repeated inserts stay amortized O(n)."""
+        capacity = self._vectors.shape[0]
+        if rows <= capacity:
+            return
+        capacity = max(rows, 2 * capacity)
+        n = len(self._ids)
+        vectors = np.empty((capacity, self.dimensions), dtype=_DTYPE)
+        vectors[:n] = self._vectors[:n]
+        assign = np.empty(capacity, dtype=np.int32)
+        assign[:n] = self._assign[:n]
+        self._vectors, self._assign = vectors, assign
+
+    def _inverted_lists(self) -> list[np.ndarray]:
+        if self._lists is None:
+            assign = self._assign[: len(self._ids)]
+            order = np.argsort(assign, kind="stable")
+            bounds = np.searchsorted(assign[order], np.arange(self.n_lists + 1))
+            self._lists = [order[bounds[b] : bounds[b + 1]] for b in range(self.n_lists)]
+        return self._lists
+
+
+def build_index_from_store(
+    store: EmbeddingStore,
+    *,
+    n_lists: int | None = None,
+    sample_size: int = DEFAULT_TRAIN_SAMPLE_SIZE,
+    seed: int = 0,
+    batch_size: int = DEFAULT_BUILD_BATCH_SIZE,
+) -> IVFIndex:
+    """Train on a sample of ``store`` and index every vector in it.
+
+    Raises
+    ------
+    ValueError
+        If the store is empty.
+    """
+    ids = store.ids()
+    if not ids:
+        raise ValueError(f"Embedding store at {store.root} is empty")
+    rng = np.random.default_rng(seed)
+    n_sample = min(sample_size, len(ids))
+    sample_ids = [ids[i] for i in np.sort(rng.choice(len(ids), size=n_sample, replace=False))]
+    index = IVFIndex.train(
+        store.get_many(sample_ids),
+        n_lists=n_lists or default_n_lists(len(ids)),
+        sample_size=sample_size,
+        seed=seed,
+    )
+    index.add_from_store(store, batch_size=batch_size)
+    return index
+
+
+def _build_arg_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(
+        description="Build or update an IVF index from an embedding store."
+    )
+    p.add_argument("--store-dir", required=True)
+    p.add_argument("--index-path", required=True, help="Index .npz (updated if it exists)")
+    p.add_argument("--n-lists", type=int, default=None)
+    p.add_argument("--rebuild", action="store_true", help="Retrain even if the index exists")
+    p.add_argument(
+        "--near-duplicates",
+        type=float,
+        default=None,
+        metavar="THRESHOLD",
+        help="Print pairs with cosine >= THRESHOLD",
+    )
+    p.add_argument("--n-probe", type=int, default=DEFAULT_N_PROBE)
+    return p
+
+
+def main() -> None:
+    args = _build_arg_parser().parse_args()
+    store = EmbeddingStore(args.store_dir)
+    index_path = Path(args.index_path)
+    if index_path.is_file() and not args.rebuild:
+        index = IVFIndex.load(index_path)
+        added = index.add_from_store(store)
+        print(f"Added {added} vectors; index holds {len(index)}")
+    else:
+        index = build_index_from_store(store, n_lists=args.n_lists)
+        print(f"Built index: {len(index)} vectors in {index.n_lists} lists")
+    index.save(index_path)
+    if args.near_duplicates is not None:
+        pairs = index.near_duplicates(args.near_duplicates, n_probe=args.n_probe)
+        print(f"{len(pairs)} pairs with cosine >= {args.near_duplicates}")
+        for a, b, score in pairs[:25]:
+            print(f"  {score:.4f}  {a}  {b}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 """Amazon Bedrock Titan Text Embeddings helpers.
 
-Provides ``create_embedding`` for live Bedrock calls and ``cosine_similarity``
+Provides ``create_embedding`` for live Bedrock calls, ``create_embeddings_batch``
+for concurrent, throttle-adaptive bulk embedding, and ``cosine_similarity``
 for comparing vectors. Default model, region, and dimensions are module
 constants. Requires AWS credentials with Bedrock invoke access.
 """
@@ -9,40 +10,110 @@ from __future__ import annotations
 
 import json
 import math
+import random
+import threading
 import time
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from functools import wraps
-from typing import Any, Callable, ParamSpec, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, ParamSpec, TypeVar
 
-import boto3
 from botocore.exceptions import ClientError
+from tqdm import tqdm
+
+from lib.telemetry import TELEMETRY
 
 AWS_REGION = "us-east-1"
 BEDROCK_MODEL_ID = "amazon.titan-embed-text-v2:0"
 EMBEDDING_DIMENSIONS = 256
+DEFAULT_MAX_CONCURRENCY = 16
+DEFAULT_MAX_ATTEMPTS = 8
+_RETRY_BASE_SECONDS = 0.25
+_RETRY_CAP_SECONDS = 20.0
+_THROTTLE_ERROR_CODES = frozenset({"ThrottlingException", "TooManyRequestsException"})
+_TRANSIENT_ERROR_CODES = frozenset(
+    {
+        "ModelTimeoutException",
+        "ServiceUnavailableException",
+        "InternalServerException",
+        "ModelNotReadyException",
+    }
+)
 
-bedrock = boto3.client("bedrock-runtime", region_name=AWS_REGION)
+if TYPE_CHECKING:
+    from botocore.client import BaseClient
 
 P = ParamSpec("P")
 R = TypeVar("R")
 
 
-def timed_embedding_calls(fn: Callable[P, R]) -> Callable[P, R]:
-    """Append each call's wall-clock seconds to ``fn.embedding_times``.
+_client_lock = threading.Lock()
+_client: BaseClient | None = None
+_client_pool_size = 0
+
 
-    Latencies are recorded even when the wrapped function raises.
+def get_bedrock_client(min_pool_connections: int = DEFAULT_MAX_CONCURRENCY) -> BaseClient:
+    """Return the shared ``bedrock-runtime`` client, created on first use.
+
+    The connection pool holds at least ``min_pool_connections`` connections;
+    the client is rebuilt with a larger pool when a caller asks for more
+    than the current one holds. boto3 is imported here rather than at module
+    import.
     """
+    global _client, _client_pool_size
+    with _client_lock:
+        if _client is None or _client_pool_size < min_pool_connections:
+            import boto3
+            from botocore.config import Config
+
+            _client_pool_size = max(min_pool_connections, DEFAULT_MAX_CONCURRENCY)
+            _client = boto3.client(
+                "bedrock-runtime",
+                region_name=AWS_REGION,
+                config=Config(max_pool_connections=_client_pool_size),
+            )
+        return _client
+
 
-    times: list[float] = []
+def __getattr__(name: str) -> Any:
+    # ``bedrock`` used to be an eagerly built module global; keep it readable.
+    if name == "bedrock":
+        return get_bedrock_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def timed_embedding_calls(fn: Callable[P, R]) -> Callable[P, R]:
+    """Record each call in :data:`lib.telemetry.TELEMETRY`.
+
+    Latency goes to the ``bedrock_call_seconds{operation=<fn name>}``
+    histogram (also exposed as ``fn.latency``) even when the call raises;
+    failures increment ``bedrock_call_errors_total`` by error code, and the
+    result's ``input_text_token_count`` is added to
+    ``bedrock_input_tokens_total``.
+    """
+    operation = fn.__name__
+    latency = TELEMETRY.histogram("bedrock_call_seconds", operation=operation)
 
     @wraps(fn)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
         start = time.perf_counter()
         try:
-            return fn(*args, **kwargs)
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            code = _client_error_code(e) or type(e).__name__
+            TELEMETRY.incr("bedrock_call_errors_total", operation=operation, code=code)
+            raise
         finally:
-            times.append(time.perf_counter() - start)
+            latency.observe(time.perf_counter() - start)
+        if isinstance(result, dict) and result.get("input_text_token_count") is not None:
+            TELEMETRY.incr(
+                "bedrock_input_tokens_total",
+                float(result["input_text_token_count"]),
+                operation=operation,
+            )
+        return result
 
-    wrapper.embedding_times = times  # type: ignore[attr-defined]
+    wrapper.latency = latency  # type: ignore[attr-defined]
     return wrapper
 
 
@@ -56,8 +127,8 @@ def create_embedding(
     """Invoke Titan Text Embeddings and return the vector plus request metadata.
 
     Defaults match the shared embedding-cache identity (256-d, L2-normalized).
-    Decorated by :func:`timed_embedding_calls`, so latencies accumulate on
-    ``create_embedding.embedding_times``.
+    Decorated by :func:`timed_embedding_calls`, so latency, errors, and token
+    counts accumulate in :data:`lib.telemetry.TELEMETRY`.
 
     Parameters
     ----------
@@ -89,7 +160,7 @@ def create_embedding(
     }
 
     try:
-        response = bedrock.invoke_model(
+        response = get_bedrock_client().invoke_model(
             modelId=model_id,
             body=json.dumps(body),
             contentType="application/json",
@@ -116,11 +187,167 @@ def create_embedding(
     }
 
 
+class _AdaptiveConcurrencyLimiter:
+    """AIMD gate on in-flight requests.
+
+    Halves the allowed concurrency on each throttle and grows it by one after
+    a full window of successes, never exceeding ``max_concurrency``.
+    """
+
+    def __init__(self, max_concurrency: int) -> None:
+        self._max = max_concurrency
+        self._limit = max_concurrency
+        self._in_flight = 0
+        self._successes = 0
+        self._cond = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    def acquire(self) -> None:
+        with self._cond:
+            while self._in_flight >= self._limit:
+                self._cond.wait()
+            self._in_flight += 1
+
+    def release(self, *, throttled: bool) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            if throttled:
+                self._limit = max(1, self._limit // 2)
+                self._successes = 0
+            else:
+                self._successes += 1
+                if self._successes >= self._limit and self._limit < self._max:
+                    self._limit += 1
+                    self._successes = 0
+            self._cond.notify_all()
+
+
+def _client_error_code(exc: BaseException) -> str | None:
+    cause = exc if isinstance(exc, ClientError) else exc.__cause__
+    if isinstance(cause, ClientError):
+        return cause.response.get("Error", {}).get("Code")
+    return None
+
+
+def _jitter_sleep(attempt: int) -> None:
+    cap = min(_RETRY_CAP_SECONDS, _RETRY_BASE_SECONDS * (2**attempt))
+    time.sleep(random.uniform(0.0, cap))
+
+
+def _embed_with_retries(
+    text: str,
+    limiter: _AdaptiveConcurrencyLimiter,
+    *,
+    model_id: str,
+    dimensions: int,
+    normalize: bool,
+    max_attempts: int,
+) -> dict[str, Any]:
+    """Call :func:`create_embedding`, retrying throttles and transient errors."""
+    for attempt in range(max_attempts):
+        limiter.acquire()
+        throttled = False
+        try:
+            return create_embedding(
+                text, model_id=model_id, dimensions=dimensions, normalize=normalize
+            )
+        except RuntimeError as e:
+            code = _client_error_code(e)
+            throttled = code in _THROTTLE_ERROR_CODES
+            retryable = throttled or code in _TRANSIENT_ERROR_CODES
+            if throttled:
+                TELEMETRY.incr("bedrock_throttles_total")
+            if not retryable or attempt == max_attempts - 1:
+                raise
+        finally:
+            limiter.release(throttled=throttled)
+        TELEMETRY.incr("bedrock_retries_total")
+        _jitter_sleep(attempt)
+    raise RuntimeError("unreachable: retry loop exited without result")
+
+
+def create_embeddings_batch(
+    texts: Sequence[str],
+    *,
+    model_id: str = BEDROCK_MODEL_ID,
+    dimensions: int = EMBEDDING_DIMENSIONS,
+    normalize: bool = True,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    show_progress: bool = True,
+) -> list[dict[str, Any]]:
+    """Embed many texts concurrently and return results in input order.
+
+    Identical texts are embedded once and fanned back out. Requests run on a
+    thread pool gated by an adaptive limiter that halves concurrency on
+    ``ThrottlingException`` and recovers additively; throttles and transient
+    Bedrock errors are retried with jittered exponential backoff.
+
+    Parameters
+    ----------
+    texts : Sequence[str]
+        Non-empty inputs.
+    max_concurrency : int
+        Upper bound on in-flight ``invoke_model`` calls.
+    max_attempts : int
+        Attempts per unique text before the error is raised.
+
+    Returns
+    -------
+    list[dict]
+        One :func:`create_embedding` result per input text (copies for
+        repeated texts).
+
+    Raises
+    ------
+    ValueError
+        If any text is empty or whitespace-only, or ``max_concurrency < 1``.
+    RuntimeError
+        If a text still fails after retries, or fails with a non-retryable error.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    if any(not t or not t.strip() for t in texts):
+        raise ValueError("texts must be non-empty strings")
+    unique_texts = list(dict.fromkeys(texts))
+    # Size the shared HTTP pool for every worker so none queue on it.
+    get_bedrock_client(max_concurrency)
+    limiter = _AdaptiveConcurrencyLimiter(max_concurrency)
+    results: dict[str, dict[str, Any]] = {}
+    with ThreadPoolExecutor(max_workers=max_concurrency) as pool:
+        futures = {
+            pool.submit(
+                _embed_with_retries,
+                text,
+                limiter,
+                model_id=model_id,
+                dimensions=dimensions,
+                normalize=normalize,
+                max_attempts=max_attempts,
+            ): text
+            for text in unique_texts
+        }
+        done = as_completed(futures)
+        if show_progress:
+            done = tqdm(done, total=len(futures), desc="Bedrock embeddings")
+        try:
+            for future in done:
+                results[futures[future]] = future.result()
+        except BaseException:
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+    return [dict(results[t]) for t in texts]
+
+
 def cosine_similarity(a: list[float], b: list[float]) -> float:
     """Return the cosine similarity of two equal-length vectors.
 
     Zero-norm vectors yield ``0.0``. For already L2-normalized inputs this
-    equals the dot product.
+    equals the dot product. For matrices, use
+    :mod:`shared.embeddings.similarity`.
 
     Raises
     ------
@@ -1,29 +1,44 @@
 """Read Titan text embeddings from the shared DynamoDB → S3 identity cache.
 
 Looks up vectors by embedding identity (or by text hashed to that identity).
-Does not call Bedrock; cache misses return ``None``.
+Does not call Bedrock; cache misses return ``None``. When ``cache_dir`` is
+given, vectors are kept in a local :class:`~shared.embeddings.store.EmbeddingStore`
+under ``cache_dir / "embedding_store"``; legacy ``embeddings/<id>.npy`` files
+are still read as a fallback.
 """
 
 from __future__ import annotations
 
-import json
+import time
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING
+
+import numpy as np
 
-from lib.aws.dynamodb import DynamoDBEmbeddingIndex
 from lib.aws.embedding_identity import embedding_identity_sha256
-from lib.aws.s3 import S3
+from lib.telemetry import TELEMETRY
 from shared.embeddings.bedrock import (
     AWS_REGION,
     BEDROCK_MODEL_ID,
     EMBEDDING_DIMENSIONS,
 )
+from shared.embeddings.payload import decode_embedding_payload
+from shared.embeddings.store import STORE_DIRNAME, EmbeddingStore
+
+if TYPE_CHECKING:
+    from lib.aws.dynamodb import DynamoDBEmbeddingIndex
+    from lib.aws.s3 import S3
 
 # Same defaults as experiments/simplified_predict_remove_2026_05_13/
 # experiment_create_embedding_and_upload.py
 DEFAULT_S3_BUCKET = "jspsych-mirror-view-3"
 DEFAULT_DYNAMODB_TABLE_NAME = "jspsych-mirror-view-embedding-cache"
+DEFAULT_S3_PREFIX = "embeddings/"
+DEFAULT_S3_MAX_WORKERS = 32
 
 
 @dataclass(frozen=True)
@@ -57,39 +72,94 @@ def make_embedding_cache_clients(
     table_name = (table or DEFAULT_DYNAMODB_TABLE_NAME).strip()
     if not bucket_name or not table_name:
         raise ValueError("S3 bucket and DynamoDB table must be non-empty.")
+    # boto3 (and pandas, via lib.aws.s3) load only when clients are built.
+    from lib.aws.dynamodb import DynamoDBEmbeddingIndex
+    from lib.aws.s3 import S3
+
     region = region_name if region_name is not None else AWS_REGION
     return EmbeddingCacheClients(
-        s3=S3(bucket_name, region_name=region),
+        s3=S3(
+            bucket_name,
+            region_name=region,
+            max_pool_connections=DEFAULT_S3_MAX_WORKERS,
+        ),
         ddb=DynamoDBEmbeddingIndex(table_name, region_name=region),
     )
 
 
+@dataclass(frozen=True)
+class BulkLoadStats:
+    """Hit/miss counts and wall-clock seconds for one bulk load."""
+
+    n_requested: int
+    n_unique: int
+    local_hits: int
+    remote_hits: int
+    misses: int
+    dynamodb_seconds: float
+    s3_seconds: float
+    total_seconds: float
+
+
+@dataclass(frozen=True)
+class BulkEmbeddingLoad:
+    """Dense result of :func:`load_embeddings_by_ids`.
+
+    ``matrix`` row ``i`` holds the vector for input id ``i``; rows for misses
+    are NaN and ``found[i]`` is False.
+    """
+
+    matrix: np.ndarray
+    found: np.ndarray
+    stats: BulkLoadStats
+
+
 def _local_cache_path(cache_dir: Path, embedding_id: str) -> Path:
+    """Legacy one-file-per-vector location (read-only fallback)."""
     return cache_dir / "embeddings" / f"{embedding_id}.npy"
 
 
 def _load_local_npy(path: Path) -> list[float] | None:
     if not path.exists():
         return None
-    import numpy as np
-
     vec = np.load(path)
     return [float(x) for x in vec.ravel().tolist()]
 
 
-def _save_local_npy(path: Path, embedding: list[float]) -> None:
-    import numpy as np
+def open_local_store(cache_dir: str | Path) -> EmbeddingStore:
+    """Return the process-wide sharded local store under ``cache_dir``.
+
+    One instance per resolved directory, so the id index is read once per
+    process rather than once per lookup.
+    """
+    return _open_store_at(str((Path(cache_dir) / STORE_DIRNAME).resolve()))
+
 
-    path.parent.mkdir(parents=True, exist_ok=True)
-    np.save(path, np.asarray(embedding, dtype=np.float64))
+@lru_cache(maxsize=None)
+def _open_store_at(store_dir: str) -> EmbeddingStore:
+    return EmbeddingStore(store_dir)
+
+
+def _load_local(cache_root: Path, embedding_id: str) -> list[float] | None:
+    vec = open_local_store(cache_root).get(embedding_id)
+    if vec is not None:
+        return [float(x) for x in vec.tolist()]
+    return _load_local_npy(_local_cache_path(cache_root, embedding_id))
+
+
+def _parse_s3_embedding_vector(raw: bytes, *, embedding_id: str) -> np.ndarray:
+    """Decode a binary or legacy JSON S3 payload to a 1-D vector."""
+    try:
+        return decode_embedding_payload(raw).embedding
+    except (ValueError, KeyError, UnicodeDecodeError) as e:
+        raise RuntimeError(
+            f"S3 embedding invalid for embedding_id={embedding_id!r}: {e}"
+        ) from e
 
 
 def _parse_s3_embedding_payload(raw: bytes, *, embedding_id: str) -> list[float]:
-    parsed: dict[str, Any] = json.loads(raw.decode("utf-8"))
-    emb = parsed.get("embedding")
-    if emb is None or not isinstance(emb, list):
-        raise RuntimeError(f"S3 embedding invalid for embedding_id={embedding_id!r}")
-    return [float(x) for x in emb]
+    vec = _parse_s3_embedding_vector(raw, embedding_id=embedding_id)
+    return [float(x) for x in vec.tolist()]
 
 
 def load_embedding_by_id(
@@ -103,9 +173,10 @@ def load_embedding_by_id(
 ) -> list[float] | None:
     """Fetch an embedding vector by its identity hash.
 
-    Resolution order: optional local ``.npy`` under ``cache_dir``, then
-    DynamoDB pointer → S3 JSON payload. On a successful remote fetch with
-    ``cache_dir`` set, writes a local copy for subsequent calls.
+    Resolution order: optional local store (then legacy ``.npy``) under
+    ``cache_dir``, then DynamoDB pointer → S3 payload. On a successful
+    remote fetch with ``cache_dir`` set, appends the vector to the local store
+    for subsequent calls. Locally served vectors are float32-precision.
 
     Returns
     -------
@@ -126,7 +197,7 @@ def load_embedding_by_id(
     eid = str(embedding_id).strip()
     cache_root = Path(cache_dir) if cache_dir is not None else None
     if cache_root is not None:
-        local = _load_local_npy(_local_cache_path(cache_root, eid))
+        local = _load_local(cache_root, eid)
         if local is not None:
             return local
 
@@ -144,7 +215,7 @@ def load_embedding_by_id(
     vec = _parse_s3_embedding_payload(handle.s3.get_bytes(s3_key), embedding_id=eid)
 
     if cache_root is not None:
-        _save_local_npy(_local_cache_path(cache_root, eid), vec)
+        open_local_store(cache_root).append([eid], [vec])
 
     return vec
 
@@ -189,3 +260,139 @@ def load_embedding_by_text(
         region_name=region_name,
         cache_dir=cache_dir,
     )
+
+
+def _load_local_many(
+    cache_root: Path, embedding_ids: list[str]
+) -> dict[str, np.ndarray]:
+    """Serve ids from the local store, migrating any legacy ``.npy`` hits into it."""
+    store = open_local_store(cache_root)
+    present = [e for e in embedding_ids if e in store]
+    vectors = dict(zip(present, store.get_many(present), strict=True))
+    legacy: dict[str, np.ndarray] = {}
+    for eid in store.missing(embedding_ids):
+        path = _local_cache_path(cache_root, eid)
+        if path.exists():
+            legacy[eid] = np.load(path).ravel().astype(np.float32)
+    if legacy:
+        store.append(list(legacy), np.stack(list(legacy.values())))
+    vectors.update(legacy)
+    return vectors
+
+
+def _fetch_s3_vectors(
+    s3: S3, pointers: dict[str, str], *, max_workers: int
+) -> dict[str, np.ndarray]:
+    """Download and parse S3 payloads concurrently over one pooled client."""
+
+    def fetch(item: tuple[str, str]) -> tuple[str, np.ndarray]:
+        eid, key = item
+        vec = _parse_s3_embedding_vector(s3.get_bytes(key), embedding_id=eid)
+        return eid, vec.astype(np.float32, copy=False)
+
+    if not pointers:
+        return {}
+    workers = max(1, min(max_workers, len(pointers)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return dict(pool.map(fetch, pointers.items()))
+
+
+def load_embeddings_by_ids(
+    embedding_ids: Sequence[str],
+    *,
+    clients: EmbeddingCacheClients | None = None,
+    bucket: str | None = None,
+    table: str | None = None,
+    region_name: str | None = None,
+    cache_dir: str | Path | None = None,
+    dimensions: int = EMBEDDING_DIMENSIONS,
+    max_workers: int = DEFAULT_S3_MAX_WORKERS,
+) -> BulkEmbeddingLoad:
+    """Fetch many embeddings at once, aligned to the input order.
+
+    Ids are deduplicated, then resolved in tiers: the local store under
+    ``cache_dir`` (if given), DynamoDB ``BatchGetItem`` pointers for the
+    rest, and S3 payloads fetched on a bounded thread pool. Remote hits are
+    appended to the local store in one batch.
+
+    Returns
+    -------
+    BulkEmbeddingLoad
+        ``(n, dimensions)`` float32 matrix (NaN rows for misses), a boolean
+        ``found`` mask, and per-tier stats.
+
+    Raises
+    ------
+    ValueError
+        If any id is empty.
+    RuntimeError
+        If an S3 payload is invalid or has the wrong length.
+    """
+    started = time.perf_counter()
+    ids = [str(e).strip() for e in embedding_ids]
+    if any(not e for e in ids):
+        raise ValueError("embedding_ids must be non-empty strings")
+    unique_ids = list(dict.fromkeys(ids))
+    cache_root = Path(cache_dir) if cache_dir is not None else None
+
+    vectors = _load_local_many(cache_root, unique_ids) if cache_root else {}
+    local_hits = len(vectors)
+    pending = [e for e in unique_ids if e not in vectors]
+
+    ddb_seconds = s3_seconds = 0.0
+    remote: dict[str, np.ndarray] = {}
+    if pending:
+        handle = clients or make_embedding_cache_clients(
+            bucket=bucket, table=table, region_name=region_name
+        )
+        t0 = time.perf_counter()
+        rows = handle.ddb.batch_get_items(pending, projection=("s3_key",))
+        ddb_seconds = time.perf_counter() - t0
+        pointers = {
+            eid: str(row.get("s3_key", "")).strip()
+            for eid, row in rows.items()
+            if str(row.get("s3_key", "")).strip()
+        }
+        t0 = time.perf_counter()
+        remote = _fetch_s3_vectors(handle.s3, pointers, max_workers=max_workers)
+        s3_seconds = time.perf_counter() - t0
+        vectors.update(remote)
+
+    bad = [eid for eid, vec in vectors.items() if vec.shape[0] != dimensions]
+    if bad:
+        raise RuntimeError(
+            f"{len(bad)} embedding(s) have length != {dimensions}; sample={bad[:5]}"
+        )
+    if cache_root is not None and remote:
+        open_local_store(cache_root).append(list(remote), np.stack(list(remote.values())))
+
+    matrix = np.full((len(ids), dimensions), np.nan, dtype=np.float32)
+    found = np.zeros(len(ids), dtype=bool)
+    for i, eid in enumerate(ids):
+        vec = vectors.get(eid)
+        if vec is not None:
+            matrix[i] = vec
+            found[i] = True
+
+    stats = BulkLoadStats(
+        n_requested=len(ids),
+        n_unique=len(unique_ids),
+        local_hits=local_hits,
+        remote_hits=len(remote),
+        misses=len(unique_ids) - len(vectors),
+        dynamodb_seconds=ddb_seconds,
+        s3_seconds=s3_seconds,
+        total_seconds=time.perf_counter() - started,
+    )
+    _record_bulk_load_telemetry(stats)
+    return BulkEmbeddingLoad(matrix=matrix, found=found, stats=stats)
+
+
+def _record_bulk_load_telemetry(stats: BulkLoadStats) -> None:
+    TELEMETRY.observe("embedding_cache_load_seconds", stats.total_seconds)
+    for tier, n in (
+        ("local", stats.local_hits),
+        ("remote", stats.remote_hits),
+        ("miss", stats.misses),
+    ):
+        TELEMETRY.incr("embedding_cache_lookups_total", n, tier=tier)
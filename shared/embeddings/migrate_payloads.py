@@ -0,0 +1,119 @@
+"""Rewrite legacy JSON embedding payloads under an S3 prefix as binary.
+
+Objects are rewritten in place (same key), so DynamoDB pointers stay valid;
+readers detect the format from the payload bytes, not the key suffix. Already
+binary objects are skipped, so the migration can be re-run after a failure.
+
+Run from repo root::
+
+    PYTHONPATH=. uv run python -m shared.embeddings.migrate_payloads \\
+      --prefix embeddings/ --dry-run
+"""
+
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from tqdm import tqdm
+
+from lib.aws.s3 import S3
+from shared.embeddings.bedrock import AWS_REGION
+from shared.embeddings.cache import (
+    DEFAULT_S3_BUCKET,
+    DEFAULT_S3_MAX_WORKERS,
+    DEFAULT_S3_PREFIX,
+)
+from shared.embeddings.payload import BINARY_CONTENT_TYPE, json_to_binary_payload
+
+
+@dataclass
+class MigrationStats:
+    """Outcome counts for one prefix migration."""
+
+    scanned: int = 0
+    converted: int = 0
+    already_binary: int = 0
+    bytes_before: int = 0
+    bytes_after: int = 0
+    failures: list[tuple[str, str]] = field(default_factory=list)
+
+
+def _migrate_one(s3: S3, key: str, *, dry_run: bool) -> tuple[str, int, int | None]:
+    """Return ``(key, old_size, new_size)``; ``new_size`` is None when skipped."""
+    raw = s3.get_bytes(key)
+    converted = json_to_binary_payload(raw)
+    if converted is None:
+        return key, len(raw), None
+    if not dry_run:
+        s3.upload_bytes(key, converted, content_type=BINARY_CONTENT_TYPE)
+    return key, len(raw), len(converted)
+
+
+def migrate_prefix_to_binary(
+    s3: S3,
+    prefix: str = DEFAULT_S3_PREFIX,
+    *,
+    max_workers: int = DEFAULT_S3_MAX_WORKERS,
+    dry_run: bool = False,
+) -> MigrationStats:
+    """Convert every JSON payload under ``prefix`` to the binary format.
+
+    Per-object errors are collected in ``failures`` rather than aborting the
+    run.
+    """
+    keys = s3.list_keys_ordered(prefix)
+    stats = MigrationStats(scanned=len(keys))
+
+    def task(key: str) -> tuple[str, int, int | None] | tuple[str, Exception]:
+        try:
+            return _migrate_one(s3, key, dry_run=dry_run)
+        except Exception as e:  # noqa: BLE001 - reported per key
+            return key, e
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        for result in tqdm(pool.map(task, keys), total=len(keys), desc="Migrate payloads"):
+            if isinstance(result[1], Exception):
+                stats.failures.append((result[0], repr(result[1])))
+                continue
+            _key, old_size, new_size = result
+            stats.bytes_before += old_size
+            if new_size is None:
+                stats.already_binary += 1
+                stats.bytes_after += old_size
+            else:
+                stats.converted += 1
+                stats.bytes_after += new_size
+    return stats
+
+
+def _build_arg_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(description="Rewrite JSON embedding payloads as binary.")
+    p.add_argument("--bucket", default=DEFAULT_S3_BUCKET)
+    p.add_argument("--prefix", default=DEFAULT_S3_PREFIX)
+    p.add_argument("--region", default=AWS_REGION)
+    p.add_argument("--max-workers", type=int, default=DEFAULT_S3_MAX_WORKERS)
+    p.add_argument("--dry-run", action="store_true", help="Convert in memory; do not upload")
+    return p
+
+
+def main() -> None:
+    args = _build_arg_parser().parse_args()
+    s3 = S3(args.bucket, region_name=args.region, max_pool_connections=args.max_workers)
+    stats = migrate_prefix_to_binary(
+        s3, args.prefix, max_workers=args.max_workers, dry_run=args.dry_run
+    )
+    print(
+        f"scanned={stats.scanned} converted={stats.converted} "
+        f"already_binary={stats.already_binary} failures={len(stats.failures)} "
+        f"bytes {stats.bytes_before} -> {stats.bytes_after}"
+    )
+    for key, err in stats.failures[:25]:
+        print(f"  FAILED {key}: {err}")
+    if stats.failures:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
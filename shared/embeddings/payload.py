@@ -0,0 +1,170 @@
+"""Versioned S3 payload codec for cached embedding vectors.
+
+Binary layout (all little-endian)::
+
+    b"MVEB"  | u8 version | u32 header_len | header JSON (utf-8) | float32[dims]
+
+The header carries ``model_id``, ``dimensions``, ``normalize`` and any extra
+metadata (e.g. ``text``, ``input_text_token_count``). A 256-d vector is about
+1 KB of floats instead of ~5 KB of JSON, and decodes with one
+``np.frombuffer``. :func:`decode_embedding_payload` also accepts the legacy
+JSON documents (``{"embedding": [...], ...}``), so readers work on mixed
+prefixes during and after migration.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+BINARY_MAGIC = b"MVEB"
+BINARY_VERSION = 1
+BINARY_CONTENT_TYPE = "application/octet-stream"
+BINARY_KEY_SUFFIX = ".bin"
+PAYLOAD_FORMAT_BINARY = "binary-v1"
+PAYLOAD_FORMAT_JSON = "json"
+_PREFIX = struct.Struct("<4sBI")
+_DTYPE = np.dtype("<f4")
+_HEADER_KEYS = ("model_id", "dimensions", "normalize")
+
+
+@dataclass(frozen=True)
+class EmbeddingPayload:
+    """Decoded embedding plus its identity metadata.
+
+    ``embedding`` is float32 for binary payloads and float64 (the exact JSON
+    values) for legacy JSON payloads.
+    """
+
+    embedding: np.ndarray
+    model_id: str | None
+    dimensions: int
+    normalize: bool | None
+    payload_format: str
+    extra: dict[str, Any] = field(default_factory=dict)
+
+
+def encode_embedding_payload(
+    embedding: np.ndarray | list[float],
+    *,
+    model_id: str,
+    normalize: bool,
+    extra: dict[str, Any] | None = None,
+) -> bytes:
+    """Serialize one vector to the binary payload format.
+
+    Parameters
+    ----------
+    extra
+        JSON-serializable metadata stored in the header (never the vector).
+
+    Raises
+    ------
+    ValueError
+        If ``embedding`` is not one-dimensional.
+    """
+    vec = np.asarray(embedding, dtype=_DTYPE)
+    if vec.ndim != 1:
+        raise ValueError(f"embedding must be 1-D; got shape {vec.shape}")
+    reserved = ("embedding", *_HEADER_KEYS)
+    meta = {k: v for k, v in (extra or {}).items() if k not in reserved}
+    header = {
+        "model_id": model_id,
+        "dimensions": int(vec.shape[0]),
+        "normalize": bool(normalize),
+        **meta,
+    }
+    header_bytes = json.dumps(header, separators=(",", ":"), ensure_ascii=False).encode(
+        "utf-8"
+    )
+    return (
+        _PREFIX.pack(BINARY_MAGIC, BINARY_VERSION, len(header_bytes))
+        + header_bytes
+        + vec.tobytes()
+    )
+
+
+def is_binary_payload(raw: bytes) -> bool:
+    """True when ``raw`` starts with the binary payload magic."""
+    return raw[: len(BINARY_MAGIC)] == BINARY_MAGIC
+
+
+def _decode_binary(raw: bytes) -> EmbeddingPayload:
+    if len(raw) < _PREFIX.size:
+        raise ValueError(f"Truncated binary embedding payload: {len(raw)} bytes")
+    _magic, version, header_len = _PREFIX.unpack_from(raw)
+    if version != BINARY_VERSION:
+        raise ValueError(f"Unsupported binary embedding payload version {version}")
+    start = _PREFIX.size
+    if len(raw) < start + header_len:
+        raise ValueError(
+            f"Truncated binary embedding payload: header needs {header_len} bytes, "
+            f"{len(raw) - start} present"
+        )
+    header = json.loads(raw[start : start + header_len].decode("utf-8"))
+    if not isinstance(header, dict):
+        raise ValueError(f"Binary payload header is {type(header).__name__}, not an object")
+    dimensions = header.get("dimensions")
+    if not isinstance(dimensions, int) or isinstance(dimensions, bool):
+        raise ValueError(f"Binary payload header has no integer 'dimensions': {dimensions!r}")
+    vec = np.frombuffer(raw, dtype=_DTYPE, offset=start + header_len)
+    if vec.shape[0] != dimensions:
+        raise ValueError(f"Binary payload has {vec.shape[0]} floats; header says {dimensions}")
+    return EmbeddingPayload(
+        embedding=vec,
+        model_id=header.get("model_id"),
+        dimensions=dimensions,
+        normalize=header.get("normalize"),
+        payload_format=PAYLOAD_FORMAT_BINARY,
+        extra={k: v for k, v in header.items() if k not in _HEADER_KEYS},
+    )
+
+
+def _decode_json(raw: bytes) -> EmbeddingPayload:
+    parsed = json.loads(raw.decode("utf-8"))
+    if not isinstance(parsed, dict):
+        raise ValueError(f"JSON payload is {type(parsed).__name__}, not an object")
+    emb = parsed.get("embedding")
+    if emb is None or not isinstance(emb, list):
+        raise ValueError("JSON payload has no 'embedding' list")
+    vec = np.asarray([float(x) for x in emb], dtype=np.float64)
+    return EmbeddingPayload(
+        embedding=vec,
+        model_id=parsed.get("model_id"),
+        dimensions=int(parsed.get("dimensions") or vec.shape[0]),
+        normalize=parsed.get("normalize"),
+        payload_format=PAYLOAD_FORMAT_JSON,
+        extra={k: v for k, v in parsed.items() if k not in ("embedding", *_HEADER_KEYS)},
+    )
+
+
+def decode_embedding_payload(raw: bytes) -> EmbeddingPayload:
+    """Decode a binary or legacy JSON embedding payload (format auto-detected).
+
+    Raises
+    ------
+    ValueError
+        If the payload is malformed or of an unknown version.
+    """
+    if is_binary_payload(raw):
+        return _decode_binary(raw)
+    return _decode_json(raw)
+
+
+def json_to_binary_payload(raw: bytes) -> bytes | None:
+    """Convert a legacy JSON payload to binary; ``None`` if already binary."""
+    if is_binary_payload(raw):
+        return None
+    decoded = _decode_json(raw)
+    if decoded.model_id is None:
+        raise ValueError("JSON payload has no 'model_id'; cannot build binary header")
+    return encode_embedding_payload(
+        decoded.embedding,
+        model_id=str(decoded.model_id),
+        normalize=bool(decoded.normalize),
+        extra=decoded.extra,
+    )
@@ -0,0 +1,230 @@
+"""Write-through embedding resolver over the shared identity cache.
+
+``resolve_embeddings`` hashes each text to its embedding identity, serves hits
+from the local store, then from DynamoDB → S3, and calls Bedrock only for true
+misses. New vectors are written once to S3 and DynamoDB (and the local store),
+so the same text is never embedded twice across experiments.
+
+Run from repo root::
+
+    PYTHONPATH=. uv run python -c "
+    from shared.embeddings.resolver import resolve_embeddings
+    out = resolve_embeddings(['Hello world.'], cache_dir='.embedding_cache')
+    print(out.matrix.shape, out.stats)
+    "
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from lib.aws.embedding_identity import embedding_identity_sha256
+from shared.embeddings.bedrock import (
+    BEDROCK_MODEL_ID,
+    DEFAULT_MAX_CONCURRENCY,
+    EMBEDDING_DIMENSIONS,
+    create_embeddings_batch,
+)
+from shared.embeddings.cache import (
+    DEFAULT_S3_MAX_WORKERS,
+    DEFAULT_S3_PREFIX,
+    EmbeddingCacheClients,
+    load_embeddings_by_ids,
+    make_embedding_cache_clients,
+    open_local_store,
+)
+from shared.embeddings.payload import (
+    BINARY_CONTENT_TYPE,
+    BINARY_KEY_SUFFIX,
+    PAYLOAD_FORMAT_BINARY,
+    encode_embedding_payload,
+)
+
+
+@dataclass(frozen=True)
+class ResolveStats:
+    """Per-tier counts over unique embedding identities for one resolve call."""
+
+    n_requested: int
+    n_unique: int
+    local_hits: int
+    remote_hits: int
+    embedded: int
+
+    def hit_rates(self) -> dict[str, float]:
+        """Fraction of unique identities served by each tier."""
+        denom = self.n_unique or 1
+        return {
+            "local": self.local_hits / denom,
+            "remote": self.remote_hits / denom,
+            "bedrock": self.embedded / denom,
+        }
+
+
+@dataclass(frozen=True)
+class ResolvedEmbeddings:
+    """Dense vectors for :func:`resolve_embeddings`, aligned to the input texts."""
+
+    matrix: np.ndarray
+    embedding_ids: list[str]
+    stats: ResolveStats
+
+
+def _utc_iso_z() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _pointer_row(
+    embedding_id: str,
+    *,
+    bucket: str,
+    s3_key: str,
+    model_id: str,
+    dimensions: int,
+    normalize: bool,
+) -> dict[str, Any]:
+    """DynamoDB pointer row matching the identity-cache contract."""
+    return {
+        "embedding_id": embedding_id,
+        "s3_bucket": bucket,
+        "s3_key": s3_key,
+        "text_sha256": embedding_id,
+        "created_at": _utc_iso_z(),
+        "model_id": model_id,
+        "dimensions": dimensions,
+        "normalize": normalize,
+        "payload_format": PAYLOAD_FORMAT_BINARY,
+    }
+
+
+def _persist_new_embeddings(
+    clients: EmbeddingCacheClients,
+    payloads: dict[str, dict[str, Any]],
+    *,
+    s3_prefix: str,
+    max_workers: int,
+) -> None:
+    """Upload binary S3 payloads concurrently, then batch-write DynamoDB pointers.
+
+    Pointers are written only after every payload upload succeeded, so a
+    pointer never references a missing object.
+    """
+
+    def upload(item: tuple[str, dict[str, Any]]) -> str:
+        eid, payload = item
+        key = f"{s3_prefix}{eid}{BINARY_KEY_SUFFIX}"
+        body = encode_embedding_payload(
+            payload["embedding"],
+            model_id=payload["model_id"],
+            normalize=bool(payload["normalize"]),
+            extra={
+                "text": payload.get("text"),
+                "input_text_token_count": payload.get("input_text_token_count"),
+            },
+        )
+        clients.s3.upload_bytes(key, body, content_type=BINARY_CONTENT_TYPE)
+        return key
+
+    workers = max(1, min(max_workers, len(payloads)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        keys = list(pool.map(upload, payloads.items()))
+    clients.ddb.batch_put_items(
+        _pointer_row(
+            eid,
+            bucket=clients.s3.bucket,
+            s3_key=key,
+            model_id=payload["model_id"],
+            dimensions=int(payload["dimensions"]),
+            normalize=bool(payload["normalize"]),
+        )
+        for (eid, payload), key in zip(payloads.items(), keys, strict=True)
+    )
+
+
+def resolve_embeddings(
+    texts: Sequence[str],
+    *,
+    model_id: str = BEDROCK_MODEL_ID,
+    dimensions: int = EMBEDDING_DIMENSIONS,
+    normalize: bool = True,
+    clients: EmbeddingCacheClients | None = None,
+    cache_dir: str | Path | None = None,
+    s3_prefix: str = DEFAULT_S3_PREFIX,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    max_workers: int = DEFAULT_S3_MAX_WORKERS,
+) -> ResolvedEmbeddings:
+    """Return embeddings for ``texts``, calling Bedrock only for cache misses.
+
+    Tiers, in order: local store under ``cache_dir``, DynamoDB → S3 identity
+    cache, then :func:`~shared.embeddings.bedrock.create_embeddings_batch`.
+    Misses are written back to S3, DynamoDB, and the local store.
+
+    Returns
+    -------
+    ResolvedEmbeddings
+        ``(len(texts), dimensions)`` float32 matrix, the identity per text,
+        and per-tier stats (see :meth:`ResolveStats.hit_rates`).
+
+    Raises
+    ------
+    ValueError
+        If any text is empty or whitespace-only.
+    RuntimeError
+        If Bedrock fails after retries or a cached payload is invalid.
+    """
+    if any(not t or not t.strip() for t in texts):
+        raise ValueError("texts must be non-empty strings")
+    ids = [
+        embedding_identity_sha256(
+            t, model_id=model_id, dimensions=dimensions, normalize=normalize
+        )
+        for t in texts
+    ]
+    text_by_id = dict(zip(ids, texts, strict=True))
+    clients = clients or make_embedding_cache_clients()
+
+    cached = load_embeddings_by_ids(
+        list(text_by_id),
+        clients=clients,
+        cache_dir=cache_dir,
+        dimensions=dimensions,
+        max_workers=max_workers,
+    )
+    vectors = {
+        eid: cached.matrix[i] for i, eid in enumerate(text_by_id) if cached.found[i]
+    }
+    miss_ids = [eid for eid in text_by_id if eid not in vectors]
+
+    if miss_ids:
+        created = create_embeddings_batch(
+            [text_by_id[eid] for eid in miss_ids],
+            model_id=model_id,
+            dimensions=dimensions,
+            normalize=normalize,
+            max_concurrency=max_concurrency,
+        )
+        payloads = dict(zip(miss_ids, created, strict=True))
+        _persist_new_embeddings(clients, payloads, s3_prefix=s3_prefix, max_workers=max_workers)
+        new_matrix = np.asarray([p["embedding"] for p in created], dtype=np.float32)
+        if cache_dir is not None:
+            open_local_store(cache_dir).append(miss_ids, new_matrix)
+        vectors.update(zip(miss_ids, new_matrix, strict=True))
+
+    matrix = np.empty((len(ids), dimensions), dtype=np.float32)
+    for i, eid in enumerate(ids):
+        matrix[i] = vectors[eid]
+    stats = ResolveStats(
+        n_requested=len(texts),
+        n_unique=len(text_by_id),
+        local_hits=cached.stats.local_hits,
+        remote_hits=cached.stats.remote_hits,
+        embedded=len(miss_ids),
+    )
+    return ResolvedEmbeddings(matrix=matrix, embedding_ids=ids, stats=stats)
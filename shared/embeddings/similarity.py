@@ -0,0 +1,147 @@
+"""Vectorized cosine similarity over embedding matrices.
+
+Matrix-level counterparts to :func:`shared.embeddings.bedrock.cosine_similarity`:
+row-wise pair cosine, blocked all-pairs similarity under a memory bound, and
+top-k search. Everything runs in float32 NumPy; pass ``normalized=True`` when
+rows are already L2-normalized (Titan's default) to skip the norm pass.
+
+Run from repo root::
+
+    PYTHONPATH=. uv run python -c "
+    import numpy as np
+    from shared.embeddings.similarity import topk_similar
+    x = np.random.default_rng(0).standard_normal((1000, 256))
+    print(topk_similar(x[:3], x, k=2))
+    "
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import numpy as np
+
+DEFAULT_MAX_BLOCK_BYTES = 256 * 1024 * 1024
+_DTYPE = np.float32
+
+
+def as_float32_matrix(vectors: np.ndarray | list[list[float]]) -> np.ndarray:
+    """Return ``vectors`` as a C-contiguous 2-D float32 array (no copy if already one).
+
+    Raises
+    ------
+    ValueError
+        If ``vectors`` is not two-dimensional.
+    """
+    matrix = np.ascontiguousarray(vectors, dtype=_DTYPE)
+    if matrix.ndim != 2:
+        raise ValueError(f"Expected a 2-D matrix; got shape {matrix.shape}")
+    return matrix
+
+
+def l2_normalize(vectors: np.ndarray | list[list[float]]) -> np.ndarray:
+    """Return a float32 copy with unit-norm rows; all-zero rows stay zero."""
+    matrix = as_float32_matrix(vectors)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
+
+def _prepare(vectors: np.ndarray | list[list[float]], normalized: bool) -> np.ndarray:
+    return as_float32_matrix(vectors) if normalized else l2_normalize(vectors)
+
+
+def pair_cosine(
+    a: np.ndarray | list[list[float]],
+    b: np.ndarray | list[list[float]],
+    *,
+    normalized: bool = False,
+) -> np.ndarray:
+    """Cosine similarity of ``a[i]`` with ``b[i]`` for every row ``i``.
+
+    Zero-norm rows yield ``0.0``, matching the scalar helper.
+
+    Raises
+    ------
+    ValueError
+        If the matrices differ in shape.
+    """
+    left = _prepare(a, normalized)
+    right = _prepare(b, normalized)
+    if left.shape != right.shape:
+        raise ValueError(f"shape mismatch: {left.shape} vs {right.shape}")
+    return np.einsum("ij,ij->i", left, right)
+
+
+def _block_rows(n_cols: int, max_block_bytes: int) -> int:
+    return max(1, max_block_bytes // (max(1, n_cols) * np.dtype(_DTYPE).itemsize))
+
+
+def iter_similarity_blocks(
+    a: np.ndarray | list[list[float]],
+    b: np.ndarray | list[list[float]] | None = None,
+    *,
+    normalized: bool = False,
+    max_block_bytes: int = DEFAULT_MAX_BLOCK_BYTES,
+) -> Iterator[tuple[int, np.ndarray]]:
+    """Yield ``(row_start, block)`` slices of the all-pairs cosine matrix.
+
+    ``block`` is ``sim[row_start : row_start + r, :]`` against all of ``b``
+    (or ``a`` itself when ``b`` is None), with ``r`` chosen so each block
+    stays within ``max_block_bytes``. The full ``n × m`` matrix is never
+    materialized.
+    """
+    left = _prepare(a, normalized)
+    right = left if b is None else _prepare(b, normalized)
+    step = _block_rows(right.shape[0], max_block_bytes)
+    for start in range(0, left.shape[0], step):
+        yield start, left[start : start + step] @ right.T
+
+
+def topk_similar(
+    query_matrix: np.ndarray | list[list[float]],
+    corpus_matrix: np.ndarray | list[list[float]],
+    k: int,
+    *,
+    normalized: bool = False,
+    exclude_self: bool = False,
+    max_block_bytes: int = DEFAULT_MAX_BLOCK_BYTES,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return the ``k`` most similar corpus rows for each query row.
+
+    Parameters
+    ----------
+    exclude_self
+        When the query is the corpus (same row order), drop each row's match
+        with itself.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, numpy.ndarray]
+        ``(indices, scores)``, each ``(n_queries, min(k, n_corpus))``, sorted
+        by descending similarity.
+
+    Raises
+    ------
+    ValueError
+        If ``k < 1``.
+    """
+    if k < 1:
+        raise ValueError("k must be at least 1")
+    corpus = _prepare(corpus_matrix, normalized)
+    kk = min(k, corpus.shape[0] - (1 if exclude_self else 0))
+    indices: list[np.ndarray] = []
+    scores: list[np.ndarray] = []
+    for start, block in iter_similarity_blocks(
+        query_matrix, corpus, normalized=normalized, max_block_bytes=max_block_bytes
+    ):
+        if exclude_self:
+            rows = np.arange(block.shape[0])
+            block[rows, start + rows] = -np.inf
+        part = np.argpartition(-block, kk - 1, axis=1)[:, :kk]
+        part_scores = np.take_along_axis(block, part, axis=1)
+        order = np.argsort(-part_scores, axis=1, kind="stable")
+        indices.append(np.take_along_axis(part, order, axis=1))
+        scores.append(np.take_along_axis(part_scores, order, axis=1))
+    if not indices:
+        return np.empty((0, kk), dtype=np.int64), np.empty((0, kk), dtype=_DTYPE)
+    return np.vstack(indices), np.vstack(scores)
@@ -0,0 +1,451 @@
+"""Append-only, sharded, memory-mapped local store for embedding vectors.
+
+Replaces the one-``.npy``-file-per-``embedding_id`` layout used by the local
+embedding caches. Vectors live in a few large float32 shard files that are
+opened with :class:`numpy.memmap`; an in-memory ``embedding_id -> (shard, row)``
+index is rebuilt from per-shard id files on open.
+
+On-disk layout under ``root``::
+
+    manifest.json          # dimensions + committed row count per shard
+    shard-000000.f32       # raw little-endian float32 rows, shape (rows, d)
+    shard-000000.ids       # one embedding_id per line, aligned with rows
+
+Only the first ``rows`` entries of each shard (per the manifest) are visible.
+Appends write shard bytes first and commit by atomically replacing
+``manifest.json``, so a crash mid-append leaves an ignored (and later
+truncated) tail rather than a corrupt store. One writer process at a time.
+
+Run from repo root::
+
+    PYTHONPATH=. uv run python -m shared.embeddings.store \\
+      --npy-dir path/to/embedding_cache --store-dir path/to/embedding_cache/embedding_store
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import threading
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+STORE_DIRNAME = "embedding_store"
+MANIFEST_FILENAME = "manifest.json"
+STORE_FORMAT_VERSION = 1
+DEFAULT_MAX_ROWS_PER_SHARD = 65_536
+DEFAULT_IMPORT_BATCH_SIZE = 4_096
+_DTYPE = np.dtype("<f4")
+_SHARD_PREFIX = "shard-"
+_VECTORS_SUFFIX = ".f32"
+_IDS_SUFFIX = ".ids"
+
+
+@dataclass
+class _ShardInfo:
+    """Committed extent of one shard as recorded in the manifest."""
+
+    name: str
+    rows: int
+    ids_bytes: int
+
+
+@dataclass(frozen=True)
+class CompactionStats:
+    """Summary returned by :meth:`EmbeddingStore.compact`."""
+
+    rows: int
+    shards_before: int
+    shards_after: int
+
+
+def _fsync_write(path: Path, data: bytes) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("wb") as handle:
+        handle.write(data)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(tmp, path)
+
+
+def _append_at(path: Path, offset: int, data: bytes) -> None:
+    """Truncate ``path`` to ``offset`` (dropping any torn tail) and append ``data``."""
+    mode = "r+b" if path.exists() else "w+b"
+    with path.open(mode) as handle:
+        handle.truncate(offset)
+        handle.seek(offset)
+        handle.write(data)
+        handle.flush()
+        os.fsync(handle.fileno())
+
+
+def _validate_embedding_id(embedding_id: str) -> str:
+    eid = str(embedding_id).strip()
+    if not eid or "\n" in eid or "\r" in eid:
+        raise ValueError(f"Invalid embedding_id for store: {embedding_id!r}")
+    return eid
+
+
+class EmbeddingStore:
+    """Local sharded float32 store keyed by ``embedding_id``.
+
+    Parameters
+    ----------
+    root
+        Store directory; created on first append.
+    dimensions
+        Expected vector length. When ``None``, taken from an existing manifest
+        or from the first append.
+    max_rows_per_shard
+        Rows per shard before a new shard is started.
+
+    Raises
+    ------
+    ValueError
+        If ``dimensions`` disagrees with an existing store on disk.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        *,
+        dimensions: int | None = None,
+        max_rows_per_shard: int = DEFAULT_MAX_ROWS_PER_SHARD,
+    ) -> None:
+        if max_rows_per_shard <= 0:
+            raise ValueError("max_rows_per_shard must be positive")
+        self._root = Path(root)
+        self._max_rows_per_shard = max_rows_per_shard
+        self._lock = threading.Lock()
+        self._shards: list[_ShardInfo] = []
+        self._next_shard = 0
+        self._index: dict[str, tuple[int, int]] = {}
+        self._maps: dict[str, np.memmap] = {}
+        self._dimensions = dimensions
+        self._load_manifest()
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    @property
+    def dimensions(self) -> int | None:
+        return self._dimensions
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, embedding_id: object) -> bool:
+        return str(embedding_id).strip() in self._index
+
+    def ids(self) -> list[str]:
+        """Return every stored ``embedding_id`` in storage order."""
+        return list(self._index)
+
+    def missing(self, embedding_ids: Iterable[str]) -> list[str]:
+        """Return the ids from ``embedding_ids`` not present (order kept, deduplicated)."""
+        seen: set[str] = set()
+        out: list[str] = []
+        for raw in embedding_ids:
+            eid = str(raw).strip()
+            if eid not in self._index and eid not in seen:
+                seen.add(eid)
+                out.append(eid)
+        return out
+
+    def get(self, embedding_id: str) -> np.ndarray | None:
+        """Return one float32 vector (a copy), or ``None`` when absent."""
+        loc = self._index.get(str(embedding_id).strip())
+        if loc is None:
+            return None
+        shard_pos, row = loc
+        return np.array(self._shard_map(shard_pos)[row], dtype=np.float32)
+
+    def get_many(self, embedding_ids: Sequence[str]) -> np.ndarray:
+        """Return a dense ``(len(embedding_ids), d)`` float32 matrix in input order.
+
+        Rows are gathered per shard with one fancy-index read each, so the cost
+        is a handful of memmap reads rather than one file open per id.
+
+        Raises
+        ------
+        KeyError
+            If any id is not in the store (message includes a sample).
+        """
+        ids = [str(e).strip() for e in embedding_ids]
+        absent = [e for e in ids if e not in self._index]
+        if absent:
+            raise KeyError(
+                f"{len(absent)} embedding_id(s) not in store {self._root}; "
+                f"sample={absent[:5]}"
+            )
+        dims = self._dimensions or 0
+        out = np.empty((len(ids), dims), dtype=np.float32)
+        if not ids:
+            return out
+        locs = np.asarray([self._index[e] for e in ids], dtype=np.int64)
+        for shard_pos in np.unique(locs[:, 0]):
+            mask = locs[:, 0] == shard_pos
+            out[mask] = self._shard_map(int(shard_pos))[locs[mask, 1]]
+        return out
+
+    def append(
+        self,
+        embedding_ids: Sequence[str],
+        vectors: np.ndarray | Sequence[Sequence[float]],
+    ) -> int:
+        """Append new vectors; ids already stored (or repeated in the batch) are skipped.
+
+        The batch is committed atomically per shard touched: readers either see
+        all rows written to a shard by this call or none of them.
+
+        Returns
+        -------
+        int
+            Number of rows actually written.
+
+        Raises
+        ------
+        ValueError
+            On a length mismatch between ids and vectors, wrong vector width,
+            or an invalid id.
+        """
+        matrix = np.asarray(vectors, dtype=_DTYPE)
+        if matrix.ndim == 1 and len(embedding_ids) == 1:
+            matrix = matrix.reshape(1, -1)
+        if matrix.ndim != 2 or matrix.shape[0] != len(embedding_ids):
+            raise ValueError(
+                f"Expected ({len(embedding_ids)}, d) vectors; got shape {matrix.shape}"
+            )
+        with self._lock:
+            if self._dimensions is None:
+                self._dimensions = int(matrix.shape[1])
+            if matrix.shape[1] != self._dimensions:
+                raise ValueError(
+                    f"Vector width {matrix.shape[1]} != store dimensions {self._dimensions}"
+                )
+            new_ids, keep_rows = self._select_new(embedding_ids)
+            if not new_ids:
+                return 0
+            self._write_rows(new_ids, np.ascontiguousarray(matrix[keep_rows]))
+            return len(new_ids)
+
+    def compact(self) -> CompactionStats:
+        """Rewrite all committed rows into full shards and drop superseded files.
+
+        Merges the many small shards that single-row appends produce and
+        reclaims torn tails. New shards are committed via the manifest before
+        old files are removed.
+        """
+        with self._lock:
+            shards_before = len(self._shards)
+            if not self._shards:
+                return CompactionStats(rows=0, shards_before=0, shards_after=0)
+            old_names = [s.name for s in self._shards]
+            ids = list(self._index)
+            new_shards: list[_ShardInfo] = []
+            for start in range(0, len(ids), self._max_rows_per_shard):
+                chunk = ids[start : start + self._max_rows_per_shard]
+                name = self._allocate_shard_name()
+                ids_blob = "".join(f"{e}\n" for e in chunk).encode("utf-8")
+                _append_at(self._vectors_path(name), 0, self.get_many(chunk).tobytes())
+                _append_at(self._ids_path(name), 0, ids_blob)
+                new_shards.append(_ShardInfo(name, len(chunk), len(ids_blob)))
+            self._shards = new_shards
+            self._write_manifest()
+            self._maps.clear()
+            self._rebuild_index()
+            for name in old_names:
+                self._vectors_path(name).unlink(missing_ok=True)
+                self._ids_path(name).unlink(missing_ok=True)
+            return CompactionStats(
+                rows=len(ids), shards_before=shards_before, shards_after=len(new_shards)
+            )
+
+    def _select_new(self, embedding_ids: Sequence[str]) -> tuple[list[str], list[int]]:
+        new_ids: list[str] = []
+        keep_rows: list[int] = []
+        batch_seen: set[str] = set()
+        for i, raw in enumerate(embedding_ids):
+            eid = _validate_embedding_id(raw)
+            if eid in self._index or eid in batch_seen:
+                continue
+            batch_seen.add(eid)
+            new_ids.append(eid)
+            keep_rows.append(i)
+        return new_ids, keep_rows
+
+    def _write_rows(self, ids: list[str], matrix: np.ndarray) -> None:
+        self._root.mkdir(parents=True, exist_ok=True)
+        start = 0
+        touched: list[tuple[int, int, list[str]]] = []
+        while start < len(ids):
+            shard_pos = self._writable_shard()
+            shard = self._shards[shard_pos]
+            take = min(self._max_rows_per_shard - shard.rows, len(ids) - start)
+            chunk_ids = ids[start : start + take]
+            ids_blob = "".join(f"{e}\n" for e in chunk_ids).encode("utf-8")
+            row_bytes = matrix.shape[1] * _DTYPE.itemsize
+            _append_at(
+                self._vectors_path(shard.name),
+                shard.rows * row_bytes,
+                matrix[start : start + take].tobytes(),
+            )
+            _append_at(self._ids_path(shard.name), shard.ids_bytes, ids_blob)
+            touched.append((shard_pos, shard.rows, chunk_ids))
+            shard.rows += take
+            shard.ids_bytes += len(ids_blob)
+            self._maps.pop(shard.name, None)
+            start += take
+        self._write_manifest()
+        for shard_pos, first_row, chunk_ids in touched:
+            for offset, eid in enumerate(chunk_ids):
+                self._index[eid] = (shard_pos, first_row + offset)
+
+    def _writable_shard(self) -> int:
+        if self._shards and self._shards[-1].rows < self._max_rows_per_shard:
+            return len(self._shards) - 1
+        self._shards.append(_ShardInfo(self._allocate_shard_name(), 0, 0))
+        return len(self._shards) - 1
+
+    def _allocate_shard_name(self) -> str:
+        name = f"{_SHARD_PREFIX}{self._next_shard:06d}"
+        self._next_shard += 1
+        return name
+
+    def _shard_map(self, shard_pos: int) -> np.memmap:
+        shard = self._shards[shard_pos]
+        mm = self._maps.get(shard.name)
+        if mm is None:
+            mm = np.memmap(
+                self._vectors_path(shard.name),
+                dtype=_DTYPE,
+                mode="r",
+                shape=(shard.rows, self._dimensions or 0),
+            )
+            self._maps[shard.name] = mm
+        return mm
+
+    def _vectors_path(self, name: str) -> Path:
+        return self._root / f"{name}{_VECTORS_SUFFIX}"
+
+    def _ids_path(self, name: str) -> Path:
+        return self._root / f"{name}{_IDS_SUFFIX}"
+
+    def _load_manifest(self) -> None:
+        path = self._root / MANIFEST_FILENAME
+        if not path.is_file():
+            return
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+        if manifest.get("format_version") != STORE_FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported embedding store format {manifest.get('format_version')!r} "
+                f"in {path}"
+            )
+        on_disk_dims = int(manifest["dimensions"])
+        if self._dimensions is not None and self._dimensions != on_disk_dims:
+            raise ValueError(
+                f"Store at {self._root} has dimensions={on_disk_dims}, "
+                f"requested {self._dimensions}"
+            )
+        self._dimensions = on_disk_dims
+        self._next_shard = int(manifest["next_shard"])
+        self._shards = [
+            _ShardInfo(s["name"], int(s["rows"]), int(s["ids_bytes"]))
+            for s in manifest["shards"]
+        ]
+        self._rebuild_index()
+
+    def _rebuild_index(self) -> None:
+        self._index = {}
+        for shard_pos, shard in enumerate(self._shards):
+            with self._ids_path(shard.name).open("rb") as handle:
+                blob = handle.read(shard.ids_bytes)
+            lines = blob.decode("utf-8").splitlines()[: shard.rows]
+            for row, eid in enumerate(lines):
+                self._index.setdefault(eid, (shard_pos, row))
+
+    def _write_manifest(self) -> None:
+        manifest = {
+            "format_version": STORE_FORMAT_VERSION,
+            "dimensions": self._dimensions,
+            "dtype": _DTYPE.str,
+            "next_shard": self._next_shard,
+            "shards": [
+                {"name": s.name, "rows": s.rows, "ids_bytes": s.ids_bytes}
+                for s in self._shards
+            ],
+        }
+        _fsync_write(
+            self._root / MANIFEST_FILENAME,
+            json.dumps(manifest, indent=2).encode("utf-8"),
+        )
+
+
+def import_npy_tree(
+    store: EmbeddingStore,
+    npy_dir: str | Path,
+    *,
+    batch_size: int = DEFAULT_IMPORT_BATCH_SIZE,
+) -> int:
+    """Import a legacy ``<embedding_id>.npy`` tree into ``store``.
+
+    Accepts either the cache root (containing ``embeddings/``) or the
+    ``embeddings/`` directory itself. Files are read in sorted order and
+    appended in batches; ids already in the store are skipped, so the import
+    can be re-run safely.
+
+    Returns
+    -------
+    int
+        Number of vectors newly written.
+
+    Raises
+    ------
+    FileNotFoundError
+        If no ``.npy`` directory exists at ``npy_dir``.
+    """
+    root = Path(npy_dir)
+    emb_dir = root / "embeddings" if (root / "embeddings").is_dir() else root
+    if not emb_dir.is_dir():
+        raise FileNotFoundError(f"No .npy embedding directory at {root}")
+    paths = sorted(p for p in emb_dir.glob("*.npy") if p.stem not in store)
+    written = 0
+    for start in range(0, len(paths), batch_size):
+        chunk = paths[start : start + batch_size]
+        vectors = np.stack([np.load(p).ravel() for p in chunk])
+        written += store.append([p.stem for p in chunk], vectors)
+    return written
+
+
+def _build_arg_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(
+        description="Import a legacy <embedding_id>.npy cache into a sharded embedding store."
+    )
+    p.add_argument("--npy-dir", required=True, help="Legacy cache root or its embeddings/ dir")
+    p.add_argument(
+        "--store-dir",
+        default=None,
+        help=f"Destination store (default: <npy-dir>/{STORE_DIRNAME})",
+    )
+    p.add_argument("--compact", action="store_true", help="Compact the store after import")
+    return p
+
+
+def main() -> None:
+    args = _build_arg_parser().parse_args()
+    npy_dir = Path(args.npy_dir)
+    store = EmbeddingStore(args.store_dir or npy_dir / STORE_DIRNAME)
+    written = import_npy_tree(store, npy_dir)
+    print(f"Imported {written} vectors; store now holds {len(store)} at {store.root}")
+    if args.compact:
+        stats = store.compact()
+        print(f"Compacted {stats.shards_before} -> {stats.shards_after} shards")
+
+
+if __name__ == "__main__":
+    main()
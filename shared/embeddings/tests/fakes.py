@@ -0,0 +1,72 @@
+"""In-memory stand-ins for Bedrock embedding calls and the S3 / DynamoDB cache clients."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Mapping
+from typing import Any
+
+from shared.embeddings.cache import EmbeddingCacheClients
+
+
+class FakeCreateEmbedding:
+    """Thread-safe ``bedrock.create_embedding`` that records every request.
+
+    Returns ``[len(text)] * dimensions`` as the embedding. ``fail_once`` maps a
+    text to the exception raised on its first request only.
+    """
+
+    def __init__(self, fail_once: Mapping[str, BaseException] | None = None) -> None:
+        self.calls: list[str] = []
+        self._fail_once = dict(fail_once or {})
+        self._lock = threading.Lock()
+
+    def __call__(self, text: str, **kwargs: Any) -> dict[str, Any]:
+        with self._lock:
+            self.calls.append(text)
+            error = self._fail_once.pop(text, None)
+        if error is not None:
+            raise error
+        vector = [float(len(text))] * kwargs["dimensions"]
+        return {"text": text, "embedding": vector, "input_text_token_count": 3, **kwargs}
+
+
+class FakeDynamoDB:
+    """Dict-backed DynamoDBEmbeddingIndex supporting the batch methods."""
+
+    def __init__(self, rows: dict[str, dict[str, Any]] | None = None) -> None:
+        self.rows = dict(rows or {})
+        self.requested: list[list[str]] = []
+
+    def batch_get_items(
+        self, embedding_ids: list[str], **_: Any
+    ) -> dict[str, dict[str, Any]]:
+        self.requested.append(list(embedding_ids))
+        return {e: self.rows[e] for e in embedding_ids if e in self.rows}
+
+    def batch_put_items(self, items: Any, **_: Any) -> int:
+        written = list(items)
+        for item in written:
+            self.rows[str(item["embedding_id"])] = item
+        return len(written)
+
+
+class FakeS3:
+    """Dict-backed S3 wrapper."""
+
+    def __init__(self, objects: dict[str, bytes] | None = None) -> None:
+        self.objects = dict(objects or {})
+        self.bucket = "fake-bucket"
+
+    def get_bytes(self, key: str) -> bytes:
+        return self.objects[key]
+
+    def upload_bytes(self, key: str, body: bytes, *, content_type: str | None = None) -> None:
+        self.objects[key] = body
+
+
+def make_fake_clients(
+    rows: dict[str, dict[str, Any]] | None = None,
+    objects: dict[str, bytes] | None = None,
+) -> EmbeddingCacheClients:
+    return EmbeddingCacheClients(s3=FakeS3(objects), ddb=FakeDynamoDB(rows))  # type: ignore[arg-type]
@@ -0,0 +1,77 @@
+"""Tests for the IVF approximate nearest-neighbour index."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from shared.embeddings.ann import IVFIndex, build_index_from_store
+from shared.embeddings.store import EmbeddingStore
+
+DIMS = 16
+
+
+def _corpus(n: int, seed: int = 0) -> tuple[list[str], np.ndarray]:
+    vectors = np.random.default_rng(seed).standard_normal((n, DIMS)).astype(np.float32)
+    return [f"id{i:04d}" for i in range(n)], vectors
+
+
+class TestIVFIndex:
+    """Tests for IVFIndex."""
+
+    def test_full_probe_search_is_exact(self) -> None:
+        """Verifies probing every bucket returns the brute-force top-k."""
+        ids, vectors = _corpus(200)
+        index = IVFIndex.train(vectors, n_lists=8)
+        assert index.add(ids, vectors) == 200
+        hits = index.search(vectors[:3], k=5, n_probe=8)
+        unit = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        expected = np.argsort(-(unit[:3] @ unit.T), axis=1)[:, :5]
+        assert [[eid for eid, _ in row] for row in hits] == [
+            [ids[i] for i in row] for row in expected
+        ]
+
+    def test_incremental_add_skips_known_ids(self) -> None:
+        """Verifies re-adding indexed ids is a no-op and new ids are searchable."""
+        ids, vectors = _corpus(50)
+        index = IVFIndex.train(vectors, n_lists=4)
+        index.add(ids[:30], vectors[:30])
+        assert index.add(ids, vectors) == 20
+        assert len(index) == 50
+        assert index.search(vectors[45], k=1, n_probe=4)[0][0][0] == ids[45]
+
+    def test_near_duplicates_finds_planted_pairs(self) -> None:
+        """Verifies the sweep reports each planted near-copy exactly once."""
+        ids, vectors = _corpus(100)
+        dup = vectors[[3, 40]] + 1e-3
+        index = IVFIndex.train(vectors, n_lists=5)
+        index.add(ids + ["dup3", "dup40"], np.vstack([vectors, dup]))
+        pairs = index.near_duplicates(0.999, n_probe=5)
+        assert sorted((a, b) for a, b, _ in pairs) == [("id0003", "dup3"), ("id0040", "dup40")]
+
+    def test_save_load_round_trip(self, tmp_path: Path) -> None:
+        """Verifies a saved index reloads with identical results and accepts inserts."""
+        ids, vectors = _corpus(60)
+        index = IVFIndex.train(vectors, n_lists=4)
+        index.add(ids[:50], vectors[:50])
+        loaded = IVFIndex.load(index.save(tmp_path / "index.npz"))
+        assert loaded.ids() == index.ids()
+        assert loaded.search(vectors[:2], k=3) == index.search(vectors[:2], k=3)
+        assert loaded.add(ids, vectors) == 10
+
+    def test_add_rejects_wrong_width(self) -> None:
+        """Verifies vectors of the wrong dimensionality are rejected."""
+        index = IVFIndex.train(_corpus(10)[1], n_lists=2)
+        with pytest.raises(ValueError, match="Expected shape"):
+            index.add(["x"], np.zeros((1, DIMS + 1)))
+
+
+def test_build_index_from_store(tmp_path: Path) -> None:
+    """Verifies an index built from a store covers every stored id."""
+    ids, vectors = _corpus(80)
+    store = EmbeddingStore(tmp_path / "store", dimensions=DIMS)
+    store.append(ids, vectors)
+    index = build_index_from_store(store, n_lists=4)
+    assert sorted(index.ids()) == sorted(ids)
@@ -0,0 +1,123 @@
+"""Tests for concurrent Titan batch embedding (Bedrock calls faked)."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from botocore.exceptions import ClientError
+
+from lib.telemetry import TELEMETRY
+from shared.embeddings import bedrock
+from shared.embeddings.bedrock import timed_embedding_calls
+from shared.embeddings.tests.fakes import FakeCreateEmbedding
+
+
+def _throttle_error() -> RuntimeError:
+    cause = ClientError({"Error": {"Code": "ThrottlingException"}}, "InvokeModel")
+    err = RuntimeError("Bedrock invoke_model failed")
+    err.__cause__ = cause
+    return err
+
+
+@pytest.fixture(autouse=True)
+def _no_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(bedrock, "_jitter_sleep", lambda attempt: None)
+
+
+class TestCreateEmbeddingsBatch:
+    """Tests for create_embeddings_batch()."""
+
+    def test_dedupes_and_preserves_input_order(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Verifies identical texts are embedded once and results align to input."""
+        fake = FakeCreateEmbedding()
+        monkeypatch.setattr(bedrock, "create_embedding", fake)
+        texts = ["bb", "a", "bb", "ccc"]
+        result = bedrock.create_embeddings_batch(texts, max_concurrency=3, show_progress=False)
+        assert [r["text"] for r in result] == texts
+        assert sorted(fake.calls) == ["a", "bb", "ccc"]
+
+    def test_retries_throttled_requests(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Verifies ThrottlingException is retried rather than raised."""
+        fake = FakeCreateEmbedding(fail_once={"a": _throttle_error()})
+        monkeypatch.setattr(bedrock, "create_embedding", fake)
+        result = bedrock.create_embeddings_batch(["a"], show_progress=False)
+        assert result[0]["embedding"] == [1.0] * bedrock.EMBEDDING_DIMENSIONS
+        assert fake.calls == ["a", "a"]
+
+    def test_non_retryable_error_propagates(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Verifies errors without a retryable code are raised immediately."""
+
+        def fail(text: str, **kwargs: Any) -> dict[str, Any]:
+            raise RuntimeError("Response missing top-level 'embedding'")
+
+        monkeypatch.setattr(bedrock, "create_embedding", fail)
+        with pytest.raises(RuntimeError, match="missing"):
+            bedrock.create_embeddings_batch(["a"], show_progress=False)
+
+    def test_sizes_client_pool_for_requested_concurrency(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verifies the shared client is rebuilt only when more connections are needed."""
+        import boto3
+
+        pools: list[int] = []
+
+        def fake_client(service: str, **kwargs: Any) -> object:
+            pools.append(kwargs["config"].max_pool_connections)
+            return object()
+
+        monkeypatch.setattr(boto3, "client", fake_client)
+        monkeypatch.setattr(bedrock, "_client", None)
+        monkeypatch.setattr(bedrock, "_client_pool_size", 0)
+        monkeypatch.setattr(bedrock, "create_embedding", FakeCreateEmbedding())
+        bedrock.create_embeddings_batch(["a"], max_concurrency=32, show_progress=False)
+        bedrock.create_embeddings_batch(["a"], max_concurrency=4, show_progress=False)
+        client = bedrock.get_bedrock_client()
+        assert pools == [32]
+        assert bedrock.get_bedrock_client(64) is not client
+        assert pools == [32, 64]
+
+    def test_blank_text_raises(self) -> None:
+        """Verifies whitespace-only inputs are rejected up front."""
+        with pytest.raises(ValueError, match="non-empty"):
+            bedrock.create_embeddings_batch(["ok", "  "], show_progress=False)
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Tests for the AIMD concurrency limiter."""
+
+    def test_throttle_halves_and_success_recovers(self) -> None:
+        """Verifies multiplicative decrease and additive increase."""
+        limiter = bedrock._AdaptiveConcurrencyLimiter(8)
+        limiter.acquire()
+        limiter.release(throttled=True)
+        assert limiter.limit == 4
+        for _ in range(4):
+            limiter.acquire()
+            limiter.release(throttled=False)
+        assert limiter.limit == 5
+
+
+class TestTimedEmbeddingCalls:
+    """Tests for the timed_embedding_calls decorator."""
+
+    def test_records_tokens_and_errors(self) -> None:
+        """Verifies the Bedrock decorator feeds latency, tokens, and error counts."""
+
+        @timed_embedding_calls
+        def fake_embed(text: str) -> dict[str, int]:
+            if not text:
+                raise ValueError("empty")
+            return {"input_text_token_count": 7}
+
+        TELEMETRY.reset()
+        fake_embed("hello")
+        with pytest.raises(ValueError):
+            fake_embed("")
+        assert fake_embed.latency.count == 2  # type: ignore[attr-defined]
+        assert TELEMETRY.counter("bedrock_input_tokens_total", operation="fake_embed") == 7
+        errors = TELEMETRY.counter(
+            "bedrock_call_errors_total", operation="fake_embed", code="ValueError"
+        )
+        assert errors == 1
@@ -0,0 +1,53 @@
+"""Tests for bulk reads from the embedding identity cache."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import numpy as np
+
+from shared.embeddings.cache import EmbeddingCacheClients, load_embeddings_by_ids
+from shared.embeddings.tests.fakes import make_fake_clients
+
+DIMS = 3
+
+
+def _clients(vectors: dict[str, list[float]]) -> EmbeddingCacheClients:
+    rows = {e: {"embedding_id": e, "s3_key": f"embeddings/{e}.json"} for e in vectors}
+    objects = {
+        f"embeddings/{e}.json": json.dumps({"embedding": v}).encode("utf-8")
+        for e, v in vectors.items()
+    }
+    return make_fake_clients(rows, objects)
+
+
+class TestLoadEmbeddingsByIds:
+    """Tests for load_embeddings_by_ids()."""
+
+    def test_aligns_rows_to_input_order_with_misses(self) -> None:
+        """Verifies dedupe, input-order alignment, and NaN rows for misses."""
+        clients = _clients({"a": [1.0, 0.0, 0.0], "b": [0.0, 1.0, 0.0]})
+        result = load_embeddings_by_ids(
+            ["b", "missing", "a", "b"], clients=clients, dimensions=DIMS
+        )
+        assert result.found.tolist() == [True, False, True, True]
+        np.testing.assert_array_equal(result.matrix[0], [0.0, 1.0, 0.0])
+        np.testing.assert_array_equal(result.matrix[2], [1.0, 0.0, 0.0])
+        assert np.isnan(result.matrix[1]).all()
+        assert clients.ddb.requested == [["b", "missing", "a"]]  # type: ignore[attr-defined]
+        assert (result.stats.n_unique, result.stats.remote_hits, result.stats.misses) == (
+            3,
+            2,
+            1,
+        )
+
+    def test_second_load_is_served_from_local_store(self, tmp_path: Path) -> None:
+        """Verifies remote hits are persisted and reused without DynamoDB calls."""
+        clients = _clients({"a": [1.0, 2.0, 3.0]})
+        load_embeddings_by_ids(["a"], clients=clients, cache_dir=tmp_path, dimensions=DIMS)
+        again = load_embeddings_by_ids(
+            ["a"], clients=clients, cache_dir=tmp_path, dimensions=DIMS
+        )
+        assert again.stats.local_hits == 1
+        assert len(clients.ddb.requested) == 1  # type: ignore[attr-defined]
+        np.testing.assert_array_equal(again.matrix[0], [1.0, 2.0, 3.0])
@@ -0,0 +1,83 @@
+"""Tests for the binary / legacy JSON embedding payload codec."""
+
+from __future__ import annotations
+
+import json
+import struct
+
+import numpy as np
+import pytest
+
+from shared.embeddings.payload import (
+    BINARY_MAGIC,
+    BINARY_VERSION,
+    PAYLOAD_FORMAT_BINARY,
+    PAYLOAD_FORMAT_JSON,
+    decode_embedding_payload,
+    encode_embedding_payload,
+    json_to_binary_payload,
+)
+
+LEGACY_PAYLOAD = {
+    "text": "Hello world.",
+    "model_id": "amazon.titan-embed-text-v2:0",
+    "dimensions": 3,
+    "normalize": True,
+    "embedding": [0.5, -0.25, 0.125],
+    "input_text_token_count": 4,
+}
+
+
+class TestEmbeddingPayloadCodec:
+    """Tests for encode/decode round trips and format detection."""
+
+    def test_binary_round_trip(self) -> None:
+        """Verifies vector and header survive encode -> decode."""
+        raw = encode_embedding_payload(
+            [0.5, -0.25, 0.125], model_id="m", normalize=True, extra={"text": "hi"}
+        )
+        decoded = decode_embedding_payload(raw)
+        assert decoded.payload_format == PAYLOAD_FORMAT_BINARY
+        np.testing.assert_array_equal(decoded.embedding, [0.5, -0.25, 0.125])
+        assert (decoded.model_id, decoded.dimensions, decoded.normalize) == ("m", 3, True)
+        assert decoded.extra == {"text": "hi"}
+
+    def test_legacy_json_is_still_readable(self) -> None:
+        """Verifies JSON payloads decode with exact float values."""
+        decoded = decode_embedding_payload(json.dumps(LEGACY_PAYLOAD).encode("utf-8"))
+        assert decoded.payload_format == PAYLOAD_FORMAT_JSON
+        assert decoded.embedding.tolist() == LEGACY_PAYLOAD["embedding"]
+
+    def test_json_to_binary_is_smaller_and_idempotent(self) -> None:
+        """Verifies migration conversion shrinks payloads and skips binary input."""
+        raw = json.dumps({**LEGACY_PAYLOAD, "embedding": [0.123456789] * 256}).encode()
+        converted = json_to_binary_payload(raw)
+        assert converted is not None
+        assert len(converted) < len(raw) / 2
+        assert json_to_binary_payload(converted) is None
+        assert decode_embedding_payload(converted).extra["text"] == "Hello world."
+
+    @pytest.mark.parametrize("keep", [4, 8, 12])
+    def test_truncated_binary_raises_value_error(self, keep: int) -> None:
+        """Verifies a body cut short after the magic raises ValueError, not struct.error."""
+        raw = encode_embedding_payload([0.5, -0.25], model_id="m", normalize=True)
+        with pytest.raises(ValueError, match="Truncated"):
+            decode_embedding_payload(raw[:keep])
+
+    @pytest.mark.parametrize(
+        "header",
+        [b"[]", b'{"model_id": "m"}', b'{"dimensions": "2"}'],
+        ids=["not-an-object", "no-dimensions", "non-integer-dimensions"],
+    )
+    def test_malformed_binary_header_raises_value_error(self, header: bytes) -> None:
+        """Verifies a bad header raises ValueError, not KeyError or TypeError."""
+        raw = struct.pack("<4sBI", BINARY_MAGIC, BINARY_VERSION, len(header)) + header + bytes(8)
+        with pytest.raises(ValueError, match="header"):
+            decode_embedding_payload(raw)
+
+    def test_malformed_json_raises(self) -> None:
+        """Verifies payloads without an embedding list or top-level object are rejected."""
+        with pytest.raises(ValueError, match="embedding"):
+            decode_embedding_payload(b'{"embedding": null}')
+        with pytest.raises(ValueError, match="not an object"):
+            decode_embedding_payload(b"[0.5]")
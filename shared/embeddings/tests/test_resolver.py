@@ -0,0 +1,78 @@
+"""Tests for the write-through embedding resolver (Bedrock faked)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+
+from shared.embeddings import resolver
+from shared.embeddings.tests.fakes import make_fake_clients
+
+DIMS = 2
+
+
+class FakeBatchEmbedder:
+    """Stands in for create_embeddings_batch and records requested texts."""
+
+    def __init__(self) -> None:
+        self.requested: list[str] = []
+
+    def __call__(self, texts: list[str], **kwargs: Any) -> list[dict[str, Any]]:
+        self.requested.extend(texts)
+        return [
+            {
+                "text": t,
+                "embedding": [float(len(t)), 1.0],
+                "model_id": kwargs["model_id"],
+                "dimensions": kwargs["dimensions"],
+                "normalize": kwargs["normalize"],
+                "input_text_token_count": 1,
+            }
+            for t in texts
+        ]
+
+
+@pytest.fixture
+def embedder(monkeypatch: pytest.MonkeyPatch) -> FakeBatchEmbedder:
+    fake = FakeBatchEmbedder()
+    monkeypatch.setattr(resolver, "create_embeddings_batch", fake)
+    return fake
+
+
+class TestResolveEmbeddings:
+    """Tests for resolve_embeddings()."""
+
+    def test_embeds_misses_once_and_writes_through(
+        self, embedder: FakeBatchEmbedder, tmp_path: Path
+    ) -> None:
+        """Verifies only unique misses hit Bedrock and are persisted to every tier."""
+        clients = make_fake_clients()
+        out = resolver.resolve_embeddings(
+            ["aa", "b", "aa"], clients=clients, cache_dir=tmp_path, dimensions=DIMS
+        )
+        assert sorted(embedder.requested) == ["aa", "b"]
+        np.testing.assert_array_equal(out.matrix[:, 0], [2.0, 1.0, 2.0])
+        assert out.stats.embedded == 2
+        assert set(clients.ddb.rows) == set(out.embedding_ids)  # type: ignore[attr-defined]
+        assert len(clients.s3.objects) == 2  # type: ignore[attr-defined]
+
+    def test_second_call_is_served_without_bedrock(
+        self, embedder: FakeBatchEmbedder, tmp_path: Path
+    ) -> None:
+        """Verifies repeat texts are cache hits, locally and remotely."""
+        clients = make_fake_clients()
+        resolver.resolve_embeddings(["aa"], clients=clients, dimensions=DIMS)
+        remote = resolver.resolve_embeddings(["aa"], clients=clients, dimensions=DIMS)
+        assert remote.stats.hit_rates()["remote"] == 1.0
+        local = resolver.resolve_embeddings(
+            ["aa"], clients=clients, cache_dir=tmp_path, dimensions=DIMS
+        )
+        again = resolver.resolve_embeddings(
+            ["aa"], clients=clients, cache_dir=tmp_path, dimensions=DIMS
+        )
+        assert local.stats.remote_hits == 1
+        assert again.stats.hit_rates()["local"] == 1.0
+        assert embedder.requested == ["aa"]
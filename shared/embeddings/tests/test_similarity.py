@@ -0,0 +1,76 @@
+"""Tests for vectorized cosine similarity and top-k search."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from shared.embeddings.bedrock import cosine_similarity
+from shared.embeddings.similarity import (
+    iter_similarity_blocks,
+    l2_normalize,
+    pair_cosine,
+    topk_similar,
+)
+
+
+def _random(n: int, d: int = 8, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).standard_normal((n, d))
+
+
+class TestPairCosine:
+    """Tests for pair_cosine()."""
+
+    def test_matches_scalar_helper(self) -> None:
+        """Verifies row-wise results agree with the pure-Python cosine."""
+        a, b = _random(5), _random(5, seed=1)
+        expected = [cosine_similarity(list(x), list(y)) for x, y in zip(a, b)]
+        got = pair_cosine(a, b)
+        assert got.dtype == np.float32
+        np.testing.assert_allclose(got, expected, atol=1e-6)
+
+    def test_zero_rows_and_normalized_fast_path(self) -> None:
+        """Verifies zero-norm rows give 0 and pre-normalized input skips rescaling."""
+        a = np.array([[0.0, 0.0], [3.0, 4.0]])
+        assert pair_cosine(a, a).tolist() == pytest.approx([0.0, 1.0])
+        unit = l2_normalize(_random(4))
+        np.testing.assert_allclose(
+            pair_cosine(unit, unit, normalized=True), np.ones(4), atol=1e-6
+        )
+
+    def test_shape_mismatch_raises(self) -> None:
+        """Verifies matrices of different shape are rejected."""
+        with pytest.raises(ValueError, match="shape mismatch"):
+            pair_cosine(_random(2), _random(3))
+
+
+class TestTopkSimilar:
+    """Tests for iter_similarity_blocks() and topk_similar()."""
+
+    def test_blocks_reassemble_full_matrix(self) -> None:
+        """Verifies small blocks cover the same values as one dense product."""
+        x = _random(10)
+        unit = l2_normalize(x)
+        blocks = list(iter_similarity_blocks(x, max_block_bytes=3 * 10 * 4))
+        assert [start for start, _ in blocks] == [0, 3, 6, 9]
+        np.testing.assert_allclose(
+            np.vstack([b for _, b in blocks]), unit @ unit.T, atol=1e-6
+        )
+
+    def test_matches_brute_force_argsort(self) -> None:
+        """Verifies blocked top-k equals a full argsort on the dense matrix."""
+        query, corpus = _random(7, seed=2), _random(50, seed=3)
+        idx, scores = topk_similar(query, corpus, k=4, max_block_bytes=2 * 50 * 4)
+        dense = l2_normalize(query) @ l2_normalize(corpus).T
+        expected = np.argsort(-dense, axis=1)[:, :4]
+        np.testing.assert_array_equal(idx, expected)
+        np.testing.assert_allclose(
+            scores, np.take_along_axis(dense, expected, axis=1), atol=1e-6
+        )
+
+    def test_exclude_self_and_k_clamped(self) -> None:
+        """Verifies self-matches are dropped and k is clamped to the corpus size."""
+        x = _random(3)
+        idx, _ = topk_similar(x, x, k=10, exclude_self=True)
+        assert idx.shape == (3, 2)
+        assert all(i not in row for i, row in enumerate(idx.tolist()))
@@ -0,0 +1,104 @@
+"""Tests for the sharded memory-mapped embedding store."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from shared.embeddings.store import EmbeddingStore, import_npy_tree
+
+DIMS = 4
+
+
+def _vectors(n: int, offset: float = 0.0) -> np.ndarray:
+    return np.arange(n * DIMS, dtype=np.float32).reshape(n, DIMS) + offset
+
+
+class TestEmbeddingStore:
+    """Tests for EmbeddingStore append / get_many / compact."""
+
+    def test_get_many_returns_rows_in_input_order(self, tmp_path: Path) -> None:
+        """Verifies bulk reads align with the requested id order."""
+        store = EmbeddingStore(tmp_path / "store")
+        store.append(["a", "b", "c"], _vectors(3))
+        result = store.get_many(["c", "a"])
+        expected = _vectors(3)[[2, 0]]
+        np.testing.assert_array_equal(result, expected)
+        assert result.dtype == np.float32
+
+    def test_append_skips_existing_and_batch_duplicate_ids(self, tmp_path: Path) -> None:
+        """Verifies append is first-write-wins for repeated ids."""
+        store = EmbeddingStore(tmp_path / "store")
+        store.append(["a"], _vectors(1))
+        written = store.append(["a", "b", "b"], _vectors(3, offset=100.0))
+        assert written == 1
+        np.testing.assert_array_equal(store.get("a"), _vectors(1)[0])
+        np.testing.assert_array_equal(store.get("b"), _vectors(3, offset=100.0)[1])
+
+    def test_rows_span_shards_and_survive_reopen(self, tmp_path: Path) -> None:
+        """Verifies shard rollover and index rebuild from disk."""
+        root = tmp_path / "store"
+        store = EmbeddingStore(root, max_rows_per_shard=2)
+        ids = [f"id{i}" for i in range(5)]
+        store.append(ids, _vectors(5))
+        reopened = EmbeddingStore(root, max_rows_per_shard=2)
+        assert len(reopened) == 5
+        np.testing.assert_array_equal(reopened.get_many(ids), _vectors(5))
+
+    def test_uncommitted_tail_is_ignored(self, tmp_path: Path) -> None:
+        """Verifies bytes past the manifest row count are invisible and overwritten."""
+        root = tmp_path / "store"
+        store = EmbeddingStore(root)
+        store.append(["a"], _vectors(1))
+        shard = next(root.glob("*.f32"))
+        with shard.open("ab") as handle:
+            handle.write(b"\x00" * 7)
+        reopened = EmbeddingStore(root)
+        reopened.append(["b"], _vectors(1, offset=5.0))
+        np.testing.assert_array_equal(
+            EmbeddingStore(root).get_many(["a", "b"]),
+            np.vstack([_vectors(1), _vectors(1, offset=5.0)]),
+        )
+
+    def test_get_many_missing_raises_key_error(self, tmp_path: Path) -> None:
+        """Verifies unknown ids raise KeyError."""
+        store = EmbeddingStore(tmp_path / "store")
+        store.append(["a"], _vectors(1))
+        with pytest.raises(KeyError, match="not in store"):
+            store.get_many(["a", "zzz"])
+
+    def test_compact_merges_shards(self, tmp_path: Path) -> None:
+        """Verifies compaction merges single-row shards without losing rows."""
+        root = tmp_path / "store"
+        store = EmbeddingStore(root, max_rows_per_shard=1)
+        ids = [f"id{i}" for i in range(4)]
+        for i, eid in enumerate(ids):
+            store.append([eid], _vectors(1, offset=float(i)))
+        stats = EmbeddingStore(root, max_rows_per_shard=10).compact()
+        assert (stats.shards_before, stats.shards_after) == (4, 1)
+        assert len(list(root.glob("*.f32"))) == 1
+        reopened = EmbeddingStore(root)
+        np.testing.assert_array_equal(reopened.get("id3"), _vectors(1, offset=3.0)[0])
+
+    def test_dimension_mismatch_raises(self, tmp_path: Path) -> None:
+        """Verifies vectors of the wrong width are rejected."""
+        store = EmbeddingStore(tmp_path / "store", dimensions=DIMS)
+        with pytest.raises(ValueError, match="dimensions"):
+            store.append(["a"], np.zeros((1, DIMS + 1)))
+
+
+class TestImportNpyTree:
+    """Tests for import_npy_tree()."""
+
+    def test_imports_legacy_files_once(self, tmp_path: Path) -> None:
+        """Verifies legacy .npy vectors are imported and re-import is a no-op."""
+        emb_dir = tmp_path / "cache" / "embeddings"
+        emb_dir.mkdir(parents=True)
+        for i in range(3):
+            np.save(emb_dir / f"e{i}.npy", _vectors(1, offset=float(i))[0].astype(np.float64))
+        store = EmbeddingStore(tmp_path / "store")
+        assert import_npy_tree(store, tmp_path / "cache") == 3
+        assert import_npy_tree(store, tmp_path / "cache") == 0
+        np.testing.assert_array_equal(store.get("e2"), _vectors(1, offset=2.0)[0])
@@ -44,6 +44,8 @@ ASSIGNMENTS_KMEANS_FILENAME = "assignments_kmeans.json"
 PNG_HDBSCAN_NAME = "cluster_hdbscan.png"
 PNG_KMEANS_NAME = "cluster_kmeans.png"
 EMBEDDING_DIMENSIONS = 256
+# Optional per-feature ids; Stage 2 stores them as null where absent.
+_PROVENANCE_ID_KEYS = ("participant_id", "message_id")
 
 
 def load_stage2_embeddings(
@@ -51,39 +53,61 @@ def load_stage2_embeddings(
 ) -> tuple[np.ndarray, list[dict[str, Any]]]:
     """Load embedding matrix and aligned feature provenance records.
 
+    Reads ``features.parquet`` with a memory-mapped float32
+    ``embeddings.npy``. Falls back to ``features.jsonl`` for runs written
+    before the Parquet layout.
+
     Parameters
     ----------
     embeddings_run_dir
-        Stage-2 run directory with embeddings.npy and features.jsonl.
+        Stage-2 run directory with embeddings.npy and features.parquet (or
+        legacy features.jsonl).
 
     Returns
     -------
     tuple[np.ndarray, list[dict[str, Any]]]
         Matrix shape (n_features, 256) and provenance rows aligned by row order.
+        The matrix is a read-only memory map for Parquet-layout runs.
+
+    Raises
+    ------
+    FileNotFoundError
+        When embeddings.npy or both feature files are missing.
+    ValueError
+        When row counts, feature ids, or matrix shape disagree.
     """
     npy_path = embeddings_run_dir / "embeddings.npy"
+    parquet_path = embeddings_run_dir / "features.parquet"
     jsonl_path = embeddings_run_dir / "features.jsonl"
     ids_path = embeddings_run_dir / "feature_ids.json"
     if not npy_path.is_file():
         raise FileNotFoundError(f"Missing embeddings.npy in {embeddings_run_dir}")
-    if not jsonl_path.is_file():
-        raise FileNotFoundError(f"Missing features.jsonl in {embeddings_run_dir}")
-
-    matrix = np.load(npy_path)
-    records = [
-        json.loads(line)
-        for line in jsonl_path.read_text(encoding="utf-8").splitlines()
-        if line.strip()
-    ]
+
+    if parquet_path.is_file():
+        features_name = parquet_path.name
+        matrix = np.load(npy_path, mmap_mode="r")
+        records = _read_feature_table(parquet_path)
+    elif jsonl_path.is_file():
+        features_name = jsonl_path.name
+        matrix = np.load(npy_path)
+        records = [
+            json.loads(line)
+            for line in jsonl_path.read_text(encoding="utf-8").splitlines()
+            if line.strip()
+        ]
+    else:
+        raise FileNotFoundError(
+            f"Missing features.parquet (or legacy features.jsonl) in {embeddings_run_dir}"
+        )
     if len(records) != matrix.shape[0]:
         raise ValueError(
             f"Row mismatch: embeddings.npy has {matrix.shape[0]} rows, "
-            f"features.jsonl has {len(records)}"
+            f"{features_name} has {len(records)}"
         )
     if ids_path.is_file():
         feature_ids = json.loads(ids_path.read_text(encoding="utf-8"))
         if feature_ids != [record["feature_id"] for record in records]:
-            raise ValueError("feature_ids.json does not match features.jsonl order")
+            raise ValueError(f"feature_ids.json does not match {features_name} order")
     if matrix.ndim != 2 or matrix.shape[1] != EMBEDDING_DIMENSIONS:
         raise ValueError(
             f"Expected matrix shape (n, {EMBEDDING_DIMENSIONS}), got {matrix.shape}"
@@ -91,6 +115,18 @@ def load_stage2_embeddings(
     return matrix, records
 
 
+def _read_feature_table(path: Path) -> list[dict[str, Any]]:
+    """Read Stage-2 feature records, dropping provenance ids that were never set."""
+    import pyarrow.parquet as pq
+
+    records = pq.read_table(path).to_pylist()
+    for record in records:
+        for key in _PROVENANCE_ID_KEYS:
+            if record.get(key, "") is None:
+                del record[key]
+    return records
+
+
 def resolve_hdbscan_params(
     n_features: int,
     requested_min_cluster_size: int,
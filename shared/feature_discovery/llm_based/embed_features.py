@@ -3,6 +3,20 @@
 Path-parameterized helpers with no experiment imports. Callers supply
 ``output_root`` and label/group identifiers.
 
+Many ``text_embedded`` strings repeat across batches. Each distinct text is
+embedded once through :func:`~shared.embeddings.bedrock.create_embeddings_batch`,
+which runs requests concurrently and retries throttles. The vector is then
+copied to every record with that text. Finished vectors are appended, in
+chunks, to ``embeddings_checkpoint.jsonl`` under ``output_root``, so a rerun
+after a crash only embeds the texts that were never finished.
+
+Each Stage-2 run directory holds ``embeddings.npy`` (float32, one row per
+feature), ``features.parquet`` (the feature records without their vectors),
+``feature_ids.json``, and ``metadata.json``. Runs written before the switch
+to Parquet have ``features.jsonl`` with the vectors inline and a float64
+``embeddings.npy``. :func:`~shared.feature_discovery.llm_based.cluster.load_stage2_embeddings`
+reads both layouts.
+
 Run from repo root::
 
     PYTHONPATH=. uv run python -c "
@@ -15,21 +29,31 @@ Run from repo root::
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 from typing import Any
 
 import numpy as np
 from tqdm import tqdm
 
+from lib.aws.embedding_identity import embedding_identity_sha256
 from shared.embeddings.bedrock import (
     BEDROCK_MODEL_ID,
+    DEFAULT_MAX_CONCURRENCY,
     EMBEDDING_DIMENSIONS,
-    create_embedding,
+    create_embeddings_batch,
 )
 
 _METADATA_FILENAME = "metadata.json"
 FEATURE_ID_SCHEME = "batch_id_index_in_batch"
 _PROVENANCE_ID_KEYS = ("participant_id", "message_id")
+CHECKPOINT_FILENAME = "embeddings_checkpoint.jsonl"
+EMBEDDINGS_FILENAME = "embeddings.npy"
+FEATURES_FILENAME = "features.parquet"
+FEATURE_IDS_FILENAME = "feature_ids.json"
+STAGE2_FORMAT_VERSION = 2
+# Unique texts embedded between checkpoint appends.
+DEFAULT_CHECKPOINT_EVERY = 256
 
 
 def load_stage1_feature_rows(features_run_dir: Path) -> list[dict[str, Any]]:
@@ -152,9 +176,14 @@ def extract_features_for_embedding(
     return records
 
 
-def _embed_one_record(record: dict[str, Any]) -> dict[str, Any]:
-    """Call Titan and attach embedding fields to one feature record."""
-    out = create_embedding(record["text_embedded"])
+def _embedding_id(text: str) -> str:
+    return embedding_identity_sha256(
+        text, model_id=BEDROCK_MODEL_ID, dimensions=EMBEDDING_DIMENSIONS, normalize=True
+    )
+
+
+def _validate_embedding(out: dict[str, Any]) -> None:
+    """Raise if a Titan result does not match the Stage-2 embedding identity."""
     if out["model_id"] != BEDROCK_MODEL_ID:
         raise ValueError(f"Unexpected model_id: {out['model_id']}")
     if out["dimensions"] != EMBEDDING_DIMENSIONS:
@@ -163,33 +192,113 @@ def _embed_one_record(record: dict[str, Any]) -> dict[str, Any]:
         raise ValueError("Expected normalize=True from create_embedding")
     if len(out["embedding"]) != EMBEDDING_DIMENSIONS:
         raise ValueError(f"Expected embedding length {EMBEDDING_DIMENSIONS}")
-    return {
-        **record,
-        "embedding": out["embedding"],
-        "input_text_token_count": out.get("input_text_token_count"),
-        "model_id": out["model_id"],
-        "dimensions": out["dimensions"],
-        "normalize": out["normalize"],
-    }
 
 
-def embed_feature_records(records: list[dict[str, Any]]) -> list[dict[str, Any]]:
+def load_embedding_checkpoint(path: Path) -> dict[str, dict[str, Any]]:
+    """Read finished embeddings from a Stage-2 checkpoint file.
+
+    Parameters
+    ----------
+    path
+        JSONL checkpoint written by :func:`embed_feature_records`.
+
+    Returns
+    -------
+    dict[str, dict[str, Any]]
+        Titan results keyed by embedding identity. Empty when the file is
+        missing. A torn last line from an interrupted append is ignored.
+    """
+    if not path.is_file():
+        return {}
+    done: dict[str, dict[str, Any]] = {}
+    with path.open(encoding="utf-8") as handle:
+        for line in handle:
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            done[row.pop("embedding_id")] = row
+    return done
+
+
+def _append_checkpoint(path: Path, results: dict[str, dict[str, Any]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as handle:
+        for embedding_id, out in results.items():
+            handle.write(json.dumps({"embedding_id": embedding_id, **out}) + "\n")
+        handle.flush()
+        os.fsync(handle.fileno())
+
+
+def embed_feature_records(
+    records: list[dict[str, Any]],
+    *,
+    checkpoint_path: Path | None = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
+) -> list[dict[str, Any]]:
     """Embed each feature record via Bedrock Titan with defaults.
 
+    Each distinct ``text_embedded`` is embedded once, concurrently and with
+    throttle-aware retries, then copied to every record with that text.
+
     Parameters
     ----------
     records
         Flattened feature records with ``text_embedded``.
+    checkpoint_path
+        Optional JSONL checkpoint. Texts already in it are not re-embedded.
+        New vectors are appended every ``checkpoint_every`` unique texts.
+    max_concurrency
+        Upper bound on in-flight Titan requests.
+    checkpoint_every
+        Unique texts per :func:`create_embeddings_batch` call and checkpoint
+        append.
 
     Returns
     -------
     list[dict[str, Any]]
-        Records with embedding vectors attached.
+        Records with embedding vectors attached, in input order.
+
+    Raises
+    ------
+    ValueError
+        When a Titan result has the wrong model, dimensions, or normalization.
+    RuntimeError
+        When a text still fails after retries.
     """
-    embedded: list[dict[str, Any]] = []
-    for record in tqdm(records, desc="Stage 2 embeddings"):
-        embedded.append(_embed_one_record(record))
-    return embedded
+    ids = [_embedding_id(record["text_embedded"]) for record in records]
+    texts = dict(zip(ids, (record["text_embedded"] for record in records), strict=True))
+    done = load_embedding_checkpoint(checkpoint_path) if checkpoint_path else {}
+    todo = [embedding_id for embedding_id in texts if embedding_id not in done]
+
+    with tqdm(total=len(texts), initial=len(texts) - len(todo), desc="Stage 2 embeddings") as bar:
+        for start in range(0, len(todo), checkpoint_every):
+            chunk = todo[start : start + checkpoint_every]
+            outputs = create_embeddings_batch(
+                [texts[embedding_id] for embedding_id in chunk],
+                max_concurrency=max_concurrency,
+                show_progress=False,
+            )
+            results: dict[str, dict[str, Any]] = {}
+            for embedding_id, out in zip(chunk, outputs, strict=True):
+                _validate_embedding(out)
+                results[embedding_id] = {
+                    "embedding": out["embedding"],
+                    "input_text_token_count": out.get("input_text_token_count"),
+                    "model_id": out["model_id"],
+                    "dimensions": out["dimensions"],
+                    "normalize": out["normalize"],
+                }
+            if checkpoint_path is not None:
+                _append_checkpoint(checkpoint_path, results)
+            done.update(results)
+            bar.update(len(chunk))
+
+    return [
+        {**record, **done[embedding_id], "embedding": list(done[embedding_id]["embedding"])}
+        for record, embedding_id in zip(records, ids, strict=True)
+    ]
 
 
 def write_embedding_artifacts(
@@ -199,7 +308,7 @@ def write_embedding_artifacts(
     embedded_records: list[dict[str, Any]],
     run_timestamp: str,
 ) -> Path:
-    """Write Stage-2 metadata, JSONL, npy, and feature_ids sidecar.
+    """Write Stage-2 metadata, float32 npy, Parquet features, and feature_ids sidecar.
 
     Parameters
     ----------
@@ -210,7 +319,8 @@ def write_embedding_artifacts(
     source_features_run_dir
         Stage-1 run directory used as input.
     embedded_records
-        Features with embeddings.
+        Features with embeddings. Vectors go to ``embeddings.npy`` only; the
+        remaining fields go to ``features.parquet`` in the same row order.
     run_timestamp
         Output folder name.
 
@@ -219,23 +329,32 @@ def write_embedding_artifacts(
     Path
         Stage-2 run directory.
     """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
     out_dir = output_root / run_timestamp
     out_dir.mkdir(parents=True, exist_ok=True)
 
     matrix = np.asarray(
         [record["embedding"] for record in embedded_records],
-        dtype=np.float64,
+        dtype=np.float32,
     )
     feature_ids = [record["feature_id"] for record in embedded_records]
-    np.save(out_dir / "embeddings.npy", matrix)
-    (out_dir / "feature_ids.json").write_text(
+    np.save(out_dir / EMBEDDINGS_FILENAME, matrix)
+    (out_dir / FEATURE_IDS_FILENAME).write_text(
         json.dumps(feature_ids, indent=2),
         encoding="utf-8",
     )
 
-    with (out_dir / "features.jsonl").open("w", encoding="utf-8") as handle:
-        for record in embedded_records:
-            handle.write(json.dumps(record) + "\n")
+    # Union of keys in first-seen order: provenance ids are only set on some
+    # records, and absent ones are stored as null.
+    columns = dict.fromkeys(
+        key for record in embedded_records for key in record if key != "embedding"
+    )
+    table = pa.table(
+        {key: [record.get(key) for record in embedded_records] for key in columns}
+    )
+    pq.write_table(table, out_dir / FEATURES_FILENAME)
 
     metadata = {
         "label_class": label_class,
@@ -245,7 +364,9 @@ def write_embedding_artifacts(
         "normalize": True,
         "n_features": len(embedded_records),
         "feature_id_scheme": FEATURE_ID_SCHEME,
-        "primary_format": "features.jsonl + embeddings.npy + feature_ids.json",
+        "format_version": STAGE2_FORMAT_VERSION,
+        "embedding_dtype": "float32",
+        "primary_format": "features.parquet + embeddings.npy + feature_ids.json",
     }
     (out_dir / _METADATA_FILENAME).write_text(
         json.dumps(metadata, indent=2),
@@ -262,6 +383,9 @@ def run_embed_features(
 ) -> Path:
     """Load Stage-1 features, embed, and write Stage-2 artifacts.
 
+    Vectors are checkpointed to ``output_root / CHECKPOINT_FILENAME`` as they
+    finish, so rerunning after a failure resumes instead of starting over.
+
     Parameters
     ----------
     output_root
@@ -280,7 +404,7 @@ def run_embed_features(
     """
     stage1_rows = load_stage1_feature_rows(features_run_dir)
     records = extract_features_for_embedding(stage1_rows)
-    embedded = embed_feature_records(records)
+    embedded = embed_feature_records(records, checkpoint_path=output_root / CHECKPOINT_FILENAME)
     return write_embedding_artifacts(
         output_root=output_root,
         label_class=label_class,
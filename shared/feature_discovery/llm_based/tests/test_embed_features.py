@@ -0,0 +1,133 @@
+"""Tests for Stage-2 feature embedding (Bedrock calls faked)."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+
+from shared.embeddings import bedrock
+from shared.embeddings.tests.fakes import FakeCreateEmbedding
+from shared.feature_discovery.llm_based.cluster import load_stage2_embeddings
+from shared.feature_discovery.llm_based.embed_features import (
+    embed_feature_records,
+    extract_features_for_embedding,
+    load_embedding_checkpoint,
+    write_embedding_artifacts,
+)
+
+
+def _stage1_rows(n_batches: int) -> list[dict[str, Any]]:
+    feature = {"feature_name": "tone", "feature_value": "hostile", "rationale": "insults"}
+    return [
+        {
+            "batch_id": f"b{i}",
+            "result": {
+                "features": [
+                    feature,
+                    {**feature, "feature_value": f"value {i}", "participant_id": f"p{i}"},
+                ]
+            },
+        }
+        for i in range(n_batches)
+    ]
+
+
+@pytest.fixture
+def fake(monkeypatch: pytest.MonkeyPatch) -> FakeCreateEmbedding:
+    fake = FakeCreateEmbedding()
+    monkeypatch.setattr(bedrock, "create_embedding", fake)
+    return fake
+
+
+class TestEmbedFeatureRecords:
+    """Tests for embed_feature_records()."""
+
+    def test_embeds_unique_texts_once(self, fake: FakeCreateEmbedding) -> None:
+        """Verifies repeated texts share one request and every record gets its vector."""
+        records = extract_features_for_embedding(_stage1_rows(4))
+        embedded = embed_feature_records(records, max_concurrency=3)
+        assert len(fake.calls) == len(set(fake.calls)) == 5
+        assert [r["feature_id"] for r in embedded] == [r["feature_id"] for r in records]
+        for record in embedded:
+            assert record["embedding"] == [float(len(record["text_embedded"]))] * 256
+            assert record["input_text_token_count"] == 3
+        assert embedded[0]["embedding"] is not embedded[2]["embedding"]
+
+    def test_resumes_from_checkpoint(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verifies a crash keeps finished chunks and the rerun embeds only the rest."""
+        records = extract_features_for_embedding(_stage1_rows(4))
+        checkpoint = tmp_path / "embeddings_checkpoint.jsonl"
+        error = RuntimeError("Response missing top-level 'embedding'")
+        failing = FakeCreateEmbedding(fail_once={records[-1]["text_embedded"]: error})
+        monkeypatch.setattr(bedrock, "create_embedding", failing)
+        with pytest.raises(RuntimeError, match="missing"):
+            embed_feature_records(records, checkpoint_path=checkpoint, checkpoint_every=2)
+        assert len(load_embedding_checkpoint(checkpoint)) == 4
+
+        resumed = FakeCreateEmbedding()
+        monkeypatch.setattr(bedrock, "create_embedding", resumed)
+        embedded = embed_feature_records(records, checkpoint_path=checkpoint, checkpoint_every=2)
+        assert resumed.calls == [records[-1]["text_embedded"]]
+        assert embedded == embed_feature_records(records)
+
+    def test_torn_checkpoint_line_is_ignored(
+        self, tmp_path: Path, fake: FakeCreateEmbedding
+    ) -> None:
+        """Verifies a partial trailing line from an interrupted append is skipped."""
+        records = extract_features_for_embedding(_stage1_rows(1))
+        checkpoint = tmp_path / "embeddings_checkpoint.jsonl"
+        embed_feature_records(records, checkpoint_path=checkpoint)
+        with checkpoint.open("a", encoding="utf-8") as handle:
+            handle.write('{"embedding_id": "abc", "embed')
+        assert len(load_embedding_checkpoint(checkpoint)) == 2
+
+
+class TestStage2Artifacts:
+    """Tests for write_embedding_artifacts() and load_stage2_embeddings()."""
+
+    def _write(self, tmp_path: Path, fake: FakeCreateEmbedding) -> tuple[Path, list[dict]]:
+        records = embed_feature_records(extract_features_for_embedding(_stage1_rows(3)))
+        run_dir = write_embedding_artifacts(
+            output_root=tmp_path,
+            label_class="keep",
+            source_features_run_dir=tmp_path / "stage1",
+            embedded_records=records,
+            run_timestamp="2026-01-01T00-00-00",
+        )
+        return run_dir, records
+
+    def test_round_trip(self, tmp_path: Path, fake: FakeCreateEmbedding) -> None:
+        """Verifies a float32 memory-mapped matrix and vector-free records come back."""
+        run_dir, records = self._write(tmp_path, fake)
+        assert not (run_dir / "features.jsonl").exists()
+        matrix, loaded = load_stage2_embeddings(run_dir)
+        assert isinstance(matrix, np.memmap) and matrix.dtype == np.float32
+        np.testing.assert_array_equal(matrix, np.asarray([r["embedding"] for r in records]))
+        expected = [{k: v for k, v in r.items() if k != "embedding"} for r in records]
+        assert loaded == expected
+        assert "participant_id" not in loaded[0] and loaded[1]["participant_id"] == "p0"
+
+    def test_reads_legacy_jsonl_runs(self, tmp_path: Path, fake: FakeCreateEmbedding) -> None:
+        """Verifies runs with features.jsonl and a float64 matrix still load."""
+        run_dir, records = self._write(tmp_path, fake)
+        (run_dir / "features.parquet").unlink()
+        np.save(run_dir / "embeddings.npy", np.asarray([r["embedding"] for r in records]))
+        with (run_dir / "features.jsonl").open("w", encoding="utf-8") as handle:
+            for record in records:
+                handle.write(json.dumps(record) + "\n")
+        matrix, loaded = load_stage2_embeddings(run_dir)
+        assert matrix.dtype == np.float64
+        assert loaded == records
+
+    def test_row_mismatch(self, tmp_path: Path, fake: FakeCreateEmbedding) -> None:
+        """Verifies a matrix that does not match the feature table is rejected."""
+        run_dir, _ = self._write(tmp_path, fake)
+        np.save(run_dir / "embeddings.npy", np.zeros((1, 256), dtype=np.float32))
+        with pytest.raises(ValueError, match="features.parquet has 6"):
+            load_stage2_embeddings(run_dir)
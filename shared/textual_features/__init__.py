@@ -1,5 +1,9 @@
 """Shared textual feature extractors and registry.
 
+Public names resolve lazily (PEP 562): ``from shared.textual_features import
+CharCountMetric`` imports only that metric's module, and the LLM classifiers
+(LangChain / OpenAI) load only when one of their names is first accessed.
+
 To run:
 
 PYTHONPATH=. uv run python -c "from shared.textual_features import get_feature, CHAR_COUNT"
@@ -7,58 +11,118 @@ PYTHONPATH=. uv run python -c "from shared.textual_features import get_feature,
 
 from __future__ import annotations
 
-from shared.textual_features.avg_sentence_length import AvgSentenceLengthMetric
-from shared.textual_features.base import CalculateMetric
-from shared.textual_features.char_count import CharCountMetric
-from shared.textual_features.flesch_kincaid_grade import FleschKincaidGradeMetric
-from shared.textual_features.intergroup import (
-    IntergroupClassification,
-    classify_post as classify_intergroup_post,
-    classify_texts as classify_intergroup_texts,
-)
-from shared.textual_features.prime import (
-    PrimeClassification,
-    classify_post as classify_prime_post,
-    classify_texts as classify_prime_texts,
-)
-from shared.textual_features.punctuation_count import PunctuationCountMetric
-from shared.textual_features.punctuation_density import PunctuationDensityMetric
-from shared.textual_features.reading_ease import FleschReadingEaseMetric
-from shared.textual_features.registry import (
-    AVG_SENTENCE_LENGTH,
-    CHAR_COUNT,
-    FLESCH_KINCAID_GRADE,
-    INTERGROUP,
-    PRIME,
-    PUNCTUATION_COUNT,
-    PUNCTUATION_DENSITY,
-    READING_EASE,
-    SENTENCE_COUNT,
-    VALENCE,
-    WORD_COUNT,
-    FEATURES,
-    FeatureEntry,
-    FeatureKind,
-    get_feature,
-)
-from shared.textual_features.sentence_count import SentenceCountMetric
-from shared.textual_features.valence import (
-    ValenceClassification,
-    classify_post as classify_valence_post,
-    classify_texts as classify_valence_texts,
-)
-from shared.textual_features.word_count import WordCountMetric
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from shared.textual_features.avg_sentence_length import AvgSentenceLengthMetric
+    from shared.textual_features.base import CalculateMetric
+    from shared.textual_features.char_count import CharCountMetric
+    from shared.textual_features.combined import (
+        CombinedClassification,
+        classify_post as classify_combined_post,
+        classify_texts as classify_combined_texts,
+    )
+    from shared.textual_features.engine import compute_metrics
+    from shared.textual_features.feature_store import FeatureStore, features_for
+    from shared.textual_features.flesch_kincaid_grade import FleschKincaidGradeMetric
+    from shared.textual_features.intergroup import (
+        IntergroupClassification,
+        classify_post as classify_intergroup_post,
+        classify_texts as classify_intergroup_texts,
+    )
+    from shared.textual_features.prime import (
+        PrimeClassification,
+        classify_post as classify_prime_post,
+        classify_texts as classify_prime_texts,
+    )
+    from shared.textual_features.punctuation_count import PunctuationCountMetric
+    from shared.textual_features.punctuation_density import PunctuationDensityMetric
+    from shared.textual_features.reading_ease import FleschReadingEaseMetric
+    from shared.textual_features.registry import (
+        AVG_SENTENCE_LENGTH,
+        CHAR_COUNT,
+        CLASSIFIER_MODULES,
+        FLESCH_KINCAID_GRADE,
+        INTERGROUP,
+        PRIME,
+        PUNCTUATION_COUNT,
+        PUNCTUATION_DENSITY,
+        READING_EASE,
+        SENTENCE_COUNT,
+        VALENCE,
+        WORD_COUNT,
+        FEATURES,
+        FeatureEntry,
+        FeatureKind,
+        classify_features,
+        get_feature,
+    )
+    from shared.textual_features.sentence_count import SentenceCountMetric
+    from shared.textual_features.valence import (
+        ValenceClassification,
+        classify_post as classify_valence_post,
+        classify_texts as classify_valence_texts,
+    )
+    from shared.textual_features.word_count import WordCountMetric
+
+_LAZY_ATTRS: dict[str, tuple[str, str]] = {
+    "AvgSentenceLengthMetric": ("avg_sentence_length", "AvgSentenceLengthMetric"),
+    "CalculateMetric": ("base", "CalculateMetric"),
+    "CharCountMetric": ("char_count", "CharCountMetric"),
+    "CombinedClassification": ("combined", "CombinedClassification"),
+    "classify_combined_post": ("combined", "classify_post"),
+    "classify_combined_texts": ("combined", "classify_texts"),
+    "compute_metrics": ("engine", "compute_metrics"),
+    "FeatureStore": ("feature_store", "FeatureStore"),
+    "features_for": ("feature_store", "features_for"),
+    "FleschKincaidGradeMetric": ("flesch_kincaid_grade", "FleschKincaidGradeMetric"),
+    "IntergroupClassification": ("intergroup", "IntergroupClassification"),
+    "classify_intergroup_post": ("intergroup", "classify_post"),
+    "classify_intergroup_texts": ("intergroup", "classify_texts"),
+    "PrimeClassification": ("prime", "PrimeClassification"),
+    "classify_prime_post": ("prime", "classify_post"),
+    "classify_prime_texts": ("prime", "classify_texts"),
+    "PunctuationCountMetric": ("punctuation_count", "PunctuationCountMetric"),
+    "PunctuationDensityMetric": ("punctuation_density", "PunctuationDensityMetric"),
+    "FleschReadingEaseMetric": ("reading_ease", "FleschReadingEaseMetric"),
+    "AVG_SENTENCE_LENGTH": ("registry", "AVG_SENTENCE_LENGTH"),
+    "CHAR_COUNT": ("registry", "CHAR_COUNT"),
+    "CLASSIFIER_MODULES": ("registry", "CLASSIFIER_MODULES"),
+    "FLESCH_KINCAID_GRADE": ("registry", "FLESCH_KINCAID_GRADE"),
+    "INTERGROUP": ("registry", "INTERGROUP"),
+    "PRIME": ("registry", "PRIME"),
+    "PUNCTUATION_COUNT": ("registry", "PUNCTUATION_COUNT"),
+    "PUNCTUATION_DENSITY": ("registry", "PUNCTUATION_DENSITY"),
+    "READING_EASE": ("registry", "READING_EASE"),
+    "SENTENCE_COUNT": ("registry", "SENTENCE_COUNT"),
+    "VALENCE": ("registry", "VALENCE"),
+    "WORD_COUNT": ("registry", "WORD_COUNT"),
+    "FEATURES": ("registry", "FEATURES"),
+    "FeatureEntry": ("registry", "FeatureEntry"),
+    "FeatureKind": ("registry", "FeatureKind"),
+    "classify_features": ("registry", "classify_features"),
+    "get_feature": ("registry", "get_feature"),
+    "SentenceCountMetric": ("sentence_count", "SentenceCountMetric"),
+    "ValenceClassification": ("valence", "ValenceClassification"),
+    "classify_valence_post": ("valence", "classify_post"),
+    "classify_valence_texts": ("valence", "classify_texts"),
+    "WordCountMetric": ("word_count", "WordCountMetric"),
+}
 
 __all__ = [
     "AVG_SENTENCE_LENGTH",
     "AvgSentenceLengthMetric",
     "CHAR_COUNT",
+    "CLASSIFIER_MODULES",
     "CalculateMetric",
     "CharCountMetric",
+    "CombinedClassification",
     "FEATURES",
     "FLESCH_KINCAID_GRADE",
     "FeatureEntry",
     "FeatureKind",
+    "FeatureStore",
     "FleschKincaidGradeMetric",
     "FleschReadingEaseMetric",
     "INTERGROUP",
@@ -76,11 +140,30 @@ __all__ = [
     "ValenceClassification",
     "WORD_COUNT",
     "WordCountMetric",
+    "classify_combined_post",
+    "classify_combined_texts",
+    "classify_features",
     "classify_intergroup_post",
     "classify_intergroup_texts",
     "classify_prime_post",
     "classify_prime_texts",
     "classify_valence_post",
     "classify_valence_texts",
+    "compute_metrics",
+    "features_for",
     "get_feature",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(f"{__name__}.{module}"), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
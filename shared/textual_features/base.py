@@ -8,10 +8,22 @@ PYTHONPATH=. uv run python -c "from shared.textual_features.base import Calculat
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+    from shared.textual_features.vectorized import TextColumn
 
 
 class CalculateMetric(ABC):
-    """Single-text scalar metric: stable ``name``, prose ``describe()``, and ``calculate()``."""
+    """Single-text scalar metric: stable ``name``, prose ``describe()``, and ``calculate()``.
+
+    ``calculate_array`` / ``calculate_series`` score a whole column. They loop
+    over ``calculate`` by default; metrics with a columnar implementation
+    override ``calculate_array`` and must return the same values.
+    """
 
     @property
     @abstractmethod
@@ -25,3 +37,31 @@ class CalculateMetric(ABC):
     @abstractmethod
     def calculate(self, text: str) -> float:
         """Return the metric value for one normalized post string."""
+
+    def calculate_array(self, texts: TextColumn) -> np.ndarray:
+        """Return ``calculate(text)`` for every text as a float64 array.
+
+        Parameters
+        ----------
+        texts
+            Strings as a list, pandas Series, or Arrow array (no nulls).
+
+        Returns
+        -------
+        numpy.ndarray
+            One value per text, in input order.
+        """
+        import numpy as np
+
+        from shared.textual_features.vectorized import as_string_array
+
+        values = as_string_array(texts).to_pylist()
+        return np.fromiter((self.calculate(text) for text in values), np.float64, len(values))
+
+    def calculate_series(self, texts: pd.Series) -> pd.Series:
+        """Return ``calculate_array`` as a float64 Series named ``self.name`` on ``texts.index``."""
+        import pandas as pd
+
+        return pd.Series(
+            self.calculate_array(texts), index=texts.index, name=self.name, dtype="float64"
+        )
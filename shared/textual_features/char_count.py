@@ -7,8 +7,15 @@ PYTHONPATH=. uv run python -c "from shared.textual_features.char_count import Ch
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from shared.textual_features.base import CalculateMetric
 
+if TYPE_CHECKING:
+    import numpy as np
+
+    from shared.textual_features.vectorized import TextColumn
+
 
 class CharCountMetric(CalculateMetric):
     """Post length in characters."""
@@ -37,3 +44,9 @@ class CharCountMetric(CalculateMetric):
             ``float(len(text))``.
         """
         return float(len(text))
+
+    def calculate_array(self, texts: TextColumn) -> np.ndarray:
+        """Return character counts for ``texts`` via Arrow ``utf8_length``."""
+        from shared.textual_features.vectorized import char_counts
+
+        return char_counts(texts)
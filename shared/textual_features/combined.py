@@ -0,0 +1,219 @@
+"""One-call multi-label classifier for VALENCE, INTERGROUP, and PRIME.
+
+The joint prompt restates the three single-feature task definitions and their
+few-shot examples, and the structured output returns all three labels, so a
+post costs one request instead of three. ``agreement_report`` compares the
+combined labels against the single-feature classifiers before relying on
+them; see ``scripts/classifier_agreement_report.py``.
+
+To run:
+
+PYTHONPATH=. uv run python -c "from shared.textual_features.combined import classify_post; print(classify_post('They always cheat, and it is disgusting.'))"
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from langchain_core.prompts import ChatPromptTemplate
+from pydantic import BaseModel
+
+from lib.constants import DEFAULT_LLM_MODEL
+from shared.textual_features.intergroup import INTERGROUP_EXAMPLES
+from shared.textual_features.llm_batch import (
+    DEFAULT_MAX_ATTEMPTS,
+    DEFAULT_MAX_CONCURRENCY,
+    classify_texts_with,
+)
+from shared.textual_features.result_cache import ClassifierResultCache, prompt_fingerprint
+from shared.textual_features.prime import PRIME_EXAMPLES
+from shared.textual_features.valence import get_llm
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from langchain_core.runnables import Runnable
+
+COMBINED_PROMPT = (
+    "\nYou are a helpful assistant. Your job is to analyze a single social media post "
+    "and answer three independent binary classification questions about it. Judge each "
+    "question on its own; the answer to one must not influence the others.\n"
+    "\n# 1. is_positive (valence)\n"
+    "\nDetermine whether the overall valence of the post is positive.\n"
+    "- If the post expresses a favorable attitude, optimism, praise, or generally good "
+    "feelings, answer true.\n"
+    "- If the post expresses criticism, disapproval, pessimism, anger, or generally bad "
+    "feelings, answer false.\n"
+    "- Consider the overall tone, affect, and language of the post.\n"
+    "- If there is a mix of positive and negative language, use the dominant sentiment.\n"
+    "- Ignore sarcasm unless it is obvious.\n"
+    '- Do NOT answer "neutral". Every post is either true (positive) or false (not '
+    "positive).\n"
+    "\n## Examples\n"
+    '\nPost: "I really enjoyed reading this, it made my day better!"\nAnswer: true\n'
+    "\nPost: \"This is awful. I can't believe people think this way.\"\nAnswer: false\n"
+    '\nPost: "Beautifully written and very inspiring."\nAnswer: true\n'
+    '\nPost: "This post is misleading and frustrating to read."\nAnswer: false\n'
+    "\n# 2. is_intergroup\n"
+    "\nDecide whether the post involves intergroup discussion. In social psychology, "
+    "intergroup refers to interactions or situations that involve two or more groups "
+    "that define themselves—or are defined by others—as distinct based on "
+    "characteristics such as identity, beliefs, status, affiliation, or other "
+    "boundaries.\n"
+    "- If the post describes, reports, or implies intergroup discussion, answer true "
+    "(1 in the examples).\n"
+    "- If the post is unrelated, speaks only about individuals, is ambiguous, or "
+    "describes within-group matters, answer false (0 in the examples).\n"
+    f"{INTERGROUP_EXAMPLES}"
+    "\n# 3. is_prime\n"
+    "\nClassify whether the post contains PRIME content, which includes one or more "
+    "of:\n"
+    "- Prestigious cues (status/success/authority signals)\n"
+    "- In-group cues (us-vs-them identity, group affiliation, group boundaries)\n"
+    "- Moral cues (right/wrong, virtue/vice, norm violations, condemnation/praise)\n"
+    "- Emotional cues (strong affective language, especially high-arousal emotion)\n"
+    "\nAnswer true (1 in the examples) if the post contains clear PRIME content (any "
+    "one of the categories is sufficient) and false (0 in the examples) if none are "
+    "clearly present. Use conservative judgment:\n"
+    "- If ambiguous or weak, answer false.\n"
+    "- Factual/neutral reporting without clear PRIME cues is false.\n"
+    "- Only use the text provided; do not infer hidden context.\n"
+    f"{PRIME_EXAMPLES}"
+    "\nNow, given the following post, reply strictly in this JSON format:\n"
+    '\n{{\n  "is_positive": <true|false>,\n  "is_intergroup": <true|false>,\n'
+    '  "is_prime": <true|false>\n}}\n'
+    '\nPost:\n"""{post}"""\n'
+)
+
+
+class CombinedClassification(BaseModel):
+    """Structured valence, intergroup, and PRIME labels for one post."""
+
+    is_positive: bool
+    is_intergroup: bool
+    is_prime: bool
+
+
+FEATURE_NAME = "COMBINED"
+PROMPT_HASH = prompt_fingerprint(COMBINED_PROMPT, CombinedClassification)
+
+
+_COMBINED_PROMPT = ChatPromptTemplate.from_messages([("human", COMBINED_PROMPT)])
+
+
+@lru_cache(maxsize=8)
+def get_chain(model: str = DEFAULT_LLM_MODEL) -> Runnable:
+    """Return the joint prompt | structured-output chain for ``model``, built once.
+
+    Parameters
+    ----------
+    model
+        OpenAI model id.
+
+    Returns
+    -------
+    Runnable
+        Chain mapping ``{"post": post}`` to ``CombinedClassification``.
+    """
+    return _COMBINED_PROMPT | get_llm(model).with_structured_output(CombinedClassification)
+
+
+def classify_post(post: str) -> CombinedClassification:
+    """Classify one post on all three labels with a single request.
+
+    Parameters
+    ----------
+    post
+        Social media post text.
+
+    Returns
+    -------
+    CombinedClassification
+        Structured ``is_positive``, ``is_intergroup``, and ``is_prime`` labels.
+    """
+    return get_chain().invoke({"post": post})
+
+
+def classify_texts(
+    posts: list[str],
+    *,
+    model: str = DEFAULT_LLM_MODEL,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    cache: ClassifierResultCache | bool = True,
+) -> list[CombinedClassification]:
+    """Label each post on all three features, one request per uncached post."""
+    return classify_texts_with(
+        get_chain,
+        posts,
+        input_key="post",
+        feature=FEATURE_NAME,
+        prompt_hash=PROMPT_HASH,
+        schema=CombinedClassification,
+        model=model,
+        max_concurrency=max_concurrency,
+        max_attempts=max_attempts,
+        cache=cache,
+        desc="Combined classification",
+    )
+
+
+def agreement_report(
+    combined: Mapping[str, Sequence[bool]],
+    separate: Mapping[str, Sequence[bool]],
+) -> pd.DataFrame:
+    """Per-label agreement between combined and single-feature classifications.
+
+    Parameters
+    ----------
+    combined
+        Label column (e.g. ``"is_prime"``) -> combined-mode labels.
+    separate
+        Same keys -> single-feature labels for the same posts, in the same order.
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per label with ``n``, ``agreement`` (share of equal labels),
+        ``cohen_kappa``, the positive rate under each mode, and the
+        ``combined_only`` / ``separate_only`` disagreement counts.
+
+    Raises
+    ------
+    ValueError
+        If the two mappings have different keys or a label's lengths differ.
+    """
+    import pandas as pd
+
+    if set(combined) != set(separate):
+        raise ValueError(f"label mismatch: {sorted(combined)} vs {sorted(separate)}")
+    rows = []
+    for label in combined:
+        a = [bool(x) for x in combined[label]]
+        b = [bool(x) for x in separate[label]]
+        if len(a) != len(b):
+            raise ValueError(f"{label}: {len(a)} combined vs {len(b)} separate labels")
+        n = len(a)
+        both_true = sum(x and y for x, y in zip(a, b, strict=True))
+        combined_only = sum(x and not y for x, y in zip(a, b, strict=True))
+        separate_only = sum(y and not x for x, y in zip(a, b, strict=True))
+        observed = (n - combined_only - separate_only) / n if n else float("nan")
+        p_a = sum(a) / n if n else float("nan")
+        p_b = sum(b) / n if n else float("nan")
+        expected = p_a * p_b + (1 - p_a) * (1 - p_b)
+        kappa = (observed - expected) / (1 - expected) if expected < 1 else float("nan")
+        rows.append(
+            {
+                "label": label,
+                "n": n,
+                "agreement": observed,
+                "cohen_kappa": kappa,
+                "combined_positive_rate": p_a,
+                "separate_positive_rate": p_b,
+                "both_true": both_true,
+                "combined_only": combined_only,
+                "separate_only": separate_only,
+            }
+        )
+    return pd.DataFrame(rows)
@@ -0,0 +1,235 @@
+"""Shared-parse batch engine for the deterministic textual metrics.
+
+``compute_metrics`` derives every requested registry metric from one set of
+per-text counts: regex word/sentence/punctuation counts, and (only when a
+readability metric is requested) one spaCy parse per text streamed through
+``nlp().pipe`` (or replayed without spaCy via ``backend="regex"``). Results
+are columnar and match each metric's ``calculate()`` exactly.
+
+To run:
+
+PYTHONPATH=. uv run python -c "from shared.textual_features.engine import compute_metrics; print(compute_metrics(['Hello world.'], ['READING_EASE', 'WORD_COUNT']))"
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from shared.textual_features.flesch_kincaid_grade import (
+    FLESCH_KINCAID_INTERCEPT,
+    FLESCH_KINCAID_SYLLABLES_PER_WORD_WEIGHT,
+    FLESCH_KINCAID_WORDS_PER_SENTENCE_WEIGHT,
+)
+from shared.textual_features.reading_ease import (
+    FLESCH_READING_EASE_INTERCEPT,
+    FLESCH_READING_EASE_SYLLABLES_PER_WORD_WEIGHT,
+    FLESCH_READING_EASE_WORDS_PER_SENTENCE_WEIGHT,
+)
+from shared.textual_features.registry import (
+    AVG_SENTENCE_LENGTH,
+    CHAR_COUNT,
+    FEATURES,
+    FLESCH_KINCAID_GRADE,
+    PUNCTUATION_COUNT,
+    PUNCTUATION_DENSITY,
+    READING_EASE,
+    SENTENCE_COUNT,
+    WORD_COUNT,
+    FeatureKind,
+    get_feature,
+)
+from shared.textual_features.text_utils import (
+    SENTENCE_SPLIT_RE,
+    ReadabilityBackend,
+    nlp,
+    readability_counts_from_doc,
+)
+from shared.textual_features.vectorized import (
+    as_string_array,
+    char_counts,
+    punctuation_counts,
+    safe_divide,
+    word_counts,
+)
+
+DEFAULT_BATCH_SIZE = 256
+READABILITY_NAMES = frozenset({FLESCH_KINCAID_GRADE, READING_EASE})
+
+
+@dataclass(frozen=True)
+class SharedCounts:
+    """Per-text counts shared by all deterministic metrics (one entry per text).
+
+    ``readability_*`` arrays come from the spaCy parse and are ``None`` when
+    no readability metric was requested.
+    """
+
+    char_count: np.ndarray
+    word_count: np.ndarray
+    sentence_count: np.ndarray
+    punctuation_count: np.ndarray
+    readability_words: np.ndarray | None = None
+    readability_sentences: np.ndarray | None = None
+    readability_syllables: np.ndarray | None = None
+
+
+def _flesch_kincaid_grade(c: SharedCounts) -> np.ndarray:
+    words = c.readability_words
+    grade = (
+        FLESCH_KINCAID_WORDS_PER_SENTENCE_WEIGHT * safe_divide(words, c.readability_sentences)
+        + FLESCH_KINCAID_SYLLABLES_PER_WORD_WEIGHT
+        * safe_divide(c.readability_syllables, words)
+        - FLESCH_KINCAID_INTERCEPT
+    )
+    return np.where(words == 0, 0.0, grade)
+
+
+def _flesch_reading_ease(c: SharedCounts) -> np.ndarray:
+    words = c.readability_words
+    ease = (
+        FLESCH_READING_EASE_INTERCEPT
+        - FLESCH_READING_EASE_WORDS_PER_SENTENCE_WEIGHT
+        * safe_divide(words, c.readability_sentences)
+        - FLESCH_READING_EASE_SYLLABLES_PER_WORD_WEIGHT
+        * safe_divide(c.readability_syllables, words)
+    )
+    return np.where(words == 0, 0.0, ease)
+
+
+_COLUMNS: dict[str, Callable[[SharedCounts], np.ndarray]] = {
+    CHAR_COUNT: lambda c: c.char_count,
+    WORD_COUNT: lambda c: c.word_count,
+    SENTENCE_COUNT: lambda c: c.sentence_count,
+    AVG_SENTENCE_LENGTH: lambda c: safe_divide(c.word_count, c.sentence_count),
+    PUNCTUATION_COUNT: lambda c: c.punctuation_count,
+    PUNCTUATION_DENSITY: lambda c: safe_divide(c.punctuation_count, c.char_count),
+    FLESCH_KINCAID_GRADE: _flesch_kincaid_grade,
+    READING_EASE: _flesch_reading_ease,
+}
+
+
+def metric_names() -> list[str]:
+    """Registry names of every metric (non-classifier) feature, in catalog order."""
+    return [name for name, entry in FEATURES.items() if entry.kind is FeatureKind.METRIC]
+
+
+def _regex_counts(texts: Sequence[str]) -> dict[str, np.ndarray]:
+    def sentences(text: str) -> int:
+        return sum(1 for part in SENTENCE_SPLIT_RE.split(text) if part.strip())
+
+    arr = as_string_array(texts)
+    return {
+        "char_count": char_counts(arr),
+        "word_count": word_counts(arr),
+        "sentence_count": np.fromiter((sentences(t) for t in texts), np.float64, len(texts)),
+        "punctuation_count": punctuation_counts(arr),
+    }
+
+
+def _readability_counts(
+    texts: Sequence[str], *, backend: ReadabilityBackend, batch_size: int, n_process: int
+) -> dict[str, np.ndarray]:
+    counts = np.zeros((len(texts), 3), dtype=np.float64)
+    if backend == "regex":
+        from shared.textual_features.fast_readability import readability_counts
+
+        for i, text in enumerate(texts):
+            counts[i] = readability_counts(text)
+    elif backend == "spacy":
+        docs = nlp().pipe(texts, batch_size=batch_size, n_process=n_process)
+        for i, doc in enumerate(docs):
+            counts[i] = readability_counts_from_doc(doc)
+    else:
+        raise ValueError(f"Unknown readability backend {backend!r}; expected 'spacy' or 'regex'")
+    return {
+        "readability_words": counts[:, 0],
+        "readability_sentences": counts[:, 1],
+        "readability_syllables": counts[:, 2],
+    }
+
+
+def shared_counts(
+    texts: Sequence[str],
+    *,
+    readability: bool = True,
+    backend: ReadabilityBackend = "spacy",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    n_process: int = 1,
+) -> SharedCounts:
+    """Compute the shared per-text counts once for ``texts``.
+
+    Parameters
+    ----------
+    readability
+        Also compute the readability counts.
+    backend
+        ``"spacy"`` parses with ``nlp()``; ``"regex"`` uses
+        ``fast_readability`` (same counts, no spaCy import).
+    batch_size, n_process
+        Forwarded to ``nlp().pipe`` for the spaCy backend; ``n_process > 1``
+        parses on worker processes.
+    """
+    texts = list(texts)
+    counts = _regex_counts(texts)
+    if readability:
+        counts.update(
+            _readability_counts(
+                texts, backend=backend, batch_size=batch_size, n_process=n_process
+            )
+        )
+    return SharedCounts(**counts)
+
+
+def compute_metrics(
+    texts: Sequence[str],
+    names: Sequence[str] | None = None,
+    *,
+    backend: ReadabilityBackend = "spacy",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    n_process: int = 1,
+) -> dict[str, np.ndarray]:
+    """Compute several deterministic metrics for many texts with one parse each.
+
+    Parameters
+    ----------
+    texts
+        Input post strings.
+    names
+        Registry names (e.g. ``READING_EASE``); defaults to every metric.
+    backend
+        Readability backend, ``"spacy"`` or ``"regex"`` (see
+        :func:`shared_counts`).
+    batch_size, n_process
+        Forwarded to ``nlp().pipe`` when a readability metric is requested
+        with the spaCy backend.
+
+    Returns
+    -------
+    dict[str, numpy.ndarray]
+        ``metric_name -> float64 column`` in ``names`` order, aligned with
+        ``texts`` (ready for ``pd.DataFrame(result)``).
+
+    Raises
+    ------
+    KeyError
+        If a name is not in the registry.
+    ValueError
+        If a name refers to an LLM classifier rather than a metric, or the
+        backend is unknown.
+    """
+    requested = list(dict.fromkeys(names if names is not None else metric_names()))
+    entries = [get_feature(name) for name in requested]
+    not_metrics = [e.name for e in entries if e.kind is not FeatureKind.METRIC]
+    if not_metrics:
+        raise ValueError(f"compute_metrics handles metrics only; got classifiers {not_metrics}")
+    counts = shared_counts(
+        texts,
+        readability=bool(READABILITY_NAMES.intersection(requested)),
+        backend=backend,
+        batch_size=batch_size,
+        n_process=n_process,
+    )
+    return {str(e.metric_name): _COLUMNS[e.name](counts) for e in entries}
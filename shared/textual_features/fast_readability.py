@@ -0,0 +1,414 @@
+"""spaCy-free readability counts that reproduce ``text_utils.nlp()`` boundaries.
+
+The blank English pipeline used by the readability metrics is a tokenizer plus
+the rule-based sentencizer, both of which are deterministic. This module
+replays the same algorithm in plain Python over a rules snapshot
+(``spacy_en_rules.json``: affix regexes, URL pattern, special cases, and
+sentencizer punctuation) exported from spaCy by
+``scripts/export_spacy_tokenizer_rules.py``. Each space-delimited piece is
+reduced once to ``(alpha_words, syllables, token_kinds)`` and memoized in a
+bounded LRU, so repeated vocabulary costs a cache lookup instead of a parse.
+
+To run:
+
+PYTHONPATH=. uv run python -c "from shared.textual_features.fast_readability import readability_counts; print(readability_counts('Hello world.'))"
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import unicodedata
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from operator import itemgetter
+from pathlib import Path
+from typing import Any
+
+from shared.textual_features.text_utils import count_syllables
+
+RULES_PATH = Path(__file__).with_name("spacy_en_rules.json")
+CHUNK_CACHE_SIZE = 1 << 18
+
+# Token kinds as seen by the sentencizer: sentence-final punctuation, other
+# punctuation, whitespace-only tokens, and everything else.
+_TERMINAL = "T"
+_PUNCT = "P"
+_SPACE = "S"
+_OTHER = "W"
+# A sentence ends after a terminal and any punctuation that follows it; the
+# next non-punctuation token starts the next sentence.
+_SENTENCE_END_RE = re.compile(r"T[TP]*(?=[WS])")
+# Within a ' '-split piece: runs of non-whitespace and of other whitespace.
+_CHUNK_RE = re.compile(r"\S+|\s+")
+# An ASCII word with at most one trailing mark that the suffix rules always
+# split off ('.' only after a lowercase letter: "B." stays one token).
+_PLAIN_CHUNK_RE = re.compile(r"([A-Za-z]+)([,;:!?\"')]|(?<=[a-z])\.)?")
+# (alpha_words, syllables, token_kinds, first_token, last_token); the edge
+# tokens come from the first pass and are "" next to whitespace.
+_Profile = tuple[int, int, str, str, str]
+_SPACE_PROFILE: _Profile = (0, 0, _SPACE, "", "")
+
+
+@dataclass(frozen=True)
+class TokenizerRules:
+    """Compiled rules snapshot for the blank English tokenizer and sentencizer.
+
+    ``merges`` maps the affix-only tokenization of a special case back to the
+    special case, mirroring the tokenizer's second (``_apply_special_cases``)
+    pass; ``merge_pairs`` holds every pair of adjacent tokens in those keys.
+    """
+
+    spacy_version: str
+    prefix_search: Callable[[str], re.Match[str] | None]
+    suffix_search: Callable[[str], re.Match[str] | None]
+    infix_finditer: Callable[[str], Any]
+    url_match: Callable[[str], re.Match[str] | None]
+    specials: dict[str, tuple[str, ...]]
+    punct_chars: frozenset[str]
+    merges: dict[tuple[str, ...], str] = field(default_factory=dict)
+    merge_pairs: frozenset[tuple[str, str]] = frozenset()
+
+
+@dataclass(frozen=True)
+class Disagreement:
+    """One text whose regex-backend counts differ from the spaCy backend."""
+
+    index: int
+    text: str
+    spacy_counts: tuple[int, int, int]
+    regex_counts: tuple[int, int, int]
+
+
+@lru_cache(maxsize=1)
+def rules() -> TokenizerRules:
+    """Load and compile the rules snapshot (once per process)."""
+    raw = json.loads(RULES_PATH.read_text(encoding="utf-8"))
+
+    def compile_(key: str) -> re.Pattern[str]:
+        return re.compile(raw[key]["pattern"], raw[key]["flags"])
+
+    loaded = TokenizerRules(
+        spacy_version=raw["spacy_version"],
+        prefix_search=compile_("prefix").search,
+        suffix_search=compile_("suffix").search,
+        infix_finditer=compile_("infix").finditer,
+        url_match=compile_("url").match,
+        specials={text: tuple(orths) for text, orths in raw["specials"].items()},
+        punct_chars=frozenset(raw["punct_chars"]),
+    )
+    merges = {}
+    for text in loaded.specials:
+        pieces = tuple(_tokenize(text, loaded, {}))
+        if len(pieces) > 1:
+            merges[pieces] = text
+    merge_pairs = frozenset(pair for pieces in merges for pair in zip(pieces, pieces[1:]))
+    return replace(loaded, merges=merges, merge_pairs=merge_pairs)
+
+
+def export_rules() -> dict[str, Any]:
+    """Build the rules snapshot from the installed spaCy (requires spaCy).
+
+    Returns
+    -------
+    dict[str, Any]
+        JSON-serializable snapshot in the ``spacy_en_rules.json`` layout.
+    """
+    import spacy
+    from spacy.symbols import ORTH
+
+    from shared.textual_features.text_utils import nlp
+
+    tokenizer = nlp().tokenizer
+
+    def pattern(fn: Callable[..., Any]) -> dict[str, Any]:
+        compiled = fn.__self__
+        return {"pattern": compiled.pattern, "flags": int(compiled.flags)}
+
+    return {
+        "spacy_version": spacy.__version__,
+        "prefix": pattern(tokenizer.prefix_search),
+        "suffix": pattern(tokenizer.suffix_search),
+        "infix": pattern(tokenizer.infix_finditer),
+        "url": pattern(tokenizer.url_match),
+        "specials": {
+            text: [attrs[ORTH] for attrs in substrings]
+            for text, substrings in sorted(tokenizer.rules.items())
+        },
+        "punct_chars": sorted(nlp().get_pipe("sentencizer").punct_chars),
+    }
+
+
+def _is_punct(token: str) -> bool:
+    """spaCy ``Token.is_punct``: every character is Unicode punctuation (P*)."""
+    return all(unicodedata.category(char).startswith("P") for char in token)
+
+
+def _split_affixes(
+    chunk: str, r: TokenizerRules, specials: Mapping[str, tuple[str, ...]]
+) -> tuple[list[str], str, list[str]]:
+    """Mirror of ``Tokenizer._split_affixes`` (English has no ``token_match``)."""
+    prefixes: list[str] = []
+    suffixes: list[str] = []
+    last_size = 0
+    while chunk and len(chunk) != last_size:
+        if chunk in specials:
+            break
+        last_size = len(chunk)
+        match = r.prefix_search(chunk)
+        pre_len = match.end() - match.start() if match else 0
+        if pre_len and chunk[pre_len:] in specials:
+            prefixes.append(chunk[:pre_len])
+            chunk = chunk[pre_len:]
+            break
+        match = r.suffix_search(chunk[pre_len:])
+        suf_len = match.end() - match.start() if match else 0
+        if suf_len and chunk[:-suf_len] in specials:
+            suffixes.append(chunk[-suf_len:])
+            chunk = chunk[:-suf_len]
+            break
+        if pre_len and suf_len and pre_len + suf_len <= len(chunk):
+            prefixes.append(chunk[:pre_len])
+            suffixes.append(chunk[-suf_len:])
+            chunk = chunk[pre_len:-suf_len]
+        elif pre_len:
+            prefixes.append(chunk[:pre_len])
+            chunk = chunk[pre_len:]
+        elif suf_len:
+            suffixes.append(chunk[-suf_len:])
+            chunk = chunk[:-suf_len]
+    return prefixes, chunk, suffixes
+
+
+def _split_infixes(
+    middle: str, r: TokenizerRules, specials: Mapping[str, tuple[str, ...]]
+) -> list[str]:
+    """Mirror of the infix branch of ``Tokenizer._attach_tokens``."""
+    if middle in specials:
+        return list(specials[middle])
+    if r.url_match(middle):
+        return [middle]
+    pieces: list[str] = []
+    start = 0
+    for match in r.infix_finditer(middle):
+        infix_start, infix_end = match.start(), match.end()
+        if infix_start == 0:
+            continue
+        if infix_start != start:
+            pieces.append(middle[start:infix_start])
+        if infix_start != infix_end:
+            pieces.append(middle[infix_start:infix_end])
+        start = infix_end
+    if middle[start:]:
+        pieces.append(middle[start:])
+    return pieces
+
+
+def _tokenize(
+    chunk: str, r: TokenizerRules, specials: Mapping[str, tuple[str, ...]]
+) -> list[str]:
+    """First tokenizer pass over one chunk: specials, affixes, then infixes."""
+    if chunk in specials:
+        return list(specials[chunk])
+    prefixes, middle, suffixes = _split_affixes(chunk, r, specials)
+    pieces = _split_infixes(middle, r, specials) if middle else []
+    return [*prefixes, *pieces, *reversed(suffixes)]
+
+
+def _apply_merges(
+    tokens: list[str], r: TokenizerRules, chunk_ids: Sequence[int] | None = None
+) -> list[str]:
+    """Mirror of ``Tokenizer._apply_special_cases``.
+
+    Longest matches win, then leftmost; matched spans are replaced by the
+    special case's pieces. With ``chunk_ids`` (one per token), a span across
+    chunks still claims its tokens but is left as is: its text contains a
+    space, so it never equals the special case.
+    """
+    spans = [
+        (start, end)
+        for start in range(len(tokens))
+        for end in range(start + 2, len(tokens) + 1)
+        if tuple(tokens[start:end]) in r.merges
+    ]
+    if not spans:
+        return tokens
+    chosen: dict[int, int] = {}
+    seen: set[int] = set()
+    for start, end in sorted(spans, key=lambda span: (span[0] - span[1], span[0])):
+        if start not in seen and end - 1 not in seen:
+            chosen[start] = end
+        seen.update(range(start, end))
+    merged: list[str] = []
+    i = 0
+    while i < len(tokens):
+        end = chosen.get(i)
+        if end is None:
+            merged.append(tokens[i])
+            i += 1
+        elif chunk_ids is not None and chunk_ids[i] != chunk_ids[end - 1]:
+            merged.extend(tokens[i:end])
+            i = end
+        else:
+            merged.extend(r.specials[r.merges[tuple(tokens[i:end])]])
+            i = end
+    return merged
+
+
+def tokenize_chunk(chunk: str) -> list[str]:
+    """Split one whitespace-free chunk into spaCy's token texts.
+
+    Parameters
+    ----------
+    chunk
+        Non-empty run of non-whitespace characters.
+
+    Returns
+    -------
+    list[str]
+        Token texts, concatenating back to ``chunk``.
+    """
+    r = rules()
+    tokens = _tokenize(chunk, r, r.specials)
+    return _apply_merges(tokens, r) if len(tokens) > 1 else tokens
+
+
+def _token_kind(token: str, punct_chars: frozenset[str]) -> str:
+    if token in punct_chars:
+        return _TERMINAL
+    if _is_punct(token):
+        return _PUNCT
+    return _OTHER
+
+
+def _token_profile(tokens: list[str], r: TokenizerRules) -> tuple[int, int, str]:
+    words = syllables = 0
+    kinds = []
+    for token in tokens:
+        if token.isspace():
+            kinds.append(_SPACE)
+            continue
+        if token.isalpha():
+            words += 1
+            syllables += count_syllables(token)
+        kinds.append(_token_kind(token, r.punct_chars))
+    return words, syllables, "".join(kinds)
+
+
+def _chunk_profile(chunk: str) -> _Profile:
+    """``_Profile`` for one whitespace-free chunk."""
+    r = rules()
+    plain = _PLAIN_CHUNK_RE.fullmatch(chunk)
+    if plain and chunk not in r.specials and plain[1] not in r.specials:
+        word, mark = plain.groups()
+        if mark is None:
+            return 1, count_syllables(word), _OTHER, word, word
+        if (word, mark) not in r.merges:
+            kinds = _OTHER + _token_kind(mark, r.punct_chars)
+            return 1, count_syllables(word), kinds, word, mark
+    first = _tokenize(chunk, r, r.specials)
+    tokens = _apply_merges(first, r) if len(first) > 1 else first
+    return (*_token_profile(tokens, r), first[0], first[-1])
+
+
+@lru_cache(maxsize=CHUNK_CACHE_SIZE)
+def _piece_profile(piece: str) -> _Profile:
+    """``_chunk_profile`` for one ``' '``-split piece (memoized).
+
+    An empty piece (from consecutive spaces) and any other whitespace run is a
+    space token; repeated space tokens segment sentences exactly like one.
+    """
+    parts = _CHUNK_RE.findall(piece)
+    if len(parts) == 1 and not parts[0].isspace():
+        return _chunk_profile(piece)
+    if not parts:
+        return _SPACE_PROFILE
+    profiles = [_SPACE_PROFILE if part.isspace() else _chunk_profile(part) for part in parts]
+    return (
+        sum(map(itemgetter(0), profiles)),
+        sum(map(itemgetter(1), profiles)),
+        "".join(map(itemgetter(2), profiles)),
+        profiles[0][3],
+        profiles[-1][4],
+    )
+
+
+def _text_profile(pieces: list[str], r: TokenizerRules) -> _Profile:
+    """``_Profile`` of a whole text, matching special cases across pieces."""
+    tokens: list[str] = []
+    chunk_ids: list[int] = []
+    parts = (part for piece in pieces for part in _CHUNK_RE.findall(piece) or [" "])
+    for chunk_id, part in enumerate(parts):
+        chunk = [part] if part.isspace() else _tokenize(part, r, r.specials)
+        tokens += chunk
+        chunk_ids += [chunk_id] * len(chunk)
+    return (*_token_profile(_apply_merges(tokens, r, chunk_ids), r), "", "")
+
+
+def readability_counts(text: str) -> tuple[int, int, int]:
+    """Regex-backend equivalent of :func:`text_utils.readability_counts`.
+
+    Parameters
+    ----------
+    text
+        Input post string.
+
+    Returns
+    -------
+    tuple[int, int, int]
+        ``(word_count, sentence_count, syllable_count)``; sentence count is at
+        least 1.
+    """
+    if not text:
+        return 0, 1, 0
+    # spaCy absorbs each single ' ' separator; every other whitespace run
+    # becomes a space token, which the empty or whitespace pieces stand for.
+    r = rules()
+    pieces = text.split(" ")
+    profiles = list(map(_piece_profile, pieces))
+    # Special cases are matched over the whole token sequence, so a pattern
+    # can span a ' ' (the emoticon "._." matches ". _ .") and outrank an
+    # overlapping in-piece merge; replay the text as one sequence when a
+    # piece boundary joins two adjacent pattern tokens.
+    boundaries = zip(map(itemgetter(4), profiles), map(itemgetter(3), profiles[1:]))
+    if not r.merge_pairs.isdisjoint(boundaries):
+        profiles = [_text_profile(pieces, r)]
+    # Only a trailing whitespace-only sentence can be empty, so drop trailing
+    # space tokens and count sentence ends before what remains.
+    kinds = "".join(map(itemgetter(2), profiles)).rstrip(_SPACE)
+    sentence_count = len(_SENTENCE_END_RE.findall(kinds)) + 1 if kinds else 1
+    return (
+        sum(map(itemgetter(0), profiles)),
+        sentence_count,
+        sum(map(itemgetter(1), profiles)),
+    )
+
+
+def find_disagreements(texts: Iterable[str], *, batch_size: int = 256) -> list[Disagreement]:
+    """Compare both readability backends on ``texts`` (requires spaCy).
+
+    Parameters
+    ----------
+    texts
+        Input post strings.
+    batch_size
+        Forwarded to ``nlp().pipe``.
+
+    Returns
+    -------
+    list[Disagreement]
+        Every text whose ``(words, sentences, syllables)`` differ, in input
+        order; empty when the backends agree.
+    """
+    from shared.textual_features.text_utils import nlp, readability_counts_from_doc
+
+    texts = list(texts)
+    docs = nlp().pipe(texts, batch_size=batch_size)
+    disagreements = []
+    for i, (text, doc) in enumerate(zip(texts, docs, strict=True)):
+        expected = readability_counts_from_doc(doc)
+        actual = readability_counts(text)
+        if actual != expected:
+            disagreements.append(Disagreement(i, text, expected, actual))
+    return disagreements
@@ -0,0 +1,302 @@
+"""Incremental, Parquet-backed store of textual feature values per unique text.
+
+Analyses score DataFrames in which the same post text appears once per
+participant trial. :func:`features_for` computes each registry feature once
+per distinct text, keyed by a hash of the exact text, and joins the values
+back onto every row. Values persist under ``.cache/textual_features/
+feature_store/<FEATURE>/part-*.parquet``, so later runs only compute texts
+the store has not seen.
+
+- Metrics go through :func:`shared.textual_features.engine.compute_metrics`
+  (one shared parse per new text).
+- LLM classifiers go through
+  :func:`shared.textual_features.registry.classify_features` (batched, and
+  backed by the classifier result cache).
+
+Each row also records a ``version``: ``METRIC_VERSION`` for metrics, and
+``<prompt hash>:<model>`` for classifiers, so a prompt or model change
+recomputes instead of serving old labels.
+
+To run:
+
+PYTHONPATH=. uv run python -c "import pandas as pd; from shared.textual_features.feature_store import features_for; print(features_for(pd.DataFrame({'text': ['Hi there.', 'Hi there.']}), 'text', ['WORD_COUNT']))"
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import time
+import uuid
+from collections.abc import Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from lib.constants import DEFAULT_LLM_MODEL, REPO_ROOT
+from shared.textual_features.registry import FeatureEntry, FeatureKind, get_feature
+from shared.textual_features.text_utils import ReadabilityBackend
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+DEFAULT_STORE_DIR = REPO_ROOT / ".cache" / "textual_features" / "feature_store"
+# Bump when a metric definition changes so stored values are recomputed.
+METRIC_VERSION = "metrics-v1"
+
+
+def text_key(text: str) -> str:
+    """128-bit BLAKE2b hex of the exact text (metrics depend on every character)."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _column_name(entry: FeatureEntry) -> str:
+    return str(entry.metric_name if entry.kind is FeatureKind.METRIC else entry.label_field)
+
+
+class FeatureStore:
+    """Append-only Parquet table of ``(text_hash, version, value)`` per feature.
+
+    Parameters
+    ----------
+    root
+        Directory holding one sub-directory of Parquet parts per feature.
+    """
+
+    def __init__(self, root: str | Path = DEFAULT_STORE_DIR) -> None:
+        self._root = Path(root)
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    def load(self, feature: str, version: str) -> pd.Series:
+        """Stored values of ``feature`` under ``version``, indexed by text hash."""
+        import pandas as pd
+
+        table = self._read(feature)
+        if table is None:
+            return pd.Series(dtype=object)
+        frame = table.to_pandas()
+        frame = frame[frame["version"] == version].drop_duplicates("text_hash", keep="last")
+        return pd.Series(frame["value"].to_numpy(), index=frame["text_hash"].to_numpy())
+
+    def append(
+        self, feature: str, version: str, text_hashes: Sequence[str], values: Sequence[Any]
+    ) -> None:
+        """Write one new Parquet part for ``feature`` (no-op when empty)."""
+        import pyarrow as pa
+
+        if len(text_hashes) != len(values):
+            raise ValueError(f"{len(text_hashes)} hashes vs {len(values)} values")
+        if not len(text_hashes):
+            return
+        table = pa.table(
+            {
+                "text_hash": pa.array(text_hashes, type=pa.string()),
+                "version": pa.array([version] * len(text_hashes), type=pa.string()),
+                "value": pa.array(values),
+            }
+        )
+        self._write_part(feature, table)
+
+    def compact(self, feature: str) -> int:
+        """Merge ``feature``'s parts into one, keeping the latest row per key.
+
+        Returns
+        -------
+        int
+            Rows in the compacted part.
+        """
+        import pyarrow as pa
+
+        parts = self._parts(feature)
+        table = self._read(feature)
+        if table is None:
+            return 0
+        frame = table.to_pandas().drop_duplicates(["text_hash", "version"], keep="last")
+        self._write_part(feature, pa.Table.from_pandas(frame, preserve_index=False))
+        for part in parts:
+            part.unlink()
+        return len(frame)
+
+    def features_for(
+        self,
+        df: pd.DataFrame,
+        text_column: str,
+        names: Sequence[str],
+        *,
+        backend: ReadabilityBackend = "spacy",
+        combined: bool = True,
+        model: str = DEFAULT_LLM_MODEL,
+        **classifier_kwargs: Any,
+    ) -> pd.DataFrame:
+        """Feature columns for ``df[text_column]``, computing only unseen texts.
+
+        Parameters
+        ----------
+        df
+            Any frame with a text column; missing text is scored as ``""``.
+        text_column
+            Column holding the post text.
+        names
+            Registry keys: metrics and/or classifiers.
+        backend
+            Readability backend for new metric values (see ``compute_metrics``).
+        combined, model, **classifier_kwargs
+            Forwarded to ``registry.classify_features`` for new classifier
+            labels (``max_concurrency``, ``max_attempts``, ``cache``).
+
+        Returns
+        -------
+        pandas.DataFrame
+            One column per feature (``metric_name`` for metrics, ``label_field``
+            for classifiers) on ``df.index``; ``pd.concat([df, result], axis=1)``
+            joins them on.
+
+        Raises
+        ------
+        KeyError
+            If a name is not in the registry.
+        """
+        import pandas as pd
+
+        entries = [get_feature(name) for name in dict.fromkeys(names)]
+        texts = df[text_column].fillna("").astype(str)
+        row_keys = [text_key(text) for text in texts]
+        unique = dict(zip(row_keys, texts, strict=True))
+        row_index = pd.Index(row_keys)
+
+        metrics = [e for e in entries if e.kind is FeatureKind.METRIC]
+        classifiers = [e for e in entries if e.kind is FeatureKind.CLASSIFIER]
+        values: dict[str, pd.Series] = {}
+        if metrics:
+            values.update(self._materialize_metrics(metrics, unique, backend=backend))
+        if classifiers:
+            values.update(
+                self._materialize_classifiers(
+                    classifiers, unique, combined=combined, model=model, **classifier_kwargs
+                )
+            )
+
+        columns = {}
+        for e in entries:
+            stored = values[e.name]
+            column = stored.to_numpy()[stored.index.get_indexer(row_index)]
+            columns[_column_name(e)] = column
+        return pd.DataFrame(columns, index=df.index)
+
+    def _materialize_metrics(
+        self,
+        entries: list[FeatureEntry],
+        unique: dict[str, str],
+        *,
+        backend: ReadabilityBackend,
+    ) -> dict[str, pd.Series]:
+        from shared.textual_features.engine import compute_metrics
+
+        stored = {e.name: self.load(e.name, METRIC_VERSION) for e in entries}
+        missing = {
+            e.name: [k for k in unique if k not in stored[e.name].index] for e in entries
+        }
+        keys = list(dict.fromkeys(k for ks in missing.values() for k in ks))
+        if keys:
+            todo = [e for e in entries if missing[e.name]]
+            computed = compute_metrics(
+                [unique[k] for k in keys], [e.name for e in todo], backend=backend
+            )
+            position = {k: i for i, k in enumerate(keys)}
+            for e in todo:
+                column = computed[str(e.metric_name)]
+                new = [float(column[position[k]]) for k in missing[e.name]]
+                self.append(e.name, METRIC_VERSION, missing[e.name], new)
+                stored[e.name] = _extend(stored[e.name], missing[e.name], new)
+        return stored
+
+    def _materialize_classifiers(
+        self,
+        entries: list[FeatureEntry],
+        unique: dict[str, str],
+        *,
+        combined: bool,
+        model: str,
+        **classifier_kwargs: Any,
+    ) -> dict[str, pd.Series]:
+        from importlib import import_module
+
+        from shared.textual_features.registry import CLASSIFIER_MODULES, classify_features
+
+        def version(e: FeatureEntry) -> str:
+            module = "combined" if combined else CLASSIFIER_MODULES[e.name]
+            prompt_hash = import_module(f"shared.textual_features.{module}").PROMPT_HASH
+            return f"{prompt_hash}:{model}"
+
+        versions = {e.name: version(e) for e in entries}
+        stored = {e.name: self.load(e.name, versions[e.name]) for e in entries}
+        missing = {
+            e.name: [k for k in unique if k not in stored[e.name].index] for e in entries
+        }
+        keys = list(dict.fromkeys(k for ks in missing.values() for k in ks))
+        if keys:
+            todo = [e.name for e in entries if missing[e.name]]
+            labels = classify_features(
+                todo,
+                [unique[k] for k in keys],
+                combined=combined,
+                model=model,
+                **classifier_kwargs,
+            )
+            position = {k: i for i, k in enumerate(keys)}
+            for name in todo:
+                new = [bool(labels[name][position[k]]) for k in missing[name]]
+                self.append(name, versions[name], missing[name], new)
+                stored[name] = _extend(stored[name], missing[name], new)
+        return stored
+
+    def _feature_dir(self, feature: str) -> Path:
+        return self._root / feature
+
+    def _parts(self, feature: str) -> list[Path]:
+        directory = self._feature_dir(feature)
+        return sorted(directory.glob("part-*.parquet")) if directory.is_dir() else []
+
+    def _read(self, feature: str) -> pa.Table | None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        parts = self._parts(feature)
+        if not parts:
+            return None
+        return pa.concat_tables(
+            [pq.read_table(part) for part in parts], promote_options="permissive"
+        )
+
+    def _write_part(self, feature: str, table: pa.Table) -> None:
+        import pyarrow.parquet as pq
+
+        directory = self._feature_dir(feature)
+        directory.mkdir(parents=True, exist_ok=True)
+        # Names sort by write time so later parts win in ``load``.
+        name = f"part-{time.time_ns():020d}-{uuid.uuid4().hex[:8]}.parquet"
+        tmp = directory / f".{name}.tmp"
+        pq.write_table(table, tmp)
+        os.replace(tmp, directory / name)
+
+
+def _extend(stored: pd.Series, keys: list[str], values: list[Any]) -> pd.Series:
+    import pandas as pd
+
+    new = pd.Series(values, index=keys)
+    return new if stored.empty else pd.concat([stored, new])
+
+
+def features_for(
+    df: pd.DataFrame,
+    text_column: str,
+    names: Sequence[str],
+    *,
+    store: FeatureStore | None = None,
+    **kwargs: Any,
+) -> pd.DataFrame:
+    """:meth:`FeatureStore.features_for` on ``store`` (default: ``DEFAULT_STORE_DIR``)."""
+    return (store or FeatureStore()).features_for(df, text_column, names, **kwargs)
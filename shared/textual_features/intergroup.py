@@ -7,13 +7,25 @@ PYTHONPATH=. uv run python -c "from shared.textual_features.intergroup import In
 
 from __future__ import annotations
 
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_openai import ChatOpenAI
 from pydantic import BaseModel
-from tqdm import tqdm
 
 from lib.constants import DEFAULT_LLM_MODEL
 from lib.load_env_vars import EnvVarsContainer
+from shared.textual_features.llm_batch import (
+    DEFAULT_MAX_ATTEMPTS,
+    DEFAULT_MAX_CONCURRENCY,
+    classify_texts_with,
+)
+from shared.textual_features.registry import INTERGROUP
+from shared.textual_features.result_cache import ClassifierResultCache, prompt_fingerprint
+
+if TYPE_CHECKING:
+    from langchain_core.runnables import Runnable
+    from langchain_openai import ChatOpenAI
 
 INTERGROUP_EXAMPLES = '\n## Examples\n\nPost: "Customers are upset because the management changed the return policy."\nAnswer: 1\n\nPost: "She was frustrated after missing her bus."\nAnswer: 0\n\nPost: "People in City A say City B always cheats during football tournaments."\nAnswer: 1\n\nPost: "Members of my hiking club disagreed on where to set up camp."\nAnswer: 0\n\nPost: "Why do older employees ignore what the younger staff suggest?"\nAnswer: 1\n\nPost: "A new bakery opened across from the old one."\nAnswer: 0\n\nPost: "Several men argued loudly outside the bar."\nAnswer: 0\n'
 
@@ -28,13 +40,21 @@ class IntergroupClassification(BaseModel):
     is_intergroup: bool
 
 
+FEATURE_NAME = INTERGROUP
+PROMPT_HASH = prompt_fingerprint(INTERGROUP_PROMPT, IntergroupClassification)
+
+
 _INTERGROUP_PROMPT = ChatPromptTemplate.from_messages(
     [("human", INTERGROUP_PROMPT)]
 )
 
 
+@lru_cache(maxsize=8)
 def get_llm(model: str = DEFAULT_LLM_MODEL) -> ChatOpenAI:
-    """Build a ChatOpenAI client using ``OPENAI_API_KEY``.
+    """Build a ChatOpenAI client using ``OPENAI_API_KEY``, once per model.
+
+    ``langchain_openai`` is imported on first call; later calls reuse the
+    cached client.
 
     Parameters
     ----------
@@ -46,40 +66,64 @@ def get_llm(model: str = DEFAULT_LLM_MODEL) -> ChatOpenAI:
     ChatOpenAI
         Configured LangChain chat model.
     """
+    from langchain_openai import ChatOpenAI
+
     api_key = EnvVarsContainer.get_env_var("OPENAI_API_KEY", required=True)
     return ChatOpenAI(model=model, api_key=api_key)
 
 
-def classify_post(post: str) -> IntergroupClassification:
-    """Classify one post via OpenAI structured output (LangChain).
+@lru_cache(maxsize=8)
+def get_chain(model: str = DEFAULT_LLM_MODEL) -> Runnable:
+    """Return the prompt | structured-output chain for ``model``, built once.
 
     Parameters
     ----------
-    post
-        Social media post text.
+    model
+        OpenAI model id.
 
     Returns
     -------
-    IntergroupClassification
-        Structured ``is_intergroup`` label.
+    Runnable
+        Chain mapping ``{"prompt_input": post}`` to ``IntergroupClassification``.
     """
-    llm = get_llm()
-    structured = llm.with_structured_output(IntergroupClassification)
-    chain = _INTERGROUP_PROMPT | structured
-    return chain.invoke({"prompt_input": post})
+    return _INTERGROUP_PROMPT | get_llm(model).with_structured_output(IntergroupClassification)
 
 
-def classify_texts(posts: list[str]) -> list[IntergroupClassification]:
-    """Classify each post with ``classify_post``.
+def classify_post(post: str) -> IntergroupClassification:
+    """Classify one post via OpenAI structured output (LangChain).
 
     Parameters
     ----------
-    posts
-        Post texts.
+    post
+        Social media post text.
 
     Returns
     -------
-    list[IntergroupClassification]
-        One label per input post.
+    IntergroupClassification
+        Structured ``is_intergroup`` label.
     """
-    return [classify_post(p) for p in tqdm(posts, desc="Intergroup classification")]
+    return get_chain().invoke({"prompt_input": post})
+
+
+def classify_texts(
+    posts: list[str],
+    *,
+    model: str = DEFAULT_LLM_MODEL,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    cache: ClassifierResultCache | bool = True,
+) -> list[IntergroupClassification]:
+    """``is_intergroup`` for each post; see :func:`.llm_batch.classify_texts_with`."""
+    return classify_texts_with(
+        get_chain,
+        posts,
+        input_key="prompt_input",
+        feature=FEATURE_NAME,
+        prompt_hash=PROMPT_HASH,
+        schema=IntergroupClassification,
+        model=model,
+        max_concurrency=max_concurrency,
+        max_attempts=max_attempts,
+        cache=cache,
+        desc="Intergroup classification",
+    )
@@ -0,0 +1,300 @@
+"""Bounded-concurrency batch runner for the LLM textual feature classifiers.
+
+``classify_texts`` in ``valence``, ``intergroup``, ``prime``, and ``combined``
+pass their cached chain factory to :func:`classify_texts_with`, which serves
+cached labels and hands the rest to :func:`invoke_batch`. That runs
+``chain.ainvoke`` under an ``asyncio.Semaphore`` on a shared background event
+loop, retries rate limits and transient OpenAI errors with jittered
+exponential backoff (honoring ``Retry-After``), and returns results in input
+order.
+
+To run:
+
+PYTHONPATH=. uv run python -c "from shared.textual_features.valence import classify_texts; print(classify_texts(['What a lovely day!', 'This is awful.']))"
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import threading
+import time
+from collections.abc import Callable, Coroutine, Sequence
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from tqdm import tqdm
+
+from lib.telemetry import TELEMETRY
+from shared.textual_features.result_cache import ClassifierResultCache, classify_with_cache
+
+if TYPE_CHECKING:
+    from langchain_core.runnables import Runnable
+    from pydantic import BaseModel
+
+DEFAULT_MAX_CONCURRENCY = 16
+DEFAULT_MAX_ATTEMPTS = 6
+_RETRY_BASE_SECONDS = 0.5
+_RETRY_CAP_SECONDS = 30.0
+_RATE_LIMIT_STATUS = 429
+_TRANSIENT_STATUSES = frozenset({408, 409, 500, 502, 503, 504})
+_TRANSIENT_ERROR_NAMES = frozenset({"APIConnectionError", "APITimeoutError"})
+
+T = TypeVar("T")
+M = TypeVar("M", bound="BaseModel")
+
+
+def _status_code(exc: BaseException) -> int | None:
+    status = getattr(exc, "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    """Whether ``exc`` is an OpenAI 429 (``openai.RateLimitError``)."""
+    return _status_code(exc) == _RATE_LIMIT_STATUS or type(exc).__name__ == "RateLimitError"
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    return (
+        is_rate_limit_error(exc)
+        or _status_code(exc) in _TRANSIENT_STATUSES
+        or any(cls.__name__ in _TRANSIENT_ERROR_NAMES for cls in type(exc).__mro__)
+    )
+
+
+def _retry_after_seconds(exc: BaseException) -> float | None:
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if headers is None:
+        return None
+    try:
+        return min(_RETRY_CAP_SECONDS, float(headers.get("retry-after")))
+    except (TypeError, ValueError):
+        return None
+
+
+def _backoff_seconds(attempt: int, exc: BaseException) -> float:
+    cap = min(_RETRY_CAP_SECONDS, _RETRY_BASE_SECONDS * (2**attempt))
+    return max(random.uniform(0.0, cap), _retry_after_seconds(exc) or 0.0)
+
+
+async def _ainvoke_with_retries(
+    chain: Runnable,
+    payload: dict[str, Any],
+    semaphore: asyncio.Semaphore,
+    *,
+    operation: str,
+    max_attempts: int,
+) -> Any:
+    latency = TELEMETRY.histogram("llm_call_seconds", operation=operation)
+    for attempt in range(max_attempts):
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                return await chain.ainvoke(payload)
+            except Exception as e:
+                TELEMETRY.incr(
+                    "llm_call_errors_total", operation=operation, code=type(e).__name__
+                )
+                if not _is_retryable(e) or attempt == max_attempts - 1:
+                    raise
+                delay = _backoff_seconds(attempt, e)
+            finally:
+                latency.observe(time.perf_counter() - start)
+        TELEMETRY.incr("llm_retries_total", operation=operation)
+        await asyncio.sleep(delay)
+    raise RuntimeError("unreachable: retry loop exited without result")
+
+
+async def ainvoke_batch(
+    chain: Runnable,
+    posts: Sequence[str],
+    *,
+    input_key: str,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    desc: str | None = None,
+) -> list[Any]:
+    """Run ``chain.ainvoke({input_key: post})`` for every post, in input order.
+
+    Identical posts are sent once and the result is shared. At most
+    ``max_concurrency`` requests are in flight; rate limits (429), timeouts,
+    connection errors, and 5xx responses are retried up to ``max_attempts``
+    times per post. Latency, errors, and retries are recorded in
+    :data:`lib.telemetry.TELEMETRY` under ``operation=desc``.
+
+    Parameters
+    ----------
+    chain
+        Prompt | structured-output runnable, built once by the caller.
+    posts
+        Post texts.
+    input_key
+        Prompt template variable that receives the post.
+    max_concurrency
+        Upper bound on in-flight requests.
+    max_attempts
+        Attempts per unique post before its error is raised.
+    desc
+        Progress-bar label (no bar when ``None``).
+
+    Returns
+    -------
+    list
+        One chain output per input post.
+
+    Raises
+    ------
+    ValueError
+        If ``max_concurrency`` or ``max_attempts`` is below 1.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    if max_attempts < 1:
+        raise ValueError("max_attempts must be at least 1")
+    unique_posts = list(dict.fromkeys(posts))
+    semaphore = asyncio.Semaphore(max_concurrency)
+    operation = desc or "llm_batch"
+    progress = tqdm(total=len(unique_posts), desc=desc, disable=desc is None)
+
+    async def run(post: str) -> Any:
+        result = await _ainvoke_with_retries(
+            chain,
+            {input_key: post},
+            semaphore,
+            operation=operation,
+            max_attempts=max_attempts,
+        )
+        progress.update()
+        return result
+
+    tasks = [asyncio.ensure_future(run(post)) for post in unique_posts]
+    try:
+        results = await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+    finally:
+        progress.close()
+    by_post = dict(zip(unique_posts, results, strict=True))
+    return [by_post[post] for post in posts]
+
+
+@lru_cache(maxsize=1)
+def _background_loop() -> asyncio.AbstractEventLoop:
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="llm-batch-loop", daemon=True).start()
+    return loop
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """Run ``coro`` to completion from synchronous code.
+
+    All batches share one event loop on a daemon thread, so the cached
+    clients' async connection pools stay bound to a live loop across calls
+    (and this also works while another loop is running, e.g. in Jupyter).
+    Interrupting the wait cancels the coroutine.
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, _background_loop())
+    try:
+        return future.result()
+    except BaseException:
+        future.cancel()
+        raise
+
+
+def invoke_batch(
+    chain: Runnable,
+    posts: Sequence[str],
+    *,
+    input_key: str,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    desc: str | None = None,
+) -> list[Any]:
+    """Synchronous :func:`ainvoke_batch`; see there for parameters."""
+    return run_sync(
+        ainvoke_batch(
+            chain,
+            posts,
+            input_key=input_key,
+            max_concurrency=max_concurrency,
+            max_attempts=max_attempts,
+            desc=desc,
+        )
+    )
+
+
+def classify_texts_with(
+    chain_factory: Callable[[str], Runnable],
+    posts: list[str],
+    *,
+    input_key: str,
+    feature: str,
+    prompt_hash: str,
+    schema: type[M],
+    model: str,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    cache: ClassifierResultCache | bool = True,
+    desc: str | None = None,
+) -> list[M]:
+    """Classify many posts with one shared chain, reusing cached labels.
+
+    Posts already labeled under ``prompt_hash`` and ``model`` are read from
+    the result cache; the rest go through :func:`invoke_batch` on
+    ``chain_factory(model)`` and are stored.
+
+    Parameters
+    ----------
+    chain_factory
+        Cached ``get_chain`` of the classifier module, called with ``model``
+        only when some post misses the cache.
+    posts
+        Post texts.
+    input_key
+        Prompt template variable that receives the post.
+    feature
+        Feature name the labels are cached under.
+    prompt_hash
+        :func:`~shared.textual_features.result_cache.prompt_fingerprint` of
+        the prompt and ``schema``.
+    schema
+        Structured-output model the chain returns.
+    model
+        OpenAI model id.
+    max_concurrency
+        Upper bound on in-flight OpenAI requests.
+    max_attempts
+        Attempts per post on rate-limit and transient errors.
+    cache
+        ``True`` for the shared on-disk cache, ``False`` to always call the
+        LLM, or a specific ``ClassifierResultCache``.
+    desc
+        Progress-bar and telemetry label.
+
+    Returns
+    -------
+    list
+        One ``schema`` instance per input post, in input order.
+    """
+
+    def classify_missing(missing: list[str]) -> list[M]:
+        return invoke_batch(
+            chain_factory(model),
+            missing,
+            input_key=input_key,
+            max_concurrency=max_concurrency,
+            max_attempts=max_attempts,
+            desc=desc,
+        )
+
+    return classify_with_cache(
+        posts,
+        classify_missing,
+        feature=feature,
+        prompt_hash=prompt_hash,
+        model=model,
+        schema=schema,
+        cache=cache,
+    )
@@ -7,13 +7,25 @@ PYTHONPATH=. uv run python -c "from shared.textual_features.prime import PrimeCl
 
 from __future__ import annotations
 
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_openai import ChatOpenAI
 from pydantic import BaseModel
-from tqdm import tqdm
 
 from lib.constants import DEFAULT_LLM_MODEL
 from lib.load_env_vars import EnvVarsContainer
+from shared.textual_features.llm_batch import (
+    DEFAULT_MAX_ATTEMPTS,
+    DEFAULT_MAX_CONCURRENCY,
+    classify_texts_with,
+)
+from shared.textual_features.registry import PRIME
+from shared.textual_features.result_cache import ClassifierResultCache, prompt_fingerprint
+
+if TYPE_CHECKING:
+    from langchain_core.runnables import Runnable
+    from langchain_openai import ChatOpenAI
 
 PRIME_EXAMPLES = '\n## Examples\n\nPost: "Senator X is a national hero and everyone should follow her lead."\nAnswer: 1\n\nPost: "I made coffee and read emails this morning."\nAnswer: 0\n\nPost: "People like us are being ignored again while their side gets everything."\nAnswer: 1\n\nPost: "The city council passed a transportation budget."\nAnswer: 0\n\nPost: "It is disgusting and immoral what they did to those families."\nAnswer: 1\n\nPost: "The weather is mild today and traffic is normal."\nAnswer: 0\n'
 
@@ -28,13 +40,21 @@ class PrimeClassification(BaseModel):
     is_prime: bool
 
 
+FEATURE_NAME = PRIME
+PROMPT_HASH = prompt_fingerprint(PRIME_PROMPT, PrimeClassification)
+
+
 _PRIME_PROMPT = ChatPromptTemplate.from_messages(
     [("human", PRIME_PROMPT)]
 )
 
 
+@lru_cache(maxsize=8)
 def get_llm(model: str = DEFAULT_LLM_MODEL) -> ChatOpenAI:
-    """Build a ChatOpenAI client using ``OPENAI_API_KEY``.
+    """Build a ChatOpenAI client using ``OPENAI_API_KEY``, once per model.
+
+    ``langchain_openai`` is imported on first call; later calls reuse the
+    cached client.
 
     Parameters
     ----------
@@ -46,40 +66,64 @@ def get_llm(model: str = DEFAULT_LLM_MODEL) -> ChatOpenAI:
     ChatOpenAI
         Configured LangChain chat model.
     """
+    from langchain_openai import ChatOpenAI
+
     api_key = EnvVarsContainer.get_env_var("OPENAI_API_KEY", required=True)
     return ChatOpenAI(model=model, api_key=api_key)
 
 
-def classify_post(post: str) -> PrimeClassification:
-    """Classify one post via OpenAI structured output (LangChain).
+@lru_cache(maxsize=8)
+def get_chain(model: str = DEFAULT_LLM_MODEL) -> Runnable:
+    """Return the prompt | structured-output chain for ``model``, built once.
 
     Parameters
     ----------
-    post
-        Social media post text.
+    model
+        OpenAI model id.
 
     Returns
     -------
-    PrimeClassification
-        Structured ``is_prime`` label.
+    Runnable
+        Chain mapping ``{"prompt_input": post}`` to ``PrimeClassification``.
     """
-    llm = get_llm()
-    structured = llm.with_structured_output(PrimeClassification)
-    chain = _PRIME_PROMPT | structured
-    return chain.invoke({"prompt_input": post})
+    return _PRIME_PROMPT | get_llm(model).with_structured_output(PrimeClassification)
 
 
-def classify_texts(posts: list[str]) -> list[PrimeClassification]:
-    """Classify each post with ``classify_post``.
+def classify_post(post: str) -> PrimeClassification:
+    """Classify one post via OpenAI structured output (LangChain).
 
     Parameters
     ----------
-    posts
-        Post texts.
+    post
+        Social media post text.
 
     Returns
     -------
-    list[PrimeClassification]
-        One label per input post.
+    PrimeClassification
+        Structured ``is_prime`` label.
     """
-    return [classify_post(p) for p in tqdm(posts, desc="PRIME classification")]
+    return get_chain().invoke({"prompt_input": post})
+
+
+def classify_texts(
+    posts: list[str],
+    *,
+    model: str = DEFAULT_LLM_MODEL,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    cache: ClassifierResultCache | bool = True,
+) -> list[PrimeClassification]:
+    """``is_prime`` for each post; see :func:`.llm_batch.classify_texts_with`."""
+    return classify_texts_with(
+        get_chain,
+        posts,
+        input_key="prompt_input",
+        feature=FEATURE_NAME,
+        prompt_hash=PROMPT_HASH,
+        schema=PrimeClassification,
+        model=model,
+        max_concurrency=max_concurrency,
+        max_attempts=max_attempts,
+        cache=cache,
+        desc="PRIME classification",
+    )
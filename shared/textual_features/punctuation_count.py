@@ -7,9 +7,16 @@ PYTHONPATH=. uv run python -c "from shared.textual_features.punctuation_count im
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from shared.textual_features.base import CalculateMetric
 from shared.textual_features.text_utils import PUNCTUATION_RE
 
+if TYPE_CHECKING:
+    import numpy as np
+
+    from shared.textual_features.vectorized import TextColumn
+
 
 class PunctuationCountMetric(CalculateMetric):
     """Count of punctuation-like characters."""
@@ -38,3 +45,9 @@ class PunctuationCountMetric(CalculateMetric):
             Number of ``PUNCTUATION_RE`` matches.
         """
         return float(len(PUNCTUATION_RE.findall(text)))
+
+    def calculate_array(self, texts: TextColumn) -> np.ndarray:
+        """Return punctuation counts for ``texts`` via an Arrow regex count."""
+        from shared.textual_features.vectorized import punctuation_counts
+
+        return punctuation_counts(texts)
@@ -7,9 +7,16 @@ PYTHONPATH=. uv run python -c "from shared.textual_features.punctuation_density
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from shared.textual_features.base import CalculateMetric
 from shared.textual_features.text_utils import PUNCTUATION_RE, safe_divide
 
+if TYPE_CHECKING:
+    import numpy as np
+
+    from shared.textual_features.vectorized import TextColumn
+
 
 class PunctuationDensityMetric(CalculateMetric):
     """Punctuation per character."""
@@ -40,3 +47,12 @@ class PunctuationDensityMetric(CalculateMetric):
         char_count = len(text)
         punct = float(len(PUNCTUATION_RE.findall(text)))
         return safe_divide(punct, float(char_count) if char_count else 0.0)
+
+    def calculate_array(self, texts: TextColumn) -> np.ndarray:
+        """Return punctuation densities for ``texts`` from Arrow counts."""
+        from shared.textual_features import vectorized
+
+        arr = vectorized.as_string_array(texts)
+        return vectorized.safe_divide(
+            vectorized.punctuation_counts(arr), vectorized.char_counts(arr)
+        )
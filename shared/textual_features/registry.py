@@ -7,22 +7,20 @@ PYTHONPATH=. uv run python -c "from shared.textual_features.registry import get_
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from enum import Enum
+from importlib import import_module
 from typing import Any
 
 from shared.textual_features.avg_sentence_length import AvgSentenceLengthMetric
 from shared.textual_features.base import CalculateMetric
 from shared.textual_features.char_count import CharCountMetric
 from shared.textual_features.flesch_kincaid_grade import FleschKincaidGradeMetric
-from shared.textual_features.intergroup import classify_post as classify_intergroup_post
-from shared.textual_features.prime import classify_post as classify_prime_post
 from shared.textual_features.punctuation_count import PunctuationCountMetric
 from shared.textual_features.punctuation_density import PunctuationDensityMetric
 from shared.textual_features.reading_ease import FleschReadingEaseMetric
 from shared.textual_features.sentence_count import SentenceCountMetric
-from shared.textual_features.valence import classify_post as classify_valence_post
 from shared.textual_features.word_count import WordCountMetric
 
 CHAR_COUNT = "CHAR_COUNT"
@@ -38,6 +36,22 @@ INTERGROUP = "INTERGROUP"
 PRIME = "PRIME"
 
 
+def _lazy_classify_post(module: str) -> Callable[[str], Any]:
+    """Return a ``classify_post`` proxy that imports ``module`` on first call.
+
+    Keeps LangChain / OpenAI imports out of ``import registry`` for callers
+    that only need deterministic metrics.
+    """
+    qualified = f"shared.textual_features.{module}"
+
+    def classify_post(post: str) -> Any:
+        return import_module(qualified).classify_post(post)
+
+    classify_post.__qualname__ = f"{module}.classify_post"
+    classify_post.__doc__ = f"Proxy for :func:`{qualified}.classify_post`."
+    return classify_post
+
+
 class FeatureKind(str, Enum):
     """Whether a registry entry is a deterministic metric or an LLM classifier."""
 
@@ -61,6 +75,9 @@ class FeatureEntry:
         Zero-arg factory returning a ``CalculateMetric`` (metrics only).
     classify_post
         Single-post classifier callable (classifiers only).
+    label_field
+        Boolean attribute of the classifier's structured output (classifiers
+        only), e.g. ``"is_positive"``.
     """
 
     name: str
@@ -68,6 +85,7 @@ class FeatureEntry:
     metric_name: str | None
     build: Callable[[], CalculateMetric] | None
     classify_post: Callable[[str], Any] | None
+    label_field: str | None = None
 
 
 FEATURES: dict[str, FeatureEntry] = {
@@ -132,25 +150,37 @@ FEATURES: dict[str, FeatureEntry] = {
         kind=FeatureKind.CLASSIFIER,
         metric_name=None,
         build=None,
-        classify_post=classify_valence_post,
+        classify_post=_lazy_classify_post("valence"),
+        label_field="is_positive",
     ),
     INTERGROUP: FeatureEntry(
         name=INTERGROUP,
         kind=FeatureKind.CLASSIFIER,
         metric_name=None,
         build=None,
-        classify_post=classify_intergroup_post,
+        classify_post=_lazy_classify_post("intergroup"),
+        label_field="is_intergroup",
     ),
     PRIME: FeatureEntry(
         name=PRIME,
         kind=FeatureKind.CLASSIFIER,
         metric_name=None,
         build=None,
-        classify_post=classify_prime_post,
+        classify_post=_lazy_classify_post("prime"),
+        label_field="is_prime",
     ),
 }
 
 
+# Single-feature module per classifier; ``shared.textual_features.combined``
+# answers all of them in one request per post.
+CLASSIFIER_MODULES: dict[str, str] = {
+    VALENCE: "valence",
+    INTERGROUP: "intergroup",
+    PRIME: "prime",
+}
+
+
 def get_feature(name: str) -> FeatureEntry:
     """Return the registry entry for ``name``.
 
@@ -177,3 +207,58 @@ def get_feature(name: str) -> FeatureEntry:
             f"Unknown textual feature {name!r}. Valid names are in "
             f"shared.textual_features.registry: {known}"
         ) from exc
+
+
+def classify_features(
+    names: Sequence[str],
+    posts: list[str],
+    *,
+    combined: bool = True,
+    **batch_kwargs: Any,
+) -> dict[str, list[bool]]:
+    """Label ``posts`` for each classifier in ``names``.
+
+    With ``combined=True`` (default) any subset of ``CLASSIFIER_MODULES``
+    costs one request per post through ``combined.classify_texts``; with
+    ``combined=False`` each feature runs its own single-feature prompt.
+
+    Parameters
+    ----------
+    names
+        Classifier registry keys (``VALENCE``, ``INTERGROUP``, ``PRIME``).
+    posts
+        Post texts.
+    combined
+        Use the joint multi-label prompt instead of one prompt per feature.
+    **batch_kwargs
+        Forwarded to ``classify_texts`` (``model``, ``max_concurrency``,
+        ``max_attempts``, ``cache``).
+
+    Returns
+    -------
+    dict[str, list[bool]]
+        Registry key -> one label per post, in input order.
+
+    Raises
+    ------
+    KeyError
+        If a name is not in the catalog.
+    ValueError
+        If a name is not a classifier.
+    """
+    entries = [get_feature(name) for name in dict.fromkeys(names)]
+    not_classifiers = [e.name for e in entries if e.kind is not FeatureKind.CLASSIFIER]
+    if not_classifiers:
+        raise ValueError(f"Not classifier features: {not_classifiers}")
+    if not entries:
+        return {}
+    if combined:
+        module = import_module("shared.textual_features.combined")
+        results = module.classify_texts(posts, **batch_kwargs)
+        return {e.name: [bool(getattr(r, e.label_field)) for r in results] for e in entries}
+    labels: dict[str, list[bool]] = {}
+    for e in entries:
+        module = import_module(f"shared.textual_features.{CLASSIFIER_MODULES[e.name]}")
+        results = module.classify_texts(posts, **batch_kwargs)
+        labels[e.name] = [bool(getattr(r, e.label_field)) for r in results]
+    return labels
@@ -0,0 +1,360 @@
+"""Persistent, content-addressed cache for LLM textual feature labels.
+
+Labels live in one local SQLite file keyed by ``(feature, prompt_hash, model,
+text_hash)``:
+
+- ``prompt_hash`` fingerprints the prompt template and the structured-output
+  schema (:func:`prompt_fingerprint`), so editing a prompt or a label field
+  misses automatically; rows under older fingerprints are never served and
+  can be dropped with :meth:`ClassifierResultCache.prune_stale`.
+- ``text_hash`` is the SHA-256 of the NFC-normalized, stripped post text
+  (:func:`text_sha256`), so the same post recurring across analyses and
+  study phases is labeled once.
+
+``classify_texts`` in ``valence``, ``intergroup``, ``prime``, and ``combined``
+go through :func:`classify_with_cache` and only send misses to the LLM. The
+file defaults to ``.cache/textual_features/classifier_results.sqlite3`` under
+the repo root; set ``TEXTUAL_FEATURES_CACHE_PATH`` to move it.
+
+To run:
+
+PYTHONPATH=. uv run python -m shared.textual_features.result_cache --summary
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from lib.constants import REPO_ROOT
+from lib.load_env_vars import EnvVarsContainer
+from lib.telemetry import TELEMETRY
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+DEFAULT_CACHE_PATH = REPO_ROOT / ".cache" / "textual_features" / "classifier_results.sqlite3"
+CACHE_PATH_ENV_VAR = "TEXTUAL_FEATURES_CACHE_PATH"
+# SQLite's default limit on host parameters per statement is 999 (older builds).
+_LOOKUP_CHUNK = 500
+
+M = TypeVar("M", bound="BaseModel")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS classifier_results (
+    feature TEXT NOT NULL,
+    prompt_hash TEXT NOT NULL,
+    model TEXT NOT NULL,
+    text_hash TEXT NOT NULL,
+    result TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (feature, prompt_hash, model, text_hash)
+) WITHOUT ROWID
+"""
+
+
+def normalize_text(text: str) -> str:
+    """NFC-normalize and strip ``text`` (the form that is hashed)."""
+    return unicodedata.normalize("NFC", text).strip()
+
+
+def text_sha256(text: str) -> str:
+    """SHA-256 hex of :func:`normalize_text` (UTF-8)."""
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+
+
+def prompt_fingerprint(prompt: str, schema: type[BaseModel]) -> str:
+    """Short SHA-256 over the prompt template text and the output JSON schema.
+
+    Parameters
+    ----------
+    prompt
+        Prompt template string (e.g. ``valence.BINARY_SENTIMENT_PROMPT``).
+    schema
+        Pydantic structured-output model.
+
+    Returns
+    -------
+    str
+        First 16 hex characters of the digest.
+    """
+    blob = json.dumps(
+        {"prompt": prompt, "schema": schema.model_json_schema()},
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(b"v1\n" + blob.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Lookup counts since the cache was opened (or ``reset_stats``)."""
+
+    hits: int
+    misses: int
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+
+
+class ClassifierResultCache:
+    """SQLite-backed label cache shared by the LLM feature classifiers.
+
+    Safe to use from several threads; each statement runs under one lock on a
+    single connection in WAL mode.
+
+    Parameters
+    ----------
+    path
+        SQLite file, created with its parent directories when missing;
+        ``":memory:"`` for a throwaway cache.
+    """
+
+    def __init__(self, path: str | Path = DEFAULT_CACHE_PATH) -> None:
+        self._path = path if path == ":memory:" else Path(path)
+        if isinstance(self._path, Path):
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self._path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(_SCHEMA)
+        self._hits: dict[str, int] = {}
+        self._misses: dict[str, int] = {}
+
+    @property
+    def path(self) -> str | Path:
+        return self._path
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
+
+    def get_many(
+        self,
+        feature: str,
+        prompt_hash: str,
+        model: str,
+        texts: Sequence[str],
+    ) -> list[dict[str, Any] | None]:
+        """Look up cached results for ``texts``.
+
+        Returns
+        -------
+        list[dict | None]
+            Decoded result per input text, ``None`` on a miss. Hits and misses
+            count towards :meth:`stats` and ``classifier_cache_lookups_total``.
+        """
+        hashes = [text_sha256(text) for text in texts]
+        found: dict[str, dict[str, Any]] = {}
+        unique = list(dict.fromkeys(hashes))
+        with self._lock:
+            for start in range(0, len(unique), _LOOKUP_CHUNK):
+                chunk = unique[start : start + _LOOKUP_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    "SELECT text_hash, result FROM classifier_results "
+                    "WHERE feature = ? AND prompt_hash = ? AND model = ? "
+                    f"AND text_hash IN ({placeholders})",
+                    (feature, prompt_hash, model, *chunk),
+                ).fetchall()
+                found.update((text_hash, json.loads(result)) for text_hash, result in rows)
+        results = [found.get(h) for h in hashes]
+        hits = sum(r is not None for r in results)
+        self._record(feature, hits, len(results) - hits)
+        return results
+
+    def put_many(
+        self,
+        feature: str,
+        prompt_hash: str,
+        model: str,
+        texts: Sequence[str],
+        results: Sequence[dict[str, Any]],
+    ) -> None:
+        """Store one JSON-serializable result per text (replacing existing rows).
+
+        Raises
+        ------
+        ValueError
+            If ``texts`` and ``results`` differ in length.
+        """
+        if len(texts) != len(results):
+            raise ValueError(f"{len(texts)} texts vs {len(results)} results")
+        now = time.time()
+        rows = [
+            (feature, prompt_hash, model, text_sha256(text), json.dumps(result), now)
+            for text, result in zip(texts, results, strict=True)
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO classifier_results VALUES (?, ?, ?, ?, ?, ?)", rows
+            )
+
+    def prune_stale(self, feature: str, prompt_hash: str) -> int:
+        """Delete ``feature`` rows stored under any other prompt fingerprint.
+
+        Returns
+        -------
+        int
+            Rows deleted.
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM classifier_results WHERE feature = ? AND prompt_hash != ?",
+                (feature, prompt_hash),
+            )
+        return cursor.rowcount
+
+    def stats(self, feature: str | None = None) -> CacheStats:
+        """Hits and misses for ``feature`` (all features when ``None``)."""
+        if feature is not None:
+            return CacheStats(self._hits.get(feature, 0), self._misses.get(feature, 0))
+        return CacheStats(sum(self._hits.values()), sum(self._misses.values()))
+
+    def reset_stats(self) -> None:
+        """Zero the in-process hit/miss counters."""
+        with self._lock:
+            self._hits.clear()
+            self._misses.clear()
+
+    def summary(self) -> list[dict[str, Any]]:
+        """Stored row counts per ``(feature, prompt_hash, model)``, newest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT feature, prompt_hash, model, COUNT(*), MAX(created_at) "
+                "FROM classifier_results GROUP BY feature, prompt_hash, model "
+                "ORDER BY feature, MAX(created_at) DESC"
+            ).fetchall()
+        return [
+            {
+                "feature": feature,
+                "prompt_hash": prompt_hash,
+                "model": model,
+                "rows": n,
+                "last_written": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(last)),
+            }
+            for feature, prompt_hash, model, n, last in rows
+        ]
+
+    def _record(self, feature: str, hits: int, misses: int) -> None:
+        with self._lock:
+            self._hits[feature] = self._hits.get(feature, 0) + hits
+            self._misses[feature] = self._misses.get(feature, 0) + misses
+        TELEMETRY.incr("classifier_cache_lookups_total", hits, feature=feature, outcome="hit")
+        TELEMETRY.incr("classifier_cache_lookups_total", misses, feature=feature, outcome="miss")
+
+
+@lru_cache(maxsize=1)
+def get_default_cache() -> ClassifierResultCache:
+    """Return the process-wide cache at ``TEXTUAL_FEATURES_CACHE_PATH`` or the default path."""
+    path = EnvVarsContainer.get_env_var(CACHE_PATH_ENV_VAR) or DEFAULT_CACHE_PATH
+    return ClassifierResultCache(path)
+
+
+def classify_with_cache(
+    posts: Sequence[str],
+    classify: Callable[[list[str]], list[M]],
+    *,
+    feature: str,
+    prompt_hash: str,
+    model: str,
+    schema: type[M],
+    cache: ClassifierResultCache | bool = True,
+) -> list[M]:
+    """Serve cached labels and run ``classify`` only on the misses.
+
+    Parameters
+    ----------
+    posts
+        Post texts.
+    classify
+        Batched classifier for the missing posts (input order preserved).
+    feature, prompt_hash, model
+        Cache key components; see :func:`prompt_fingerprint`.
+    schema
+        Structured-output model used to rebuild cached results.
+    cache
+        ``True`` for :func:`get_default_cache`, ``False`` to bypass caching
+        (``classify`` sees every post), or a specific cache.
+
+    Returns
+    -------
+    list
+        One ``schema`` instance per input post, in input order.
+    """
+    if cache is False:
+        return classify(list(posts))
+    if cache is True:
+        cache = get_default_cache()
+    cached = cache.get_many(feature, prompt_hash, model, posts)
+    missing = list(dict.fromkeys(p for p, hit in zip(posts, cached, strict=True) if hit is None))
+    fresh: dict[str, M] = {}
+    if missing:
+        labels = classify(missing)
+        cache.put_many(feature, prompt_hash, model, missing, [m.model_dump() for m in labels])
+        fresh = dict(zip(missing, labels, strict=True))
+    return [
+        schema.model_validate(hit) if hit is not None else fresh[post]
+        for post, hit in zip(posts, cached, strict=True)
+    ]
+
+
+def _iter_summary_lines(cache: ClassifierResultCache) -> Iterator[str]:
+    rows = cache.summary()
+    if not rows:
+        yield f"{cache.path}: empty"
+        return
+    yield f"{cache.path}:"
+    for row in rows:
+        yield (
+            f"  {row['feature']:<12} prompt={row['prompt_hash']} model={row['model']} "
+            f"rows={row['rows']} last_written={row['last_written']}"
+        )
+
+
+def _build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Inspect or prune the classifier label cache.")
+    parser.add_argument("--path", type=Path, default=None, help="SQLite file (default: env/repo)")
+    parser.add_argument("--summary", action="store_true", help="Print row counts per prompt")
+    parser.add_argument(
+        "--prune-stale",
+        action="store_true",
+        help="Drop rows whose prompt fingerprint no longer matches the current prompts",
+    )
+    return parser
+
+
+def main() -> None:
+    args = _build_arg_parser().parse_args()
+    cache = ClassifierResultCache(args.path) if args.path else get_default_cache()
+    if args.prune_stale:
+        from shared.textual_features import combined, intergroup, prime, valence
+
+        for module in (valence, intergroup, prime, combined):
+            deleted = cache.prune_stale(module.FEATURE_NAME, module.PROMPT_HASH)
+            print(f"{module.FEATURE_NAME}: pruned {deleted} stale rows")
+    if args.summary or not args.prune_stale:
+        for line in _iter_summary_lines(cache):
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
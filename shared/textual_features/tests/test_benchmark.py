@@ -0,0 +1,93 @@
+"""Tests for the textual feature benchmark harness (small sizes, no network)."""
+
+from __future__ import annotations
+
+from scripts import benchmark_textual_features as bench
+from shared.textual_features import combined, valence
+
+
+class TestCorpora:
+    """Tests for the synthetic and real-shaped corpus builders."""
+
+    def test_synthetic_is_deterministic_unique_and_post_sized(self) -> None:
+        """Verifies a seed reproduces the corpus and every post is distinct and post-length."""
+        posts = bench.synthetic_corpus(300, seed=1)
+        assert posts == bench.synthetic_corpus(300, seed=1)
+        assert len(set(posts)) == 300
+        assert all(100 <= len(p) <= 420 for p in posts)
+
+    def test_real_resamples_stimuli(self) -> None:
+        """Verifies the real-shaped corpus draws only stimulus texts."""
+        posts = bench.real_corpus(50, seed=0)
+        assert len(posts) == 50
+        assert all(isinstance(p, str) and p for p in posts)
+
+
+class TestBenchMetrics:
+    """Tests for bench_metrics()."""
+
+    def test_cases_and_spacy_cap(self) -> None:
+        """Verifies one case per metric plus ALL, and spaCy cases above the cap are skipped."""
+        results = bench.bench_metrics(
+            bench.synthetic_corpus(20),
+            corpus="synthetic",
+            backends=["regex", "spacy"],
+            memory=False,
+            spacy_max_posts=10,
+        )
+        timed = {(r.case, r.backend) for r in results if r.skipped is None}
+        skipped = {(r.case, r.backend) for r in results if r.skipped is not None}
+        assert ("CHAR_COUNT", None) in timed
+        assert ("ALL", "regex") in timed
+        assert skipped == {
+            ("FLESCH_KINCAID_GRADE", "spacy"),
+            ("READING_EASE", "spacy"),
+            ("ALL", "spacy"),
+        }
+        assert all(r.posts_per_second > 0 for r in results if r.skipped is None)
+
+
+class TestFakeLLMBackend:
+    """Tests for fake_llm_backend() and bench_llm()."""
+
+    def test_restores_get_chain(self) -> None:
+        """Verifies the real chain builders are put back on exit."""
+        originals = (combined.get_chain, valence.get_chain)
+        with bench.fake_llm_backend(0.0):
+            assert combined.get_chain is not originals[0]
+        assert (combined.get_chain, valence.get_chain) == originals
+
+    def test_request_counts_per_mode(self) -> None:
+        """Verifies one request per post combined, three separate, none on a warm cache."""
+        results = bench.bench_llm(bench.synthetic_corpus(12), corpus="synthetic", latency=0.0)
+        requests = {r.case: r.extra["requests"] for r in results}
+        assert requests == {
+            "combined": 12,
+            "separate": 36,
+            "combined_cold_cache": 12,
+            "combined_warm_cache": 0,
+        }
+
+
+class TestCompareReports:
+    """Tests for compare_reports()."""
+
+    def test_speedup_for_shared_timed_cases(self) -> None:
+        """Verifies ratios cover cases timed in both reports only."""
+
+        def row(case: str, pps: float | None) -> dict:
+            result = bench.BenchmarkResult(
+                suite="metrics",
+                case=case,
+                corpus="synthetic",
+                n_posts=10,
+                backend=None,
+                seconds=None if pps is None else 10 / pps,
+                posts_per_second=pps,
+            )
+            return bench.asdict(result)
+
+        baseline = {"results": [row("A", 100.0), row("B", 50.0), row("C", None)]}
+        current = {"results": [row("A", 200.0), row("C", 10.0), row("D", 1.0)]}
+        rows = bench.compare_reports(baseline, current)
+        assert [(r["case"], r["speedup"]) for r in rows] == [("A", 2.0)]
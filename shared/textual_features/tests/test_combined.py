@@ -0,0 +1,110 @@
+"""Tests for the combined VALENCE/INTERGROUP/PRIME classifier (no network)."""
+
+from __future__ import annotations
+
+import math
+from types import SimpleNamespace
+
+import pytest
+
+from shared.textual_features import combined, intergroup, prime, valence
+from shared.textual_features.registry import (
+    CHAR_COUNT,
+    CLASSIFIER_MODULES,
+    INTERGROUP,
+    PRIME,
+    VALENCE,
+    classify_features,
+    get_feature,
+)
+
+POSTS = ["They always cheat!", "Lovely morning.", "They always cheat!"]
+
+
+@pytest.fixture
+def calls(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Replace every classify_texts with a fake that records which module ran."""
+    recorded: list[str] = []
+
+    def fake(module: str):
+        def classify_texts(posts: list[str], **kwargs) -> list[SimpleNamespace]:
+            recorded.append(module)
+            return [
+                SimpleNamespace(
+                    is_positive="Lovely" in p,
+                    is_intergroup="They" in p,
+                    is_prime="!" in p and module != "prime",
+                )
+                for p in posts
+            ]
+
+        return classify_texts
+
+    for module in (combined, valence, intergroup, prime):
+        monkeypatch.setattr(module, "classify_texts", fake(module.__name__.rsplit(".", 1)[1]))
+    return recorded
+
+
+class TestCombinedPrompt:
+    """Tests for the joint prompt template."""
+
+    def test_single_post_variable(self) -> None:
+        """Verifies the template takes only ``post`` and asks for all three fields."""
+        prompt = combined._COMBINED_PROMPT
+        assert prompt.input_variables == ["post"]
+        text = prompt.format(post="hello")
+        for field in combined.CombinedClassification.model_fields:
+            assert f'"{field}"' in text
+        assert '"""hello"""' in text
+
+
+class TestClassifyFeatures:
+    """Tests for registry.classify_features() routing."""
+
+    @pytest.mark.parametrize("names", [[VALENCE], [INTERGROUP, PRIME], list(CLASSIFIER_MODULES)])
+    def test_combined_is_one_batch_for_any_subset(self, calls: list[str], names) -> None:
+        """Verifies any subset of the classifiers costs one combined batch."""
+        result = classify_features(names, POSTS)
+        assert calls == ["combined"]
+        assert list(result) == names
+        assert all(len(labels) == len(POSTS) for labels in result.values())
+
+    def test_separate_runs_each_feature(self, calls: list[str]) -> None:
+        """Verifies combined=False runs each single-feature classifier."""
+        result = classify_features([VALENCE, PRIME], POSTS, combined=False)
+        assert calls == ["valence", "prime"]
+        assert result[VALENCE] == [False, True, False]
+        assert result[PRIME] == [False, False, False]
+
+    def test_rejects_metrics(self) -> None:
+        """Verifies deterministic metrics are not accepted."""
+        with pytest.raises(ValueError, match="CHAR_COUNT"):
+            classify_features([CHAR_COUNT], POSTS)
+
+    def test_label_fields(self) -> None:
+        """Verifies registry label fields match the combined schema."""
+        fields = {get_feature(name).label_field for name in CLASSIFIER_MODULES}
+        assert fields == set(combined.CombinedClassification.model_fields)
+
+
+class TestAgreementReport:
+    """Tests for combined.agreement_report()."""
+
+    def test_agreement_and_kappa(self) -> None:
+        """Verifies agreement, kappa, and disagreement counts on a known table."""
+        report = combined.agreement_report(
+            {"is_prime": [True, True, False, False]},
+            {"is_prime": [True, False, False, False]},
+        ).set_index("label")
+        row = report.loc["is_prime"]
+        assert row["agreement"] == 0.75
+        # p_o = .75, p_e = .5 * .25 + .5 * .75 = .5 -> kappa = .5
+        assert math.isclose(row["cohen_kappa"], 0.5)
+        assert (row["both_true"], row["combined_only"], row["separate_only"]) == (1, 1, 0)
+
+    def test_rejects_mismatched_inputs(self) -> None:
+        """Verifies label sets and lengths must match."""
+        with pytest.raises(ValueError, match="label mismatch"):
+            combined.agreement_report({"is_prime": [True]}, {"is_positive": [True]})
+        with pytest.raises(ValueError, match="is_prime"):
+            combined.agreement_report({"is_prime": [True]}, {"is_prime": [True, False]})
@@ -0,0 +1,46 @@
+"""Tests for the shared-parse metric engine."""
+
+from __future__ import annotations
+
+import pytest
+
+from shared.textual_features.engine import compute_metrics, metric_names
+from shared.textual_features.registry import (
+    PUNCTUATION_DENSITY,
+    READING_EASE,
+    VALENCE,
+    get_feature,
+)
+
+TEXTS = [
+    "Hello world.",
+    "",
+    "   ",
+    "Wow!!! Is this real?? I can't believe it... Truly remarkable.",
+    "no punctuation at all here",
+    "Café owners say naïve policies hurt small businesses; others disagree.",
+    "1234 5678 !!!",
+]
+
+
+def test_matches_per_metric_calculate_exactly() -> None:
+    """Verifies every column equals the metric's own calculate() bit-for-bit."""
+    result = compute_metrics(TEXTS)
+    for name in metric_names():
+        entry = get_feature(name)
+        metric = entry.build()
+        expected = [metric.calculate(t) for t in TEXTS]
+        assert result[entry.metric_name].tolist() == expected, name
+
+
+def test_columns_follow_requested_order() -> None:
+    """Verifies output keys are metric names in request order, deduplicated."""
+    result = compute_metrics(TEXTS[:2], [READING_EASE, PUNCTUATION_DENSITY, READING_EASE])
+    assert list(result) == ["flesch_reading_ease", "punctuation_density"]
+    assert all(len(col) == 2 for col in result.values())
+
+
+def test_rejects_classifier_names() -> None:
+    """Verifies LLM classifier names are refused."""
+    with pytest.raises(ValueError, match="classifiers"):
+        compute_metrics(TEXTS, [VALENCE])
@@ -0,0 +1,152 @@
+"""Parity tests for the spaCy-free readability backend."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+from lib.constants import REPO_ROOT
+from shared.data.registry import (
+    STUDY_PHASE_2_PART_1_STIMULI,
+    STUDY_PHASE_2_PART_2_KEEP_REMOVE_LABELS,
+    resolve_path,
+)
+from shared.textual_features import fast_readability
+from shared.textual_features.engine import compute_metrics
+from shared.textual_features.registry import FLESCH_KINCAID_GRADE, READING_EASE
+from shared.textual_features.text_utils import (
+    SYLLABLE_CACHE_SIZE,
+    count_syllables,
+    readability_counts,
+)
+
+# Tokenizer edge cases: contractions and slang exceptions, abbreviations,
+# single-letter initials, emoticons, URLs, ellipses, hyphens, whitespace, and
+# an emoticon matched across spaces that blocks an abbreviation merge.
+EDGE_CASES = [
+    "",
+    "   ",
+    "Hello world.",
+    "I don't know. You can't, won't, and shouldn't! Dont. Im here, cuz gonna.",
+    "Mr. Smith met Dr. Jones at 5 p.m. on Jan. 3rd in Washington D.C. today.",
+    "Plan B. Then J. K. Rowling. U.S. policy vs. E.U. policy, e.g. tariffs.",
+    "Great job :) really :D wow :-( <3 ¯\\_(ツ)_/¯",
+    "See https://example.com/a?b=c and www.test.org. Email me@x.io now!",
+    "Wait... what?! Really?!?! (Yes.) \"Quoted.\" 'Single.'",
+    "well-known state-of-the-art 2-3 10am cr--k w/e and/or 'cuz'.",
+    "Line one.\n\nLine two\n)\nLast line.  \n\t ",
+    "Hi.\n)",
+    "  Leading spaces. Trailing spaces.   ",
+    "Café owners say naïve policies hurt; «others» disagree… Truly!",
+    "ALL CAPS TEXT. NASA'S plan. It's John's dog's toy.",
+    "1234 5678 !!! ??? ...",
+    "!!!Dr. _ .\nn't\n`",
+]
+
+
+def _corpus_texts(name: str, columns: tuple[str, ...]) -> list[str]:
+    import pandas as pd
+
+    path = resolve_path(name)
+    if not path.exists():
+        pytest.skip(f"{path} not present")
+    frame = pd.read_csv(path, usecols=list(columns), dtype=str)
+    texts = frame.stack().dropna().tolist()
+    return list(dict.fromkeys(texts))
+
+
+def _report(disagreements: list[fast_readability.Disagreement]) -> str:
+    lines = [f"{len(disagreements)} texts disagree (spacy vs regex):"]
+    lines += [
+        f"  [{d.index}] {d.spacy_counts} != {d.regex_counts}: {d.text[:120]!r}"
+        for d in disagreements[:25]
+    ]
+    return "\n".join(lines)
+
+
+class TestParityWithSpacy:
+    """Tests that the regex backend reproduces the spaCy counts."""
+
+    @pytest.fixture(autouse=True)
+    def _require_spacy(self) -> None:
+        pytest.importorskip("spacy")
+
+    def test_rules_snapshot_matches_installed_spacy(self) -> None:
+        """Verifies spacy_en_rules.json is current (re-run the export script if not)."""
+        import json
+
+        committed = json.loads(fast_readability.RULES_PATH.read_text(encoding="utf-8"))
+        exported = json.loads(json.dumps(fast_readability.export_rules()))
+        assert committed == exported
+
+    def test_edge_cases(self) -> None:
+        """Verifies counts match on tokenizer and sentencizer edge cases."""
+        disagreements = fast_readability.find_disagreements(EDGE_CASES)
+        assert disagreements == [], _report(disagreements)
+
+    @pytest.mark.parametrize(
+        ("dataset", "columns"),
+        [
+            (STUDY_PHASE_2_PART_1_STIMULI, ("original_text", "claude_mirror")),
+            (STUDY_PHASE_2_PART_2_KEEP_REMOVE_LABELS, ("original_text", "mirror_text")),
+        ],
+    )
+    def test_study_corpora(self, dataset: str, columns: tuple[str, ...]) -> None:
+        """Verifies counts match on every post and mirror in the study corpora."""
+        disagreements = fast_readability.find_disagreements(_corpus_texts(dataset, columns))
+        assert disagreements == [], _report(disagreements)
+
+    def test_compute_metrics_backends_agree(self) -> None:
+        """Verifies compute_metrics returns identical readability columns per backend."""
+        names = [FLESCH_KINCAID_GRADE, READING_EASE]
+        expected = compute_metrics(EDGE_CASES, names, backend="spacy")
+        result = compute_metrics(EDGE_CASES, names, backend="regex")
+        assert {k: v.tolist() for k, v in result.items()} == {
+            k: v.tolist() for k, v in expected.items()
+        }
+
+
+class TestReadabilityCounts:
+    """Tests for text_utils.readability_counts() backend selection."""
+
+    def test_regex_backend_matches_legacy_fixture(self) -> None:
+        """Verifies the regex backend reproduces the pinned 'Hello world.' counts."""
+        result = readability_counts("Hello world.", backend="regex")
+        expected = (2, 1, 3)
+        assert result == expected
+
+    def test_unknown_backend_raises(self) -> None:
+        """Verifies an unknown backend name is rejected."""
+        with pytest.raises(ValueError, match="backend"):
+            readability_counts("Hello world.", backend="nltk")  # type: ignore[arg-type]
+
+    def test_regex_backend_does_not_import_spacy(self) -> None:
+        """Verifies the regex backend runs in a fresh interpreter without spaCy."""
+        code = (
+            "import sys\n"
+            "from shared.textual_features.text_utils import readability_counts\n"
+            "readability_counts('Mr. Smith left. He did not return!', backend='regex')\n"
+            "assert 'spacy' not in sys.modules, 'spacy was imported'\n"
+        )
+        proc = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            cwd=REPO_ROOT,
+            env={"PYTHONPATH": str(REPO_ROOT)},
+            check=False,
+        )
+        assert proc.returncode == 0, proc.stderr
+
+
+class TestCountSyllables:
+    """Tests for the count_syllables() memo."""
+
+    def test_memo_is_bounded(self) -> None:
+        """Verifies the per-word syllable memo is an LRU of SYLLABLE_CACHE_SIZE."""
+        count_syllables("readability")
+        info = count_syllables.cache_info()
+        assert info.maxsize == SYLLABLE_CACHE_SIZE
+        assert info.currsize <= SYLLABLE_CACHE_SIZE
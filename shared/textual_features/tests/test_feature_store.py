@@ -0,0 +1,130 @@
+"""Tests for the incremental Parquet feature store (no network)."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from shared.textual_features import engine, feature_store, registry
+from shared.textual_features.feature_store import FeatureStore
+from shared.textual_features.registry import (
+    CHAR_COUNT,
+    INTERGROUP,
+    READING_EASE,
+    VALENCE,
+    WORD_COUNT,
+)
+
+# Repeated texts as in per-trial frames, plus missing text.
+FRAME = pd.DataFrame(
+    {
+        "text": ["Hello world.", "Another post here!", None, "Hello world.", " Hello world."],
+        "trial": [1, 2, 3, 4, 5],
+    },
+    index=[10, 11, 12, 13, 14],
+)
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> FeatureStore:
+    return FeatureStore(tmp_path / "store")
+
+
+@pytest.fixture
+def metric_calls(monkeypatch: pytest.MonkeyPatch) -> list[list[str]]:
+    """Record the texts passed to compute_metrics."""
+    calls: list[list[str]] = []
+    real = engine.compute_metrics
+
+    def compute_metrics(texts, names=None, **kwargs):
+        calls.append(list(texts))
+        return real(texts, names, **kwargs)
+
+    monkeypatch.setattr(engine, "compute_metrics", compute_metrics)
+    return calls
+
+
+class TestMetrics:
+    """Tests for FeatureStore.features_for() on deterministic metrics."""
+
+    def test_matches_compute_metrics(self, store: FeatureStore) -> None:
+        """Verifies joined values equal compute_metrics on every row."""
+        names = [CHAR_COUNT, WORD_COUNT, READING_EASE]
+        result = store.features_for(FRAME, "text", names, backend="regex")
+        texts = FRAME["text"].fillna("").tolist()
+        expected = pd.DataFrame(
+            engine.compute_metrics(texts, names, backend="regex"), index=FRAME.index
+        )
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_each_text_is_computed_once(
+        self, store: FeatureStore, metric_calls: list[list[str]]
+    ) -> None:
+        """Verifies distinct texts are scored once and later runs score only new ones."""
+        store.features_for(FRAME, "text", [WORD_COUNT], backend="regex")
+        later = pd.DataFrame({"text": ["Hello world.", "Brand new text."]})
+        result = store.features_for(later, "text", [WORD_COUNT], backend="regex")
+        assert metric_calls == [
+            ["Hello world.", "Another post here!", "", " Hello world."],
+            ["Brand new text."],
+        ]
+        assert result["word_count"].tolist() == [2.0, 3.0]
+
+    def test_persists_across_instances(self, store: FeatureStore, metric_calls) -> None:
+        """Verifies a new store on the same directory reuses stored values."""
+        store.features_for(FRAME, "text", [CHAR_COUNT], backend="regex")
+        reopened = FeatureStore(store.root)
+        result = reopened.features_for(FRAME, "text", [CHAR_COUNT], backend="regex")
+        assert len(metric_calls) == 1
+        assert result["char_count"].tolist() == [12.0, 18.0, 0.0, 12.0, 13.0]
+
+    def test_metric_version_invalidates(
+        self, store: FeatureStore, metric_calls, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verifies bumping METRIC_VERSION recomputes stored metrics."""
+        store.features_for(FRAME, "text", [WORD_COUNT], backend="regex")
+        monkeypatch.setattr(feature_store, "METRIC_VERSION", "metrics-test")
+        store.features_for(FRAME, "text", [WORD_COUNT], backend="regex")
+        assert len(metric_calls) == 2
+
+    def test_compact_keeps_values(self, store: FeatureStore) -> None:
+        """Verifies compaction merges parts without changing results."""
+        store.features_for(FRAME.iloc[:2], "text", [WORD_COUNT], backend="regex")
+        before = store.features_for(FRAME, "text", [WORD_COUNT], backend="regex")
+        assert len(list((store.root / WORD_COUNT).glob("part-*.parquet"))) == 2
+        assert store.compact(WORD_COUNT) == 4
+        assert len(list((store.root / WORD_COUNT).glob("part-*.parquet"))) == 1
+        after = store.features_for(FRAME, "text", [WORD_COUNT], backend="regex")
+        pd.testing.assert_frame_equal(before, after)
+
+
+class TestClassifiers:
+    """Tests that classifiers go through registry.classify_features."""
+
+    def test_batches_new_texts_and_reuses_labels(
+        self, store: FeatureStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verifies one batched call per run, covering only unseen texts."""
+        calls: list[tuple[list[str], list[str], bool]] = []
+
+        def classify_features(names, posts, *, combined=True, **kwargs):
+            calls.append((list(names), list(posts), combined))
+            return {name: ["Hello" in p for p in posts] for name in names}
+
+        monkeypatch.setattr(registry, "classify_features", classify_features)
+        monkeypatch.setitem(
+            sys.modules, "shared.textual_features.combined", SimpleNamespace(PROMPT_HASH="fake")
+        )
+        first = store.features_for(FRAME, "text", [VALENCE, INTERGROUP, WORD_COUNT])
+        store.features_for(FRAME, "text", [VALENCE, INTERGROUP])
+        assert len(calls) == 1
+        assert calls[0][0] == [VALENCE, INTERGROUP]
+        assert len(calls[0][1]) == 4
+        assert first["is_positive"].tolist() == [True, False, False, True, True]
+        assert first["is_positive"].dtype == np.bool_
+        assert list(first.columns) == ["is_positive", "is_intergroup", "word_count"]
@@ -0,0 +1,42 @@
+"""Tests that package imports stay lazy (no spaCy / LangChain / boto3 at import)."""
+
+from __future__ import annotations
+
+import pytest
+
+from scripts.check_import_times import BUDGETS, ImportBudget, check_budget, parse_importtime
+
+
+class TestParseImporttime:
+    """Tests for parse_importtime()."""
+
+    def test_parses_records_and_skips_header(self) -> None:
+        """Verifies times, names, and nesting depth are read from -X importtime output."""
+        stderr = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:        12 |         12 |     _io\n"
+            "import time:       300 |        450 |   shared.textual_features\n"
+        )
+        records = parse_importtime(stderr)
+        assert [(r.module, r.self_us, r.cumulative_us, r.depth) for r in records] == [
+            ("_io", 12, 12, 2),
+            ("shared.textual_features", 300, 450, 1),
+        ]
+
+
+@pytest.mark.parametrize("budget", BUDGETS, ids=lambda b: b.module)
+def test_module_does_not_eagerly_import_heavy_dependencies(budget: ImportBudget) -> None:
+    """Verifies each budgeted module imports none of its forbidden dependencies."""
+    report = check_budget(budget, repeat=1)
+    assert report.loaded_forbidden == []
+
+
+def test_lazy_package_attributes_resolve() -> None:
+    """Verifies PEP 562 attributes resolve to the defining module's objects."""
+    import shared.textual_features as tf
+    from shared.textual_features.char_count import CharCountMetric
+
+    assert tf.CharCountMetric is CharCountMetric
+    assert "get_feature" in dir(tf)
+    with pytest.raises(AttributeError):
+        tf.NotAFeature  # noqa: B018
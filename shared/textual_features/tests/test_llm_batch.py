@@ -0,0 +1,158 @@
+"""Tests for the concurrent LLM classifier batch runner (no network)."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from shared.textual_features import llm_batch
+
+_backoff_seconds = llm_batch._backoff_seconds
+
+
+class _StatusError(Exception):
+    """Stand-in for an ``openai.APIStatusError`` with ``status_code``."""
+
+    def __init__(self, status_code: int, retry_after: str | None = None) -> None:
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        headers = {} if retry_after is None else {"retry-after": retry_after}
+        self.response = SimpleNamespace(headers=headers)
+
+
+class _FakeChain:
+    """Async chain that echoes the post, failing the first ``failures[post]`` calls."""
+
+    def __init__(self, failures: dict[str, BaseException] | None = None) -> None:
+        self.failures = dict(failures or {})
+        self.calls: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def ainvoke(self, payload: dict[str, str]) -> str:
+        post = payload["post"]
+        self.calls.append(post)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.001 * (len(post) % 5))
+            error = self.failures.pop(post, None)
+            if error is not None:
+                raise error
+            return post.upper()
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture(autouse=True)
+def _no_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(llm_batch, "_backoff_seconds", lambda attempt, exc: 0.0)
+
+
+class TestInvokeBatch:
+    """Tests for llm_batch.invoke_batch()."""
+
+    def test_preserves_order_and_dedupes(self) -> None:
+        """Verifies results follow input order and repeated posts are sent once."""
+        chain = _FakeChain()
+        posts = ["bb", "a", "cccc", "a", "bb", "ddd"]
+        result = llm_batch.invoke_batch(chain, posts, input_key="post")
+        assert result == [p.upper() for p in posts]
+        assert sorted(chain.calls) == ["a", "bb", "cccc", "ddd"]
+
+    def test_bounds_concurrency(self) -> None:
+        """Verifies no more than max_concurrency requests are in flight."""
+        chain = _FakeChain()
+        posts = [f"post {i}" for i in range(50)]
+        llm_batch.invoke_batch(chain, posts, input_key="post", max_concurrency=4)
+        assert 1 < chain.max_in_flight <= 4
+
+    def test_retries_rate_limits(self) -> None:
+        """Verifies a 429 is retried and the post still gets its result."""
+        chain = _FakeChain({"x": _StatusError(429)})
+        result = llm_batch.invoke_batch(chain, ["x", "y"], input_key="post")
+        assert result == ["X", "Y"]
+        assert chain.calls.count("x") == 2
+
+    def test_gives_up_after_max_attempts(self) -> None:
+        """Verifies the last retryable error is raised once attempts run out."""
+
+        class _AlwaysLimited(_FakeChain):
+            async def ainvoke(self, payload: dict[str, str]) -> str:
+                self.calls.append(payload["post"])
+                raise _StatusError(429)
+
+        chain = _AlwaysLimited()
+        with pytest.raises(_StatusError):
+            llm_batch.invoke_batch(chain, ["x"], input_key="post", max_attempts=3)
+        assert chain.calls == ["x", "x", "x"]
+
+    def test_does_not_retry_client_errors(self) -> None:
+        """Verifies non-retryable errors (e.g. 400) propagate immediately."""
+        chain = _FakeChain({"bad": _StatusError(400)})
+        with pytest.raises(_StatusError):
+            llm_batch.invoke_batch(chain, ["bad"], input_key="post")
+        assert chain.calls == ["bad"]
+
+    def test_rejects_invalid_limits(self) -> None:
+        """Verifies max_concurrency and max_attempts must be positive."""
+        with pytest.raises(ValueError, match="max_concurrency"):
+            llm_batch.invoke_batch(_FakeChain(), ["x"], input_key="post", max_concurrency=0)
+        with pytest.raises(ValueError, match="max_attempts"):
+            llm_batch.invoke_batch(_FakeChain(), ["x"], input_key="post", max_attempts=0)
+
+    def test_runs_inside_running_event_loop(self) -> None:
+        """Verifies the sync entry point works when called from async code."""
+
+        async def caller() -> list[str]:
+            return llm_batch.invoke_batch(_FakeChain(), ["a", "b"], input_key="post")
+
+        assert asyncio.run(caller()) == ["A", "B"]
+
+
+class TestBackoff:
+    """Tests for retry classification and Retry-After handling."""
+
+    def test_retryable_statuses(self) -> None:
+        """Verifies 429/5xx are retried and other 4xx are not."""
+        assert llm_batch._is_retryable(_StatusError(429))
+        assert llm_batch._is_retryable(_StatusError(503))
+        assert not llm_batch._is_retryable(_StatusError(401))
+        assert not llm_batch._is_retryable(ValueError("schema"))
+
+    def test_honors_retry_after(self) -> None:
+        """Verifies the server's Retry-After is a floor on the jittered delay."""
+        delay = _backoff_seconds(0, _StatusError(429, retry_after="2.5"))
+        assert delay >= 2.5
+
+
+class TestClassifyTexts:
+    """Tests that classify_texts builds the chain once and keeps input order."""
+
+    def test_valence_uses_cached_chain(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Verifies one structured-output chain serves every post."""
+        from langchain_core.runnables import RunnableLambda
+
+        from shared.textual_features import valence
+
+        built: list[type] = []
+
+        def with_structured_output(schema: type) -> RunnableLambda:
+            built.append(schema)
+            return RunnableLambda(
+                lambda prompt: schema(is_positive="sunny" in prompt.to_string())
+            )
+
+        fake_llm = SimpleNamespace(with_structured_output=with_structured_output)
+        monkeypatch.setattr(valence, "get_llm", lambda model=None: fake_llm)
+        valence.get_chain.cache_clear()
+        try:
+            result = valence.classify_texts(
+                ["sunny day", "rainy day", "sunny day"], cache=False
+            )
+        finally:
+            valence.get_chain.cache_clear()
+        assert [r.is_positive for r in result] == [True, False, True]
+        assert built == [valence.ValenceClassification]
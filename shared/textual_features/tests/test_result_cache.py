@@ -0,0 +1,146 @@
+"""Tests for the SQLite classifier result cache (no network)."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from pydantic import BaseModel
+
+from shared.textual_features import result_cache
+from shared.textual_features.result_cache import (
+    ClassifierResultCache,
+    classify_with_cache,
+    prompt_fingerprint,
+    text_sha256,
+)
+
+
+class _Label(BaseModel):
+    is_positive: bool
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> Iterator[ClassifierResultCache]:
+    cache = ClassifierResultCache(tmp_path / "labels.sqlite3")
+    yield cache
+    cache.close()
+
+
+class TestClassifierResultCache:
+    """Tests for ClassifierResultCache bulk get/put and bookkeeping."""
+
+    def test_round_trip_and_persistence(self, tmp_path: Path) -> None:
+        """Verifies stored results are served after reopening the file."""
+        path = tmp_path / "labels.sqlite3"
+        first = ClassifierResultCache(path)
+        first.put_many(
+            "VALENCE", "p1", "m", ["a", "b"], [{"is_positive": True}, {"is_positive": False}]
+        )
+        first.close()
+        reopened = ClassifierResultCache(path)
+        result = reopened.get_many("VALENCE", "p1", "m", ["b", "c", "a"])
+        reopened.close()
+        assert result == [{"is_positive": False}, None, {"is_positive": True}]
+
+    def test_key_includes_prompt_model_and_feature(self, cache: ClassifierResultCache) -> None:
+        """Verifies a different prompt hash, model, or feature misses."""
+        cache.put_many("VALENCE", "p1", "m", ["a"], [{"is_positive": True}])
+        assert cache.get_many("VALENCE", "p2", "m", ["a"]) == [None]
+        assert cache.get_many("VALENCE", "p1", "other-model", ["a"]) == [None]
+        assert cache.get_many("PRIME", "p1", "m", ["a"]) == [None]
+
+    def test_text_is_normalized(self, cache: ClassifierResultCache) -> None:
+        """Verifies surrounding whitespace and Unicode composition do not split keys."""
+        cache.put_many("VALENCE", "p", "m", ["Café "], [{"is_positive": True}])
+        assert cache.get_many("VALENCE", "p", "m", ["  Café"]) == [{"is_positive": True}]
+        assert text_sha256("a b") != text_sha256("a  b")
+
+    def test_large_lookup_is_chunked(self, cache: ClassifierResultCache) -> None:
+        """Verifies lookups larger than SQLite's parameter limit succeed."""
+        texts = [f"post {i}" for i in range(2500)]
+        cache.put_many("VALENCE", "p", "m", texts, [{"i": i} for i in range(2500)])
+        result = cache.get_many("VALENCE", "p", "m", texts)
+        assert [r["i"] for r in result] == list(range(2500))
+
+    def test_hit_rate(self, cache: ClassifierResultCache) -> None:
+        """Verifies per-feature hit and miss counts."""
+        cache.put_many("VALENCE", "p", "m", ["a"], [{"is_positive": True}])
+        cache.get_many("VALENCE", "p", "m", ["a", "b", "a", "c"])
+        stats = cache.stats("VALENCE")
+        assert (stats.hits, stats.misses, stats.hit_rate) == (2, 2, 0.5)
+        assert cache.stats("PRIME").lookups == 0
+
+    def test_prune_stale(self, cache: ClassifierResultCache) -> None:
+        """Verifies rows under old prompt fingerprints are dropped, current ones kept."""
+        cache.put_many("VALENCE", "old", "m", ["a", "b"], [{}, {}])
+        cache.put_many("VALENCE", "new", "m", ["a"], [{}])
+        cache.put_many("PRIME", "old", "m", ["a"], [{}])
+        assert cache.prune_stale("VALENCE", "new") == 2
+        assert {(r["feature"], r["prompt_hash"]) for r in cache.summary()} == {
+            ("VALENCE", "new"),
+            ("PRIME", "old"),
+        }
+
+    def test_put_many_length_mismatch(self, cache: ClassifierResultCache) -> None:
+        """Verifies texts and results must align."""
+        with pytest.raises(ValueError, match="2 texts vs 1 results"):
+            cache.put_many("VALENCE", "p", "m", ["a", "b"], [{}])
+
+
+class TestPromptFingerprint:
+    """Tests for prompt_fingerprint()."""
+
+    def test_changes_with_prompt_and_schema(self) -> None:
+        """Verifies editing the prompt or the schema changes the fingerprint."""
+
+        class _Other(BaseModel):
+            is_prime: bool
+
+        base = prompt_fingerprint("Classify {post}", _Label)
+        assert base == prompt_fingerprint("Classify {post}", _Label)
+        assert base != prompt_fingerprint("Classify: {post}", _Label)
+        assert base != prompt_fingerprint("Classify {post}", _Other)
+
+
+class TestClassifyWithCache:
+    """Tests for classify_with_cache()."""
+
+    def test_only_misses_are_classified(self, cache: ClassifierResultCache) -> None:
+        """Verifies a repeat run is served entirely from the cache."""
+        seen: list[list[str]] = []
+
+        def classify(posts: list[str]) -> list[_Label]:
+            seen.append(posts)
+            return [_Label(is_positive="good" in p) for p in posts]
+
+        kwargs = dict(feature="VALENCE", prompt_hash="p", model="m", schema=_Label, cache=cache)
+        first = classify_with_cache(["good", "bad", "good"], classify, **kwargs)
+        second = classify_with_cache(["bad", "good", "new good"], classify, **kwargs)
+        assert [r.is_positive for r in first] == [True, False, True]
+        assert [r.is_positive for r in second] == [False, True, True]
+        assert seen == [["good", "bad"], ["new good"]]
+
+    def test_cache_false_bypasses(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Verifies cache=False neither reads nor opens the default cache."""
+        monkeypatch.setattr(result_cache, "get_default_cache", pytest.fail)
+        result = classify_with_cache(
+            ["x", "x"],
+            lambda posts: [_Label(is_positive=True) for _ in posts],
+            feature="VALENCE",
+            prompt_hash="p",
+            model="m",
+            schema=_Label,
+            cache=False,
+        )
+        assert len(result) == 2
+
+    def test_classifier_modules_expose_cache_keys(self) -> None:
+        """Verifies each LLM feature module has a stable feature name and prompt hash."""
+        from shared.textual_features import combined, intergroup, prime, valence
+
+        names = [m.FEATURE_NAME for m in (valence, intergroup, prime, combined)]
+        hashes = [m.PROMPT_HASH for m in (valence, intergroup, prime, combined)]
+        assert names == ["VALENCE", "INTERGROUP", "PRIME", "COMBINED"]
+        assert len(set(hashes)) == 4
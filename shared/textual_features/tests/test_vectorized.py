@@ -0,0 +1,110 @@
+"""Parity tests for the columnar calculate_array / calculate_series path."""
+
+from __future__ import annotations
+
+import re
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from shared.textual_features import vectorized
+from shared.textual_features.char_count import CharCountMetric
+from shared.textual_features.punctuation_count import PunctuationCountMetric
+from shared.textual_features.punctuation_density import PunctuationDensityMetric
+from shared.textual_features.sentence_count import SentenceCountMetric
+from shared.textual_features.text_utils import PUNCTUATION_RE, WORD_RE
+from shared.textual_features.word_count import WordCountMetric
+
+# Unicode letters/digits outside ASCII, emoji and ZWJ sequences, combining
+# marks, non-ASCII whitespace, underscores, and CJK Extension I (see
+# vectorized.ARROW_UNICODE_DRIFT_PATTERN).
+EDGE_CASES = [
+    "",
+    "   ",
+    "Hello world!",
+    "Café au lait, naïve façade — déjà vu…",
+    "Ελληνικά κείμενα; русский текст? 日本語のテキスト。",
+    "snake_case __dunder__ x_1 _",
+    "emoji 👍🏽 family 👨‍👩‍👧 flag 🇺🇸!!",
+    "é combining accent and ½ ² ٣ numerals",
+    "nbsp thin ideographic　line para nel\u0085tab\t",
+    "\x1c\x1d\x1e\x1f file separators",
+    "@user #tag $5 100% a&b <html> {json: [1, 2]}",
+    "CJK Ext I \U0002ebf0\U0002ebf1 mixed with text.",
+]
+
+METRICS = [
+    CharCountMetric(),
+    WordCountMetric(),
+    PunctuationCountMetric(),
+    PunctuationDensityMetric(),
+]
+
+
+class TestCalculateArray:
+    """Tests for CalculateMetric.calculate_array() on the length metrics."""
+
+    @pytest.mark.parametrize("metric", METRICS, ids=lambda m: m.name)
+    def test_matches_calculate(self, metric) -> None:
+        """Verifies the columnar values equal calculate() on every edge case."""
+        expected = [metric.calculate(text) for text in EDGE_CASES]
+        result = metric.calculate_array(EDGE_CASES)
+        assert result.dtype == np.float64
+        assert result.tolist() == expected
+
+    @pytest.mark.parametrize(
+        "texts",
+        [
+            pd.Series(EDGE_CASES, dtype=object),
+            pd.Series(EDGE_CASES, dtype="string[pyarrow]"),
+            pa.chunked_array([EDGE_CASES[:5], EDGE_CASES[5:]]),
+        ],
+        ids=["object", "string[pyarrow]", "chunked"],
+    )
+    def test_accepts_column_types(self, texts) -> None:
+        """Verifies Series and chunked Arrow inputs give the same counts as a list."""
+        metric = WordCountMetric()
+        assert metric.calculate_array(texts).tolist() == metric.calculate_array(EDGE_CASES).tolist()
+
+    def test_default_falls_back_to_calculate(self) -> None:
+        """Verifies a metric without an override scores each row with calculate()."""
+        metric = SentenceCountMetric()
+        texts = ["One. Two.", "", "No end"]
+        expected = [metric.calculate(text) for text in texts]
+        assert metric.calculate_array(texts).tolist() == expected
+
+    def test_rejects_nulls(self) -> None:
+        """Verifies missing text must be filled before scoring."""
+        with pytest.raises(TypeError, match="nulls"):
+            CharCountMetric().calculate_array(pd.Series(["a", None]))
+
+
+class TestCalculateSeries:
+    """Tests for CalculateMetric.calculate_series()."""
+
+    def test_preserves_index_and_name(self) -> None:
+        """Verifies the result is aligned to the input index and named after the metric."""
+        texts = pd.Series(["Hi!", "Hello, world."], index=[10, 3])
+        result = PunctuationCountMetric().calculate_series(texts)
+        assert result.index.tolist() == [10, 3]
+        assert result.name == "punctuation_count"
+        assert result.tolist() == [1.0, 2.0]
+
+
+class TestArrowPatterns:
+    """Tests that the RE2 patterns reproduce Python re over all codepoints."""
+
+    @pytest.mark.parametrize("pattern", [WORD_RE, PUNCTUATION_RE], ids=["word", "punct"])
+    def test_every_codepoint(self, pattern: re.Pattern[str]) -> None:
+        """Verifies per-codepoint counts agree with Python re (surrogates excluded)."""
+        texts = [
+            f"a{chr(cp)}a"
+            for cp in range(0x110000)
+            if not 0xD800 <= cp <= 0xDFFF
+        ]
+        expected = np.fromiter((len(pattern.findall(t)) for t in texts), np.float64, len(texts))
+        result = vectorized.count_matches(texts, pattern)
+        mismatches = np.flatnonzero(result != expected)
+        assert mismatches.size == 0, [hex(ord(texts[i][1])) for i in mismatches[:20]]
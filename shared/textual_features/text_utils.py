@@ -9,14 +9,19 @@ from __future__ import annotations
 
 import re
 from functools import lru_cache
+from typing import TYPE_CHECKING, Literal
 
-import spacy
+if TYPE_CHECKING:
+    import spacy
+
+ReadabilityBackend = Literal["spacy", "regex"]
 
 WORD_RE = re.compile(r"\b\w+\b")
 PUNCTUATION_RE = re.compile(r"[^\w\s]")
 SENTENCE_SPLIT_RE = re.compile(r"[.!?]+")
 VOWEL_GROUP_RE = re.compile(r"[aeiouy]+", re.IGNORECASE)
 NON_LETTER_RE = re.compile(r"[^a-z]")
+SYLLABLE_CACHE_SIZE = 1 << 16
 
 
 def safe_divide(numerator: float, denominator: float) -> float:
@@ -41,15 +46,23 @@ def safe_divide(numerator: float, denominator: float) -> float:
 
 @lru_cache(maxsize=1)
 def nlp() -> spacy.language.Language:
-    """Minimal English pipeline for deterministic token/sentence boundaries."""
+    """Minimal English pipeline for deterministic token/sentence boundaries.
+
+    spaCy is imported on first call, so importing this module stays cheap.
+    """
+    import spacy
+
     pipeline = spacy.blank("en")
     pipeline.add_pipe("sentencizer")
     return pipeline
 
 
+@lru_cache(maxsize=SYLLABLE_CACHE_SIZE)
 def count_syllables(word: str) -> int:
     """Count syllables with the same heuristic as the mirrors readability metrics.
 
+    Memoized per word (bounded LRU of ``SYLLABLE_CACHE_SIZE`` entries).
+
     Parameters
     ----------
     word
@@ -70,21 +83,54 @@ def count_syllables(word: str) -> int:
     return max(1, syllables)
 
 
-def readability_counts(text: str) -> tuple[int, int, int]:
+def readability_counts(
+    text: str, *, backend: ReadabilityBackend = "spacy"
+) -> tuple[int, int, int]:
     """Return word, sentence, and syllable counts for readability formulas.
 
     Parameters
     ----------
     text
         Input post string.
+    backend
+        ``"spacy"`` parses with :func:`nlp`; ``"regex"`` replays the same
+        tokenizer and sentencizer rules without importing spaCy (see
+        ``fast_readability``).
 
     Returns
     -------
     tuple[int, int, int]
         ``(word_count, sentence_count, syllable_count)``. Sentence count is at
         least 1 when the spaCy doc has no non-empty sentences.
+
+    Raises
+    ------
+    ValueError
+        If ``backend`` is not ``"spacy"`` or ``"regex"``.
+    """
+    if backend == "regex":
+        from shared.textual_features import fast_readability
+
+        return fast_readability.readability_counts(text)
+    if backend != "spacy":
+        raise ValueError(f"Unknown readability backend {backend!r}; expected 'spacy' or 'regex'")
+    return readability_counts_from_doc(nlp()(text))
+
+
+def readability_counts_from_doc(doc: spacy.tokens.Doc) -> tuple[int, int, int]:
+    """Return ``readability_counts`` for an already-parsed ``nlp()`` doc.
+
+    Parameters
+    ----------
+    doc
+        Output of :func:`nlp` (or ``nlp().pipe``) for one text.
+
+    Returns
+    -------
+    tuple[int, int, int]
+        ``(word_count, sentence_count, syllable_count)`` as in
+        :func:`readability_counts`.
     """
-    doc = nlp()(text)
     words = [token.text for token in doc if token.is_alpha]
     sentence_count = sum(1 for sent in doc.sents if sent.text.strip())
     if sentence_count == 0:
@@ -7,13 +7,25 @@ PYTHONPATH=. uv run python -c "from shared.textual_features.valence import Valen
 
 from __future__ import annotations
 
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_openai import ChatOpenAI
 from pydantic import BaseModel
-from tqdm import tqdm
 
 from lib.constants import DEFAULT_LLM_MODEL
 from lib.load_env_vars import EnvVarsContainer
+from shared.textual_features.llm_batch import (
+    DEFAULT_MAX_ATTEMPTS,
+    DEFAULT_MAX_CONCURRENCY,
+    classify_texts_with,
+)
+from shared.textual_features.registry import VALENCE
+from shared.textual_features.result_cache import ClassifierResultCache, prompt_fingerprint
+
+if TYPE_CHECKING:
+    from langchain_core.runnables import Runnable
+    from langchain_openai import ChatOpenAI
 
 BINARY_SENTIMENT_PROMPT = '\nYou are a sentiment analysis expert. Your task is to determine whether the overall valence of the following social media post is positive.\n\nInstructions:\n- If the post expresses a favorable attitude, optimism, praise, or generally good feelings, classify as true.\n- If the post expresses criticism, disapproval, pessimism, anger, or generally bad feelings, classify as false.\n- Consider the overall tone, affect, and language of the post.\n- If there is a mix of positive and negative language, use the dominant sentiment.\n- Ignore sarcasm unless it is obvious.\n- Do NOT classify as "neutral". Every post should be labeled as true (positive) or false (not positive).\n\nFew-shot Examples:\n\nExample 1:\nPost: "I really enjoyed reading this, it made my day better!"\nis_positive: true\n\nExample 2:\nPost: "This is awful. I can\'t believe people think this way."\nis_positive: false\n\nExample 3:\nPost: "Beautifully written and very inspiring."\nis_positive: true\n\nExample 4:\nPost: "This post is misleading and frustrating to read."\nis_positive: false\n\nNow, given the following post, reply strictly in this JSON format:\n\n{{\n  "is_positive": <true|false>\n}}\n\nPost:\n"""{post}"""\n'
 
@@ -24,13 +36,21 @@ class ValenceClassification(BaseModel):
     is_positive: bool
 
 
+FEATURE_NAME = VALENCE
+PROMPT_HASH = prompt_fingerprint(BINARY_SENTIMENT_PROMPT, ValenceClassification)
+
+
 _VALENCE_PROMPT = ChatPromptTemplate.from_messages(
     [("human", BINARY_SENTIMENT_PROMPT)]
 )
 
 
+@lru_cache(maxsize=8)
 def get_llm(model: str = DEFAULT_LLM_MODEL) -> ChatOpenAI:
-    """Build a ChatOpenAI client using ``OPENAI_API_KEY``.
+    """Build a ChatOpenAI client using ``OPENAI_API_KEY``, once per model.
+
+    ``langchain_openai`` is imported on first call; later calls reuse the
+    cached client.
 
     Parameters
     ----------
@@ -42,40 +62,64 @@ def get_llm(model: str = DEFAULT_LLM_MODEL) -> ChatOpenAI:
     ChatOpenAI
         Configured LangChain chat model.
     """
+    from langchain_openai import ChatOpenAI
+
     api_key = EnvVarsContainer.get_env_var("OPENAI_API_KEY", required=True)
     return ChatOpenAI(model=model, api_key=api_key)
 
 
-def classify_post(post: str) -> ValenceClassification:
-    """Classify one post via OpenAI structured output (LangChain).
+@lru_cache(maxsize=8)
+def get_chain(model: str = DEFAULT_LLM_MODEL) -> Runnable:
+    """Return the prompt | structured-output chain for ``model``, built once.
 
     Parameters
     ----------
-    post
-        Social media post text.
+    model
+        OpenAI model id.
 
     Returns
     -------
-    ValenceClassification
-        Structured ``is_positive`` label.
+    Runnable
+        Chain mapping ``{"post": post}`` to ``ValenceClassification``.
     """
-    llm = get_llm()
-    structured = llm.with_structured_output(ValenceClassification)
-    chain = _VALENCE_PROMPT | structured
-    return chain.invoke({"post": post})
+    return _VALENCE_PROMPT | get_llm(model).with_structured_output(ValenceClassification)
 
 
-def classify_texts(posts: list[str]) -> list[ValenceClassification]:
-    """Classify each post with ``classify_post``.
+def classify_post(post: str) -> ValenceClassification:
+    """Classify one post via OpenAI structured output (LangChain).
 
     Parameters
     ----------
-    posts
-        Post texts.
+    post
+        Social media post text.
 
     Returns
     -------
-    list[ValenceClassification]
-        One label per input post.
+    ValenceClassification
+        Structured ``is_positive`` label.
     """
-    return [classify_post(p) for p in tqdm(posts, desc="Valence classification")]
+    return get_chain().invoke({"post": post})
+
+
+def classify_texts(
+    posts: list[str],
+    *,
+    model: str = DEFAULT_LLM_MODEL,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    cache: ClassifierResultCache | bool = True,
+) -> list[ValenceClassification]:
+    """``is_positive`` for each post; see :func:`.llm_batch.classify_texts_with`."""
+    return classify_texts_with(
+        get_chain,
+        posts,
+        input_key="post",
+        feature=FEATURE_NAME,
+        prompt_hash=PROMPT_HASH,
+        schema=ValenceClassification,
+        model=model,
+        max_concurrency=max_concurrency,
+        max_attempts=max_attempts,
+        cache=cache,
+        desc="Valence classification",
+    )
@@ -0,0 +1,118 @@
+"""Columnar (Arrow) counts for the regex-based textual metrics.
+
+``pyarrow.compute`` regexes use RE2, whose ``\\w``, ``\\s``, and ``\\b`` are
+ASCII-only, so the ``text_utils`` patterns cannot be passed through as-is (this
+is also why ``Series.str.count`` on pandas' Arrow-backed ``str`` dtype would
+silently change the counts). The RE2 patterns below spell out Python's Unicode
+``\\w`` and ``\\s`` classes instead, and rows containing codepoints that the
+two Unicode tables classify differently fall back to Python ``re``.
+
+To run:
+
+PYTHONPATH=. uv run python -c "from shared.textual_features.vectorized import word_counts; print(word_counts(['Hello world!', 'Café au lait']))"
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Union
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from shared.textual_features.text_utils import PUNCTUATION_RE, WORD_RE
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+TextColumn = Union[Sequence[str], "pd.Series", pa.Array, pa.ChunkedArray]
+
+# Python ``\w`` on str patterns is ``str.isalnum()`` or ``_``: Unicode letters
+# and numbers. A maximal ``\w`` run always sits on ``\b`` boundaries, so
+# ``\b\w+\b`` counts the same matches as ``\w+``.
+_RE2_WORD_CLASS = r"\pL\pN_"
+# Python ``\s``: exactly the codepoints for which ``str.isspace()`` is true.
+_RE2_SPACE_CLASS = (
+    r"\t\n\x0b\x0c\r\x1c-\x1f \x{85}\x{a0}\x{1680}\x{2000}-\x{200a}"
+    r"\x{2028}\x{2029}\x{202f}\x{205f}\x{3000}"
+)
+ARROW_WORD_PATTERN = f"[{_RE2_WORD_CLASS}]+"
+ARROW_PUNCTUATION_PATTERN = f"[^{_RE2_WORD_CLASS}{_RE2_SPACE_CLASS}]"
+# CJK Extension I: letters in RE2's Unicode tables, unassigned in Python 3.12's
+# (Unicode 15.0), so Python treats them as punctuation rather than word chars.
+ARROW_UNICODE_DRIFT_PATTERN = r"[\x{2ebf0}-\x{2ee5d}]"
+
+_ARROW_PATTERNS = {
+    WORD_RE.pattern: ARROW_WORD_PATTERN,
+    PUNCTUATION_RE.pattern: ARROW_PUNCTUATION_PATTERN,
+}
+
+
+def as_string_array(texts: TextColumn) -> pa.Array | pa.ChunkedArray:
+    """Return ``texts`` as an Arrow string array.
+
+    Raises
+    ------
+    TypeError
+        If ``texts`` contains nulls (normalize missing text to ``""`` first,
+        as ``calculate`` does not accept ``None`` either).
+    """
+    if isinstance(texts, (pa.Array, pa.ChunkedArray)):
+        arr = texts
+    else:
+        arr = pa.array(texts, type=pa.large_string(), from_pandas=True)
+    if not (pa.types.is_string(arr.type) or pa.types.is_large_string(arr.type)):
+        raise TypeError(f"Expected a string column, got Arrow type {arr.type}")
+    if arr.null_count:
+        raise TypeError(f"texts contains {arr.null_count} nulls; fill them (e.g. with '') first")
+    return arr
+
+
+def char_counts(texts: TextColumn) -> np.ndarray:
+    """``len(text)`` per text (Unicode codepoints) as float64."""
+    arr = as_string_array(texts)
+    return pc.utf8_length(arr).to_numpy(zero_copy_only=False).astype(np.float64)
+
+
+def count_matches(texts: TextColumn, pattern: re.Pattern[str]) -> np.ndarray:
+    """``len(pattern.findall(text))`` per text as float64.
+
+    Parameters
+    ----------
+    texts
+        Strings (list, pandas Series, or Arrow array) without nulls.
+    pattern
+        ``WORD_RE`` or ``PUNCTUATION_RE``; other patterns are counted with
+        Python ``re`` per row.
+    """
+    arr = as_string_array(texts)
+    arrow_pattern = _ARROW_PATTERNS.get(pattern.pattern)
+    if arrow_pattern is None:
+        return np.fromiter(
+            (len(pattern.findall(text)) for text in arr.to_pylist()), np.float64, len(arr)
+        )
+    counts = pc.count_substring_regex(arr, arrow_pattern)
+    counts = counts.to_numpy(zero_copy_only=False).astype(np.float64)
+    drift = pc.match_substring_regex(arr, ARROW_UNICODE_DRIFT_PATTERN)
+    for i in np.flatnonzero(drift.to_numpy(zero_copy_only=False)):
+        counts[i] = len(pattern.findall(arr[int(i)].as_py()))
+    return counts
+
+
+def word_counts(texts: TextColumn) -> np.ndarray:
+    """``WORD_RE`` matches per text, as in ``WordCountMetric``."""
+    return count_matches(texts, WORD_RE)
+
+
+def punctuation_counts(texts: TextColumn) -> np.ndarray:
+    """``PUNCTUATION_RE`` matches per text, as in ``PunctuationCountMetric``."""
+    return count_matches(texts, PUNCTUATION_RE)
+
+
+def safe_divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """Vector form of ``text_utils.safe_divide`` (0.0 where denominator <= 0)."""
+    out = np.zeros(numerator.shape, dtype=np.float64)
+    np.divide(numerator, denominator, out=out, where=denominator > 0)
+    return out
@@ -7,9 +7,16 @@ PYTHONPATH=. uv run python -c "from shared.textual_features.word_count import Wo
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from shared.textual_features.base import CalculateMetric
 from shared.textual_features.text_utils import WORD_RE
 
+if TYPE_CHECKING:
+    import numpy as np
+
+    from shared.textual_features.vectorized import TextColumn
+
 
 class WordCountMetric(CalculateMetric):
     """Approximate word count via regex tokenization."""
@@ -39,3 +46,9 @@ class WordCountMetric(CalculateMetric):
             Number of ``WORD_RE`` matches.
         """
         return float(len(WORD_RE.findall(text)))
+
+    def calculate_array(self, texts: TextColumn) -> np.ndarray:
+        """Return word counts for ``texts`` via an Arrow regex count."""
+        from shared.textual_features.vectorized import word_counts
+
+        return word_counts(texts)